@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from threading import Lock
 from typing import Any
 
 import httpx
@@ -27,6 +28,7 @@ class ApiClient:
     def __init__(self, settings: Settings) -> None:
         self.settings = settings
         self.access_token: str | None = None
+        self._refresh_lock = Lock()
         self._client = httpx.Client(
             base_url=f"{settings.api_base_url}/",
             timeout=settings.request_timeout_seconds,
@@ -77,16 +79,20 @@ class ApiClient:
         allow_refresh: bool = True,
     ) -> Any:
         headers: dict[str, str] = {}
-        if authenticated and self.access_token:
-            headers["Authorization"] = f"Bearer {self.access_token}"
+        token = self.access_token
+        if authenticated and token:
+            headers["Authorization"] = f"Bearer {token}"
         try:
             response = self._client.request(method, path.lstrip("/"), json=json, headers=headers)
         except httpx.HTTPError as error:
             raise ApiClientError(method=method, path=path, status_code=None, message=str(error), code="NETWORK_ERROR") from error
 
         payload, envelope = self._decode(response, method, path)
-        if authenticated and allow_refresh and self._refreshable(response, envelope, bool(self.access_token)):
-            self.refresh()
+        if authenticated and allow_refresh and self._refreshable(response, envelope, bool(token)):
+            # Concurrent cleanup workers share this session: only the first expired request refreshes.
+            with self._refresh_lock:
+                if self.access_token == token:
+                    self.refresh()
             return self._send(method, path, json=json, authenticated=True, allow_refresh=False)
         if not response.is_success or not envelope.success:
             raise ApiClientError(
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from threading import Lock
+
 from issue_scenario_lab.api.client import ApiClient
 from issue_scenario_lab.config import Settings, UserCredentials, load_users
 from issue_scenario_lab.errors import UnknownUserAliasError
@@ -12,6 +14,7 @@ class SessionPool:
         self.settings = settings
         self.users = users
         self._clients: dict[str, ApiClient] = {}
+        self._clients_lock = Lock()
 
     @classmethod
     def from_settings(cls, settings: Settings) -> SessionPool:
@@ -30,9 +33,10 @@ class SessionPool:
     def client_for(self, alias: str) -> ApiClient:
         if alias not in self.users:
             raise UnknownUserAliasError(f"unknown user alias: {alias}")
-        if alias not in self._clients:
-            self._clients[alias] = ApiClient(self.settings)
-        return self._clients[alias]
+        with self._clients_lock:
+            if alias not in self._clients:
+                self._clients[alias] = ApiClient(self.settings)
+            return self._clients[alias]
 
     def login(self, alias: str) -> dict[str, object]:
         credentials = self.users.get(alias)
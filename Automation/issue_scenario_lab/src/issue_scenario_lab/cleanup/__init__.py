@@ -1,4 +1,18 @@
 from issue_scenario_lab.cleanup.active import ActiveDeletionResult, delete_active_issue
-from issue_scenario_lab.cleanup.finished import FinishedDeletionResult, delete_finished_generation
+from issue_scenario_lab.cleanup.finished import (
+    BulkDeletionFailure,
+    BulkDeletionResult,
+    FinishedDeletionResult,
+    delete_finished_generation,
+    delete_finished_generations,
+)
 
-__all__ = ["ActiveDeletionResult", "FinishedDeletionResult", "delete_active_issue", "delete_finished_generation"]
+__all__ = [
+    "ActiveDeletionResult",
+    "BulkDeletionFailure",
+    "BulkDeletionResult",
+    "FinishedDeletionResult",
+    "delete_active_issue",
+    "delete_finished_generation",
+    "delete_finished_generations",
+]
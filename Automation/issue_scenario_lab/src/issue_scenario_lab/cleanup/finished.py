@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
+from time import perf_counter
 from typing import Any
 
 from issue_scenario_lab.api.issues import IssuesApi
@@ -9,6 +12,8 @@ from issue_scenario_lab.errors import ApiClientError, ManifestError, ScenarioLab
 from issue_scenario_lab.manifest.models import GeneratedIssue
 from issue_scenario_lab.manifest.store import ManifestStore
 
+DEFAULT_CLEANUP_WORKERS = 4
+
 
 @dataclass(frozen=True)
 class FinishedDeletionResult:
@@ -52,20 +57,12 @@ def _ordered_aliases(entry: GeneratedIssue) -> tuple[str, ...]:
     return tuple(alias for alias in entry.visible_user_aliases if alias != entry.owner_alias) + (entry.owner_alias,)
 
 
-def delete_finished_generation(sessions: SessionPool, store: ManifestStore, generation_id: str) -> FinishedDeletionResult:
-    entry = store.find(generation_id)
-    if entry is None:
-        raise ScenarioLabError(f"unknown generation ID: {generation_id}")
-    _validate_entry(entry, sessions)
-    aliases = _ordered_aliases(entry)
-
-    # Authenticate everyone before hiding the issue for anyone.
-    for alias in aliases:
-        sessions.login(alias)
+def _hide_and_confirm(sessions: SessionPool, entry: GeneratedIssue) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Hide the issue for every alias (already logged in) and confirm its permanent deletion."""
 
     processed: list[str] = []
     already_hidden: list[str] = []
-    for alias in aliases:
+    for alias in _ordered_aliases(entry):
         api = IssuesApi(sessions.client_for(alias))
         matching = [item for item in _items(api.finished_issues()) if _id(item) == entry.issue_id]
         if not matching:
@@ -93,22 +90,148 @@ def delete_finished_generation(sessions: SessionPool, store: ManifestStore, gene
             raise ScenarioLabError(f"could not confirm permanent deletion: {error}") from error
     else:
         raise ScenarioLabError("finished issue remains accessible after all configured aliases were processed")
+    return tuple(processed), tuple(already_hidden)
+
+
+def _manifest_remains_message(entry: GeneratedIssue, store: ManifestStore, error: ManifestError) -> str:
+    return (
+        "Backend issue was permanently deleted but manifest entry remains "
+        f"(generationId={entry.generation_id}, issueId={entry.issue_id}, manifest={store.path}): {error}"
+    )
+
+
+def delete_finished_generation(sessions: SessionPool, store: ManifestStore, generation_id: str) -> FinishedDeletionResult:
+    entry = store.find(generation_id)
+    if entry is None:
+        raise ScenarioLabError(f"unknown generation ID: {generation_id}")
+    _validate_entry(entry, sessions)
+
+    # Authenticate everyone before hiding the issue for anyone.
+    for alias in _ordered_aliases(entry):
+        sessions.login(alias)
+
+    processed, already_hidden = _hide_and_confirm(sessions, entry)
 
     try:
         removed = store.remove(entry.generation_id)
     except ManifestError as error:
-        raise ScenarioLabError(
-            "Backend issue was permanently deleted but manifest entry remains "
-            f"(generationId={entry.generation_id}, issueId={entry.issue_id}, manifest={store.path}): {error}"
-        ) from error
+        raise ScenarioLabError(_manifest_remains_message(entry, store, error)) from error
     if removed is None:
         raise ScenarioLabError(f"Backend issue was permanently deleted but manifest entry could not be removed: {entry.generation_id}")
-    return FinishedDeletionResult(
-        entry.generation_id,
-        entry.issue_id,
-        entry.issue_name,
-        tuple(processed),
-        tuple(already_hidden),
-        True,
-        True,
+    return FinishedDeletionResult(entry.generation_id, entry.issue_id, entry.issue_name, processed, already_hidden, True, True)
+
+
+@dataclass(frozen=True)
+class BulkDeletionFailure:
+    generation_id: str
+    issue_id: str
+    message: str
+
+
+@dataclass(frozen=True)
+class BulkDeletionResult:
+    deleted: tuple[FinishedDeletionResult, ...]
+    failures: tuple[BulkDeletionFailure, ...]
+    workers: int
+    elapsed_seconds: float
+
+    @property
+    def deletions_per_second(self) -> float:
+        return len(self.deleted) / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+
+ProgressCallback = Callable[[GeneratedIssue, str | None], None]
+
+
+def delete_finished_generations(
+    sessions: SessionPool,
+    store: ManifestStore,
+    *,
+    workers: int = DEFAULT_CLEANUP_WORKERS,
+    on_progress: ProgressCallback | None = None,
+) -> BulkDeletionResult:
+    """Clean up every manifest entry with one login per alias and one manifest write.
+
+    Entries are validated and every alias they need is logged in once before
+    anything is hidden; an entry whose alias cannot log in fails without any
+    delete. Generations are then hidden and confirmed by at most ``workers``
+    threads sharing the pool's sessions. Confirmed entries are removed from the
+    manifest in a single atomic write. ``on_progress`` receives each finished
+    entry with ``None`` or its failure message.
+    """
+
+    if workers < 1:
+        raise ScenarioLabError("cleanup workers must be at least 1")
+    started = perf_counter()
+    entries = store.list_entries()
+    failures: dict[str, str] = {}
+
+    def fail(entry: GeneratedIssue, message: str) -> None:
+        failures[entry.generation_id] = message
+        if on_progress is not None:
+            on_progress(entry, message)
+
+    ready: list[GeneratedIssue] = []
+    for entry in entries:
+        try:
+            _validate_entry(entry, sessions)
+        except ScenarioLabError as error:
+            fail(entry, str(error))
+        else:
+            ready.append(entry)
+
+    login_failures: dict[str, str] = {}
+    for alias in dict.fromkeys(alias for entry in ready for alias in _ordered_aliases(entry)):
+        try:
+            sessions.login(alias)
+        except ScenarioLabError as error:
+            login_failures[alias] = str(error)
+
+    runnable: list[GeneratedIssue] = []
+    for entry in ready:
+        failed_alias = next((alias for alias in _ordered_aliases(entry) if alias in login_failures), None)
+        if failed_alias is None:
+            runnable.append(entry)
+        else:
+            fail(entry, login_failures[failed_alias])
+
+    confirmed: dict[str, tuple[tuple[str, ...], tuple[str, ...]]] = {}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(_hide_and_confirm, sessions, entry): entry for entry in runnable}
+        for future in as_completed(futures):
+            entry = futures[future]
+            try:
+                confirmed[entry.generation_id] = future.result()
+            except ScenarioLabError as error:
+                fail(entry, str(error))
+            except Exception as error:
+                # Keep going so entries already deleted still leave the manifest.
+                fail(entry, f"unexpected {type(error).__name__} while deleting: {error}")
+            else:
+                if on_progress is not None:
+                    on_progress(entry, None)
+
+    deleted_entries = [entry for entry in runnable if entry.generation_id in confirmed]
+    try:
+        removed_ids = {entry.generation_id for entry in store.remove_many(confirmed)}
+    except ManifestError as error:
+        for entry in deleted_entries:
+            failures[entry.generation_id] = _manifest_remains_message(entry, store, error)
+        removed_ids = set()
+
+    deleted: list[FinishedDeletionResult] = []
+    for entry in deleted_entries:
+        if entry.generation_id not in removed_ids:
+            failures.setdefault(
+                entry.generation_id, f"Backend issue was permanently deleted but manifest entry could not be removed: {entry.generation_id}"
+            )
+            continue
+        processed, already_hidden = confirmed[entry.generation_id]
+        deleted.append(FinishedDeletionResult(entry.generation_id, entry.issue_id, entry.issue_name, processed, already_hidden, True, True))
+
+    return BulkDeletionResult(
+        tuple(deleted),
+        tuple(BulkDeletionFailure(entry.generation_id, entry.issue_id, failures[entry.generation_id]) for entry in entries if entry.generation_id in failures),
+        workers,
+        perf_counter() - started,
     )
@@ -1,18 +1,20 @@
 from __future__ import annotations
 
+from pathlib import Path
 from typing import Any
 
 import typer
 from rich.console import Console
+from rich.progress import Progress
 from rich.table import Table
 
 from issue_scenario_lab.api.client import ApiClient
 from issue_scenario_lab.api.session_pool import SessionPool
 from issue_scenario_lab.cleanup.active import delete_active_issue
-from issue_scenario_lab.cleanup.finished import delete_finished_generation
+from issue_scenario_lab.cleanup.finished import delete_finished_generation, delete_finished_generations
 from issue_scenario_lab.config import Settings
 from issue_scenario_lab.errors import ScenarioLabError
-from issue_scenario_lab.manifest.store import ManifestStore
+from issue_scenario_lab.manifest.sqlite_store import migrate_json_manifest, open_manifest_store
 from issue_scenario_lab.scenarios.consensus_first_round import SCENARIO_ID as CONSENSUS_FIRST_ROUND_SCENARIO_ID
 from issue_scenario_lab.scenarios.consensus_first_round import generate as generate_consensus_first_round
 from issue_scenario_lab.scenarios.consensus_later_round import SCENARIO_ID as CONSENSUS_LATER_ROUND_SCENARIO_ID
@@ -111,7 +113,7 @@ def list_generated() -> None:
     """List generated issues known to the minimal local manifest."""
 
     try:
-        entries = ManifestStore(_settings().manifest_file).list_entries()
+        entries = open_manifest_store(_settings().manifest_file).list_entries()
     except ScenarioLabError as error:
         _raise_cli_error(error)
     if not entries:
@@ -135,6 +137,19 @@ def _finished_result_output(result: Any) -> dict[str, Any]:
     }
 
 
+@app.command("migrate-manifest")
+def migrate_manifest(target: Path) -> None:
+    """Copy the configured JSON manifest into a new SQLite manifest (.sqlite, .sqlite3 or .db)."""
+
+    try:
+        source = _settings().manifest_file
+        count = migrate_json_manifest(source, target)
+    except ScenarioLabError as error:
+        _raise_cli_error(error)
+    console.print(f"Migrated {count} generated issues from {source} to {target}.")
+    console.print(f"Set SCENARIO_LAB_MANIFEST_FILE={target} to use it; {source} was left unchanged as a backup.")
+
+
 @app.command("delete")
 def delete(generation_id: str) -> None:
     """Hide and permanently remove one generated finished issue through the Backend."""
@@ -142,37 +157,50 @@ def delete(generation_id: str) -> None:
     try:
         settings = _settings()
         with SessionPool.from_settings(settings) as sessions:
-            result = delete_finished_generation(sessions, ManifestStore(settings.manifest_file), generation_id)
+            result = delete_finished_generation(sessions, open_manifest_store(settings.manifest_file), generation_id)
     except ScenarioLabError as error:
         _raise_cli_error(error)
     console.print(_finished_result_output(result))
 
 
 @app.command("delete-all")
-def delete_all() -> None:
-    """Sequentially clean up every generated finished issue in the local manifest."""
+def delete_all(
+    workers: int | None = typer.Option(None, "--workers", min=1, help="Concurrent cleanups (default: SCENARIO_LAB_CLEANUP_WORKERS)."),
+) -> None:
+    """Concurrently clean up every generated finished issue in the local manifest."""
 
     try:
         settings = _settings()
-        store = ManifestStore(settings.manifest_file)
+        store = open_manifest_store(settings.manifest_file)
         entries = list(store.list_entries())
     except ScenarioLabError as error:
         _raise_cli_error(error)
     if not entries:
         console.print("No generated issues are recorded in the local manifest.")
         return
+    try:
+        with SessionPool.from_settings(settings) as sessions, Progress(console=console, transient=True) as progress:
+            task = progress.add_task("Deleting generated issues", total=len(entries))
+            summary = delete_finished_generations(
+                sessions,
+                store,
+                workers=workers or settings.cleanup_workers,
+                on_progress=lambda *_: progress.advance(task),
+            )
+    except ScenarioLabError as error:
+        _raise_cli_error(error)
+
     table = Table("Generation ID", "Issue ID", "Status", "Message")
-    failures = 0
-    for entry in entries:
-        try:
-            with SessionPool.from_settings(settings) as sessions:
-                result = delete_finished_generation(sessions, store, entry.generation_id)
-            table.add_row(result.generation_id, result.issue_id, "[green]deleted[/green]", "permanent deletion confirmed")
-        except ScenarioLabError as error:
-            failures += 1
-            table.add_row(entry.generation_id, entry.issue_id, "[red]failed[/red]", str(error))
+    for result in summary.deleted:
+        table.add_row(result.generation_id, result.issue_id, "[green]deleted[/green]", "permanent deletion confirmed")
+    for failure in summary.failures:
+        table.add_row(failure.generation_id, failure.issue_id, "[red]failed[/red]", failure.message)
     console.print(table)
-    if failures:
+    console.print(
+        f"Deleted {len(summary.deleted)} of {len(entries)} generated issues in {summary.elapsed_seconds:.1f} s "
+        f"({summary.deletions_per_second:.2f}/s, {summary.workers} workers); {len(summary.failures)} failed."
+    )
+    if summary.failures:
         raise typer.Exit(code=1)
 
 
@@ -209,7 +237,7 @@ def recover_finished(
         with SessionPool.from_settings(settings) as sessions:
             result = recover_consensus_max_rounds_finished(
                 sessions,
-                ManifestStore(settings.manifest_file),
+                open_manifest_store(settings.manifest_file),
                 generation_id=generation_id,
                 issue_id=issue_id,
                 owner_alias=owner_alias,
@@ -296,7 +324,7 @@ def generate(
         settings = _settings()
         with SessionPool.from_settings(settings) as sessions:
             kwargs = ({"owner_alias": "owner"} if scenario_id == TOPSIS_2TUPLE_GREECE_SCENARIO_ID else {"owner_alias": owner_alias, "expert_a_alias": expert_a_alias, "expert_b_alias": expert_b_alias})
-            result = selected[0](sessions, ManifestStore(settings.manifest_file), **kwargs)
+            result = selected[0](sessions, open_manifest_store(settings.manifest_file), **kwargs)
     except ScenarioLabError as error:
         _raise_cli_error(error)
     console.print(
@@ -39,6 +39,7 @@ class Settings(BaseSettings):
     users_file: Path = Path("users.local.yaml")
     manifest_file: Path = Path(".issue-scenario-lab/manifest.json")
     request_timeout_seconds: float = Field(default=15, gt=0, le=120)
+    cleanup_workers: int = Field(default=4, ge=1, le=32)
     verify_tls: bool = True
     allow_non_localhost: bool = False
 
@@ -64,6 +65,7 @@ class Settings(BaseSettings):
             "Users file": str(self.users_file),
             "Manifest file": str(self.manifest_file),
             "Request timeout (seconds)": self.request_timeout_seconds,
+            "Cleanup workers": self.cleanup_workers,
             "Verify TLS": self.verify_tls,
         }
 
@@ -1,4 +1,5 @@
 from issue_scenario_lab.manifest.models import GeneratedIssue, Manifest
+from issue_scenario_lab.manifest.sqlite_store import SqliteManifestStore, migrate_json_manifest, open_manifest_store
 from issue_scenario_lab.manifest.store import ManifestStore
 
-__all__ = ["GeneratedIssue", "Manifest", "ManifestStore"]
+__all__ = ["GeneratedIssue", "Manifest", "ManifestStore", "SqliteManifestStore", "migrate_json_manifest", "open_manifest_store"]
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from collections.abc import Iterable, Iterator
+from contextlib import closing, contextmanager
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from issue_scenario_lab.errors import ManifestError
+from issue_scenario_lab.manifest.models import GeneratedIssue, Manifest
+from issue_scenario_lab.manifest.store import ManifestStore
+
+SQLITE_SUFFIXES = frozenset({".sqlite", ".sqlite3", ".db"})
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS generated_issues (
+    position INTEGER PRIMARY KEY AUTOINCREMENT,
+    generation_id TEXT NOT NULL UNIQUE,
+    scenario_id TEXT NOT NULL,
+    issue_id TEXT NOT NULL,
+    issue_name TEXT NOT NULL,
+    owner_alias TEXT NOT NULL,
+    visible_user_aliases TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS generated_issues_issue_id ON generated_issues (issue_id);
+"""
+_COLUMNS = "generation_id, scenario_id, issue_id, issue_name, owner_alias, visible_user_aliases"
+
+
+def _row(entry: GeneratedIssue) -> tuple[str, ...]:
+    return (
+        entry.generation_id,
+        entry.scenario_id,
+        entry.issue_id,
+        entry.issue_name,
+        entry.owner_alias,
+        json.dumps(entry.visible_user_aliases, ensure_ascii=False),
+    )
+
+
+class SqliteManifestStore(ManifestStore):
+    """Indexed SQLite storage with the same interface as the JSON manifest.
+
+    ``generationId`` is unique and ``issueId`` is indexed, so lookups and
+    single-entry writes no longer load or rewrite the whole manifest.
+    ``add_many`` and ``remove_many`` run in one transaction each. Entries keep
+    insertion order.
+    """
+
+    def __init__(self, path: Path) -> None:
+        super().__init__(path)
+        self._schema_ready = False
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """One short-lived connection; the ``with`` body is a single transaction."""
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with closing(sqlite3.connect(self.path, timeout=30)) as connection:
+                if not self._schema_ready:
+                    with connection:
+                        connection.executescript(_SCHEMA)
+                        connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+                    self._schema_ready = True
+                with connection:
+                    yield connection
+        except sqlite3.Error as error:
+            raise ManifestError(f"could not use manifest database: {self.path}: {error}") from error
+
+    def _entries(self, rows: Iterable[tuple[str, ...]]) -> list[GeneratedIssue]:
+        entries = []
+        for generation_id, scenario_id, issue_id, issue_name, owner_alias, aliases in rows:
+            try:
+                entries.append(
+                    GeneratedIssue(
+                        generationId=generation_id,
+                        scenarioId=scenario_id,
+                        issueId=issue_id,
+                        issueName=issue_name,
+                        ownerAlias=owner_alias,
+                        visibleUserAliases=json.loads(aliases),
+                    )
+                )
+            except (ValidationError, ValueError) as error:
+                raise ManifestError(f"manifest database has an invalid entry {generation_id}: {self.path}: {error}") from error
+        return entries
+
+    def load(self) -> Manifest:
+        return Manifest(generatedIssues=self.list_entries())
+
+    def list_entries(self) -> list[GeneratedIssue]:
+        if not self.path.exists():
+            return []
+        with self._connect() as connection:
+            return self._entries(connection.execute(f"SELECT {_COLUMNS} FROM generated_issues ORDER BY position"))
+
+    def find(self, generation_id: str) -> GeneratedIssue | None:
+        if not self.path.exists():
+            return None
+        with self._connect() as connection:
+            rows = connection.execute(f"SELECT {_COLUMNS} FROM generated_issues WHERE generation_id = ?", (generation_id,))
+            return next(iter(self._entries(rows)), None)
+
+    def find_by_issue_id(self, issue_id: str) -> list[GeneratedIssue]:
+        if not self.path.exists():
+            return []
+        with self._connect() as connection:
+            rows = connection.execute(f"SELECT {_COLUMNS} FROM generated_issues WHERE issue_id = ? ORDER BY position", (issue_id,))
+            return self._entries(rows)
+
+    def add_many(self, entries: Iterable[GeneratedIssue]) -> None:
+        entries = list(entries)
+        seen: set[str] = set()
+        for entry in entries:
+            if entry.generation_id in seen:
+                raise ManifestError(f"duplicate generationId: {entry.generation_id}")
+            seen.add(entry.generation_id)
+        with self._connect() as connection:
+            for entry in entries:
+                try:
+                    connection.execute(f"INSERT INTO generated_issues ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?)", _row(entry))
+                except sqlite3.IntegrityError as error:
+                    raise ManifestError(f"duplicate generationId: {entry.generation_id}") from error
+
+    def remove_many(self, generation_ids: Iterable[str]) -> list[GeneratedIssue]:
+        targets = [(generation_id,) for generation_id in dict.fromkeys(generation_ids)]
+        if not targets or not self.path.exists():
+            return []
+        with self._connect() as connection:
+            rows = [
+                row
+                for target in targets
+                for row in connection.execute(f"SELECT position, {_COLUMNS} FROM generated_issues WHERE generation_id = ?", target)
+            ]
+            connection.executemany("DELETE FROM generated_issues WHERE generation_id = ?", targets)
+        return self._entries(row[1:] for row in sorted(rows))
+
+
+def open_manifest_store(path: Path) -> ManifestStore:
+    """Pick the SQLite store for ``.sqlite``/``.sqlite3``/``.db`` paths and the JSON store otherwise."""
+
+    if path.suffix.lower() in SQLITE_SUFFIXES:
+        return SqliteManifestStore(path)
+    return ManifestStore(path)
+
+
+def migrate_json_manifest(source: Path, target: Path) -> int:
+    """Copy a JSON manifest into an empty SQLite manifest in one transaction.
+
+    The JSON file is left untouched so it can be kept as a backup. Returns the
+    number of migrated entries.
+    """
+
+    if target.suffix.lower() not in SQLITE_SUFFIXES:
+        raise ManifestError(f"migration target must be a SQLite file ({', '.join(sorted(SQLITE_SUFFIXES))}): {target}")
+    entries = ManifestStore(source).list_entries()
+    store = SqliteManifestStore(target)
+    if store.list_entries():
+        raise ManifestError(f"refusing to migrate into a non-empty manifest database: {target}")
+    store.add_many(entries)
+    return len(entries)
@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 import os
 import tempfile
+from collections.abc import Iterable
 from pathlib import Path
 
 from pydantic import ValidationError
@@ -51,19 +52,36 @@ class ManifestStore:
     def find(self, generation_id: str) -> GeneratedIssue | None:
         return next((entry for entry in self.list_entries() if entry.generation_id == generation_id), None)
 
+    def find_by_issue_id(self, issue_id: str) -> list[GeneratedIssue]:
+        return [entry for entry in self.list_entries() if entry.issue_id == issue_id]
+
     def add(self, entry: GeneratedIssue) -> None:
+        self.add_many([entry])
+
+    def add_many(self, entries: Iterable[GeneratedIssue]) -> None:
+        """Append several entries with a single load and a single atomic write."""
+
         manifest = self.load()
-        if any(existing.generation_id == entry.generation_id for existing in manifest.generated_issues):
-            raise ManifestError(f"duplicate generationId: {entry.generation_id}")
-        manifest.generated_issues.append(entry)
+        known = {existing.generation_id for existing in manifest.generated_issues}
+        for entry in entries:
+            if entry.generation_id in known:
+                raise ManifestError(f"duplicate generationId: {entry.generation_id}")
+            known.add(entry.generation_id)
+            manifest.generated_issues.append(entry)
         self._write(manifest)
 
     def remove(self, generation_id: str) -> GeneratedIssue | None:
+        removed = self.remove_many([generation_id])
+        return removed[0] if removed else None
+
+    def remove_many(self, generation_ids: Iterable[str]) -> list[GeneratedIssue]:
+        """Remove several entries with a single load and a single atomic write."""
+
+        targets = set(generation_ids)
         manifest = self.load()
-        remaining = [entry for entry in manifest.generated_issues if entry.generation_id != generation_id]
-        if len(remaining) == len(manifest.generated_issues):
-            return None
-        removed = next(entry for entry in manifest.generated_issues if entry.generation_id == generation_id)
-        manifest.generated_issues = remaining
+        removed = [entry for entry in manifest.generated_issues if entry.generation_id in targets]
+        if not removed:
+            return []
+        manifest.generated_issues = [entry for entry in manifest.generated_issues if entry.generation_id not in targets]
         self._write(manifest)
         return removed
@@ -8,8 +8,9 @@ import pytest
 from typer.testing import CliRunner
 
 from issue_scenario_lab.api.issues import IssuesApi
+from issue_scenario_lab.cleanup import finished as finished_module
 from issue_scenario_lab.cleanup.active import ActiveDeletionResult, delete_active_issue
-from issue_scenario_lab.cleanup.finished import FinishedDeletionResult, delete_finished_generation
+from issue_scenario_lab.cleanup.finished import FinishedDeletionResult, delete_finished_generation, delete_finished_generations
 from issue_scenario_lab.config import UserCredentials
 from issue_scenario_lab.errors import ApiClientError, ManifestError, ScenarioLabError
 from issue_scenario_lab.manifest.models import GeneratedIssue
@@ -25,6 +26,14 @@ ENTRY = GeneratedIssue(
     ownerAlias="owner",
     visibleUserAliases=["owner", "expert_a", "expert_b"],
 )
+UNCONFIGURED = ENTRY.model_copy(
+    update={
+        "generation_id": "gen-two",
+        "issue_id": "issue-two",
+        "issue_name": "[AUTO:gen-two] No consensus · basic",
+        "visible_user_aliases": ["owner", "ghost"],
+    }
+)
 
 
 class RecordingClient:
@@ -241,26 +250,75 @@ def test_cli_commands_invoke_cleanup_services(monkeypatch: pytest.MonkeyPatch, t
 def test_delete_all_has_friendly_empty_state_and_continues_after_failure(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
     from issue_scenario_lab import cli
 
-    settings = SimpleNamespace(manifest_file=tmp_path / "manifest.json")
+    settings = SimpleNamespace(manifest_file=tmp_path / "manifest.json", cleanup_workers=2)
+    sessions = FakeSessions()
     monkeypatch.setattr(cli, "_settings", lambda: settings)
-    monkeypatch.setattr("issue_scenario_lab.cli.SessionPool.from_settings", lambda _: FakeSessions())
+    monkeypatch.setattr("issue_scenario_lab.cli.SessionPool.from_settings", lambda _: sessions)
     runner = CliRunner()
     empty = runner.invoke(cli.app, ["delete-all"])
     assert empty.exit_code == 0
     assert "No generated issues" in empty.output
 
     store = store_with_entry(tmp_path)
-    second = ENTRY.model_copy(update={"generation_id": "gen-two", "issue_id": "issue-two", "issue_name": "[AUTO:gen-two] No consensus · basic"})
-    store.add(second)
-    calls: list[str] = []
-
-    def cleanup(_sessions: Any, _store: Any, generation_id: str) -> FinishedDeletionResult:
-        calls.append(generation_id)
-        if generation_id == ENTRY.generation_id:
-            raise ScenarioLabError("safe failure")
-        return FinishedDeletionResult(generation_id, "issue-two", second.issue_name, (), (), True, True)
-
-    monkeypatch.setattr(cli, "delete_finished_generation", cleanup)
+    store.add(UNCONFIGURED)
     result = runner.invoke(cli.app, ["delete-all"])
     assert result.exit_code == 1
-    assert calls == [ENTRY.generation_id, second.generation_id]
+    assert "Deleted 1 of 2 generated issues" in result.output
+    assert "2 workers" in result.output
+    assert [entry.generation_id for entry in store.list_entries()] == [UNCONFIGURED.generation_id]
+
+
+def test_bulk_cleanup_logs_in_each_alias_once_and_writes_the_manifest_once(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    sessions = FakeSessions()
+    store = store_with_entry(tmp_path)
+    store.add(UNCONFIGURED)
+    writes: list[int] = []
+    original_write = store._write
+    monkeypatch.setattr(store, "_write", lambda manifest: (writes.append(len(manifest.generated_issues)), original_write(manifest)))
+    progress: list[tuple[str, str | None]] = []
+
+    result = delete_finished_generations(sessions, store, workers=4, on_progress=lambda entry, error: progress.append((entry.generation_id, error)))
+
+    logins = [alias for alias, method, _ in sessions.state["calls"] if method == "LOGIN"]
+    assert sorted(logins) == ["expert_a", "expert_b", "owner"]
+    assert writes == [1]
+    assert [item.generation_id for item in result.deleted] == [ENTRY.generation_id]
+    assert result.deleted[0].processed_aliases == ("expert_a", "expert_b", "owner")
+    assert [(item.generation_id, "unconfigured aliases" in item.message) for item in result.failures] == [(UNCONFIGURED.generation_id, True)]
+    assert sorted(generation_id for generation_id, _ in progress) == sorted([ENTRY.generation_id, UNCONFIGURED.generation_id])
+    assert result.workers == 4 and result.deletions_per_second > 0
+
+
+def test_bulk_cleanup_login_failure_and_manifest_failure_are_reported(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    sessions = FakeSessions()
+    sessions.state["login_failures"] = {"expert_b"}
+    result = delete_finished_generations(sessions, store_with_entry(tmp_path), workers=2)
+    assert not result.deleted
+    assert "login failed for expert_b" in result.failures[0].message
+    assert not any(method == "DELETE" for _, method, _ in sessions.state["calls"])
+
+    store = store_with_entry(tmp_path / "write")
+    monkeypatch.setattr(store, "remove_many", lambda _: (_ for _ in ()).throw(ManifestError("disk failed")))
+    result = delete_finished_generations(FakeSessions(), store, workers=2)
+    assert not result.deleted
+    assert "Backend issue was permanently deleted but manifest entry remains" in result.failures[0].message
+
+
+def test_bulk_cleanup_unexpected_worker_error_still_removes_deleted_entries(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    broken = ENTRY.model_copy(update={"generation_id": "gen-broken", "issue_id": "issue-broken", "issue_name": "[AUTO:gen-broken] No consensus · basic"})
+    store = store_with_entry(tmp_path)
+    store.add(broken)
+    original = finished_module._hide_and_confirm
+
+    def hide_and_confirm(sessions: Any, entry: GeneratedIssue) -> Any:
+        if entry.generation_id == broken.generation_id:
+            raise KeyError("issueName")
+        return original(sessions, entry)
+
+    monkeypatch.setattr(finished_module, "_hide_and_confirm", hide_and_confirm)
+
+    result = delete_finished_generations(FakeSessions(), store, workers=2)
+
+    assert [item.generation_id for item in result.deleted] == [ENTRY.generation_id]
+    assert [(item.generation_id, "unexpected KeyError" in item.message) for item in result.failures] == [(broken.generation_id, True)]
+    assert [entry.generation_id for entry in store.list_entries()] == [broken.generation_id]
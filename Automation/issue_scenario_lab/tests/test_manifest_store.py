@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import sqlite3
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
+from typer.testing import CliRunner
 
 from issue_scenario_lab.errors import ManifestError
 from issue_scenario_lab.manifest.models import GeneratedIssue
+from issue_scenario_lab.manifest.sqlite_store import SqliteManifestStore, migrate_json_manifest, open_manifest_store
 from issue_scenario_lab.manifest.store import ManifestStore
 
 
@@ -49,3 +53,84 @@ def test_manifest_rejects_invalid_structure(tmp_path: Path) -> None:
     path.write_text('{"generatedIssues": [{"generationId": "only-id"}]}', encoding="utf-8")
     with pytest.raises(ManifestError, match="invalid structure"):
         ManifestStore(path).load()
+
+
+def test_remove_many_rewrites_the_manifest_once(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    store = ManifestStore(tmp_path / "manifest.json")
+    for generation_id in ("one", "two", "three"):
+        store.add(entry(generation_id))
+    writes: list[int] = []
+    original_write = store._write
+    monkeypatch.setattr(store, "_write", lambda manifest: (writes.append(1), original_write(manifest)))
+    removed = store.remove_many(["three", "one", "missing"])
+    assert [item.generation_id for item in removed] == ["one", "three"]
+    assert [item.generation_id for item in store.list_entries()] == ["two"]
+    assert writes == [1]
+    assert store.remove_many(["missing"]) == [] and writes == [1]
+
+
+def test_sqlite_store_indexes_lookups_and_keeps_insertion_order(tmp_path: Path) -> None:
+    path = tmp_path / ".issue-scenario-lab" / "manifest.sqlite"
+    store = open_manifest_store(path)
+    assert isinstance(store, SqliteManifestStore)
+    assert store.list_entries() == [] and store.find("abc123") is None
+    store.add_many([entry("two"), entry("one")])
+    store.add(entry("three"))
+    assert [item.generation_id for item in store.list_entries()] == ["two", "one", "three"]
+    assert store.find("one") == entry("one")
+    assert [item.generation_id for item in store.find_by_issue_id("issue-1")] == ["two", "one", "three"]
+    assert store.remove("one") == entry("one") and store.remove("one") is None
+    assert [item.generation_id for item in store.remove_many(["three", "two", "missing"])] == ["two", "three"]
+    assert store.load().generated_issues == []
+    with sqlite3.connect(path) as connection:
+        indexes = {row[1] for row in connection.execute("PRAGMA index_list(generated_issues)")}
+    assert "generated_issues_issue_id" in indexes
+
+
+def test_sqlite_add_many_is_one_transaction_and_rejects_duplicates(tmp_path: Path) -> None:
+    store = SqliteManifestStore(tmp_path / "manifest.db")
+    store.add(entry("one"))
+    with pytest.raises(ManifestError, match="duplicate generationId: one"):
+        store.add_many([entry("two"), entry("one")])
+    with pytest.raises(ManifestError, match="duplicate generationId: three"):
+        store.add_many([entry("three"), entry("three")])
+    assert [item.generation_id for item in store.list_entries()] == ["one"]
+
+
+def test_sqlite_store_reports_corrupted_database_and_entries(tmp_path: Path) -> None:
+    path = tmp_path / "manifest.sqlite"
+    path.write_text("not a database", encoding="utf-8")
+    with pytest.raises(ManifestError, match="could not use manifest database"):
+        SqliteManifestStore(path).list_entries()
+
+    store = SqliteManifestStore(tmp_path / "valid.sqlite")
+    store.add(entry())
+    with sqlite3.connect(store.path) as connection:
+        connection.execute("UPDATE generated_issues SET visible_user_aliases = '[]'")
+    with pytest.raises(ManifestError, match="invalid entry abc123"):
+        store.find("abc123")
+
+
+def test_json_manifest_migrates_into_an_empty_sqlite_store_only(tmp_path: Path) -> None:
+    source = ManifestStore(tmp_path / "manifest.json")
+    source.add_many([entry("one"), entry("two")])
+    target = tmp_path / "manifest.sqlite"
+    assert migrate_json_manifest(source.path, target) == 2
+    assert SqliteManifestStore(target).list_entries() == source.list_entries()
+    assert len(source.list_entries()) == 2
+    with pytest.raises(ManifestError, match="non-empty"):
+        migrate_json_manifest(source.path, target)
+    with pytest.raises(ManifestError, match="must be a SQLite file"):
+        migrate_json_manifest(source.path, tmp_path / "copy.json")
+
+
+def test_cli_migrates_the_configured_manifest(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    from issue_scenario_lab import cli
+
+    ManifestStore(tmp_path / "manifest.json").add(entry())
+    monkeypatch.setattr(cli, "_settings", lambda: SimpleNamespace(manifest_file=tmp_path / "manifest.json"))
+    target = tmp_path / "manifest.sqlite"
+    result = CliRunner().invoke(cli.app, ["migrate-manifest", str(target)])
+    assert result.exit_code == 0
+    assert "Migrated 1 generated issues" in result.output
+    assert SqliteManifestStore(target).find("abc123") == entry()
@@ -2,8 +2,9 @@ from datetime import datetime, timezone
 
 from fastapi import APIRouter
 
-from registry.model_registry import get_model_definitions
+from registry.model_registry import get_model_definitions, get_model_registry_stats
 from schemas.common import ModelExecutionResponse
+from services.model_executors.execution import get_model_execution_backend
 
 router = APIRouter(tags=["Health"])
 STARTED_AT = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
@@ -30,6 +31,8 @@ async def get_health():
             "status": "healthy",
             "modelsCount": len(model_definitions),
             "startedAt": STARTED_AT,
+            "modelRegistry": get_model_registry_stats(),
+            "modelExecution": get_model_execution_backend().stats(),
         },
         "error": None,
     }
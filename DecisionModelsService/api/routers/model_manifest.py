@@ -1,11 +1,22 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Header, Query
+from fastapi.responses import Response
 
 from schemas.model_manifest import ModelManifestResponse
-from services.model_manifest_service import build_model_manifest
+from services.model_manifest_service import get_serialized_model_manifest
 
 router = APIRouter(tags=["Model Manifest"])
 
 
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Comparación débil de ``If-None-Match`` (RFC 9110), con soporte de ``*``."""
+
+    for candidate in str(if_none_match or "").split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
 @router.get(
     "/models/manifest",
     response_model=ModelManifestResponse,
@@ -13,14 +24,30 @@ router = APIRouter(tags=["Model Manifest"])
     summary="Get model manifest",
     description=(
         "Devuelve el manifest técnico read-only de modelos publicados por "
-        "DecisionModelsService."
+        "DecisionModelsService. La respuesta lleva un `ETag` fuerte que solo "
+        "cambia con las definiciones publicadas; con `If-None-Match` se "
+        "responde `304` sin cuerpo si el manifest no ha cambiado."
     ),
+    responses={304: {"description": "El manifest no ha cambiado desde el ETag indicado."}},
 )
-async def get_model_manifest():
+async def get_model_manifest(
+    include_examples: bool = Query(
+        True,
+        alias="includeExamples",
+        description=(
+            "Con `false` se omiten los ejemplos de request y response y solo "
+            "quedan los metadatos y capacidades de cada modelo."
+        ),
+    ),
+    if_none_match: str | None = Header(None),
+):
     """Devuelve el manifest técnico sin ejecutar modelos ni consultar servicios externos."""
 
-    return {
-        "success": True,
-        "message": "Model manifest fetched successfully",
-        "data": build_model_manifest(),
-    }
+    manifest = get_serialized_model_manifest(include_examples=include_examples)
+    # no-cache: los clientes pueden guardarlo, pero deben revalidar con el ETag.
+    headers = {"ETag": manifest.etag, "Cache-Control": "no-cache"}
+
+    if _etag_matches(if_none_match, manifest.etag):
+        return Response(status_code=304, headers=headers)
+
+    return Response(content=manifest.body, media_type="application/json", headers=headers)
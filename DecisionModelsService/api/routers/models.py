@@ -1,19 +1,38 @@
-from inspect import Parameter, Signature, isawaitable
+from inspect import Parameter, Signature
+from typing import Any
 
-from fastapi import APIRouter, Body
+from fastapi import APIRouter, Body, Query
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import ValidationError
 
 from registry.model_definition import ModelDefinition
 from registry.model_registry import (
     get_model_definition_by_endpoint_path,
+    get_model_definition_by_key,
     get_model_definitions,
 )
 from schemas.common import ModelExecutionResponse
+from services.model_executors.batch import get_max_batch_size, stream_batch_execution
+from services.model_executors.execution import (
+    ModelExecutionInterruptedError,
+    ModelExecutionSaturatedError,
+    ModelExecutionTimeoutError,
+    get_model_execution_backend,
+)
+from services.model_executors.serialization import (
+    RawOutputMode,
+    model_execution_response,
+)
 
 router = APIRouter(tags=["Decision Models"])
 
+RAW_OUTPUT_QUERY_DESCRIPTION = (
+    "`include` (por defecto) devuelve `data.rawOutput` completo, `omit` lo "
+    "elimina y `gzip` lo sustituye por su JSON comprimido en base64 "
+    "(`data.rawOutputEncoding: gzip+base64`)."
+)
+
 
 def _build_responses() -> dict[int, dict[str, object]]:
     return {
@@ -43,6 +62,14 @@ def _build_responses() -> dict[int, dict[str, object]]:
                 }
             },
         },
+        503: {
+            "description": (
+                "La cola de ejecución del modelo está llena; reintentar más tarde."
+            ),
+        },
+        504: {
+            "description": "La ejecución del modelo superó el tiempo máximo permitido.",
+        },
     }
 
 
@@ -61,23 +88,83 @@ def _build_model_responses(model: ModelDefinition) -> dict[int, dict[str, object
 
 
 async def _execute_model_definition(
-    model: ModelDefinition, raw_payload: dict
-) -> dict | JSONResponse:
+    model: ModelDefinition,
+    raw_payload: dict,
+    raw_output: RawOutputMode = "include",
+) -> JSONResponse:
     try:
         payload = model.request_model.model_validate(raw_payload)
     except ValidationError as exc:
         raise RequestValidationError(exc.errors()) from exc
 
-    result = model.handler(payload)
-    if isawaitable(result):
-        result = await result
+    # La salida de los handlers ya cumple el contrato: se serializa sin
+    # revalidarla contra ModelExecutionResponse (que solo documenta la ruta).
+    return model_execution_response(
+        await _execute_validated_payload(model, payload),
+        raw_output,
+    )
+
 
-    return result
+async def _execute_validated_payload(
+    model: ModelDefinition, payload: Any
+) -> dict | JSONResponse:
+    try:
+        return await get_model_execution_backend().execute(model, payload)
+    except ModelExecutionSaturatedError as exc:
+        return JSONResponse(
+            status_code=503,
+            headers={"Retry-After": "1"},
+            content={
+                "success": False,
+                "message": "Model execution capacity exhausted.",
+                "data": None,
+                "error": {
+                    "code": "MODEL_EXECUTION_SATURATED",
+                    "field": None,
+                    "details": {
+                        "apiModelKey": exc.api_model_key,
+                        "maxQueueDepth": exc.max_queue_depth,
+                    },
+                },
+            },
+        )
+    except ModelExecutionInterruptedError as exc:
+        return JSONResponse(
+            status_code=503,
+            headers={"Retry-After": "1"},
+            content={
+                "success": False,
+                "message": "Model execution was interrupted.",
+                "data": None,
+                "error": {
+                    "code": "MODEL_EXECUTION_INTERRUPTED",
+                    "field": None,
+                    "details": {"apiModelKey": exc.api_model_key},
+                },
+            },
+        )
+    except ModelExecutionTimeoutError as exc:
+        return JSONResponse(
+            status_code=504,
+            content={
+                "success": False,
+                "message": "Model execution timed out.",
+                "data": None,
+                "error": {
+                    "code": "MODEL_EXECUTION_TIMEOUT",
+                    "field": None,
+                    "details": {
+                        "apiModelKey": exc.api_model_key,
+                        "timeoutSeconds": exc.timeout_seconds,
+                    },
+                },
+            },
+        )
 
 
 def _create_explicit_model_endpoint(model: ModelDefinition):
-    async def execute_registered_model(raw_payload):
-        return await _execute_model_definition(model, raw_payload)
+    async def execute_registered_model(raw_payload, raw_output="include"):
+        return await _execute_model_definition(model, raw_payload, raw_output)
 
     execute_registered_model.__name__ = f"execute_{model.api_model_key.replace('-', '_')}"
     execute_registered_model.__doc__ = model.extended_description or model.small_description
@@ -88,7 +175,17 @@ def _create_explicit_model_endpoint(model: ModelDefinition):
                 kind=Parameter.POSITIONAL_OR_KEYWORD,
                 annotation=model.request_model,
                 default=Body(..., openapi_examples=model.request_examples or None),
-            )
+            ),
+            Parameter(
+                "raw_output",
+                kind=Parameter.POSITIONAL_OR_KEYWORD,
+                annotation=RawOutputMode,
+                default=Query(
+                    "include",
+                    alias="rawOutput",
+                    description=RAW_OUTPUT_QUERY_DESCRIPTION,
+                ),
+            ),
         ],
         return_annotation=ModelExecutionResponse,
     )
@@ -114,6 +211,89 @@ def _register_explicit_model_routes() -> None:
 _register_explicit_model_routes()
 
 
+def _batch_error(status_code: int, message: str, code: str, field: str | None, details):
+    return JSONResponse(
+        status_code=status_code,
+        content={
+            "success": False,
+            "message": message,
+            "data": None,
+            "error": {
+                "code": code,
+                "field": field,
+                "details": details,
+            },
+        },
+    )
+
+
+@router.post(
+    "/models/{api_model_key}/batch",
+    summary="Execute a decision model over many payloads",
+    description=(
+        "Valida en una pasada una lista de payloads para el mismo modelo, los "
+        "ejecuta concurrentemente en el pool del modelo y devuelve NDJSON: una "
+        "línea `result` por ítem (con `index`, `statusCode` y el sobre estándar "
+        "`success`, `message`, `data`, `error`) según terminan, y una línea "
+        "final `summary`."
+    ),
+    responses={
+        200: {"content": {"application/x-ndjson": {}}},
+        404: {"description": "El modelo solicitado no existe o no está disponible."},
+        422: {"description": "El cuerpo no contiene una lista `payloads` válida."},
+    },
+)
+async def execute_model_batch(
+    api_model_key: str,
+    body: dict[str, Any] = Body(...),
+    raw_output: RawOutputMode = Query(
+        "include",
+        alias="rawOutput",
+        description=RAW_OUTPUT_QUERY_DESCRIPTION,
+    ),
+):
+    model = get_model_definition_by_key(api_model_key)
+
+    if model is None:
+        return _batch_error(
+            404,
+            "Model not found.",
+            "MODEL_NOT_FOUND",
+            "api_model_key",
+            {"apiModelKey": api_model_key},
+        )
+
+    payloads = body.get("payloads")
+    if not isinstance(payloads, list) or len(payloads) == 0:
+        return _batch_error(
+            422,
+            "payloads must be a non-empty list.",
+            "VALIDATION_ERROR",
+            "payloads",
+            None,
+        )
+
+    max_batch_size = get_max_batch_size()
+    if len(payloads) > max_batch_size:
+        return _batch_error(
+            422,
+            f"payloads exceeds the maximum batch size of {max_batch_size}.",
+            "BATCH_TOO_LARGE",
+            "payloads",
+            {"maxBatchSize": max_batch_size, "received": len(payloads)},
+        )
+
+    return StreamingResponse(
+        stream_batch_execution(
+            model,
+            payloads,
+            _execute_validated_payload,
+            raw_output=raw_output,
+        ),
+        media_type="application/x-ndjson",
+    )
+
+
 @router.post(
     "/{model_path:path}",
     response_model=ModelExecutionResponse,
@@ -129,6 +309,11 @@ _register_explicit_model_routes()
 async def execute_dynamic_model(
     model_path: str,
     raw_payload: dict = Body(...),
+    raw_output: RawOutputMode = Query(
+        "include",
+        alias="rawOutput",
+        description=RAW_OUTPUT_QUERY_DESCRIPTION,
+    ),
 ):
     endpoint_path = "/" + str(model_path or "").strip("/")
     model = get_model_definition_by_endpoint_path(endpoint_path)
@@ -150,4 +335,4 @@ async def execute_dynamic_model(
             },
         )
 
-    return await _execute_model_definition(model, raw_payload)
+    return await _execute_model_definition(model, raw_payload, raw_output)
@@ -1,27 +1,158 @@
-from typing import Any
+from itertools import chain
+from typing import Any, Callable, Iterator
 
-from fastapi import APIRouter, Body
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Body, Request, Response, status
+from fastapi.responses import JSONResponse, StreamingResponse
 
+from core.environment import is_production_environment
 from schemas.common import ModelExecutionResponse
 from services.results_analysis.contexts import build_generic_issue_context, build_model_issue_context
+from services.results_analysis.cache import (
+    GENERIC_ANALYSIS_SCOPE,
+    analysis_cache_key,
+    analysis_package_version,
+    get_analysis_result_cache,
+)
 from services.results_analysis.contracts import normalize_analysis_result
-from services.results_analysis.generic_analysis import analyze_issue
+from services.results_analysis.generic_analysis import analyze_issue, stream_issue
 from services.results_analysis.model_analysis import load_model_analysis_handlers
+from services.results_analysis.streaming import (
+    AnalysisPart,
+    document_parts,
+    requested_stream_format,
+    stream_analysis,
+    stream_media_type,
+)
 
 router = APIRouter(tags=["Results Analysis"])
 
+ANALYSIS_CACHE_HEADER = "X-Analysis-Cache"
+ANALYSIS_CACHE_TIER_HEADER = "X-Analysis-Cache-Tier"
+ANALYSIS_CACHE_KEY_HEADER = "X-Analysis-Cache-Key"
+
+GENERIC_ANALYSIS_MESSAGE = "Generic issue analysis completed successfully"
+MODEL_ANALYSIS_MESSAGE = "Model issue analysis completed successfully"
+
+
+def _refresh_requested(request: Request | None) -> bool:
+    cache_control = request.headers.get("cache-control", "") if request is not None else ""
+    return "no-cache" in cache_control.lower()
+
+
+def _stream_format(request: Request | None) -> str | None:
+    return requested_stream_format(request.headers.get("accept")) if request is not None else None
+
+
+def _cache_headers(key: str, status: str, tier: str | None) -> dict[str, str]:
+    headers = {ANALYSIS_CACHE_HEADER: status, ANALYSIS_CACHE_KEY_HEADER: key}
+    if tier is not None:
+        headers[ANALYSIS_CACHE_TIER_HEADER] = tier
+    return headers
+
+
+def _cached_analysis(
+    *,
+    scope: str,
+    version: str,
+    context: dict,
+    compute,
+    request: Request | None,
+    response: Response | None,
+):
+    """Resuelve un análisis contra la caché y publica su estado en cabeceras."""
+    key = analysis_cache_key(scope=scope, version=version, context=context)
+    result, status, tier = get_analysis_result_cache().get_or_compute(
+        key,
+        compute,
+        refresh=_refresh_requested(request),
+    )
+
+    if response is not None:
+        response.headers.update(_cache_headers(key, status, tier))
+
+    return result
+
+
+def _streamed_analysis(
+    *,
+    scope: str,
+    version: str,
+    context: dict,
+    parts: Callable[[], Iterator[AnalysisPart]],
+    message: str,
+    request: Request | None,
+    stream_format: str,
+) -> StreamingResponse:
+    """Emite el análisis por partes; un acierto de caché se reemite de inmediato.
+
+    La primera parte se calcula antes de responder para que un contexto
+    inválido siga devolviendo el 422 habitual en vez de una línea ``error``.
+    """
+    cache = get_analysis_result_cache()
+    key = analysis_cache_key(scope=scope, version=version, context=context)
+    refresh = _refresh_requested(request)
+    cached = cache.get(key) if cache.enabled and not refresh else None
+
+    if cached is not None:
+        source, status, tier, on_complete = document_parts(cached[0]), "hit", cached[1], None
+    else:
+        source, tier = parts(), None
+        status = "miss" if cache.enabled and not refresh else "bypass"
+
+        def on_complete(result):
+            if cache.enabled and result is not None:
+                cache.set(key, result)
+
+    first = next(source, None)
+    return StreamingResponse(
+        stream_analysis(
+            source if first is None else chain([first], source),
+            stream_format=stream_format,
+            message=message,
+            on_complete=on_complete,
+        ),
+        media_type=stream_media_type(stream_format),
+        headers=_cache_headers(key, status, tier),
+    )
+
 
 @router.post(
     "/results-analysis/generic-issue",
     response_model=ModelExecutionResponse,
     response_model_exclude_none=False,
 )
-async def analyze_generic_issue(analysis_context: dict[str, Any] = Body(...)):
-    """Run only the model-independent, issue-level analysis projection."""
+async def analyze_generic_issue(
+    analysis_context: dict[str, Any] = Body(...),
+    request: Request = None,
+    response: Response = None,
+):
+    """Run only the model-independent, issue-level analysis projection.
+
+    With ``Accept: application/x-ndjson`` or ``text/event-stream`` the
+    analysis is streamed as ``part`` events followed by ``complete``.
+    """
     try:
         generic_context = build_generic_issue_context(analysis_context)
-        result = normalize_analysis_result(analyze_issue(generic_context))
+        stream_format = _stream_format(request)
+        if stream_format is not None:
+            return _streamed_analysis(
+                scope=GENERIC_ANALYSIS_SCOPE,
+                version=analysis_package_version(),
+                context=generic_context,
+                parts=lambda: stream_issue(generic_context),
+                message=GENERIC_ANALYSIS_MESSAGE,
+                request=request,
+                stream_format=stream_format,
+            )
+
+        result = _cached_analysis(
+            scope=GENERIC_ANALYSIS_SCOPE,
+            version=analysis_package_version(),
+            context=generic_context,
+            compute=lambda: normalize_analysis_result(analyze_issue(generic_context)),
+            request=request,
+            response=response,
+        )
     except (KeyError, TypeError, ValueError) as error:
         return JSONResponse(
             status_code=422,
@@ -39,7 +170,7 @@ async def analyze_generic_issue(analysis_context: dict[str, Any] = Body(...)):
 
     return {
         "success": True,
-        "message": "Generic issue analysis completed successfully",
+        "message": GENERIC_ANALYSIS_MESSAGE,
         "data": result,
         "error": None,
     }
@@ -50,17 +181,56 @@ async def analyze_generic_issue(analysis_context: dict[str, Any] = Body(...)):
     response_model=ModelExecutionResponse,
     response_model_exclude_none=False,
 )
-async def analyze_model_issue(payload: dict[str, Any] = Body(...)):
-    """Run an optional model-specific issue analysis against frozen evidence."""
+async def analyze_model_issue(
+    payload: dict[str, Any] = Body(...),
+    request: Request = None,
+    response: Response = None,
+):
+    """Run an optional model-specific issue analysis against frozen evidence.
+
+    Streaming follows the generic route; models without a ``stream_issue``
+    handler stream their ``analyze_issue`` document one top-level field at a
+    time.
+    """
     try:
         api_model_key = payload["apiModelKey"]
         analysis_context = payload["analysisContext"]
         if not isinstance(api_model_key, str) or not api_model_key.strip():
             raise ValueError("apiModelKey is required")
-        handlers = load_model_analysis_handlers(api_model_key.strip())
-        handler = handlers.get("analyze_issue") if handlers else None
-        result = None if handler is None else normalize_analysis_result(
-            handler(build_model_issue_context(analysis_context))
+        api_model_key = api_model_key.strip()
+        model_context = build_model_issue_context(analysis_context)
+
+        def compute():
+            handlers = load_model_analysis_handlers(api_model_key)
+            handler = handlers.get("analyze_issue") if handlers else None
+            return None if handler is None else normalize_analysis_result(handler(model_context))
+
+        def parts():
+            handlers = load_model_analysis_handlers(api_model_key) or {}
+            if "stream_issue" in handlers:
+                return iter(handlers["stream_issue"](model_context))
+            handler = handlers.get("analyze_issue")
+            return document_parts(None if handler is None else handler(model_context))
+
+        stream_format = _stream_format(request)
+        if stream_format is not None:
+            return _streamed_analysis(
+                scope=f"model:{api_model_key}",
+                version=analysis_package_version(api_model_key),
+                context=model_context,
+                parts=parts,
+                message=MODEL_ANALYSIS_MESSAGE,
+                request=request,
+                stream_format=stream_format,
+            )
+
+        result = _cached_analysis(
+            scope=f"model:{api_model_key}",
+            version=analysis_package_version(api_model_key),
+            context=model_context,
+            compute=compute,
+            request=request,
+            response=response,
         )
     except (KeyError, TypeError, ValueError) as error:
         return JSONResponse(
@@ -79,7 +249,40 @@ async def analyze_model_issue(payload: dict[str, Any] = Body(...)):
 
     return {
         "success": True,
-        "message": "Model issue analysis completed successfully",
+        "message": MODEL_ANALYSIS_MESSAGE,
         "data": result,
         "error": None,
     }
+
+
+@router.delete(
+    "/results-analysis/cache",
+    response_model=ModelExecutionResponse,
+    response_model_exclude_none=False,
+)
+async def purge_results_analysis_cache():
+    """Drop every memoised analysis from the memory and disk tiers.
+
+    Like ``POST /system/reload``, it is refused in production.
+    """
+    if is_production_environment():
+        return JSONResponse(
+            status_code=status.HTTP_403_FORBIDDEN,
+            content={
+                "success": False,
+                "message": "Results analysis cache purge is disabled in production.",
+                "data": None,
+                "error": {
+                    "code": "ANALYSIS_CACHE_PURGE_DISABLED",
+                    "field": None,
+                    "details": None,
+                },
+            },
+        )
+
+    return {
+        "success": True,
+        "message": "Results analysis cache purged successfully",
+        "data": get_analysis_result_cache().purge(),
+        "error": None,
+    }
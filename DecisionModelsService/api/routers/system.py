@@ -5,6 +5,8 @@ from fastapi import APIRouter, status
 from fastapi.responses import JSONResponse
 
 from core.environment import is_production_environment
+from registry.model_registry import invalidate_model_registry
+from services.model_executors.warmup import build_startup_report
 
 router = APIRouter(tags=["System"])
 
@@ -23,6 +25,24 @@ def _write_reload_marker() -> None:
     )
 
 
+@router.get(
+    "/system/startup",
+    summary="Get the startup report",
+    description=(
+        "Devuelve, por paquete de modelo, el tiempo de carga de `definition.py`, "
+        "si su executor ya se ha importado (y cuánto tardó) y el estado del "
+        "warm-up configurado con `DECISION_MODELS_WARMUP`."
+    ),
+)
+async def get_startup_report():
+    return {
+        "success": True,
+        "message": "DecisionModelsService startup report fetched successfully",
+        "data": build_startup_report(),
+        "error": None,
+    }
+
+
 @router.post(
     "/system/reload",
     response_model_exclude_none=False,
@@ -48,6 +68,7 @@ async def reload_system():
             },
         )
 
+    invalidate_model_registry()
     _write_reload_marker()
 
     return JSONResponse(
@@ -0,0 +1 @@
+"""Benchmarks reproducibles de DecisionModelsService (``python -m benchmarks.<nombre>``)."""
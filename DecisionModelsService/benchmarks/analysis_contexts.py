@@ -0,0 +1,155 @@
+"""Compara las proyecciones de contexto con ``deepcopy`` frente a las vistas de solo lectura.
+
+Uso: ``python -m benchmarks.analysis_contexts [--rounds 10] [--experts 30] [--alternatives 40] [--criteria 12]``.
+Mide tiempo y pico de memoria (``tracemalloc``) de proyectar un contexto de
+issue multironda y calcular su clave de caché, que es el camino completo de
+un acierto de caché. ``legacy_build_model_issue_context`` reproduce la
+proyección original y sirve de referencia en los tests.
+"""
+
+import argparse
+import tracemalloc
+from copy import deepcopy
+from statistics import median
+from time import perf_counter
+
+from services.results_analysis.cache import analysis_cache_key
+from services.results_analysis.contexts import _executed_rounds, build_model_issue_context
+
+
+def build_analysis_context(rounds: int, experts: int, alternatives: int, criteria: int) -> dict:
+    alternative_ids = [f"alternative-{index}" for index in range(alternatives)]
+    criterion_ids = [f"criterion-{index}" for index in range(criteria)]
+    expert_ids = [f"expert-{index}" for index in range(experts)]
+
+    def execution(phase: int) -> dict:
+        return {
+            "attemptId": f"attempt-{phase}",
+            "startedAt": "2026-01-01T00:00:01.000Z",
+            "completedAt": "2026-01-01T00:00:02.000Z",
+            "input": {
+                "modelParameters": {"weights": {criterion: 1 / criteria for criterion in criterion_ids}},
+                "evaluations": [
+                    {
+                        "expert": {"id": expert},
+                        "weight": 1 / experts,
+                        "payload": {
+                            alternative: {
+                                criterion: {"labelKey": f"s{(phase + index) % 7}", "alpha": 0.0}
+                                for index, criterion in enumerate(criterion_ids)
+                            }
+                            for alternative in alternative_ids
+                        },
+                    }
+                    for expert in expert_ids
+                ],
+            },
+            "result": {
+                "rawOutput": {
+                    "collective_beta_matrix": [
+                        [float((phase + row + column) % 7) for column in range(criteria)]
+                        for row in range(alternatives)
+                    ],
+                },
+                "standardResult": {
+                    "rankedAlternatives": [
+                        {"alternativeId": alternative, "rank": rank}
+                        for rank, alternative in enumerate(alternative_ids, start=1)
+                    ],
+                },
+            },
+        }
+
+    return {
+        "issue": {"id": "issue-1", "name": "Benchmark issue"},
+        "decisionSpace": {"alternatives": alternative_ids, "criteria": criterion_ids},
+        "participants": {"current": [{"expertId": expert} for expert in expert_ids]},
+        "semanticDirectory": {"expertsById": {expert: {"name": expert} for expert in expert_ids}},
+        "rounds": [
+            {"phase": phase, "selectedExecution": execution(phase)}
+            for phase in range(1, rounds + 1)
+        ],
+    }
+
+
+def legacy_build_model_issue_context(analysis_context: dict) -> dict:
+    return deepcopy(
+        {
+            "issue": analysis_context["issue"],
+            "decisionSpace": analysis_context["decisionSpace"],
+            "participants": analysis_context["participants"],
+            "semanticDirectory": analysis_context["semanticDirectory"],
+            "rounds": [
+                {"phase": entry["phase"], "execution": entry["selectedExecution"]}
+                for entry in _executed_rounds(analysis_context)
+            ],
+        }
+    )
+
+
+def _project_and_key(builder, analysis_context: dict) -> dict:
+    context = builder(analysis_context)
+    analysis_cache_key(scope="benchmark", version="0", context=context)
+    return context
+
+
+def _measure(builder, analysis_context: dict) -> tuple[float, int, dict]:
+    started = perf_counter()
+    context = _project_and_key(builder, analysis_context)
+    elapsed = perf_counter() - started
+
+    # El pico se mide en otra pasada porque tracemalloc distorsiona los tiempos.
+    tracemalloc.start()
+    _project_and_key(builder, analysis_context)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, context
+
+
+def run(
+    rounds: int = 10,
+    experts: int = 30,
+    alternatives: int = 40,
+    criteria: int = 12,
+    repeats: int = 3,
+) -> dict[str, float | bool]:
+    analysis_context = build_analysis_context(rounds, experts, alternatives, criteria)
+    builders = {"legacy": legacy_build_model_issue_context, "view": build_model_issue_context}
+    timings: dict[str, list[float]] = {name: [] for name in builders}
+    peaks: dict[str, list[int]] = {name: [] for name in builders}
+    outputs = {}
+
+    for _ in range(repeats):
+        for name, builder in builders.items():
+            elapsed, peak, outputs[name] = _measure(builder, analysis_context)
+            timings[name].append(elapsed)
+            peaks[name].append(peak)
+
+    return {
+        "legacyMs": round(median(timings["legacy"]) * 1000, 3),
+        "viewMs": round(median(timings["view"]) * 1000, 3),
+        "legacyPeakKiB": round(median(peaks["legacy"]) / 1024, 1),
+        "viewPeakKiB": round(median(peaks["view"]) / 1024, 1),
+        "equal": outputs["view"] == outputs["legacy"],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--experts", type=int, default=30)
+    parser.add_argument("--alternatives", type=int, default=40)
+    parser.add_argument("--criteria", type=int, default=12)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    result = run(args.rounds, args.experts, args.alternatives, args.criteria, args.repeats)
+    print(
+        f"{args.rounds} rounds x {args.experts} experts x {args.alternatives} alternatives x "
+        f"{args.criteria} criteria: deepcopy {result['legacyMs']} ms / {result['legacyPeakKiB']} KiB, "
+        f"views {result['viewMs']} ms / {result['viewPeakKiB']} KiB, equal={result['equal']}"
+    )
+
+
+if __name__ == "__main__":
+    main()
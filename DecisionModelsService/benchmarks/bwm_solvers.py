@@ -0,0 +1,94 @@
+"""Compara los modos de resolución por experto de BWM.
+
+Uso: ``python -m benchmarks.bwm_solvers [--experts 8] [--criteria 6] [--workers 4]``.
+Mide la formulación no lineal de pyDecision en serie (el comportamiento
+anterior) y en el pool de solvers, la formulación lineal y una segunda
+ejecución servida desde la caché de soluciones.
+"""
+
+import argparse
+import os
+from time import perf_counter
+
+import numpy as np
+
+from models.bwm.run import clear_bwm_solution_cache, run_bwm
+from services.model_executors.solver_pool import shutdown_solver_pool
+
+
+def build_experts(n_exp: int, n_crit: int, seed: int = 42) -> dict[str, dict[str, list[float]]]:
+    rng = np.random.default_rng(seed)
+    experts = {}
+    for index in range(n_exp):
+        best, worst = rng.choice(n_crit, size=2, replace=False)
+        mic = rng.integers(2, 9, n_crit).astype(float)
+        lic = rng.integers(2, 9, n_crit).astype(float)
+        mic[best], lic[worst] = 1.0, 1.0
+        mic[worst] = lic[best] = 9.0
+        experts[f"expert-{index}"] = {"mic": mic.tolist(), "lic": lic.tolist()}
+    return experts
+
+
+def _timed(experts: dict, formulation: str, workers: int, *, clear: bool = True) -> tuple[float, dict]:
+    os.environ["DECISION_MODELS_SOLVER_WORKERS"] = str(workers)
+    if clear:
+        clear_bwm_solution_cache()
+    started = perf_counter()
+    result = run_bwm(experts, formulation=formulation)
+    if not result["success"]:
+        raise RuntimeError(result["message"])
+    return perf_counter() - started, result
+
+
+def run(n_exp: int = 8, n_crit: int = 6, workers: int = 4) -> dict[str, float]:
+    experts = build_experts(n_exp, n_crit)
+    previous_workers = os.environ.get("DECISION_MODELS_SOLVER_WORKERS")
+
+    try:
+        _timed(experts, "nonlinear", workers)  # Arranque del pool fuera de la medida.
+        serial_seconds, serial = _timed(experts, "nonlinear", 1)
+        pooled_seconds, pooled = _timed(experts, "nonlinear", workers)
+        cached_seconds, _ = _timed(experts, "nonlinear", workers, clear=False)
+        linear_seconds, linear = _timed(experts, "linear", 1)
+    finally:
+        shutdown_solver_pool()
+        if previous_workers is None:
+            os.environ.pop("DECISION_MODELS_SOLVER_WORKERS", None)
+        else:
+            os.environ["DECISION_MODELS_SOLVER_WORKERS"] = previous_workers
+
+    linear_gap = max(
+        float(np.max(np.abs(np.subtract(linear["expertWeights"][key], weights))))
+        for key, weights in serial["expertWeights"].items()
+    )
+
+    return {
+        "serialNonlinearMs": round(serial_seconds * 1000, 3),
+        "pooledNonlinearMs": round(pooled_seconds * 1000, 3),
+        "linearMs": round(linear_seconds * 1000, 3),
+        "cachedMs": round(cached_seconds * 1000, 3),
+        "pooledMatchesSerial": pooled["expertWeights"] == serial["expertWeights"],
+        "maxLinearWeightGap": round(linear_gap, 6),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--experts", type=int, default=8)
+    parser.add_argument("--criteria", type=int, default=6)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    result = run(args.experts, args.criteria, args.workers)
+    print(
+        f"{args.experts} experts x {args.criteria} criteria: "
+        f"nonlinear serial {result['serialNonlinearMs']} ms, "
+        f"pooled ({args.workers} workers) {result['pooledNonlinearMs']} ms, "
+        f"linear {result['linearMs']} ms, cached {result['cachedMs']} ms, "
+        f"pooled==serial {result['pooledMatchesSerial']}, "
+        f"max |linear - nonlinear| {result['maxLinearWeightGap']}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Compara el kernel vectorizado de Fuzzy TOPSIS con el flujo celda a celda sobre pyDecision.
+
+Uso: ``python -m benchmarks.fuzzy_topsis_kernel [--experts 20] [--alternatives 200] [--criteria 12]``.
+``legacy_fuzzy_topsis`` reproduce la validación por celda, la matriz colectiva
+de tuplas y ``pyDecision.algorithm.fuzzy_topsis_method``; sirve también de
+referencia numérica.
+"""
+
+import argparse
+from statistics import median
+from time import perf_counter
+
+import numpy as np
+from pyDecision.algorithm import fuzzy_topsis_method
+
+from models.fuzzy_topsis.run import (
+    _fuzzy_tensor_or_throw,
+    _validate_cost_triplets_or_throw,
+    fuzzy_topsis_scores,
+)
+from utils.triangular_fuzzy import TriangularFuzzyArray
+
+
+def build_problem(n_exp: int, n_alt: int, n_crit: int, seed: int = 42) -> dict:
+    rng = np.random.default_rng(seed)
+    tensor = np.sort(rng.uniform(0.05, 1.0, (n_exp, n_alt, n_crit, 3)), axis=-1)
+    weights = np.sort(rng.uniform(0.1, 1.0, (n_crit, 3)), axis=-1)
+
+    return {
+        "matrices": {f"expert-{index}": tensor[index].tolist() for index in range(n_exp)},
+        "weights": weights.tolist(),
+        "criterion_type": ["min" if index % 3 == 1 else "max" for index in range(n_crit)],
+    }
+
+
+def legacy_fuzzy_topsis(matrices: dict, weights: list, criterion_type: list[str]) -> np.ndarray:
+    for matrix in matrices.values():
+        for row in matrix:
+            for cell in row:
+                parsed = [float(item) for item in cell]
+                if not all(np.isfinite(item) for item in parsed) or not parsed[0] <= parsed[1] <= parsed[2]:
+                    raise ValueError("invalid fuzzy triplet")
+
+    tensor = np.array(list(matrices.values()), dtype=np.float64)
+    collective_matrix = [[tuple(cell) for cell in row] for row in tensor.mean(axis=0).tolist()]
+
+    return fuzzy_topsis_method(
+        dataset=collective_matrix,
+        weights=[[tuple(weight) for weight in weights]],
+        criterion_type=criterion_type,
+        graph=False,
+        verbose=False,
+    )
+
+
+def vectorized_fuzzy_topsis(matrices: dict, weights: list, criterion_type: list[str]) -> np.ndarray:
+    """``run_fuzzy_topsis`` sin la proyección de gráficos."""
+
+    collective = _fuzzy_tensor_or_throw(matrices).mean(axis=0)
+    _validate_cost_triplets_or_throw(collective, criterion_type)
+    return fuzzy_topsis_scores(collective, TriangularFuzzyArray(weights), criterion_type)
+
+
+def run(n_exp: int = 20, n_alt: int = 200, n_crit: int = 12, repeats: int = 3) -> dict[str, float]:
+    problem = build_problem(n_exp, n_alt, n_crit)
+    timings: dict[str, list[float]] = {"legacy": [], "vectorized": []}
+    outputs = {}
+
+    for name in timings:
+        for _ in range(repeats):
+            started = perf_counter()
+            kernel = legacy_fuzzy_topsis if name == "legacy" else vectorized_fuzzy_topsis
+            outputs[name] = kernel(**problem)
+            timings[name].append(perf_counter() - started)
+
+    return {
+        "legacyMs": round(median(timings["legacy"]) * 1000, 3),
+        "vectorizedMs": round(median(timings["vectorized"]) * 1000, 3),
+        "maxAbsDifference": float(np.max(np.abs(outputs["legacy"] - outputs["vectorized"]))),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--experts", type=int, default=20)
+    parser.add_argument("--alternatives", type=int, default=200)
+    parser.add_argument("--criteria", type=int, default=12)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    result = run(args.experts, args.alternatives, args.criteria, args.repeats)
+    print(
+        f"{args.experts} experts x {args.alternatives} alternatives x {args.criteria} criteria: "
+        f"legacy {result['legacyMs']} ms, vectorized {result['vectorizedMs']} ms, "
+        f"max |difference|={result['maxAbsDifference']:.3g}"
+    )
+
+
+if __name__ == "__main__":
+    main()
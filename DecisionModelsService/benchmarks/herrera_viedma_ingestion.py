@@ -0,0 +1,131 @@
+"""Compara la ingesta tensorial de preferencias pairwise de Herrera-Viedma con la de listas anidadas.
+
+Uso: ``python -m benchmarks.herrera_viedma_ingestion [--experts 30] [--alternatives 30] [--criteria 8]``.
+``legacy_preferences`` reproduce la lectura y validación celda a celda, la
+agregación con el bucle cuádruple y la conversión posterior a ``np.zeros`` en
+``run``; sirve también de referencia numérica en los tests.
+"""
+
+import argparse
+from statistics import median
+from time import perf_counter
+
+import numpy as np
+
+from benchmarks.synthetic_issues import build_payload
+from models.herrera_viedma_crp.executor import _finite_number, _input
+from models.herrera_viedma_crp.run import _preference_tensor
+from registry.model_registry import get_model_definitions
+from schemas.model_requests import GenericModelExecutionRequest
+
+
+def build_request(n_exp: int, n_alt: int, n_crit: int, seed: int = 42) -> GenericModelExecutionRequest:
+    model = next(
+        model
+        for model in get_model_definitions(strict=False)
+        if model.api_model_key == "herrera_viedma_crp"
+    )
+    payload = build_payload(model, experts=n_exp, alternatives=n_alt, criteria=n_crit, seed=seed)
+    return GenericModelExecutionRequest.model_validate(payload)
+
+
+def legacy_preferences(payload: GenericModelExecutionRequest, weights: list[float]) -> np.ndarray:
+    alternative_ids = [item["id"] for item in payload.context["alternatives"]]
+    criterion_ids = [item["id"] for item in payload.context["criteria"]]
+    matrices = {}
+
+    for expert_index, evaluation in enumerate(payload.evaluations):
+        criterion_matrices = []
+        for criterion_id in criterion_ids:
+            criterion_payload = evaluation["payload"][criterion_id]
+            if [key for key in criterion_payload if key not in alternative_ids]:
+                raise ValueError("unknown row keys")
+
+            matrix = []
+            for row_id in alternative_ids:
+                row_payload = criterion_payload[row_id]
+                if [key for key in row_payload if key not in alternative_ids or key == row_id]:
+                    raise ValueError("unknown column keys")
+
+                row = []
+                for column_id in alternative_ids:
+                    if row_id == column_id:
+                        row.append(0.5)
+                        continue
+                    row.append(
+                        _finite_number(
+                            row_payload.get(column_id),
+                            f"evaluations[{expert_index}].payload['{criterion_id}']['{row_id}']['{column_id}']",
+                        )
+                    )
+                matrix.append(row)
+            criterion_matrices.append(matrix)
+
+        if len(criterion_ids) == 1:
+            expert_matrix = criterion_matrices[0]
+        else:
+            expert_matrix = []
+            for row_index in range(len(alternative_ids)):
+                row = []
+                for column_index in range(len(alternative_ids)):
+                    if row_index == column_index:
+                        row.append(0.5)
+                        continue
+                    value = 0.0
+                    for criterion_index in range(len(criterion_ids)):
+                        value += (
+                            weights[criterion_index]
+                            * criterion_matrices[criterion_index][row_index][column_index]
+                        )
+                    row.append(value)
+                expert_matrix.append(row)
+
+        matrices[f"expert-{expert_index}"] = {criterion_ids[0]: expert_matrix}
+
+    return _preference_tensor(matrices)[0]
+
+
+def tensor_preferences(payload: GenericModelExecutionRequest) -> np.ndarray:
+    execution_input = _input(payload)
+    return _preference_tensor(execution_input["preferences"], execution_input["expert_keys"])[0]
+
+
+def run(n_exp: int = 30, n_alt: int = 30, n_crit: int = 8, repeats: int = 3) -> dict[str, float]:
+    payload = build_request(n_exp, n_alt, n_crit)
+    weights = _input(payload)["weights"]
+    timings: dict[str, list[float]] = {"legacy": [], "tensor": []}
+    outputs = {}
+
+    for name in timings:
+        for _ in range(repeats):
+            started = perf_counter()
+            outputs[name] = (
+                legacy_preferences(payload, weights) if name == "legacy" else tensor_preferences(payload)
+            )
+            timings[name].append(perf_counter() - started)
+
+    return {
+        "legacyMs": round(median(timings["legacy"]) * 1000, 3),
+        "tensorMs": round(median(timings["tensor"]) * 1000, 3),
+        "maxAbsDifference": float(np.max(np.abs(outputs["legacy"] - outputs["tensor"]))),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--experts", type=int, default=30)
+    parser.add_argument("--alternatives", type=int, default=30)
+    parser.add_argument("--criteria", type=int, default=8)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    result = run(args.experts, args.alternatives, args.criteria, args.repeats)
+    print(
+        f"{args.experts} experts x {args.alternatives} alternatives x {args.criteria} criteria: "
+        f"legacy {result['legacyMs']} ms, tensor {result['tensorMs']} ms, "
+        f"max |difference|={result['maxAbsDifference']:.3g}"
+    )
+
+
+if __name__ == "__main__":
+    main()
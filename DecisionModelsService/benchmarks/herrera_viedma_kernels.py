@@ -0,0 +1,152 @@
+"""Compara los kernels vectorizados de Herrera-Viedma con la versión celda a celda.
+
+Uso: ``python -m benchmarks.herrera_viedma_kernels [--experts 50] [--alternatives 40]``.
+Las funciones ``legacy_*`` reproducen los bucles originales y sirven también
+de referencia numérica en los tests.
+"""
+
+import argparse
+from statistics import median
+from time import perf_counter
+
+import numpy as np
+
+from models.herrera_viedma_crp.utils import (
+    calcular_colectiva_OWA,
+    calcular_consenso_alt,
+    calcular_consenso_exp_alt,
+    calcular_diferencia_rankings,
+    calcular_pesos_OWA,
+    calcular_QGDD,
+    owa,
+)
+
+
+def legacy_colectiva_OWA(pref, n_exp, n_alt, n_crit, w_cri, w_exp):
+    agregacion_por_experto = np.zeros((n_exp, n_alt, n_alt))
+    for exp in range(n_exp):
+        for i in range(n_alt):
+            for j in range(n_alt):
+                valores = [pref[exp * n_crit + cr][i][j] for cr in range(n_crit)]
+                agregacion_por_experto[exp][i][j] = owa(valores, w_cri)
+
+    matriz_colectiva = np.zeros((n_alt, n_alt))
+    for i in range(n_alt):
+        for j in range(n_alt):
+            valores = [agregacion_por_experto[exp][i][j] for exp in range(n_exp)]
+            matriz_colectiva[i][j] = owa(valores, w_exp)
+
+    return matriz_colectiva
+
+
+def legacy_QGDD(n_alt, pref, w):
+    result = np.zeros(n_alt)
+    for i in range(n_alt):
+        values = np.array([pref[i][j] for j in range(n_alt)])
+        result[i] = owa(values, w)
+    return result
+
+
+def legacy_diferencia_rankings(alternatives_rankings):
+    n_exp = len(alternatives_rankings) - 1
+    n_alt = len(alternatives_rankings[0])
+    result = np.zeros((n_exp, n_alt), dtype=int)
+    pos_colectivo = {alt: i for i, alt in enumerate(alternatives_rankings[-1])}
+
+    for expert in range(n_exp):
+        pos_expert = {alt: i for i, alt in enumerate(alternatives_rankings[expert])}
+        result[expert] = [
+            pos_colectivo[alt] - pos_expert[alt] for alt in sorted(pos_colectivo.keys())
+        ]
+
+    return result
+
+
+def legacy_consenso_exp_alt(differences_between_rankings, b):
+    n_exp = len(differences_between_rankings)
+    n_alt = len(differences_between_rankings[0])
+    result = np.zeros((n_exp, n_alt), dtype=float)
+    for e in range(n_exp):
+        for a in range(n_alt):
+            result[e][a] = round((abs(differences_between_rankings[e][a]) / (n_alt - 1)) ** b, 2)
+    return result
+
+
+def legacy_consenso_alt(consensus_degrees_exp_alt, n_alt, n_exp):
+    result = np.zeros(n_alt, dtype=float)
+    for a in range(n_alt):
+        result[a] = sum(consensus_degrees_exp_alt[e][a] for e in range(n_exp)) / n_exp
+        result[a] = round(1.0 - result[a], 2)
+    return result
+
+
+def build_preferences(n_exp: int, n_alt: int, seed: int = 42) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    pref = np.zeros((n_exp + 1, n_alt, n_alt))
+    pref[:n_exp] = np.round(rng.random((n_exp, n_alt, n_alt)), 2)
+    return pref
+
+
+def _pipeline(pref, n_exp, n_alt, *, legacy: bool):
+    w_exp = calcular_pesos_OWA(n_exp, [0.3, 0.8])
+    w_alt = calcular_pesos_OWA(n_alt, [0.5, 1.0])
+    pref = pref.copy()
+
+    if legacy:
+        pref[-1] = legacy_colectiva_OWA(pref, n_exp, n_alt, 1, [1.0], w_exp)
+        qgdd = np.array([legacy_QGDD(n_alt, pref[index], w_alt) for index in range(n_exp + 1)])
+        rankings = [np.argsort(row)[::-1] for row in qgdd]
+        differences = legacy_diferencia_rankings(rankings)
+        exp_alt = legacy_consenso_exp_alt(differences, 1)
+        alt = legacy_consenso_alt(exp_alt, n_alt, n_exp)
+    else:
+        pref[-1] = calcular_colectiva_OWA(pref, n_exp, n_alt, 1, [1.0], w_exp)
+        qgdd = calcular_QGDD(n_alt, pref, w_alt)
+        rankings = list(np.argsort(qgdd, axis=1)[:, ::-1])
+        differences = calcular_diferencia_rankings(rankings)
+        exp_alt = calcular_consenso_exp_alt(differences, 1)
+        alt = calcular_consenso_alt(exp_alt, n_alt, n_exp)
+
+    return pref[-1], qgdd, differences, exp_alt, alt
+
+
+def run(n_exp: int = 50, n_alt: int = 40, repeats: int = 3) -> dict[str, float | bool]:
+    pref = build_preferences(n_exp, n_alt)
+    timings: dict[str, list[float]] = {"legacy": [], "vectorized": []}
+    outputs = {}
+
+    for name in timings:
+        for _ in range(repeats):
+            started = perf_counter()
+            outputs[name] = _pipeline(pref, n_exp, n_alt, legacy=name == "legacy")
+            timings[name].append(perf_counter() - started)
+
+    identical = all(
+        np.array_equal(left, right)
+        for left, right in zip(outputs["legacy"], outputs["vectorized"])
+    )
+
+    return {
+        "legacyMs": round(median(timings["legacy"]) * 1000, 3),
+        "vectorizedMs": round(median(timings["vectorized"]) * 1000, 3),
+        "bitIdentical": identical,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--experts", type=int, default=50)
+    parser.add_argument("--alternatives", type=int, default=40)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    result = run(args.experts, args.alternatives, args.repeats)
+    print(
+        f"{args.experts} experts x {args.alternatives} alternatives: "
+        f"legacy {result['legacyMs']} ms, vectorized {result['vectorizedMs']} ms, "
+        f"bit-identical={result['bitIdentical']}"
+    )
+
+
+if __name__ == "__main__":
+    main()
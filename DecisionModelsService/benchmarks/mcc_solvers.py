@@ -0,0 +1,76 @@
+"""Compara los backends LP del consenso MCC de pesos de criterios.
+
+Uso: ``python -m benchmarks.mcc_solvers [--experts 100] [--criteria 30]``.
+``pulp`` construye el modelo variable a variable y lanza CBC como
+subproceso; ``highs`` resuelve la forma matricial dispersa en proceso.
+"""
+
+import argparse
+from statistics import median
+from time import perf_counter
+
+import numpy as np
+
+from services.criteria_weights_consensus.mcc_weights import (
+    DEFAULT_MCC_EPS,
+    MCC_SOLVER_BACKENDS,
+    _solve_mcc_lp,
+)
+
+OBJECTIVE_TOLERANCE = 1e-6
+
+
+def build_problem(n_exp: int, n_crit: int, seed: int = 42) -> dict:
+    rng = np.random.default_rng(seed)
+    weights = rng.random((n_exp, n_crit))
+    weights /= weights.sum(axis=1, keepdims=True)
+
+    return {
+        "o": weights.tolist(),
+        "c": [1.0] * n_exp,
+        "w": [1.0 / n_exp] * n_exp,
+        "eps": DEFAULT_MCC_EPS,
+    }
+
+
+def run(n_exp: int = 100, n_crit: int = 30, repeats: int = 1) -> dict[str, float | bool]:
+    problem = build_problem(n_exp, n_crit)
+    timings: dict[str, list[float]] = {backend: [] for backend in MCC_SOLVER_BACKENDS}
+    outputs = {}
+
+    for _ in range(repeats):
+        for backend in MCC_SOLVER_BACKENDS:
+            started = perf_counter()
+            outputs[backend] = _solve_mcc_lp(**problem, backend=backend)
+            timings[backend].append(perf_counter() - started)
+
+    objective_delta = abs(outputs["pulp"]["objective"] - outputs["highs"]["objective"])
+
+    return {
+        "pulpMs": round(median(timings["pulp"]) * 1000, 3),
+        "highsMs": round(median(timings["highs"]) * 1000, 3),
+        "objectiveDelta": objective_delta,
+        "sameObjective": (
+            outputs["pulp"]["status"] == outputs["highs"]["status"] == "Optimal"
+            and objective_delta <= OBJECTIVE_TOLERANCE
+        ),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--experts", type=int, default=100)
+    parser.add_argument("--criteria", type=int, default=30)
+    parser.add_argument("--repeats", type=int, default=1)
+    args = parser.parse_args()
+
+    result = run(args.experts, args.criteria, args.repeats)
+    print(
+        f"{args.experts} experts x {args.criteria} criteria: "
+        f"pulp {result['pulpMs']} ms, highs {result['highsMs']} ms, "
+        f"same objective={result['sameObjective']} (delta {result['objectiveDelta']:.2e})"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,282 @@
+"""Benchmark de escalado de todos los modelos registrados y de sus análisis de issue.
+
+Uso: ``python -m benchmarks.model_suite [--size 5x10x5 --size 20x40x12] [--models topsis,bwm]
+[--output baseline.json] [--compare baseline.json]``.
+
+Para cada modelo y tamaño (expertos × alternativas × criterios) genera un
+payload con ``benchmarks.synthetic_issues`` y lo ejecuta en proceso (handler
+directo) y a través de la app ASGI. Los modelos con ``analyze_issue`` miden
+también su análisis de issue, en proceso y por
+``/results-analysis/model-issue`` sin caché. Cada medida guarda percentiles de
+latencia y, en una pasada aparte con ``tracemalloc``, el pico de memoria y lo
+que retiene el resultado. El JSON de salida es estable (claves ordenadas, una
+entrada por medida) para poder compararlo entre commits con ``git diff`` o con
+``--compare``.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import tracemalloc
+from time import perf_counter
+from typing import Any, Callable
+
+import httpx
+import numpy as np
+
+from benchmarks.synthetic_issues import build_payload
+from core.application import create_application
+from registry.model_definition import ModelDefinition
+from registry.model_registry import get_model_definitions
+from services.results_analysis.contexts import build_model_issue_context
+from services.results_analysis.model_analysis import load_model_analysis_handlers
+
+DEFAULT_SIZES = ((5, 10, 5), (20, 40, 12))
+BASELINE_VERSION = 1
+
+
+def parse_size(value: str) -> tuple[int, int, int]:
+    try:
+        experts, alternatives, criteria = (int(part) for part in value.lower().split("x"))
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(
+            f"Size must be EXPERTSxALTERNATIVESxCRITERIA, got '{value}'"
+        ) from error
+    return experts, alternatives, criteria
+
+
+def _latency(samples: list[float]) -> dict[str, float]:
+    milliseconds = np.array(samples) * 1000
+    return {
+        "p50Ms": round(float(np.percentile(milliseconds, 50)), 3),
+        "p95Ms": round(float(np.percentile(milliseconds, 95)), 3),
+        "maxMs": round(float(milliseconds.max()), 3),
+    }
+
+
+def _memory(call: Callable[[], Any]) -> dict[str, float | int]:
+    # Pasada separada: tracemalloc distorsiona los tiempos.
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    result = call()
+    after = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    retained = [stat for stat in after.compare_to(before, "filename") if stat.size_diff > 0]
+    del result
+    return {
+        "peakKiB": round(peak / 1024, 1),
+        "retainedKiB": round(sum(stat.size_diff for stat in retained) / 1024, 1),
+        "retainedBlocks": sum(max(stat.count_diff, 0) for stat in retained),
+    }
+
+
+def _measure(call: Callable[[], Any], repeats: int) -> dict[str, Any]:
+    call()  # Calentamiento: importaciones diferidas y cachés de primer uso.
+    samples = []
+    for _ in range(repeats):
+        started = perf_counter()
+        call()
+        samples.append(perf_counter() - started)
+    return {**_latency(samples), **_memory(call)}
+
+
+def _execute_in_process(model: ModelDefinition, payload: dict) -> Callable[[], Any]:
+    def call():
+        result = model.handler(model.request_model.model_validate(payload))
+        if isinstance(result, dict) and result.get("success") is not True:
+            raise RuntimeError(f"{model.api_model_key} failed: {result.get('message')}")
+        return result
+
+    return call
+
+
+def _analysis_context(payload: dict, result: dict) -> dict:
+    return {
+        "issue": payload["context"]["issue"],
+        "decisionSpace": {},
+        "participants": {},
+        "semanticDirectory": {},
+        "rounds": [{"phase": 1, "selectedExecution": {"input": payload, "result": result["data"]}}],
+    }
+
+
+class _AsgiRunner:
+    """Cliente ASGI en proceso sobre la app real, con su propio event loop."""
+
+    def __init__(self) -> None:
+        self._loop = asyncio.new_event_loop()
+        self._client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=create_application()),
+            base_url="http://benchmark",
+            timeout=None,
+        )
+
+    def post(self, path: str, payload: dict, headers: dict | None = None) -> Callable[[], Any]:
+        def call():
+            response = self._loop.run_until_complete(
+                self._client.post(path, json=payload, headers=headers)
+            )
+            if response.status_code != 200 or response.json().get("success") is not True:
+                raise RuntimeError(f"POST {path} failed with {response.status_code}")
+            return response
+
+        return call
+
+    def close(self) -> None:
+        self._loop.run_until_complete(self._client.aclose())
+        self._loop.close()
+
+
+def run(
+    sizes: tuple[tuple[int, int, int], ...] = DEFAULT_SIZES,
+    models: tuple[str, ...] | None = None,
+    repeats: int = 5,
+    seed: int = 42,
+) -> dict[str, Any]:
+    definitions = [
+        model
+        for model in get_model_definitions(strict=False)
+        if models is None or model.api_model_key in models
+    ]
+    runner = _AsgiRunner()
+    entries = []
+    # Las repeticiones deben medir el solver, no la caché de soluciones de BWM.
+    previous_bwm_cache_size = os.environ.get("DECISION_MODELS_BWM_CACHE_SIZE")
+    os.environ["DECISION_MODELS_BWM_CACHE_SIZE"] = "0"
+
+    try:
+        for model in definitions:
+            handlers = load_model_analysis_handlers(model.api_model_key) or {}
+            analyze_issue = handlers.get("analyze_issue")
+
+            for experts, alternatives, criteria in sizes:
+                payload = build_payload(
+                    model,
+                    experts=experts,
+                    alternatives=alternatives,
+                    criteria=criteria,
+                    seed=seed,
+                )
+                execute = _execute_in_process(model, payload)
+                measures = {
+                    "execute.inProcess": execute,
+                    "execute.asgi": runner.post(model.api_endpoint_path, payload),
+                }
+
+                if analyze_issue is not None:
+                    analysis_context = _analysis_context(payload, execute())
+                    measures["analysis.inProcess"] = lambda: analyze_issue(
+                        build_model_issue_context(analysis_context)
+                    )
+                    measures["analysis.asgi"] = runner.post(
+                        "/results-analysis/model-issue",
+                        {"apiModelKey": model.api_model_key, "analysisContext": analysis_context},
+                        headers={"Cache-Control": "no-cache"},
+                    )
+
+                for mode, call in measures.items():
+                    entries.append(
+                        {
+                            "apiModelKey": model.api_model_key,
+                            "mode": mode,
+                            "experts": experts,
+                            "alternatives": alternatives,
+                            "criteria": criteria,
+                            **_measure(call, repeats),
+                        }
+                    )
+    finally:
+        runner.close()
+        if previous_bwm_cache_size is None:
+            os.environ.pop("DECISION_MODELS_BWM_CACHE_SIZE", None)
+        else:
+            os.environ["DECISION_MODELS_BWM_CACHE_SIZE"] = previous_bwm_cache_size
+
+    return {
+        "version": BASELINE_VERSION,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "repeats": repeats,
+        "seed": seed,
+        "entries": entries,
+    }
+
+
+def _entry_key(entry: dict[str, Any]) -> tuple:
+    return (
+        entry["apiModelKey"],
+        entry["mode"],
+        entry["experts"],
+        entry["alternatives"],
+        entry["criteria"],
+    )
+
+
+def compare(baseline: dict[str, Any], current: dict[str, Any]) -> list[dict[str, Any]]:
+    """Cociente actual/baseline de p50 y del pico de memoria para las medidas comunes."""
+
+    previous = {_entry_key(entry): entry for entry in baseline.get("entries", [])}
+    rows = []
+
+    for entry in current["entries"]:
+        before = previous.get(_entry_key(entry))
+        if before is None:
+            continue
+        rows.append(
+            {
+                "apiModelKey": entry["apiModelKey"],
+                "mode": entry["mode"],
+                "size": f"{entry['experts']}x{entry['alternatives']}x{entry['criteria']}",
+                "p50Ratio": round(entry["p50Ms"] / before["p50Ms"], 3) if before["p50Ms"] else None,
+                "peakRatio": (
+                    round(entry["peakKiB"] / before["peakKiB"], 3) if before["peakKiB"] else None
+                ),
+            }
+        )
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=parse_size, action="append", dest="sizes")
+    parser.add_argument("--models", type=lambda value: tuple(value.split(",")))
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Write the baseline JSON to this path")
+    parser.add_argument("--compare", help="Baseline JSON to compare the run against")
+    args = parser.parse_args()
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as handle:
+            baseline = json.load(handle)
+
+    result = run(tuple(args.sizes or DEFAULT_SIZES), args.models, args.repeats, args.seed)
+
+    for entry in result["entries"]:
+        print(
+            f"{entry['apiModelKey']:<36} {entry['mode']:<20} "
+            f"{entry['experts']}x{entry['alternatives']}x{entry['criteria']:<8} "
+            f"p50 {entry['p50Ms']:>10} ms  p95 {entry['p95Ms']:>10} ms  "
+            f"peak {entry['peakKiB']:>10} KiB"
+        )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(result, handle, indent=2, sort_keys=True)
+            handle.write("\n")
+
+    if baseline is not None:
+        for row in compare(baseline, result):
+            print(
+                f"{row['apiModelKey']:<36} {row['mode']:<20} {row['size']:<10} "
+                f"p50 x{row['p50Ratio']}  peak x{row['peakRatio']}"
+            )
+
+
+if __name__ == "__main__":
+    main()
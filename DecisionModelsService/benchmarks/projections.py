@@ -0,0 +1,83 @@
+"""Compara latencia y stress de las proyecciones 2D de expertos.
+
+Uso: ``python -m benchmarks.projections [--repeats 5]``. Incluye el MDS
+SMACOF de scikit-learn (el comportamiento histórico) cuando está instalado.
+"""
+
+import argparse
+from statistics import median
+from time import perf_counter
+from typing import Callable
+
+import numpy as np
+
+from utils.projections import classical_mds, normalized_stress, pca_projection, smacof_projection
+
+SIZES = ((5, 5, 4), (20, 10, 6), (50, 40, 10))
+
+
+def _sklearn_mds(points: np.ndarray) -> np.ndarray:
+    from sklearn.manifold import MDS
+
+    return MDS(
+        n_components=2,
+        dissimilarity="euclidean",
+        random_state=42,
+        n_init=4,
+    ).fit_transform(points)
+
+
+def _methods() -> dict[str, Callable[[np.ndarray], np.ndarray]]:
+    methods = {
+        "classical": classical_mds,
+        "pca": pca_projection,
+        "smacof": smacof_projection,
+    }
+
+    try:
+        import sklearn.manifold  # noqa: F401
+    except ImportError:
+        return methods
+
+    return {"sklearn_mds": _sklearn_mds, **methods}
+
+
+def run(repeats: int = 5) -> list[dict[str, object]]:
+    rng = np.random.default_rng(42)
+    rows = []
+
+    for n_experts, n_alternatives, n_criteria in SIZES:
+        matrices = rng.random((n_experts, n_alternatives * n_criteria))
+        points = np.vstack([matrices, matrices.mean(axis=0)])
+
+        for name, method in _methods().items():
+            timings = []
+            for _ in range(repeats):
+                started = perf_counter()
+                projection = method(points)
+                timings.append(perf_counter() - started)
+
+            rows.append(
+                {
+                    "size": f"{n_experts}x{n_alternatives}x{n_criteria}",
+                    "method": name,
+                    "medianMs": round(median(timings) * 1000, 3),
+                    "stress": round(normalized_stress(points, projection), 4),
+                }
+            )
+
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'size':<12} {'method':<12} {'median ms':>10} {'stress':>8}")
+    for row in run(args.repeats):
+        print(f"{row['size']:<12} {row['method']:<12} {row['medianMs']:>10} {row['stress']:>8}")
+
+
+if __name__ == "__main__":
+    main()
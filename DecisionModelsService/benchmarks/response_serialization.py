@@ -0,0 +1,127 @@
+"""Compara la serialización de respuestas de modelos antes y después del camino rápido.
+
+Uso: ``python -m benchmarks.response_serialization [--experts 40] [--alternatives 400] [--criteria 25]``.
+``legacy_response_body`` reproduce lo que hacía FastAPI con ``response_model``:
+revalidar contra ``ModelExecutionResponse``, ``model_dump`` sin ``None``,
+``jsonable_encoder`` y ``json.dumps``. La carga es la salida de 2-tuple TOPSIS
+con la forma del executor (``rawOutput`` incluido).
+"""
+
+import argparse
+import json
+from statistics import median
+from time import perf_counter
+
+from fastapi.encoders import jsonable_encoder
+
+from benchmarks.topsis_2tuple_kernel import build_problem
+from models.topsis_2tuple.run import run_topsis_2tuple
+from schemas.common import ModelExecutionResponse
+from services.model_executors.responses import success_response
+from services.model_executors.serialization import model_execution_response
+
+
+def build_result(n_exp: int, n_alt: int, n_crit: int) -> dict:
+    problem = build_problem(n_exp, n_alt, n_crit)
+    raw_output = run_topsis_2tuple(
+        matrices=problem["tensor"],
+        expert_weights=problem["expert_weights"],
+        weights=problem["weights"],
+        criterion_directions=problem["directions"],
+        criterion_scales=problem["scales"],
+    )
+    ranked_alternatives = [
+        {
+            "alternativeId": f"alternative-{index}",
+            "name": f"Alternative {index}",
+            "score": raw_output["collective_scores"][index],
+            "rank": rank,
+        }
+        for rank, index in enumerate(raw_output["collective_ranking"], start=1)
+    ]
+
+    return success_response(
+        "2-Tuple TOPSIS executed successfully",
+        {
+            "rankedAlternatives": ranked_alternatives,
+            "plotsGraphic": raw_output["plots_graphic"],
+            "consensusMeasure": None,
+            "rawOutput": raw_output,
+        },
+    )
+
+
+def legacy_response_body(result: dict) -> bytes:
+    envelope = ModelExecutionResponse.model_validate(result).model_dump(
+        mode="json",
+        exclude_none=True,
+    )
+    return json.dumps(
+        jsonable_encoder(envelope),
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def _median_ms(render, repeats: int) -> tuple[float, bytes]:
+    timings = []
+    for _ in range(repeats):
+        started = perf_counter()
+        body = render()
+        timings.append(perf_counter() - started)
+    return round(median(timings) * 1000, 3), body
+
+
+def run(
+    n_exp: int = 40,
+    n_alt: int = 400,
+    n_crit: int = 25,
+    repeats: int = 5,
+) -> dict[str, float | int | bool]:
+    result = build_result(n_exp, n_alt, n_crit)
+
+    legacy_ms, legacy_body = _median_ms(lambda: legacy_response_body(result), repeats)
+    fast_ms, fast_body = _median_ms(lambda: model_execution_response(result).body, repeats)
+    omit_ms, omit_body = _median_ms(
+        lambda: model_execution_response(result, "omit").body,
+        repeats,
+    )
+    gzip_ms, gzip_body = _median_ms(
+        lambda: model_execution_response(result, "gzip").body,
+        repeats,
+    )
+
+    return {
+        "legacyMs": legacy_ms,
+        "fastMs": fast_ms,
+        "omitMs": omit_ms,
+        "gzipMs": gzip_ms,
+        "legacyBytes": len(legacy_body),
+        "omitBytes": len(omit_body),
+        "gzipBytes": len(gzip_body),
+        "equal": json.loads(legacy_body) == json.loads(fast_body),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--experts", type=int, default=40)
+    parser.add_argument("--alternatives", type=int, default=400)
+    parser.add_argument("--criteria", type=int, default=25)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    result = run(args.experts, args.alternatives, args.criteria, args.repeats)
+    print(
+        f"{args.experts} experts x {args.alternatives} alternatives x {args.criteria} criteria: "
+        f"legacy {result['legacyMs']} ms, fast {result['fastMs']} ms "
+        f"({result['legacyBytes']} bytes), rawOutput=omit {result['omitMs']} ms "
+        f"({result['omitBytes']} bytes), rawOutput=gzip {result['gzipMs']} ms "
+        f"({result['gzipBytes']} bytes), equal={result['equal']}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,359 @@
+"""Genera payloads ``GenericModelExecutionRequest`` sintéticos de cualquier tamaño.
+
+Uso: ``python -m benchmarks.synthetic_issues topsis [--experts 10] [--alternatives 20] [--criteria 8]``.
+El payload se deriva de la ``ModelDefinition`` del modelo: la estructura de
+evaluación decide la forma de ``evaluations``, el dominio de expresión sale
+del ejemplo de request (o, si no lo hay, de ``supported_expression_domains``),
+los parámetros por criterio se generan para los criterios nuevos y el resto
+de ``modelParameters`` se copia del ejemplo. Con la misma semilla el payload
+es siempre el mismo.
+"""
+
+import argparse
+import json
+from copy import deepcopy
+from typing import Any, Callable
+
+import numpy as np
+
+from registry.model_definition import ModelDefinition
+from registry.model_registry import get_model_definition_by_key
+
+CRITERION_PARAMETER_STRUCTURES = {"numberCriterion", "selectCriterion"}
+
+DEFAULT_EXPRESSION_DOMAINS: dict[str, dict[str, Any]] = {
+    "numericContinuous": {"min": 0.0, "max": 10.0},
+    "numericDiscrete": {"min": 0, "max": 10, "step": 1},
+    "linguisticFuzzy": {
+        "membershipFunction": "triangular",
+        "labelCount": 5,
+        "labels": [
+            {"key": f"l{index}", "label": f"L{index}", "index": index, "values": values}
+            for index, values in enumerate(
+                [[0.0, 0.1, 0.3], [0.1, 0.3, 0.5], [0.3, 0.5, 0.7], [0.5, 0.7, 0.9], [0.7, 0.9, 1.0]]
+            )
+        ],
+    },
+    "linguistic2Tuple": {
+        "labelCount": 7,
+        "labels": [{"key": f"s{index}", "label": f"S{index}", "index": index} for index in range(7)],
+    },
+}
+
+
+def _template(model: ModelDefinition) -> dict[str, Any]:
+    example = next(iter(model.request_examples.values()), None)
+    value = example.get("value") if isinstance(example, dict) else None
+    return deepcopy(value) if isinstance(value, dict) else {}
+
+
+def _expression_domain(model: ModelDefinition, template: dict[str, Any]) -> dict[str, Any] | None:
+    supported = [entry.get("typeKey") for entry in model.supported_expression_domains]
+    for criterion in template.get("context", {}).get("criteria", []):
+        domain = criterion.get("expressionDomain")
+        if isinstance(domain, dict) and domain.get("typeKey") in supported:
+            return domain
+
+    for type_key in supported:
+        if type_key in DEFAULT_EXPRESSION_DOMAINS:
+            return {
+                "name": f"Synthetic {type_key}",
+                "typeKey": type_key,
+                "definition": deepcopy(DEFAULT_EXPRESSION_DOMAINS[type_key]),
+            }
+    return None
+
+
+def _domain_values(domain: dict[str, Any] | None, rng: np.random.Generator, shape: tuple[int, ...]):
+    """Valores válidos del dominio con la forma pedida (listas anidadas)."""
+
+    type_key = (domain or {}).get("typeKey", "numericContinuous")
+    definition = (domain or {}).get("definition") or {}
+
+    if type_key == "linguisticFuzzy":
+        keys = [label["key"] for label in definition["labels"]]
+        indexes = rng.integers(0, len(keys), shape)
+        return np.vectorize(lambda index: {"labelKey": keys[index]}, otypes=[object])(indexes).tolist()
+
+    if type_key == "linguistic2Tuple":
+        keys = [label["key"] for label in definition["labels"]]
+        # beta en una rejilla de centésimas; alpha = beta - round(beta) ∈ [-0.5, 0.5).
+        betas = rng.integers(0, (len(keys) - 1) * 100 + 1, shape) / 100
+        labels = np.floor(betas + 0.5).astype(int)
+        alphas = np.round(betas - labels, 2)
+        return np.vectorize(
+            lambda index, alpha: {"labelKey": keys[index], "alpha": float(alpha) + 0.0},
+            otypes=[object],
+        )(labels, alphas).tolist()
+
+    low = float(definition.get("min", 0.0))
+    high = float(definition.get("max", 10.0))
+    if type_key == "numericDiscrete":
+        return rng.integers(int(low), int(high) + 1, shape).astype(float).tolist()
+    return np.round(rng.uniform(low, high, shape), 2).tolist()
+
+
+def _entities(prefix: str, label: str, count: int) -> list[dict[str, str]]:
+    return [{"id": f"{prefix}-{index}", "name": f"{label} {index}"} for index in range(count)]
+
+
+def _criteria(model: ModelDefinition, domain: dict[str, Any] | None, count: int) -> list[dict[str, Any]]:
+    criteria = _entities("criterion", "Criterion", count)
+    for index, criterion in enumerate(criteria):
+        if model.uses_criterion_types:
+            criterion["type"] = "cost" if index % 3 == 1 else "benefit"
+        if domain is not None and model.evaluation_structure_key == "alternativeCriteriaMatrix":
+            criterion["expressionDomain"] = deepcopy(domain)
+    return criteria
+
+
+def _expert_weights(experts: int, rng: np.random.Generator) -> list[float]:
+    weights = rng.uniform(0.5, 1.5, experts)
+    return (weights / weights.sum()).tolist()
+
+
+def _model_parameters(
+    model: ModelDefinition,
+    template: dict[str, Any],
+    criterion_ids: list[str],
+    rng: np.random.Generator,
+) -> dict[str, Any]:
+    template_parameters = dict(template.get("modelParameters") or {})
+    parameters = {
+        key: value
+        for key, value in template_parameters.items()
+        if key != "weights"
+    }
+
+    for definition in model.parameters:
+        key = definition["key"]
+        if definition.get("parameterStructureKey") not in CRITERION_PARAMETER_STRUCTURES:
+            parameters.setdefault(key, deepcopy(definition.get("default")))
+            continue
+
+        # Los valores por criterio del ejemplo se reparten cíclicamente.
+        example_values = list((template_parameters.get(key) or {}).values()) or [definition.get("default")]
+        parameters[key] = {
+            criterion_id: deepcopy(example_values[index % len(example_values)])
+            for index, criterion_id in enumerate(criterion_ids)
+        }
+
+    if model.uses_fuzzy_criteria_weights:
+        triangles = np.sort(np.round(rng.uniform(0.05, 1.0, (len(criterion_ids), 3)), 2), axis=1)
+        parameters["weights"] = dict(zip(criterion_ids, triangles.tolist()))
+    elif model.uses_criteria_weights:
+        weights = rng.uniform(0.5, 1.5, len(criterion_ids))
+        parameters["weights"] = dict(zip(criterion_ids, (weights / weights.sum()).tolist()))
+
+    return parameters
+
+
+def _expert(index: int) -> dict[str, str]:
+    return {"id": f"expert-{index}", "name": f"Expert {index}", "email": f"expert{index}@example.com"}
+
+
+def _alternative_criteria_matrix(model, template, domain, experts, alternatives, criteria, rng):
+    alternative_items = _entities("alternative", "Alternative", alternatives)
+    criterion_items = _criteria(model, domain, criteria)
+    values = _domain_values(domain, rng, (experts, alternatives, criteria))
+    weights = _expert_weights(experts, rng)
+    with_weights = model.uses_expert_weights or any(
+        "weight" in evaluation for evaluation in template.get("evaluations", [])
+    )
+
+    evaluations = []
+    for expert_index in range(experts):
+        evaluation = {
+            "expert": _expert(expert_index),
+            "payload": {
+                alternative["id"]: {
+                    criterion["id"]: values[expert_index][alternative_index][criterion_index]
+                    for criterion_index, criterion in enumerate(criterion_items)
+                }
+                for alternative_index, alternative in enumerate(alternative_items)
+            },
+        }
+        if with_weights:
+            evaluation["weight"] = weights[expert_index]
+        evaluations.append(evaluation)
+
+    return alternative_items, criterion_items, evaluations
+
+
+def _alternative_pairwise_by_criterion(model, template, domain, experts, alternatives, criteria, rng):
+    alternative_items = _entities("alternative", "Alternative", alternatives)
+    criterion_items = _criteria(model, domain, criteria)
+    ids = [alternative["id"] for alternative in alternative_items]
+    preferences = np.round(rng.uniform(0.05, 0.95, (experts, criteria, alternatives, alternatives)), 2)
+    # Matrices recíprocas aditivas: p(j, i) = 1 - p(i, j).
+    preferences = np.triu(preferences, 1) + np.tril(1 - np.swapaxes(np.triu(preferences, 1), -1, -2), -1)
+    preferences = np.round(preferences, 2)
+
+    evaluations = [
+        {
+            "expert": _expert(expert_index),
+            "payload": {
+                criterion["id"]: {
+                    row_id: {
+                        column_id: float(preferences[expert_index, criterion_index, row, column])
+                        for column, column_id in enumerate(ids)
+                        if column != row
+                    }
+                    for row, row_id in enumerate(ids)
+                }
+                for criterion_index, criterion in enumerate(criterion_items)
+            },
+        }
+        for expert_index in range(experts)
+    ]
+    return alternative_items, criterion_items, evaluations
+
+
+def _best_worst_criteria(model, template, domain, experts, alternatives, criteria, rng):
+    criterion_items = _criteria(model, domain, criteria)
+    ids = [criterion["id"] for criterion in criterion_items]
+    evaluations = []
+
+    for expert_index in range(experts):
+        best, worst = rng.choice(len(ids), 2, replace=False)
+        best_to_others = rng.integers(2, 10, len(ids))
+        others_to_worst = rng.integers(2, 10, len(ids))
+        best_to_others[best] = others_to_worst[worst] = 1
+        best_to_others[worst] = others_to_worst[best] = 9
+        evaluations.append(
+            {
+                "expert": _expert(expert_index),
+                "payload": {
+                    "bestCriterionId": ids[best],
+                    "worstCriterionId": ids[worst],
+                    "bestToOthers": dict(zip(ids, best_to_others.tolist())),
+                    "othersToWorst": dict(zip(ids, others_to_worst.tolist())),
+                },
+            }
+        )
+    return [], criterion_items, evaluations
+
+
+def _manual_criteria_weights(model, template, domain, experts, alternatives, criteria, rng):
+    criterion_items = _criteria(model, domain, criteria)
+    ids = [criterion["id"] for criterion in criterion_items]
+    weights = rng.uniform(0.5, 1.5, (experts, criteria))
+    weights = weights / weights.sum(axis=1, keepdims=True)
+    evaluations = [
+        {
+            "expert": _expert(expert_index),
+            "payload": {"weightsByCriterion": dict(zip(ids, weights[expert_index].tolist()))},
+        }
+        for expert_index in range(experts)
+    ]
+    return [], criterion_items, evaluations
+
+
+def _criteria_preference_order(model, template, domain, experts, alternatives, criteria, rng):
+    criterion_items = _criteria(model, domain, criteria)
+    ids = [criterion["id"] for criterion in criterion_items]
+    evaluations = [
+        {
+            "expert": _expert(expert_index),
+            "payload": {"criterionOrder": [ids[index] for index in rng.permutation(len(ids))]},
+        }
+        for expert_index in range(experts)
+    ]
+    return [], criterion_items, evaluations
+
+
+PayloadBuilder = Callable[..., tuple[list[dict], list[dict], list[dict]]]
+
+EVALUATION_BUILDERS: dict[str, PayloadBuilder] = {
+    "alternativeCriteriaMatrix": _alternative_criteria_matrix,
+    "alternativePairwiseByCriterion": _alternative_pairwise_by_criterion,
+    "bestWorstCriteria": _best_worst_criteria,
+    "manualCriteriaWeights": _manual_criteria_weights,
+    "criteriaPreferenceOrder": _criteria_preference_order,
+}
+
+
+def build_payload(
+    model: ModelDefinition,
+    *,
+    experts: int,
+    alternatives: int,
+    criteria: int,
+    seed: int = 42,
+) -> dict[str, Any]:
+    """Payload válido de ``experts`` × ``alternatives`` × ``criteria`` para ``model``.
+
+    Los modelos de ponderación de criterios ignoran ``alternatives``.
+    """
+
+    builder = EVALUATION_BUILDERS.get(model.evaluation_structure_key)
+    if builder is None:
+        raise ValueError(
+            f"Unsupported evaluation structure '{model.evaluation_structure_key}' "
+            f"for model '{model.api_model_key}'"
+        )
+
+    rng = np.random.default_rng(seed)
+    template = _template(model)
+    domain = _expression_domain(model, template)
+    alternative_items, criterion_items, evaluations = builder(
+        model, template, domain, experts, alternatives, criteria, rng
+    )
+    stage = "criteriaWeighting" if model.model_kind == "criteriaWeighting" else "alternativeEvaluation"
+
+    context: dict[str, Any] = {
+        "issue": {
+            "id": f"issue-synthetic-{model.api_model_key}",
+            "name": f"Synthetic {model.display_name} issue",
+            "consensusThreshold": None,
+            "consensusMaxPhases": None,
+        },
+        "criteria": criterion_items,
+        "consensusPhase": 0,
+        "previousStageResult": None,
+        "structure": {"key": model.evaluation_structure_key, "stage": stage},
+    }
+    if alternative_items:
+        context["alternatives"] = alternative_items
+    template_issue = template.get("context", {}).get("issue") or {}
+    for key in ("consensusThreshold", "consensusMaxPhases"):
+        if template_issue.get(key) is not None:
+            context["issue"][key] = template_issue[key]
+
+    return {
+        "context": context,
+        "modelParameters": _model_parameters(
+            model,
+            template,
+            [criterion["id"] for criterion in criterion_items],
+            rng,
+        ),
+        "evaluations": evaluations,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("model")
+    parser.add_argument("--experts", type=int, default=10)
+    parser.add_argument("--alternatives", type=int, default=20)
+    parser.add_argument("--criteria", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    model = get_model_definition_by_key(args.model)
+    if model is None:
+        parser.error(f"Unknown model '{args.model}'")
+
+    payload = build_payload(
+        model,
+        experts=args.experts,
+        alternatives=args.alternatives,
+        criteria=args.criteria,
+        seed=args.seed,
+    )
+    print(json.dumps(payload, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""Compara el kernel vectorizado de 2-tuple TOPSIS con la versión celda a celda.
+
+Uso: ``python -m benchmarks.topsis_2tuple_kernel [--experts 20] [--alternatives 200] [--criteria 12]``.
+``legacy_topsis_2tuple`` reproduce los bucles originales (con ``delta`` por
+celda) y sirve también de referencia numérica en los tests.
+"""
+
+import argparse
+from statistics import median
+from time import perf_counter
+
+import numpy as np
+
+from models.topsis_2tuple.run import (
+    FLOAT_TOLERANCE,
+    aggregate_expert_matrices,
+    delta,
+    evaluate_collective_beta_matrix,
+)
+
+LABEL_COUNT = 7
+
+
+def build_scales(n_crit: int, label_count: int = LABEL_COUNT) -> list[dict]:
+    labels = [{"key": f"s{index}", "index": index} for index in range(label_count)]
+    return [{"labels": labels} for _ in range(n_crit)]
+
+
+def build_problem(n_exp: int, n_alt: int, n_crit: int, seed: int = 42) -> dict:
+    rng = np.random.default_rng(seed)
+    betas = np.round(rng.uniform(0, LABEL_COUNT - 1, (n_exp, n_alt, n_crit)), 2)
+    expert_weights = rng.random(n_exp)
+    criterion_weights = rng.random(n_crit)
+
+    return {
+        "tensor": betas,
+        "matrices": {f"expert-{index}": betas[index].tolist() for index in range(n_exp)},
+        "expert_weights": (expert_weights / expert_weights.sum()).tolist(),
+        "weights": (criterion_weights / criterion_weights.sum()).tolist(),
+        "directions": ["max" if index % 3 else "min" for index in range(n_crit)],
+        "scales": build_scales(n_crit),
+    }
+
+
+def legacy_topsis_2tuple(matrices, expert_weights, weights, directions, scales):
+    labels = [scale["labels"] for scale in scales]
+    expert_weights = [weight / sum(expert_weights) for weight in expert_weights]
+    weights = [weight / sum(weights) for weight in weights]
+    expert_items = list(matrices.values())
+    n_alt = len(expert_items[0])
+    n_crit = len(expert_items[0][0])
+
+    collective = [[0.0] * n_crit for _ in range(n_alt)]
+    for expert_index, matrix in enumerate(expert_items):
+        for i in range(n_alt):
+            for j in range(n_crit):
+                collective[i][j] += expert_weights[expert_index] * float(matrix[i][j])
+    collective_2tuples = [
+        [delta(beta=collective[i][j], labels=labels[j]) for j in range(n_crit)]
+        for i in range(n_alt)
+    ]
+
+    positive_ideal, negative_ideal = [], []
+    for j in range(n_crit):
+        column = [collective[i][j] for i in range(n_alt)]
+        best, worst = (max(column), min(column)) if directions[j] == "max" else (min(column), max(column))
+        positive_ideal.append(best)
+        negative_ideal.append(worst)
+
+    positive_distances, negative_distances, closeness = [], [], []
+    for i in range(n_alt):
+        positive = negative = 0.0
+        for j in range(n_crit):
+            positive += weights[j] * abs(collective[i][j] - positive_ideal[j])
+            negative += weights[j] * abs(collective[i][j] - negative_ideal[j])
+        positive_distances.append(positive)
+        negative_distances.append(negative)
+        denominator = positive + negative
+        closeness.append(0.5 if denominator <= FLOAT_TOLERANCE else min(max(negative / denominator, 0.0), 1.0))
+
+    ranking = sorted(range(n_alt), key=lambda index: (-closeness[index], index))
+
+    return {
+        "collective_beta_matrix": collective,
+        "collective_matrix": collective_2tuples,
+        "positive_ideal_beta": positive_ideal,
+        "negative_ideal_beta": negative_ideal,
+        "positive_distances": positive_distances,
+        "negative_distances": negative_distances,
+        "closeness_coefficients": closeness,
+        "collective_ranking": ranking,
+    }
+
+
+def vectorized_topsis_2tuple(tensor, expert_weights, weights, directions, scales):
+    aggregation = aggregate_expert_matrices(
+        matrices=tensor,
+        expert_weights=expert_weights,
+        criterion_scales=scales,
+    )
+    evaluation = evaluate_collective_beta_matrix(
+        collective_beta_matrix=np.array(aggregation["collective_beta_matrix"]),
+        weights=weights,
+        criterion_directions=directions,
+        criterion_scales=scales,
+    )
+    return {**aggregation, **evaluation}
+
+
+def run(n_exp: int = 20, n_alt: int = 200, n_crit: int = 12, repeats: int = 3) -> dict[str, float | bool]:
+    problem = build_problem(n_exp, n_alt, n_crit)
+    arguments = (problem["expert_weights"], problem["weights"], problem["directions"], problem["scales"])
+    timings: dict[str, list[float]] = {"legacy": [], "vectorized": []}
+    outputs = {}
+
+    for _ in range(repeats):
+        started = perf_counter()
+        outputs["legacy"] = legacy_topsis_2tuple(problem["matrices"], *arguments)
+        timings["legacy"].append(perf_counter() - started)
+
+        started = perf_counter()
+        outputs["vectorized"] = vectorized_topsis_2tuple(problem["tensor"], *arguments)
+        timings["vectorized"].append(perf_counter() - started)
+
+    identical = all(
+        outputs["vectorized"][key] == value
+        for key, value in outputs["legacy"].items()
+    )
+
+    return {
+        "legacyMs": round(median(timings["legacy"]) * 1000, 3),
+        "vectorizedMs": round(median(timings["vectorized"]) * 1000, 3),
+        "bitIdentical": identical,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--experts", type=int, default=20)
+    parser.add_argument("--alternatives", type=int, default=200)
+    parser.add_argument("--criteria", type=int, default=12)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    result = run(args.experts, args.alternatives, args.criteria, args.repeats)
+    print(
+        f"{args.experts} experts x {args.alternatives} alternatives x {args.criteria} criteria: "
+        f"legacy {result['legacyMs']} ms, vectorized {result['vectorizedMs']} ms, "
+        f"bit-identical={result['bitIdentical']}"
+    )
+
+
+if __name__ == "__main__":
+    main()
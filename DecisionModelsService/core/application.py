@@ -9,6 +9,10 @@ from api.routers.model_manifest import router as model_manifest_router
 from api.routers.models import router as models_router
 from api.routers.results_analysis import router as results_analysis_router
 from api.routers.system import router as system_router
+from services.model_executors.execution import shutdown_model_execution_backend
+from services.model_executors.solver_pool import shutdown_solver_pool
+from services.model_executors.warmup import shutdown_model_warmup, start_model_warmup
+from services.results_analysis.cache import shutdown_analysis_result_cache
 
 
 def _ensure_error_example_nulls(openapi_schema: dict) -> None:
@@ -71,6 +75,12 @@ def create_application() -> FastAPI:
             },
         )
 
+    app.add_event_handler("startup", start_model_warmup)
+    app.add_event_handler("shutdown", shutdown_model_warmup)
+    app.add_event_handler("shutdown", shutdown_model_execution_backend)
+    app.add_event_handler("shutdown", shutdown_solver_pool)
+    app.add_event_handler("shutdown", shutdown_analysis_result_cache)
+
     app.include_router(health_router)
     app.include_router(model_manifest_router)
     app.include_router(system_router)
@@ -12,3 +12,49 @@ def is_production_environment() -> bool:
     return any(
         str(value or "").strip().lower() == "production" for value in candidates
     )
+
+
+def _get_env_value(*names: str) -> str | None:
+    for name in names:
+        value = os.getenv(name)
+        if value is not None and str(value).strip():
+            return str(value).strip()
+
+    return None
+
+
+def get_int_setting(name: str, default: int, *, minimum: int = 0) -> int:
+    value = _get_env_value(name)
+
+    if value is None:
+        return default
+
+    try:
+        parsed = int(value)
+    except ValueError:
+        return default
+
+    return max(parsed, minimum)
+
+
+def get_float_setting(name: str, default: float | None) -> float | None:
+    value = _get_env_value(name)
+
+    if value is None:
+        return default
+
+    try:
+        parsed = float(value)
+    except ValueError:
+        return default
+
+    return parsed if parsed > 0 else None
+
+
+def get_str_setting(name: str, default: str) -> str:
+    value = _get_env_value(name)
+    return value.lower() if value is not None else default
+
+
+def get_path_setting(name: str) -> str | None:
+    return _get_env_value(name)
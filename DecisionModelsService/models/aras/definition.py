@@ -1,6 +1,7 @@
+from registry.lazy_handler import lazy_handler
 from registry.model_definition import ModelDefinition
 from schemas.model_requests import GenericModelExecutionRequest
-from .executor import execute_aras
+from utils.projections import PROJECTION_METHOD_PARAMETER
 from .examples import ARAS_REQUEST_EXAMPLES, ARAS_RESPONSE_EXAMPLES
 
 
@@ -8,7 +9,7 @@ MODEL_DEFINITION = ModelDefinition(
         api_model_key="aras",
         api_endpoint_path="/aras",
         request_model=GenericModelExecutionRequest,
-        handler=execute_aras,
+        handler=lazy_handler(".executor:execute_aras", __package__),
         small_description=(
             "Utility-ratio method that compares each alternative against an optimal "
             "reference using normalized weighted criteria."
@@ -35,4 +36,5 @@ MODEL_DEFINITION = ModelDefinition(
             {"typeKey": "numericContinuous"},
             {"typeKey": "numericDiscrete"},
         ],
+        parameters=[PROJECTION_METHOD_PARAMETER],
     )
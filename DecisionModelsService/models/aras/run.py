@@ -5,18 +5,21 @@ from typing import Any
 import numpy as np
 from pyDecision.algorithm import aras_method
 
+from models.shared_alternative_matrix import expert_matrix_tensor
 from utils.clean_matrix import clean_matrix
 from utils.get_plots_graphics_from_matrices import get_plots_graphics_from_matrices
+from utils.projections import DEFAULT_PROJECTION_METHOD
 
 
 def run_aras(
-    matrices: dict[str, list[list[float]]],
+    matrices: np.ndarray | dict[str, list[list[float]]],
     weights: list[float],
     criterion_type: list[str],
+    projection_method: str = DEFAULT_PROJECTION_METHOD,
 ) -> dict[str, Any]:
     """Ejecuta ARAS sobre la matriz colectiva de expertos."""
 
-    matrices_np = [np.array(matrix, dtype=float) for matrix in matrices.values()]
+    matrices_np = expert_matrix_tensor(matrices)
     collective_matrix = np.mean(matrices_np, axis=0)
 
     matrix_clean, weights_clean, criteria_clean = clean_matrix(
@@ -52,6 +55,6 @@ def run_aras(
         "plots_graphic": get_plots_graphics_from_matrices(
             matrices_np,
             collective_matrix,
-            method="MDS",
+            method=projection_method,
         ),
     }
@@ -1,6 +1,7 @@
+from registry.lazy_handler import lazy_handler
 from registry.model_definition import ModelDefinition
 from schemas.model_requests import GenericModelExecutionRequest
-from .executor import execute_borda
+from utils.projections import PROJECTION_METHOD_PARAMETER
 from .examples import BORDA_REQUEST_EXAMPLES, BORDA_RESPONSE_EXAMPLES
 
 
@@ -8,7 +9,7 @@ MODEL_DEFINITION = ModelDefinition(
         api_model_key="borda",
         api_endpoint_path="/borda",
         request_model=GenericModelExecutionRequest,
-        handler=execute_borda,
+        handler=lazy_handler(".executor:execute_borda", __package__),
         small_description=(
             "Voting-based ranking method that converts collective preferences into point "
             "scores to produce a simple and interpretable group order."
@@ -35,4 +36,5 @@ MODEL_DEFINITION = ModelDefinition(
             {"typeKey": "numericContinuous"},
             {"typeKey": "numericDiscrete"},
         ],
+        parameters=[PROJECTION_METHOD_PARAMETER],
     )
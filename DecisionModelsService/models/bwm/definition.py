@@ -1,13 +1,13 @@
+from registry.lazy_handler import lazy_handler
 from registry.model_definition import ModelDefinition
 from schemas.model_requests import GenericModelExecutionRequest
-from .executor import execute_bwm
 from .examples import BWM_REQUEST_EXAMPLES, BWM_RESPONSE_EXAMPLES
 
 MODEL_DEFINITION = ModelDefinition(
     api_model_key="bwm",
     api_endpoint_path="/bwm",
     request_model=GenericModelExecutionRequest,
-    handler=execute_bwm,
+    handler=lazy_handler(".executor:execute_bwm", __package__),
     small_description=(
         "Auxiliary weighting service that derives criterion weights from best-worst "
         "comparisons provided by experts."
@@ -32,5 +32,19 @@ MODEL_DEFINITION = ModelDefinition(
     uses_fuzzy_criteria_weights=False,
     uses_criterion_types=False,
     supported_expression_domains=[],
-    parameters=[],
+    parameters=[
+        {
+            "key": "formulation",
+            "label": "BWM formulation",
+            "valueType": "string",
+            "parameterStructureKey": "selectGlobal",
+            "required": False,
+            "default": "nonlinear",
+            "restrictions": {
+                "min": None,
+                "max": None,
+                "allowed": ["nonlinear", "linear"],
+            },
+        },
+    ],
 )
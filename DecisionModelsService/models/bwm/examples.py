@@ -137,6 +137,7 @@ BWM_RESPONSE_EXAMPLES: dict[str, dict[str, Any]] = {
                     },
                     "n_experts": 2,
                     "eps_penalty": 1.0,
+                    "formulation": "nonlinear",
                     "useMcc": True,
                     "expertWeightsByExpert": {
                         "ana.torres@example.com": {
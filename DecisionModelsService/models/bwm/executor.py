@@ -5,7 +5,7 @@ from fastapi.responses import JSONResponse
 from schemas.model_requests import GenericModelExecutionRequest
 from services.criteria_weights_consensus.mcc_weights import solve_mcc_weights
 from services.model_executors.responses import error_response, success_response
-from .run import run_bwm
+from .run import BWM_FORMULATIONS, DEFAULT_BWM_FORMULATION, run_bwm
 
 
 def _is_plain_object(value: Any) -> bool:
@@ -215,8 +215,13 @@ def execute_bwm(payload: GenericModelExecutionRequest) -> dict[str, Any] | JSONR
         )
         eps_penalty = model_parameters.get("eps_penalty", 1)
         eps_penalty = float(eps_penalty) if eps_penalty is not None else 1
+        formulation = model_parameters.get("formulation") or DEFAULT_BWM_FORMULATION
+        if formulation not in BWM_FORMULATIONS:
+            return error_response(
+                f"modelParameters.formulation must be one of {list(BWM_FORMULATIONS)}"
+            )
 
-        results = run_bwm(experts_data, eps_penalty)
+        results = run_bwm(experts_data, eps_penalty, formulation=formulation)
 
         if not results.get("success", False):
             return error_response(results.get("message") or "Error executing BWM")
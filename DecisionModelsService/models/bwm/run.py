@@ -1,10 +1,31 @@
-"""Implementación del modelo Best-Worst Method (BWM)."""
+"""Implementación del modelo Best-Worst Method (BWM).
+
+Cada experto se resuelve de forma independiente: con la formulación no lineal
+de pyDecision (``bw_method``, por defecto) o con la formulación lineal de
+Rezaei (2016) como un LP pequeño. Los problemas pendientes se reparten en el
+pool de ``services.model_executors.solver_pool`` y las soluciones se guardan en
+una LRU por proceso indexada por la entrada normalizada del experto.
+"""
 
 import math
+from collections import OrderedDict
+from threading import Lock
+from time import perf_counter
 from typing import Any
 
 import numpy as np
 from pyDecision.algorithm import bw_method
+from scipy.optimize import linprog
+
+from core.environment import get_int_setting
+from services.model_executors.solver_pool import map_solver_tasks
+
+BWM_FORMULATIONS = ("nonlinear", "linear")
+DEFAULT_BWM_FORMULATION = "nonlinear"
+DEFAULT_BWM_CACHE_SIZE = 256
+
+# (formulación, eps_penalty, mejor, peor, MIC, LIC)
+SolveKey = tuple[str, float, int, int, tuple[float, ...], tuple[float, ...]]
 
 
 def _to_weight_list(raw_weights: Any, expert_key: str) -> list[float]:
@@ -35,9 +56,127 @@ def _to_weight_list(raw_weights: Any, expert_key: str) -> list[float]:
     return weights
 
 
+def consistency_ratio(mic: np.ndarray, lic: np.ndarray) -> float:
+    """Ratio de consistencia de entrada (Liang et al., 2020), en forma cerrada.
+
+    ``max_j |a_Bj · a_jW − a_BW| / (a_BW² − a_BW)``, con ``a_BW`` la comparación
+    del mejor criterio frente al peor; vale 0 si ``a_BW`` es 1.
+    """
+
+    a_bw = float(mic[int(np.argmin(lic))])
+    if a_bw <= 1:
+        return 0.0
+
+    return float(np.max(np.abs(mic * lic - a_bw)) / (a_bw * a_bw - a_bw))
+
+
+def _solve_linear_bwm(mic: np.ndarray, lic: np.ndarray) -> tuple[np.ndarray, float]:
+    """``min ξ`` s.a. ``|w_B − a_Bj·w_j| ≤ ξ``, ``|w_j − a_jW·w_W| ≤ ξ``, ``Σw = 1``, ``w ≥ 0``."""
+
+    n_crit = mic.size
+    best = int(np.argmin(mic))
+    worst = int(np.argmin(lic))
+    diagonal = np.arange(n_crit)
+
+    best_rows = np.zeros((n_crit, n_crit + 1))
+    best_rows[:, best] += 1.0
+    best_rows[diagonal, diagonal] -= mic
+    worst_rows = np.zeros((n_crit, n_crit + 1))
+    worst_rows[diagonal, diagonal] += 1.0
+    worst_rows[:, worst] -= lic
+
+    deviations = np.vstack([best_rows, worst_rows])
+    a_ub = np.vstack([deviations, -deviations])
+    a_ub[:, -1] = -1.0
+
+    result = linprog(
+        c=np.append(np.zeros(n_crit), 1.0),
+        A_ub=a_ub,
+        b_ub=np.zeros(len(a_ub)),
+        A_eq=np.append(np.ones(n_crit), 0.0).reshape(1, -1),
+        b_eq=[1.0],
+        bounds=[(0.0, 1.0)] * n_crit + [(0.0, None)],
+        method="highs",
+    )
+    if result.status != 0:
+        raise ValueError(f"Linear BWM LP did not reach an optimum: {result.message}")
+
+    # HiGHS puede devolver -1e-17 en pesos nulos.
+    return np.clip(result.x[:-1], 0.0, None), float(result.x[-1])
+
+
+def solve_bwm_expert(key: SolveKey) -> dict[str, Any]:
+    """Resuelve un experto; se ejecuta en el pool de solvers, así que solo recibe la clave."""
+
+    formulation, eps_penalty, _, _, mic_values, lic_values = key
+    mic = np.array(mic_values, dtype=float)
+    lic = np.array(lic_values, dtype=float)
+
+    started = perf_counter()
+    if formulation == "linear":
+        weights, xi = _solve_linear_bwm(mic, lic)
+    else:
+        weights, xi = bw_method(mic, lic, eps_penalty=eps_penalty, verbose=False), None
+
+    return {
+        "weights": np.asarray(weights, dtype=float).reshape(-1).tolist(),
+        "xi": xi,
+        "solveSeconds": perf_counter() - started,
+    }
+
+
+class _SolutionCache:
+    """LRU de soluciones por experto; ``bw_method`` fija su semilla, así que es determinista."""
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._entries: OrderedDict[SolveKey, dict[str, Any]] = OrderedDict()
+
+    def get(self, key: SolveKey) -> dict[str, Any] | None:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: SolveKey, value: dict[str, Any]) -> None:
+        max_entries = get_int_setting("DECISION_MODELS_BWM_CACHE_SIZE", DEFAULT_BWM_CACHE_SIZE)
+        if max_entries == 0:
+            return
+
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_solution_cache = _SolutionCache()
+
+
+def clear_bwm_solution_cache() -> None:
+    _solution_cache.clear()
+
+
+def _solve_key(formulation: str, eps_penalty: float, mic: np.ndarray, lic: np.ndarray) -> SolveKey:
+    return (
+        formulation,
+        float(eps_penalty),
+        int(np.argmin(mic)),
+        int(np.argmin(lic)),
+        tuple(mic.tolist()),
+        tuple(lic.tolist()),
+    )
+
+
 def run_bwm(
     experts_data: dict[str, dict[str, list[float]]],
     eps_penalty: float = 1,
+    formulation: str = DEFAULT_BWM_FORMULATION,
 ) -> dict[str, Any]:
     """Run BWM independently for each expert.
 
@@ -47,9 +186,15 @@ def run_bwm(
     try:
         if not experts_data:
             return {"success": False, "message": "No expert data provided"}
+        if formulation not in BWM_FORMULATIONS:
+            return {
+                "success": False,
+                "message": f"BWM formulation must be one of {list(BWM_FORMULATIONS)}",
+            }
 
-        expert_weights: dict[str, list[float]] = {}
+        expert_keys_by_solve: dict[str, SolveKey] = {}
         expert_inputs: dict[str, dict[str, list[float]]] = {}
+        consistency: dict[str, float] = {}
 
         for expert_key, values in experts_data.items():
             mic = np.array(values.get("mic", []), dtype=float)
@@ -67,22 +212,57 @@ def run_bwm(
                     "message": f"BWM MIC/LIC lengths differ for expert '{expert_key}'",
                 }
 
-            raw_weights = bw_method(mic, lic, eps_penalty=eps_penalty, verbose=False)
-            weights = _to_weight_list(raw_weights, expert_key)
+            expert_keys_by_solve[expert_key] = _solve_key(formulation, eps_penalty, mic, lic)
+            expert_inputs[expert_key] = {
+                "mic": mic.tolist(),
+                "lic": lic.tolist(),
+            }
+            consistency[expert_key] = consistency_ratio(mic, lic)
+
+        solutions: dict[SolveKey, dict[str, Any]] = {}
+        cached_keys: set[SolveKey] = set()
+        for key in expert_keys_by_solve.values():
+            cached = _solution_cache.get(key)
+            if cached is not None:
+                solutions[key] = cached
+                cached_keys.add(key)
+
+        pending = [
+            key for key in dict.fromkeys(expert_keys_by_solve.values()) if key not in solutions
+        ]
+        started = perf_counter()
+        solved, solver_workers = map_solver_tasks(solve_bwm_expert, pending) if pending else ([], 0)
+        solve_seconds = perf_counter() - started
+        for key, solution in zip(pending, solved):
+            solutions[key] = solution
+            _solution_cache.set(key, solution)
 
-            if len(weights) != mic.size:
+        expert_weights: dict[str, list[float]] = {}
+        expert_solves: dict[str, dict[str, Any]] = {}
+        solved_now: set[SolveKey] = set()
+
+        for expert_key, key in expert_keys_by_solve.items():
+            solution = solutions[key]
+            weights = _to_weight_list(solution["weights"], expert_key)
+            expected = len(expert_inputs[expert_key]["mic"])
+
+            if len(weights) != expected:
                 return {
                     "success": False,
                     "message": (
                         f"BWM returned {len(weights)} weights for expert '{expert_key}', "
-                        f"expected {mic.size}"
+                        f"expected {expected}"
                     ),
                 }
 
+            reused = key in cached_keys or key in solved_now
+            solved_now.add(key)
             expert_weights[expert_key] = weights
-            expert_inputs[expert_key] = {
-                "mic": mic.tolist(),
-                "lic": lic.tolist(),
+            expert_solves[expert_key] = {
+                "solveMs": None if reused else round(solution["solveSeconds"] * 1000, 3),
+                "cached": reused,
+                "consistencyRatio": consistency[expert_key],
+                "xi": solution["xi"],
             }
 
         return {
@@ -91,6 +271,10 @@ def run_bwm(
             "expertInputs": expert_inputs,
             "n_experts": len(expert_weights),
             "eps_penalty": eps_penalty,
+            "formulation": formulation,
+            "expertSolves": expert_solves,
+            "solverWorkers": solver_workers,
+            "solveMs": round(solve_seconds * 1000, 3),
         }
     except Exception as error:
         return {"success": False, "message": f"Error in run_bwm: {error}"}
@@ -1,13 +1,14 @@
+from registry.lazy_handler import lazy_handler
 from registry.model_definition import ModelDefinition
 from schemas.model_requests import GenericModelExecutionRequest
-from .executor import execute_edas
+from utils.projections import PROJECTION_METHOD_PARAMETER
 from .examples import EDAS_REQUEST_EXAMPLES, EDAS_RESPONSE_EXAMPLES
 
 MODEL_DEFINITION = ModelDefinition(
     api_model_key="edas",
     api_endpoint_path="/edas",
     request_model=GenericModelExecutionRequest,
-    handler=execute_edas,
+    handler=lazy_handler(".executor:execute_edas", __package__),
     small_description=(
         "Distance-based MCDM method that ranks alternatives according to their "
         "positive and negative distances from the average solution."
@@ -34,4 +35,5 @@ MODEL_DEFINITION = ModelDefinition(
         {"typeKey": "numericContinuous"},
         {"typeKey": "numericDiscrete"},
     ],
+    parameters=[PROJECTION_METHOD_PARAMETER],
 )
@@ -1,13 +1,14 @@
+from registry.lazy_handler import lazy_handler
 from registry.model_definition import ModelDefinition
 from schemas.model_requests import GenericModelExecutionRequest
-from .executor import execute_fuzzy_topsis
+from utils.projections import PROJECTION_METHOD_PARAMETER
 from .examples import FUZZY_TOPSIS_REQUEST_EXAMPLES, FUZZY_TOPSIS_RESPONSE_EXAMPLES
 
 MODEL_DEFINITION = ModelDefinition(
     api_model_key="fuzzy_topsis",
     api_endpoint_path="/fuzzy_topsis",
     request_model=GenericModelExecutionRequest,
-    handler=execute_fuzzy_topsis,
+    handler=lazy_handler(".executor:execute_fuzzy_topsis", __package__),
     small_description=(
         "Fuzzy method based on TOPSIS for handling linguistic, uncertain, or "
         "imprecise expert evaluations."
@@ -37,4 +38,5 @@ MODEL_DEFINITION = ModelDefinition(
             },
         }
     ],
+    parameters=[PROJECTION_METHOD_PARAMETER],
 )
@@ -6,13 +6,15 @@ from schemas.model_requests import GenericModelExecutionRequest
 from services.criteria_weights import ordered_fuzzy_weights
 from services.model_executors.responses import error_response, success_response
 from models.shared_alternative_matrix import (
-    extract_id_keyed_alternative_criteria_input,
+    DecisionMatrixValidationError,
+    extract_decision_matrix_tensor,
     normalize_collective_evaluations_by_ids,
 )
 from models.shared_expression_domains import (
+    compile_expression_domain,
     expression_domain_type_key,
-    resolve_linguistic_label_definition,
 )
+from utils.projections import projection_method_error, resolve_projection_method
 from .run import run_fuzzy_topsis
 
 
@@ -75,14 +77,15 @@ def _linguistic_values(
     expression_domain: dict[str, Any],
     field: str,
 ) -> list[float]:
-    label_definition = resolve_linguistic_label_definition(
+    compiled_label = compile_expression_domain(expression_domain).resolve_label(
         value=label,
-        expression_domain=expression_domain,
         field=field,
     )
+    if compiled_label.values is not None:
+        return list(compiled_label.values)
 
     return _numeric_sequence(
-        label_definition.get("values"),
+        compiled_label.definition.get("values"),
         f"{field}.expressionDomain.definition.labels.values",
     )
 
@@ -129,10 +132,11 @@ def _weights(payload: GenericModelExecutionRequest, criteria_count: int) -> list
 
 
 def _input(payload: GenericModelExecutionRequest) -> dict[str, Any]:
-    extracted = extract_id_keyed_alternative_criteria_input(
+    extracted = extract_decision_matrix_tensor(
         payload=payload,
         expert_key_fn=_expert_key,
         evaluation_value_fn=_evaluation_value,
+        cell_shape=(3,),
     )
 
     return {
@@ -217,12 +221,17 @@ def execute_fuzzy_topsis(
     payload: GenericModelExecutionRequest,
 ) -> dict[str, Any] | JSONResponse:
     try:
+        projection_error = projection_method_error(payload)
+        if projection_error is not None:
+            return error_response(projection_error)
+
         execution_input = _input(payload)
 
         results = run_fuzzy_topsis(
-            execution_input["matrices"],
+            execution_input["tensor"],
             execution_input["weights"],
             execution_input["criterion_directions"],
+            projection_method=resolve_projection_method(payload),
         )
 
         return success_response(
@@ -234,6 +243,12 @@ def execute_fuzzy_topsis(
                 criterion_ids=execution_input["criterion_ids"],
             ),
         )
+    except DecisionMatrixValidationError as error:
+        return error_response(
+            str(error),
+            code="VALIDATION_ERROR",
+            details={"errors": error.errors},
+        )
     except Exception as error:
         return error_response(
             f"Error executing Fuzzy TOPSIS: {error}",
@@ -3,19 +3,11 @@
 from typing import Any
 
 import numpy as np
-from pyDecision.algorithm import fuzzy_topsis_method
 
-from utils.defuzzify_centroid import defuzzify_centroid
+from models.shared_alternative_matrix import expert_matrix_tensor
 from utils.get_plots_graphics_from_matrices import get_plots_graphics_from_matrices
-
-
-def _avg_triples(triples_list: list[list[float]]) -> tuple[float, float, float]:
-    """Calcula el promedio componente a componente de etiquetas triangulares."""
-
-    low = float(np.mean([triple[0] for triple in triples_list]))
-    medium = float(np.mean([triple[1] for triple in triples_list]))
-    high = float(np.mean([triple[2] for triple in triples_list]))
-    return low, medium, high
+from utils.projections import DEFAULT_PROJECTION_METHOD
+from utils.triangular_fuzzy import TriangularFuzzyArray
 
 
 def _normalize_fuzzy_weight_or_throw(value: Any, index: int) -> tuple[float, float, float]:
@@ -32,71 +24,127 @@ def _normalize_fuzzy_weight_or_throw(value: Any, index: int) -> tuple[float, flo
     return tuple(parsed)
 
 
-def _validate_fuzzy_matrices_or_throw(
-    matrices: dict[str, list[list[list[float]]]],
-) -> None:
-    for expert_key, matrix in matrices.items():
-        for row_index, row in enumerate(matrix):
-            for col_index, cell in enumerate(row):
-                field = (
-                    f"matrices['{expert_key}'][{row_index}][{col_index}]"
-                )
-                if not isinstance(cell, (list, tuple)):
-                    raise ValueError(
-                        "Fuzzy TOPSIS requires fuzzy numeric values for every cell; "
-                        f"cell {field} received {type(cell).__name__}"
-                    )
-                if len(cell) != 3:
-                    raise ValueError(f"{field} must be a fuzzy triplet [l, m, u]")
-                parsed = [float(item) for item in cell]
-                if not all(np.isfinite(item) for item in parsed):
-                    raise ValueError(f"{field} must contain finite numbers")
-
-                if parsed[0] > parsed[1] or parsed[1] > parsed[2]:
-                    raise ValueError(
-                        f"{field} must be an ordered fuzzy triplet [l, m, u]"
-                    )
+def _dict_tensor_or_throw(matrices: dict[str, Any]) -> tuple[np.ndarray, list[str]]:
+    expert_keys = list(matrices.keys())
+
+    try:
+        tensor = np.array(list(matrices.values()), dtype=np.float64)
+    except (TypeError, ValueError):
+        tensor = None
+
+    if tensor is None or tensor.ndim != 4 or tensor.shape[-1] != 3:
+        # Solo ante una forma irregular se recorre celda a celda para localizar el error.
+        for expert_key, matrix in matrices.items():
+            for row_index, row in enumerate(matrix):
+                for col_index, cell in enumerate(row):
+                    field = f"matrices['{expert_key}'][{row_index}][{col_index}]"
+                    if not isinstance(cell, (list, tuple)):
+                        raise ValueError(
+                            "Fuzzy TOPSIS requires fuzzy numeric values for every cell; "
+                            f"cell {field} received {type(cell).__name__}"
+                        )
+                    if len(cell) != 3:
+                        raise ValueError(f"{field} must be a fuzzy triplet [l, m, u]")
+                    for item in cell:
+                        float(item)
+        raise ValueError(
+            "Fuzzy TOPSIS requires every expert matrix to have the same alternatives and criteria"
+        )
+
+    return tensor, expert_keys
+
+
+def _fuzzy_tensor_or_throw(matrices: Any) -> TriangularFuzzyArray:
+    """Devuelve el tensor ``(expertos, alternativas, criterios, 3)`` validado."""
+
+    if isinstance(matrices, TriangularFuzzyArray):
+        matrices = matrices.values
+
+    labels = None
+    if isinstance(matrices, dict):
+        tensor, labels = _dict_tensor_or_throw(matrices)
+    else:
+        tensor = expert_matrix_tensor(matrices)
+
+    if tensor.ndim != 4 or tensor.shape[-1] != 3:
+        raise ValueError(
+            "Fuzzy TOPSIS requires a tensor of fuzzy triplets with shape "
+            "(experts, alternatives, criteria, 3)"
+        )
+
+    return TriangularFuzzyArray.validated(tensor, field="matrices", labels=labels)
 
 
 def _validate_cost_triplets_or_throw(
-    collective_matrix: list[list[tuple[float, float, float]]],
+    collective: TriangularFuzzyArray,
     criterion_type: list[str],
 ) -> None:
-    for alternative_index, row in enumerate(collective_matrix):
-        for criterion_index, triplet in enumerate(row):
-            if criterion_type[criterion_index] != "min":
-                continue
-
-            if triplet[0] <= 0:
-                raise ValueError(
-                    "Fuzzy TOPSIS cost normalization is incompatible with a zero "
-                    "lower bound at alternative index "
-                    f"{alternative_index}, criterion index {criterion_index}: "
-                    "selected fuzzy values must have l > 0 for pyDecision."
-                )
+    cost = np.array([direction == "min" for direction in criterion_type])
+    invalid = (collective.lower <= 0) & cost
+    if invalid.any():
+        alternative_index, criterion_index = (int(item) for item in np.argwhere(invalid)[0])
+        raise ValueError(
+            "Fuzzy TOPSIS cost normalization is incompatible with a zero "
+            "lower bound at alternative index "
+            f"{alternative_index}, criterion index {criterion_index}: "
+            "selected fuzzy values must have l > 0."
+        )
+
+
+def fuzzy_topsis_scores(
+    collective: TriangularFuzzyArray,
+    weights: TriangularFuzzyArray,
+    criterion_type: list[str],
+) -> np.ndarray:
+    """Coeficientes de cercanía de Fuzzy TOPSIS para una matriz colectiva ``(n_alt, n_crit)``.
+
+    Reproduce ``pyDecision.algorithm.fuzzy_topsis_method``: normalización
+    lineal por ``max(u)`` (beneficio) o ``min(l)`` (coste), ponderación por
+    componente, soluciones ideales por componente y distancia de vértices
+    ``sqrt(Σ(Δ²) / n_crit)`` sumada sobre criterios.
+    """
+
+    values = collective.values
+    n_crit = values.shape[1]
+    benefit = np.array([direction == "max" for direction in criterion_type])
+
+    c_star = values[..., 2].max(axis=0)
+    a_minus = values[..., 0].min(axis=0)
+    zero_upper = benefit & (c_star == 0)
+    if zero_upper.any():
+        raise ValueError(
+            "Fuzzy TOPSIS benefit normalization requires a non-zero upper bound at "
+            f"criterion index {int(np.argmax(zero_upper))}"
+        )
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        normalized = np.where(
+            benefit[:, None],
+            values / np.where(benefit, c_star, 1.0)[:, None],
+            a_minus[:, None] / values[..., ::-1],
+        )
+
+    weighted = TriangularFuzzyArray(normalized) * weights
+    positive_ideal = weighted.max(axis=0)
+    negative_ideal = weighted.min(axis=0)
+
+    d_plus = np.sqrt(weighted.squared_distance(positive_ideal) / n_crit).sum(axis=1)
+    d_minus = np.sqrt(weighted.squared_distance(negative_ideal) / n_crit).sum(axis=1)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return d_minus / (d_minus + d_plus)
 
 
 def run_fuzzy_topsis(
-    matrices: dict[str, list[list[list[float]]]],
+    matrices: TriangularFuzzyArray | np.ndarray | dict[str, list[list[list[float]]]],
     weights: list[Any],
     criterion_type: list[str],
+    projection_method: str = DEFAULT_PROJECTION_METHOD,
 ) -> dict[str, Any]:
     """Ejecuta Fuzzy TOPSIS sobre una matriz colectiva difusa."""
 
-    _validate_fuzzy_matrices_or_throw(matrices)
-
-    matrices_list = list(matrices.values())
-    first_matrix = matrices_list[0]
-    alternatives_count = len(first_matrix)
-    criteria_count = len(first_matrix[0])
-
-    collective_matrix: list[list[tuple[float, float, float]]] = []
-    for alternative_idx in range(alternatives_count):
-        row: list[tuple[float, float, float]] = []
-        for criterion_idx in range(criteria_count):
-            triples = [matrix[alternative_idx][criterion_idx] for matrix in matrices_list]
-            row.append(_avg_triples(triples))
-        collective_matrix.append(row)
+    tensor = _fuzzy_tensor_or_throw(matrices)
+    collective = tensor.mean(axis=0)
 
     flat_weights = [
         _normalize_fuzzy_weight_or_throw(weight, index)
@@ -105,28 +153,20 @@ def run_fuzzy_topsis(
     if len(flat_weights) != len(criterion_type):
         raise ValueError(f"Mismatch: {len(flat_weights)} weights vs {len(criterion_type)} criteria")
 
-    _validate_cost_triplets_or_throw(
-        collective_matrix,
+    _validate_cost_triplets_or_throw(collective, criterion_type)
+    collective_scores = fuzzy_topsis_scores(
+        collective,
+        TriangularFuzzyArray(flat_weights),
         criterion_type,
-    )
-    collective_scores = fuzzy_topsis_method(
-        dataset=collective_matrix,
-        weights=[flat_weights],
-        criterion_type=criterion_type,
-        graph=False,
-        verbose=False,
     ).tolist()
 
-    matrices_crisp = [defuzzify_centroid(matrix) for matrix in matrices_list]
-    collective_crisp = defuzzify_centroid(collective_matrix)
-
     return {
-        "collective_matrix": collective_matrix,
+        "collective_matrix": collective.to_triplets(),
         "collective_scores": collective_scores,
         "collective_ranking": np.argsort(collective_scores)[::-1].tolist(),
         "plots_graphic": get_plots_graphics_from_matrices(
-            matrices_np=matrices_crisp,
-            collective_matrix=collective_crisp,
-            method="MDS",
+            matrices_np=tensor.centroid(),
+            collective_matrix=collective.centroid(),
+            method=projection_method,
         ),
     }
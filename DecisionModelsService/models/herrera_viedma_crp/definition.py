@@ -1,6 +1,7 @@
+from registry.lazy_handler import lazy_handler
 from registry.model_definition import ModelDefinition
 from schemas.model_requests import GenericModelExecutionRequest
-from .executor import execute_herrera_viedma
+from utils.projections import PROJECTION_METHOD_PARAMETER
 from .examples import (
     HERRERA_VIEDMA_CRP_REQUEST_EXAMPLES,
     HERRERA_VIEDMA_CRP_RESPONSE_EXAMPLES,
@@ -10,7 +11,7 @@ MODEL_DEFINITION = ModelDefinition(
     api_model_key="herrera_viedma_crp",
     api_endpoint_path="/herrera_viedma_crp",
     request_model=GenericModelExecutionRequest,
-    handler=execute_herrera_viedma,
+    handler=lazy_handler(".executor:execute_herrera_viedma", __package__),
     small_description=(
         "Consensus reaching model for group decisions based on pairwise preference "
         "matrices and iterative agreement improvement."
@@ -19,7 +20,10 @@ MODEL_DEFINITION = ModelDefinition(
         "Herrera-Viedma CRP is a consensus reaching process for group decision-making. "
         "It works with pairwise preference matrices provided by experts, measures the "
         "current consensus level, and supports iterative consensus phases until the "
-        "required threshold is reached or the process is finalized."
+        "required threshold is reached or the process is finalized. Sending any of "
+        "`maxRounds`, `seed`, `acceptanceProbability` or `changeScale` runs the whole "
+        "simulated feedback loop in one request and returns the per-round consensus "
+        "trajectory."
     ),
     request_examples=HERRERA_VIEDMA_CRP_REQUEST_EXAMPLES,
     response_examples=HERRERA_VIEDMA_CRP_RESPONSE_EXAMPLES,
@@ -94,5 +98,38 @@ MODEL_DEFINITION = ModelDefinition(
             "default": 0.8,
             "restrictions": {"min": 0, "max": 1, "allowed": None},
         },
+        {
+            "key": "maxRounds",
+            "label": "Simulation max rounds",
+            "valueType": "integer",
+            "parameterStructureKey": "numberGlobal",
+            "required": False,
+            "restrictions": {"min": 1, "max": 100, "allowed": None},
+        },
+        {
+            "key": "seed",
+            "label": "Simulation seed",
+            "valueType": "integer",
+            "parameterStructureKey": "numberGlobal",
+            "required": False,
+            "restrictions": {"min": 0, "max": None, "allowed": None},
+        },
+        {
+            "key": "acceptanceProbability",
+            "label": "Simulation acceptance probability",
+            "valueType": "number",
+            "parameterStructureKey": "numberGlobal",
+            "required": False,
+            "restrictions": {"min": 0, "max": 1, "allowed": None},
+        },
+        {
+            "key": "changeScale",
+            "label": "Simulation change scale",
+            "valueType": "number",
+            "parameterStructureKey": "numberGlobal",
+            "required": False,
+            "restrictions": {"min": 0, "max": 1, "allowed": None},
+        },
+        PROJECTION_METHOD_PARAMETER,
     ],
 )
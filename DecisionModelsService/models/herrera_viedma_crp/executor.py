@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Callable
 import math
 
 from fastapi.responses import JSONResponse
@@ -7,7 +7,13 @@ import numpy as np
 from schemas.model_requests import GenericModelExecutionRequest
 from services.criteria_weights import ordered_numeric_weights
 from services.model_executors.responses import error_response, success_response
-from .run import run_herrera_viedma
+from utils.projections import projection_method_error, resolve_projection_method
+from .run import run_herrera_viedma, run_herrera_viedma_simulation
+
+DEFAULT_SIMULATION_MAX_ROUNDS = 10
+MAX_SIMULATION_ROUNDS = 100
+PAIRWISE_MIN = 0.0
+PAIRWISE_MAX = 1.0
 
 
 def _expert_key(expert: dict[str, Any], index: int) -> str:
@@ -24,7 +30,10 @@ def _expert_key(expert: dict[str, Any], index: int) -> str:
 
 
 def _finite_number(value: Any, field: str) -> float:
-    number = float(value)
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{field} must be a finite number") from None
 
     if number != number or number in {float("inf"), float("-inf")}:
         raise ValueError(f"{field} must be a finite number")
@@ -104,6 +113,63 @@ def _weights(payload: GenericModelExecutionRequest, criteria_count: int) -> list
     return weights
 
 
+def _cell_field(expert_index: int, criterion_id: str, row_id: str, column_id: str) -> str:
+    return f"evaluations[{expert_index}].payload['{criterion_id}']['{row_id}']['{column_id}']"
+
+
+def _pairwise_values(values: list[Any], cell_field: Callable[[int], str]) -> np.ndarray:
+    """Convierte las celdas fuera de la diagonal de una matriz en un vector ``float``."""
+
+    if None in values or "" in values:
+        position = next(
+            index for index, value in enumerate(values) if value is None or value == ""
+        )
+        raise ValueError(f"{cell_field(position)} is required")
+
+    try:
+        return np.array(values, dtype=float)
+    except (TypeError, ValueError):
+        for position, value in enumerate(values):
+            try:
+                float(value)
+            except (TypeError, ValueError) as error:
+                raise ValueError(f"{cell_field(position)} must be a finite number") from error
+        raise
+
+
+def _validate_pairwise_tensor(
+    preferences: np.ndarray,
+    criterion_ids: list[str],
+    alternative_ids: list[str],
+) -> None:
+    """Valida el rango con máscaras sobre todo el tensor.
+
+    No se exige reciprocidad: las sugerencias del propio modelo, que se
+    reenvían en la ronda siguiente, no son recíprocas. Solo se construye el
+    mensaje de la primera celda inválida (en orden experto, criterio, fila,
+    columna), así que el error sigue señalando el campo exacto del payload.
+    """
+
+    def field(index: np.ndarray) -> str:
+        expert_index, criterion_index, row_index, column_index = (int(value) for value in index)
+        return _cell_field(
+            expert_index,
+            criterion_ids[criterion_index],
+            alternative_ids[row_index],
+            alternative_ids[column_index],
+        )
+
+    invalid = ~np.isfinite(preferences)
+    if invalid.any():
+        raise ValueError(f"{field(np.argwhere(invalid)[0])} must be a finite number")
+
+    invalid = (preferences < PAIRWISE_MIN) | (preferences > PAIRWISE_MAX)
+    if invalid.any():
+        raise ValueError(
+            f"{field(np.argwhere(invalid)[0])} must be between {PAIRWISE_MIN:g} and {PAIRWISE_MAX:g}"
+        )
+
+
 def _input(payload: GenericModelExecutionRequest) -> dict[str, Any]:
     context = payload.context or {}
     alternatives = context.get("alternatives") or []
@@ -143,125 +209,91 @@ def _input(payload: GenericModelExecutionRequest) -> dict[str, Any]:
     criterion_names = [item["name"] for item in criterion_items]
 
     weights = _weights(payload, len(criteria))
-    matrices: dict[str, dict[str, list[list[float]]]] = {}
-    seen_expert_keys: set[str] = set()
+    alternative_id_set = set(alternative_ids)
+    criterion_id_set = set(criterion_ids)
 
+    experts_count = len(evaluations)
     criteria_count = len(criterion_ids)
     alternatives_count = len(alternative_ids)
 
+    # Celdas fuera de la diagonal en orden fila-columna; la diagonal queda en 0.5.
+    rows, columns = np.nonzero(~np.eye(alternatives_count, dtype=bool))
+    cell_keys = [
+        (alternative_ids[row_index], alternative_ids[column_index])
+        for row_index, column_index in zip(rows.tolist(), columns.tolist())
+    ]
+    row_column_ids = [
+        [column_id for column_id in alternative_ids if column_id != row_id]
+        for row_id in alternative_ids
+    ]
+    preferences = np.empty((experts_count, criteria_count, alternatives_count, alternatives_count))
+    diagonal = np.arange(alternatives_count)
+    preferences[:, :, diagonal, diagonal] = 0.5
+
+    expert_keys: list[str] = []
+    seen_expert_keys: set[str] = set()
+
     for expert_index, evaluation in enumerate(evaluations):
         expert = evaluation.get("expert") or {}
         evaluation_payload = evaluation.get("payload") or {}
         if not isinstance(evaluation_payload, dict):
             raise ValueError(f"evaluations[{expert_index}].payload is required")
 
-        unknown_criteria = [
-            criterion_key
-            for criterion_key in evaluation_payload.keys()
-            if criterion_key not in criterion_ids
-        ]
-        if unknown_criteria:
+        if not criterion_id_set.issuperset(evaluation_payload.keys()):
             raise ValueError(
                 f"evaluations[{expert_index}].payload contains unknown criteria"
             )
 
-        criterion_matrices: list[list[list[float]]] = []
-
         for criterion_index, criterion_id in enumerate(criterion_ids):
-            criterion_name = criterion_names[criterion_index]
             criterion_payload = evaluation_payload.get(criterion_id)
             if not isinstance(criterion_payload, dict):
                 raise ValueError(
                     f"evaluations[{expert_index}].payload['{criterion_id}'] is required"
                 )
 
-            matrix: list[list[float]] = []
-
-            unknown_row_keys = [
-                alternative_key
-                for alternative_key in criterion_payload.keys()
-                if alternative_key not in alternative_ids
-            ]
-            if unknown_row_keys:
+            if not alternative_id_set.issuperset(criterion_payload.keys()):
                 raise ValueError(
                     f"evaluations[{expert_index}].payload['{criterion_id}'] contains unknown row keys"
                 )
 
-            for row_index, row_alternative_id in enumerate(alternative_ids):
-                row_alternative_name = alternative_names[row_index]
+            values: list[Any] = []
+            for row_alternative_id, column_ids in zip(alternative_ids, row_column_ids):
                 row_payload = criterion_payload.get(row_alternative_id)
                 if not isinstance(row_payload, dict):
                     raise ValueError(
                         f"evaluations[{expert_index}].payload['{criterion_id}']['{row_alternative_id}'] is required"
                     )
 
-                row: list[float] = []
-                unknown_col_keys = [
-                    alternative_key
-                    for alternative_key in row_payload.keys()
-                    if alternative_key not in alternative_ids or alternative_key == row_alternative_id
-                ]
-                if unknown_col_keys:
+                if row_alternative_id in row_payload or not alternative_id_set.issuperset(
+                    row_payload.keys()
+                ):
                     raise ValueError(
                         f"evaluations[{expert_index}].payload['{criterion_id}']['{row_alternative_id}'] contains unknown column keys"
                     )
 
-                for col_index, col_alternative_id in enumerate(alternative_ids):
-                    col_alternative_name = alternative_names[col_index]
-                    if row_alternative_id == col_alternative_id:
-                        row.append(0.5)
-                        continue
-
-                    value = row_payload.get(col_alternative_id)
-                    if value is None or value == "":
-                        raise ValueError(
-                            f"evaluations[{expert_index}].payload['{criterion_id}']['{row_alternative_id}']['{col_alternative_id}'] is required"
-                        )
-
-                    row.append(
-                        _finite_number(
-                            value,
-                            f"evaluations[{expert_index}].payload['{criterion_id}']['{row_alternative_id}']['{col_alternative_id}']",
-                        )
-                    )
-
-                matrix.append(row)
-
-            criterion_matrices.append(matrix)
-
-        if criteria_count == 1:
-            expert_matrix = criterion_matrices[0]
-        else:
-            expert_matrix: list[list[float]] = []
-
-            for row_index in range(alternatives_count):
-                row: list[float] = []
+                values.extend(map(row_payload.get, column_ids))
 
-                for column_index in range(alternatives_count):
-                    if row_index == column_index:
-                        row.append(0.5)
-                        continue
-
-                    aggregated_value = 0.0
-                    for criterion_index in range(criteria_count):
-                        aggregated_value += (
-                            weights[criterion_index]
-                            * criterion_matrices[criterion_index][row_index][column_index]
-                        )
-
-                    row.append(aggregated_value)
-
-                expert_matrix.append(row)
+            preferences[expert_index, criterion_index, rows, columns] = _pairwise_values(
+                values,
+                lambda position: _cell_field(expert_index, criterion_id, *cell_keys[position]),
+            )
 
         expert_key = _expert_key(expert, expert_index)
         if expert_key in seen_expert_keys:
             expert_key = f"{expert_key}_{expert_index + 1}"
         seen_expert_keys.add(expert_key)
+        expert_keys.append(expert_key)
 
-        matrices[expert_key] = {criterion_ids[0]: expert_matrix}
+    _validate_pairwise_tensor(preferences, criterion_ids, alternative_ids)
+
+    # Agregación ponderada de criterios de todos los expertos en una sola contracción.
+    aggregated = np.einsum("c,ecij->eij", np.asarray(weights, dtype=float), preferences)
+    aggregated[:, diagonal, diagonal] = 0.5
 
     return {
-        "matrices": matrices,
+        "preferences": aggregated,
+        "criterion_preferences": preferences,
+        "expert_keys": expert_keys,
         "alternative_ids": alternative_ids,
         "alternative_names": alternative_names,
         "criterion_ids": criterion_ids,
@@ -271,6 +303,81 @@ def _input(payload: GenericModelExecutionRequest) -> dict[str, Any]:
     }
 
 
+def _optional_int(value: Any, field: str) -> int | None:
+    if value is None or value == "":
+        return None
+
+    if (
+        isinstance(value, bool)
+        or not isinstance(value, (int, float))
+        or not math.isfinite(value)
+        or int(value) != value
+    ):
+        raise ValueError(f"{field} must be an integer")
+
+    return int(value)
+
+
+def _probability(value: Any, field: str, default: float) -> float:
+    if value is None:
+        return default
+
+    number = _finite_number(value, field)
+    if number < 0 or number > 1:
+        raise ValueError(f"{field} must be between 0 and 1")
+
+    return number
+
+
+SIMULATION_PARAMETER_KEYS = ("maxRounds", "seed", "acceptanceProbability", "changeScale")
+
+
+def _simulation_config(
+    payload: GenericModelExecutionRequest,
+    issue_context: dict[str, Any],
+) -> dict[str, Any] | None:
+    """Lee los parámetros de simulación; si no llega ninguno se mantiene el modo de una ronda."""
+
+    model_parameters = payload.modelParameters or {}
+    if all(model_parameters.get(key) is None for key in SIMULATION_PARAMETER_KEYS):
+        return None
+
+    max_rounds = _optional_int(
+        model_parameters.get("maxRounds"),
+        "modelParameters.maxRounds",
+    )
+    if max_rounds is None:
+        max_rounds = _optional_int(
+            issue_context.get("consensusMaxPhases"),
+            "context.issue.consensusMaxPhases",
+        )
+    if max_rounds is None:
+        max_rounds = DEFAULT_SIMULATION_MAX_ROUNDS
+    if max_rounds < 1 or max_rounds > MAX_SIMULATION_ROUNDS:
+        raise ValueError(
+            f"modelParameters.maxRounds must be between 1 and {MAX_SIMULATION_ROUNDS}"
+        )
+
+    seed = _optional_int(model_parameters.get("seed"), "modelParameters.seed")
+    if seed is not None and seed < 0:
+        raise ValueError("modelParameters.seed must be a non-negative integer")
+
+    return {
+        "max_rounds": max_rounds,
+        "seed": seed,
+        "prob_accept": _probability(
+            model_parameters.get("acceptanceProbability"),
+            "modelParameters.acceptanceProbability",
+            1.0,
+        ),
+        "change_scale": _probability(
+            model_parameters.get("changeScale"),
+            "modelParameters.changeScale",
+            0.2,
+        ),
+    }
+
+
 def _normalize_pairwise_collective_evaluations(
     *,
     source: Any,
@@ -397,7 +504,7 @@ def _output(
         source=safe_run_result.get("suggested_next_evaluations"),
     )
 
-    return {
+    output = {
         "rankedAlternatives": ranked_alternatives,
         "collectiveEvaluations": _normalize_pairwise_collective_evaluations(
             source=collective_evaluations,
@@ -409,18 +516,53 @@ def _output(
         "rawOutput": safe_run_result,
     }
 
+    simulation = safe_run_result.get("simulation")
+    if isinstance(simulation, dict):
+        output["consensusSimulation"] = {
+            "maxRounds": simulation.get("max_rounds"),
+            "roundsExecuted": simulation.get("rounds_executed"),
+            "consensusReached": simulation.get("consensus_reached"),
+            "seed": simulation.get("seed"),
+            "trajectory": [
+                {
+                    "round": entry.get("round"),
+                    "consensusMeasure": entry.get("cm"),
+                    "rankedAlternativeIds": [
+                        alternative_ids[int(index)]
+                        for index in entry.get("collective_ranking") or []
+                    ],
+                }
+                for entry in simulation.get("trajectory") or []
+            ],
+        }
+
+    return output
+
 
 def execute_herrera_viedma(
     payload: GenericModelExecutionRequest,
 ) -> dict[str, Any] | JSONResponse:
     try:
-        execution_input = _input(payload)
+        projection_error = projection_method_error(payload)
+        if projection_error is not None:
+            return error_response(projection_error)
+
         model_parameters = payload.modelParameters or {}
         context = payload.context or {}
         issue_context = context.get("issue") if isinstance(context, dict) else {}
         if not isinstance(issue_context, dict):
             issue_context = {}
 
+        try:
+            simulation_config = _simulation_config(payload, issue_context)
+        except ValueError as error:
+            return error_response(str(error))
+
+        try:
+            execution_input = _input(payload)
+        except (TypeError, ValueError) as error:
+            return error_response(str(error), code="VALIDATION_ERROR")
+
         consensus_threshold = float(
             issue_context.get(
                 "consensusThreshold",
@@ -428,18 +570,28 @@ def execute_herrera_viedma(
             )
         )
 
-        results = run_herrera_viedma(
-            execution_input["matrices"],
-            cl=consensus_threshold,
-            ag_lq=model_parameters.get("ag_lq") or [0.3, 0.8],
-            ex_lq=model_parameters.get("ex_lq") or [0.5, 1.0],
-            b=float(model_parameters.get("b", 1)),
-            beta=float(model_parameters.get("beta", 0.8)),
-            w_crit=[1.0],
-            criterion_id=execution_input["aggregated_criterion_id"],
-            alternative_ids=execution_input["alternative_ids"],
-            alternative_names=execution_input["alternative_names"],
-        )
+        run_arguments = {
+            "cl": consensus_threshold,
+            "ag_lq": model_parameters.get("ag_lq") or [0.3, 0.8],
+            "ex_lq": model_parameters.get("ex_lq") or [0.5, 1.0],
+            "b": float(model_parameters.get("b", 1)),
+            "beta": float(model_parameters.get("beta", 0.8)),
+            "w_crit": [1.0],
+            "criterion_id": execution_input["aggregated_criterion_id"],
+            "expert_keys": execution_input["expert_keys"],
+            "alternative_ids": execution_input["alternative_ids"],
+            "alternative_names": execution_input["alternative_names"],
+            "projection_method": resolve_projection_method(payload),
+        }
+
+        if simulation_config is None:
+            results = run_herrera_viedma(execution_input["preferences"], **run_arguments)
+        else:
+            results = run_herrera_viedma_simulation(
+                execution_input["preferences"],
+                **run_arguments,
+                **simulation_config,
+            )
 
         return success_response(
             "Herrera Viedma CRP executed successfully",
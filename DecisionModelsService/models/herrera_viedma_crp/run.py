@@ -5,6 +5,7 @@ from typing import Any
 
 import numpy as np
 
+from utils.projections import DEFAULT_PROJECTION_METHOD
 from .utils import (
     aplicar_cambios,
     calcular_colectiva_OWA,
@@ -83,26 +84,31 @@ def _build_suggested_pairwise_payload(
     return payload
 
 
-def run_herrera_viedma(
-    matrices: dict[str, dict[str, list[list[float]]]],
-    cl: float,
-    ag_lq: list[float],
-    ex_lq: list[float],
-    b: float,
-    beta: float,
-    w_crit: list[float],
-    criterion_id: str,
-    alternative_ids: list[str],
-    alternative_names: list[str],
-) -> dict[str, Any]:
-    """Ejecuta una iteración del modelo Herrera-Viedma sobre matrices por experto."""
+def _preference_tensor(
+    matrices: dict[str, dict[str, list[list[float]]]] | np.ndarray,
+    expert_keys: list[str] | None = None,
+) -> tuple[np.ndarray, list[str]]:
+    """Tensor ``(n_exp + 1, n_alt, n_alt)`` con el hueco de la matriz colectiva al final.
+
+    ``matrices`` puede ser ya un array ``(n_exp, n_alt, n_alt)`` (lo que produce
+    el executor), en cuyo caso ``expert_keys`` da el nombre de cada experto.
+    """
+
+    if isinstance(matrices, np.ndarray):
+        if matrices.ndim != 3 or matrices.shape[1] != matrices.shape[2]:
+            raise ValueError("Preference tensor must have shape (experts, alternatives, alternatives)")
+        if expert_keys is None or len(expert_keys) != len(matrices):
+            raise ValueError("expert_keys length must match the number of expert matrices")
+
+        n_exp, n_alt, _ = matrices.shape
+        pref = np.zeros((n_exp + 1, n_alt, n_alt))
+        pref[:-1] = matrices
+        return pref, list(expert_keys)
 
-    n_exp = len(matrices)
     first_user_data = next(iter(matrices.values()))
     criterion_name = next(iter(first_user_data))
-    first_matrix = first_user_data[criterion_name]
-    n_alt = len(first_matrix)
-    n_crit = 1
+    n_exp = len(matrices)
+    n_alt = len(first_user_data[criterion_name])
 
     expert_keys = list(matrices.keys())
     pref = np.zeros((n_exp + 1, n_alt, n_alt))
@@ -114,6 +120,34 @@ def run_herrera_viedma(
             )
         pref[index] = np.array(expert[criterion_name], dtype=float)
 
+    return pref, expert_keys
+
+
+def _run_round(
+    *,
+    pref: np.ndarray,
+    expert_keys: list[str],
+    cl: float,
+    ag_lq: list[float],
+    ex_lq: list[float],
+    b: float,
+    beta: float,
+    w_crit: list[float],
+    criterion_id: str,
+    alternative_ids: list[str],
+    alternative_names: list[str],
+    projection_method: str,
+    include_plots: bool,
+    rng: np.random.Generator | None,
+    prob_accept: float = 1.0,
+    change_scale: float = 0.2,
+) -> dict[str, Any]:
+    """Evalúa una ronda sobre ``pref`` y, sin consenso, aplica los cambios in situ."""
+
+    n_exp = len(expert_keys)
+    n_alt = pref.shape[1]
+    n_crit = 1
+
     w_exp = calcular_pesos_OWA(n_exp, ag_lq)
     w_alt = calcular_pesos_OWA(n_alt, ex_lq)
 
@@ -121,17 +155,11 @@ def run_herrera_viedma(
 
     collective_preferences = calcular_colectiva_OWA(pref, n_exp, n_alt, n_crit, w_crit, w_exp)
     pref[-1] = collective_preferences
-    plots = get_plots_graphics(pref, "MDS")
-
-    alternatives_rankings: list[np.ndarray | None] = [None] * (n_exp + 1)
-    qgdd_list: list[np.ndarray | None] = [None] * (n_exp + 1)
 
-    for index in range(n_exp + 1):
-        qgdd = calcular_QGDD(n_alt, pref[index], w_alt)
-        qgdd_list[index] = qgdd
-        alternatives_rankings[index] = np.argsort(qgdd)[::-1]
+    qgdd_by_row = calcular_QGDD(n_alt, pref, w_alt)
+    alternatives_rankings = list(np.argsort(qgdd_by_row, axis=1)[:, ::-1])
 
-    collective_scores = qgdd_list[-1]
+    collective_scores = qgdd_by_row[-1]
     solution_set = conjunto_solucion_desde_scores(collective_scores)
 
     differences_rankings = calcular_diferencia_rankings(alternatives_rankings)
@@ -139,22 +167,18 @@ def run_herrera_viedma(
     consensus_degree_alt = calcular_consenso_alt(consensus_degree_exp_alt, n_alt, n_exp)
     cm = s_owa_or_like(consensus_degree_alt, beta, solution_set)
 
+    # La proyección solo se calcula cuando la ronda se devuelve al cliente.
+    plots = (
+        get_plots_graphics(pref, projection_method)
+        if include_plots or cm >= cl
+        else None
+    )
+
     if cm < cl:
         proximity_measures = calcular_medidas_proximidad(consensus_degree_exp_alt, beta, solution_set)
         farthest_experts = expertos_mas_alejados(proximity_measures)
         changes = detectar_cambios(farthest_experts, differences_rankings)
-        aplicar_cambios(changes, pref)
-        suggested_next_evaluations = {
-            expert_keys[expert_index]: {
-                "payload": _build_suggested_pairwise_payload(
-                    matrix=pref[expert_index],
-                    criterion_id=criterion_id,
-                    alternative_ids=alternative_ids,
-                    alternative_names=alternative_names,
-                ),
-            }
-            for expert_index in range(n_exp)
-        }
+        aplicar_cambios(changes, pref, rng=rng, prob_accept=prob_accept, scale=change_scale)
         proximity_measures_output = [
             round(float(value), 6) for value in proximity_measures
         ]
@@ -164,7 +188,6 @@ def run_herrera_viedma(
             for expert_index, expert_changes in changes.items()
         }
     else:
-        suggested_next_evaluations = {}
         proximity_measures_output = []
         farthest_experts_output = []
         changes_output = {}
@@ -196,7 +219,6 @@ def run_herrera_viedma(
             criterion_id: _rounded_finite_matrix(pref[-1]),
         },
         "plots_graphic": plots,
-        "suggested_next_evaluations": suggested_next_evaluations,
         "diagnostics": {
             "expert_rankings": expert_rankings,
             "collective_ranking": collective_ranking,
@@ -208,4 +230,182 @@ def run_herrera_viedma(
             "farthest_experts": farthest_experts_output,
             "changes": changes_output,
         },
+        "consensus_reached": bool(cm >= cl),
+    }
+
+
+def _suggested_next_evaluations(
+    *,
+    pref: np.ndarray,
+    expert_keys: list[str],
+    criterion_id: str,
+    alternative_ids: list[str],
+    alternative_names: list[str],
+) -> dict[str, dict[str, Any]]:
+    return {
+        expert_key: {
+            "payload": _build_suggested_pairwise_payload(
+                matrix=pref[expert_index],
+                criterion_id=criterion_id,
+                alternative_ids=alternative_ids,
+                alternative_names=alternative_names,
+            ),
+        }
+        for expert_index, expert_key in enumerate(expert_keys)
+    }
+
+
+def _finalize_round(
+    round_result: dict[str, Any],
+    *,
+    pref: np.ndarray,
+    expert_keys: list[str],
+    criterion_id: str,
+    alternative_ids: list[str],
+    alternative_names: list[str],
+) -> dict[str, Any]:
+    consensus_reached = round_result.pop("consensus_reached")
+    round_result["suggested_next_evaluations"] = (
+        {}
+        if consensus_reached
+        else _suggested_next_evaluations(
+            pref=pref,
+            expert_keys=expert_keys,
+            criterion_id=criterion_id,
+            alternative_ids=alternative_ids,
+            alternative_names=alternative_names,
+        )
+    )
+    return round_result
+
+
+def run_herrera_viedma(
+    matrices: dict[str, dict[str, list[list[float]]]] | np.ndarray,
+    cl: float,
+    ag_lq: list[float],
+    ex_lq: list[float],
+    b: float,
+    beta: float,
+    w_crit: list[float],
+    criterion_id: str,
+    alternative_ids: list[str],
+    alternative_names: list[str],
+    projection_method: str = DEFAULT_PROJECTION_METHOD,
+    seed: int | None = None,
+    expert_keys: list[str] | None = None,
+) -> dict[str, Any]:
+    """Ejecuta una iteración del modelo Herrera-Viedma sobre matrices por experto."""
+
+    pref, expert_keys = _preference_tensor(matrices, expert_keys)
+    round_result = _run_round(
+        pref=pref,
+        expert_keys=expert_keys,
+        cl=cl,
+        ag_lq=ag_lq,
+        ex_lq=ex_lq,
+        b=b,
+        beta=beta,
+        w_crit=w_crit,
+        criterion_id=criterion_id,
+        alternative_ids=alternative_ids,
+        alternative_names=alternative_names,
+        projection_method=projection_method,
+        include_plots=True,
+        rng=np.random.default_rng(seed),
+    )
+
+    return _finalize_round(
+        round_result,
+        pref=pref,
+        expert_keys=expert_keys,
+        criterion_id=criterion_id,
+        alternative_ids=alternative_ids,
+        alternative_names=alternative_names,
+    )
+
+
+def run_herrera_viedma_simulation(
+    matrices: dict[str, dict[str, list[list[float]]]] | np.ndarray,
+    cl: float,
+    ag_lq: list[float],
+    ex_lq: list[float],
+    b: float,
+    beta: float,
+    w_crit: list[float],
+    criterion_id: str,
+    alternative_ids: list[str],
+    alternative_names: list[str],
+    max_rounds: int,
+    seed: int | None = None,
+    prob_accept: float = 1.0,
+    change_scale: float = 0.2,
+    projection_method: str = DEFAULT_PROJECTION_METHOD,
+    expert_keys: list[str] | None = None,
+) -> dict[str, Any]:
+    """Simula el proceso completo de consenso en memoria hasta ``max_rounds`` rondas.
+
+    El tensor de preferencias se mantiene en NumPy entre rondas y los cambios
+    sugeridos en una ronda son las preferencias de la siguiente. El resultado
+    conserva el contrato de ``run_herrera_viedma`` para la última ronda y añade
+    la trayectoria de consenso en ``simulation``.
+    """
+
+    if max_rounds < 1:
+        raise ValueError("max_rounds must be a positive integer")
+
+    pref, expert_keys = _preference_tensor(matrices, expert_keys)
+    rng = np.random.default_rng(seed)
+    trajectory: list[dict[str, Any]] = []
+
+    for round_number in range(1, max_rounds + 1):
+        round_result = _run_round(
+            pref=pref,
+            expert_keys=expert_keys,
+            cl=cl,
+            ag_lq=ag_lq,
+            ex_lq=ex_lq,
+            b=b,
+            beta=beta,
+            w_crit=w_crit,
+            criterion_id=criterion_id,
+            alternative_ids=alternative_ids,
+            alternative_names=alternative_names,
+            projection_method=projection_method,
+            include_plots=round_number == max_rounds,
+            rng=rng,
+            prob_accept=prob_accept,
+            change_scale=change_scale,
+        )
+        diagnostics = round_result["diagnostics"]
+        trajectory.append(
+            {
+                "round": round_number,
+                "cm": round_result["cm"],
+                "collective_scores": round_result["collective_scores"],
+                "collective_ranking": diagnostics["collective_ranking"],
+                "farthest_experts": diagnostics["farthest_experts"],
+                "changes": diagnostics["changes"],
+            }
+        )
+
+        if round_result["consensus_reached"]:
+            break
+
+    consensus_reached = round_result["consensus_reached"]
+    result = _finalize_round(
+        round_result,
+        pref=pref,
+        expert_keys=expert_keys,
+        criterion_id=criterion_id,
+        alternative_ids=alternative_ids,
+        alternative_names=alternative_names,
+    )
+    result["simulation"] = {
+        "max_rounds": max_rounds,
+        "rounds_executed": len(trajectory),
+        "consensus_reached": consensus_reached,
+        "seed": seed,
+        "trajectory": trajectory,
     }
+
+    return result
@@ -1,8 +1,8 @@
 """Funciones de apoyo para el modelo de consenso Herrera-Viedma CRP."""
 
 import numpy as np
-from sklearn.decomposition import PCA
-from sklearn.manifold import MDS
+
+from utils.projections import project_points
 
 
 # Calcula el cuantificador lingüístico difuso.
@@ -48,6 +48,24 @@ def owa(valores, pesos):
     valores_ordenados = sorted(valores, reverse=True)  # Ordenamos los valores en orden descendente
     return sum(v * w for v, w in zip(valores_ordenados, pesos))
 
+# Aplica el operador OWA a lo largo de un eje de un tensor.
+# Ordena una sola vez con np.sort y acumula peso a peso en el mismo orden que owa(),
+# de modo que el resultado es bit a bit idéntico al de la versión escalar.
+# :param valores: Tensor de valores a agregar.
+# :param pesos: Lista de pesos OWA (como en zip, solo se usan los primeros n valores).
+# :param axis: Eje que se agrega.
+# :return: Tensor agregado sin el eje indicado.
+def owa_tensor(valores, pesos, axis=-1):
+  valores_np = np.moveaxis(np.asarray(valores, dtype=float), axis, -1)
+  ordenados = np.flip(np.sort(valores_np, axis=-1), axis=-1)
+  pesos_np = np.asarray(pesos, dtype=float)
+
+  result = np.zeros(ordenados.shape[:-1])
+  for k in range(min(ordenados.shape[-1], pesos_np.shape[0])):
+    result = result + ordenados[..., k] * pesos_np[k]
+
+  return result
+
 # Calcula el valor agregado usando una variante del operador OWA OR-like.
 # :param values: Lista de valores a agregar.
 # :param beta: Parámetro de rigurosidad de consenso.
@@ -71,24 +89,14 @@ def s_owa_or_like(values, beta, Xsol):
 # :param w_exp: Pesos asociados a los expertos.
 # :return: Opinión colectiva de los expertos.
 def calcular_colectiva_OWA(pref, n_exp, n_alt, n_crit, w_cri, w_exp):
-  # Paso 1: Agregar todas las matrices de cada experto en una única matriz por experto
-  agregacion_por_experto = np.zeros((n_exp, n_alt, n_alt))
+  preferencias = np.asarray(pref, dtype=float)[: n_exp * n_crit]
+  preferencias = preferencias.reshape(n_exp, n_crit, n_alt, n_alt)
 
-  for exp in range(n_exp):
-      for i in range(n_alt):
-          for j in range(n_alt):
-            valores = [pref[exp * n_crit + cr][i][j] for cr in range(n_crit)]
-            agregacion_por_experto[exp][i][j] = owa(valores, w_cri)  # OWA sobre criterios
+  # Paso 1: Agregar todas las matrices de cada experto en una única matriz por experto
+  agregacion_por_experto = owa_tensor(preferencias, w_cri, axis=1)  # OWA sobre criterios
 
   # Paso 2: Agregar las matrices resultantes de cada experto en una única matriz final
-  matriz_colectiva = np.zeros((n_alt, n_alt))
-
-  for i in range(n_alt):
-    for j in range(n_alt):
-      valores = [agregacion_por_experto[exp][i][j] for exp in range(n_exp)]
-      matriz_colectiva[i][j] = owa(valores, w_exp) # OWA sobre expertos
-
-  return matriz_colectiva
+  return owa_tensor(agregacion_por_experto, w_exp, axis=0)  # OWA sobre expertos
 
 # Calcula el QGDD aplicando el operador OWA sobre las preferencias de cada alternativa.
 # :param n_alt: Número de alternativas.
@@ -97,13 +105,10 @@ def calcular_colectiva_OWA(pref, n_exp, n_alt, n_crit, w_cri, w_exp):
 # :param owa: Función que aplica el operador OWA.
 # :return: Vector de valores QGDD para cada alternativa.
 def calcular_QGDD(n_alt, pref, w):
-  result = np.zeros(n_alt)
-
-  for i in range(n_alt):
-    values = np.array([pref[i][j] for j in range(n_alt)])  # Extraer la fila i
-    result[i] = owa(values, w)  # Aplicar OWA a la fila
+  # Admite una matriz (n_alt x n_alt) o un tensor (n x n_alt x n_alt) y aplica OWA por filas
+  preferencias = np.asarray(pref, dtype=float)[..., :n_alt, :n_alt]
 
-  return result
+  return owa_tensor(preferencias, w, axis=-1)
 
 # Calcula la diferencia de posiciones entre un ranking de un experto y el ranking colectivo
 # :param c_ranking: Lista con el ranking colectivo.
@@ -123,17 +128,20 @@ def diferencia_ranking(c_ranking, e_ranking):
 # :param alternatives_rankings: Lista de listas donde cada fila es un ranking.
 # :return: Matriz de diferencias entre los rankings de los expertos y el ranking del grupo.
 def calcular_diferencia_rankings(alternatives_rankings):
-    n_exp = len(alternatives_rankings) - 1  # Última fila es el ranking del grupo
-    n_alt = len(alternatives_rankings[0])
-
-    result = np.zeros((n_exp, n_alt), dtype=int)  # Matriz de diferencias
-
-    c_ranking = alternatives_rankings[-1]  # Última fila = ranking del grupo
-
-    for i in range(n_exp):
-        result[i] = diferencia_ranking(c_ranking, alternatives_rankings[i])
+    rankings = np.asarray([np.asarray(ranking) for ranking in alternatives_rankings], dtype=int)
+    n_alt = rankings.shape[1]
+
+    # Invertir cada permutación: posiciones[r][alt] = posición de alt en el ranking r
+    posiciones = np.empty_like(rankings)
+    np.put_along_axis(
+        posiciones,
+        rankings,
+        np.broadcast_to(np.arange(n_alt), rankings.shape),
+        axis=1,
+    )
 
-    return result
+    # Última fila = ranking del grupo
+    return posiciones[-1] - posiciones[:-1]
 
 # Devuelve el conjunto de alternativas ganadoras (mejor puntuación QGDD).
 # :param scores: Puntuaciones colectivas QGDD por alternativa.
@@ -158,28 +166,33 @@ def conjunto_solucion_desde_scores(scores, tolerance=1e-9):
 # :param b: Parámetro de rigurosidad de consenso.
 # :return: Matriz de grados de consenso (n_exp x n_alt).
 def calcular_consenso_exp_alt(differences_between_rankings, b):
-    n_exp = len(differences_between_rankings)
-    n_alt = len(differences_between_rankings[0])
-
-    result = np.zeros((n_exp, n_alt), dtype=float)
-
-    for e in range(n_exp):
-        for a in range(n_alt):
-            result[e][a] = round((abs(differences_between_rankings[e][a]) / (n_alt - 1)) ** b, 2)
+    differences = np.abs(np.asarray(differences_between_rankings, dtype=int))
+    n_alt = differences.shape[1]
+
+    # Solo hay n_alt diferencias absolutas posibles: se calcula cada grado una vez
+    # con la misma aritmética escalar de NumPy y se indexa la tabla.
+    grados = np.array(
+        [round((np.int64(diff) / (n_alt - 1)) ** b, 2) for diff in range(n_alt)],
+        dtype=float,
+    )
 
-    return result
+    return grados[differences]
 
 # Calcula los grados de consenso para cada alternativa a partir de los expertos.
 # :param consensus_degrees_on_alternatives_by_experts: Matriz de grados de consenso (n_exp x n_alt).
 # :return: Vector con los grados de consenso para cada alternativa.
 def calcular_consenso_alt(consensus_degrees_exp_alt, n_alt, n_exp):
-  result = np.zeros(n_alt, dtype=float)
+  grados = np.asarray(consensus_degrees_exp_alt, dtype=float)
 
-  for a in range(n_alt):
-    result[a] = sum(consensus_degrees_exp_alt[e][a] for e in range(n_exp)) / n_exp
-    result[a] = round(1.0 - result[a], 2)  # Se invierte el valor y se redondea a 2 decimales
+  # Acumular experto a experto para reproducir exactamente la suma secuencial
+  total = np.zeros(n_alt, dtype=float)
+  for e in range(n_exp):
+    total = total + grados[e, :n_alt]
 
-  return result
+  media = total / n_exp
+
+  # Se invierte el valor y se redondea a 2 decimales (round() sobre np.float64 usa np.round)
+  return np.round(1.0 - media, 2)
 
 # Calcula la medida de proximidad aplicando la transformación 1 - value y luego OWA OR-like.
 # :param proximity_measures_by_expert: Lista de valores de proximidad de cada experto.
@@ -239,14 +252,16 @@ def detectar_cambios(farthest_experts, differences_between_rankings):
 # :param number_of_changes: Número total de cambios a generar.
 # :param prob_accept: Probabilidad de aceptar un cambio (valor entre 0 y 1).
 # :param scale: Factor de escala para determinar la magnitud del cambio.
+# :param rng: Generador np.random.Generator; si no se indica se crea uno sin semilla.
 # :return: Lista con los valores de cambio aceptados o 0 si es rechazado.
-def simular_comportamiento(number_of_changes, prob_accept, scale):
+def simular_comportamiento(number_of_changes, prob_accept, scale, rng=None):
+  rng = rng if rng is not None else np.random.default_rng()
 
   # Simulación de aceptación/rechazo basada en una distribución binomial
-  accept_changes = np.random.binomial(1, prob_accept, number_of_changes)
+  accept_changes = rng.binomial(1, prob_accept, number_of_changes)
 
   # Generar valores de cambio aleatorios en un rango [-scale, scale]
-  change_values = np.random.uniform(0, scale, number_of_changes)
+  change_values = rng.uniform(0, scale, number_of_changes)
 
   # Aplicar los cambios solo si fueron aceptados, si no, asignar 0
   final_changes = change_values * accept_changes
@@ -254,12 +269,13 @@ def simular_comportamiento(number_of_changes, prob_accept, scale):
   return final_changes.tolist()
 
 
-
-
 # Modifica las preferencias de los expertos en base a los cambios calculados.
 # :param changes: Diccionario con la lista de cambios
 # :param preferences: Matrices de preferencias de expertos.
-def aplicar_cambios(changes, preferences):
+# :param rng: Generador np.random.Generator usado para simular la aceptación.
+# :param prob_accept: Probabilidad de que un experto acepte cada cambio.
+# :param scale: Magnitud máxima de cada cambio.
+def aplicar_cambios(changes, preferences, rng=None, prob_accept=1.0, scale=0.2):
     n_alt = len(preferences[0])
 
     # Contar cuántos cambios se deben hacer
@@ -268,7 +284,7 @@ def aplicar_cambios(changes, preferences):
     )
 
     # Obtener el comportamiento de los expertos sobre los cambios. Esto permite simular si los expertos aceptan o rechazan los cambios. Con expertos reales no es necesario pero lo tendremos en cuenta para las simulaciones.
-    changes_to_make = simular_comportamiento(number_of_changes, 1.0, 0.2)
+    changes_to_make = simular_comportamiento(number_of_changes, prob_accept, scale, rng=rng)
 
     # Aplicar cambios
     number_of_changes = 0
@@ -300,12 +316,7 @@ def get_plots_graphics(preferences, method):
   # Sustituir los ceros por un valor muy pequeño (sin modificar los valores no nulos)
   preferences_flat[preferences_flat == 0] = 1e-10
 
-  if method == 'PCA':
-      reducer = PCA(n_components=2)
-  else:
-      reducer = MDS(n_components=2, dissimilarity='euclidean', random_state=42)
-
-  transformed = reducer.fit_transform(preferences_flat)
+  transformed = project_points(preferences_flat, method)
 
   collective_point = transformed[-1]
   expert_points = transformed[:-1] - collective_point
@@ -1,6 +1,6 @@
+from registry.lazy_handler import lazy_handler
 from registry.model_definition import ModelDefinition
 from schemas.model_requests import GenericModelExecutionRequest
-from .executor import execute_manual_criteria_weights
 from .examples import (
     MANUAL_CRITERIA_WEIGHTS_REQUEST_EXAMPLES,
     MANUAL_CRITERIA_WEIGHTS_RESPONSE_EXAMPLES,
@@ -10,7 +10,7 @@ MODEL_DEFINITION = ModelDefinition(
     api_model_key="manual_criteria_weights",
     api_endpoint_path="/manual_criteria_weights",
     request_model=GenericModelExecutionRequest,
-    handler=execute_manual_criteria_weights,
+    handler=lazy_handler(".executor:execute_manual_criteria_weights", __package__),
     small_description=(
         "Auxiliary weighting service that aggregates expert manual criterion "
         "weights into a single normalized group result."
@@ -1,13 +1,14 @@
+from registry.lazy_handler import lazy_handler
 from registry.model_definition import ModelDefinition
 from schemas.model_requests import GenericModelExecutionRequest
-from .executor import execute_marcos
+from utils.projections import PROJECTION_METHOD_PARAMETER
 from .examples import MARCOS_REQUEST_EXAMPLES, MARCOS_RESPONSE_EXAMPLES
 
 MODEL_DEFINITION = ModelDefinition(
     api_model_key="marcos",
     api_endpoint_path="/marcos",
     request_model=GenericModelExecutionRequest,
-    handler=execute_marcos,
+    handler=lazy_handler(".executor:execute_marcos", __package__),
     small_description=(
         "Compromise-based MCDM method that evaluates alternatives through their utility "
         "relative to ideal and anti-ideal reference solutions."
@@ -34,4 +35,5 @@ MODEL_DEFINITION = ModelDefinition(
         {"typeKey": "numericContinuous"},
         {"typeKey": "numericDiscrete"},
     ],
+    parameters=[PROJECTION_METHOD_PARAMETER],
 )
@@ -6,13 +6,15 @@ from schemas.model_requests import GenericModelExecutionRequest
 from services.criteria_weights import ordered_numeric_weights
 from services.model_executors.responses import error_response, success_response
 from models.shared_alternative_matrix import (
-    extract_id_keyed_alternative_criteria_input,
+    DecisionMatrixValidationError,
+    extract_decision_matrix_tensor,
     normalize_collective_evaluations_by_ids,
 )
 from models.shared_expression_domains import (
+    compile_expression_domain,
     expression_domain_type_key,
-    resolve_linguistic_label_definition,
 )
+from utils.projections import projection_method_error, resolve_projection_method
 from .run import run_marcos
 
 
@@ -59,12 +61,14 @@ def _linguistic_values(
     expression_domain: dict[str, Any],
     field: str,
 ) -> list[float]:
-    label_definition = resolve_linguistic_label_definition(
+    compiled_label = compile_expression_domain(expression_domain).resolve_label(
         value=label,
-        expression_domain=expression_domain,
         field=field,
     )
-    values = label_definition.get("values")
+    if compiled_label.values is not None:
+        return list(compiled_label.values)
+
+    values = compiled_label.definition.get("values")
     if not isinstance(values, list) or len(values) == 0:
         raise ValueError(f"{field}.expressionDomain label values are required")
 
@@ -115,7 +119,7 @@ def _weights(payload: GenericModelExecutionRequest, criteria_count: int) -> list
 
 
 def _input(payload: GenericModelExecutionRequest) -> dict[str, Any]:
-    extracted = extract_id_keyed_alternative_criteria_input(
+    extracted = extract_decision_matrix_tensor(
         payload=payload,
         expert_key_fn=_expert_key,
         evaluation_value_fn=_evaluation_value,
@@ -192,12 +196,17 @@ def _output(
 
 def execute_marcos(payload: GenericModelExecutionRequest) -> dict[str, Any] | JSONResponse:
     try:
+        projection_error = projection_method_error(payload)
+        if projection_error is not None:
+            return error_response(projection_error)
+
         execution_input = _input(payload)
 
         results = run_marcos(
-            execution_input["matrices"],
+            execution_input["tensor"],
             weights=execution_input["weights"],
             criterion_type=execution_input["criterion_directions"],
+            projection_method=resolve_projection_method(payload),
         )
 
         return success_response(
@@ -209,5 +218,11 @@ def execute_marcos(payload: GenericModelExecutionRequest) -> dict[str, Any] | JS
                 criterion_ids=execution_input["criterion_ids"],
             ),
         )
+    except DecisionMatrixValidationError as error:
+        return error_response(
+            str(error),
+            code="VALIDATION_ERROR",
+            details={"errors": error.errors},
+        )
     except Exception as error:
         return error_response(f"Error executing MARCOS: {error}", code="INTERNAL_ERROR")
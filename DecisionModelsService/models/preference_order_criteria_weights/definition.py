@@ -2,9 +2,9 @@
 # Declares this model's DecisionModelsService contract.
 # See IMPLEMENTATION_GUIDE.md.
 
+from registry.lazy_handler import lazy_handler
 from registry.model_definition import ModelDefinition
 from schemas.model_requests import GenericModelExecutionRequest
-from .executor import execute_preference_order_criteria_weights
 from .examples import (
     PREFERENCE_ORDER_CRITERIA_WEIGHTS_REQUEST_EXAMPLES,
     PREFERENCE_ORDER_CRITERIA_WEIGHTS_RESPONSE_EXAMPLES,
@@ -15,7 +15,7 @@ MODEL_DEFINITION = ModelDefinition(
     api_model_key="preference_order_criteria_weights",
     api_endpoint_path="/preference_order_criteria_weights",
     request_model=GenericModelExecutionRequest,
-    handler=execute_preference_order_criteria_weights,
+    handler=lazy_handler(".executor:execute_preference_order_criteria_weights", __package__),
     display_name="Preference Order Criteria Weights",
     small_description="Derives normalized criterion weights from a complete preference order.",
     extended_description="Auxiliary criteria-weighting model that transforms each complete ordinal ranking of the leaf criteria into a normalized utility vector using positional scores. It supports creator-side and expert-side weighting. Expert-derived numeric weight vectors can be aggregated through the existing MCC criteria consensus workflow.",
@@ -1,13 +1,14 @@
+from registry.lazy_handler import lazy_handler
 from registry.model_definition import ModelDefinition
 from schemas.model_requests import GenericModelExecutionRequest
-from .executor import execute_promethee_vi
+from utils.projections import PROJECTION_METHOD_PARAMETER
 from .examples import PROMETHEE_VI_REQUEST_EXAMPLES, PROMETHEE_VI_RESPONSE_EXAMPLES
 
 MODEL_DEFINITION = ModelDefinition(
     api_model_key="promethee_vi",
     api_endpoint_path="/promethee_vi",
     request_model=GenericModelExecutionRequest,
-    handler=execute_promethee_vi,
+    handler=lazy_handler(".executor:execute_promethee_vi", __package__),
     small_description=(
         "Outranking MCDM method based on preference functions, thresholds "
         "and lower/upper criterion weight bounds."
@@ -110,5 +111,6 @@ MODEL_DEFINITION = ModelDefinition(
             "default": 1000,
             "restrictions": {"min": 1, "max": None, "allowed": None},
         },
+        PROJECTION_METHOD_PARAMETER,
     ],
 )
@@ -3,11 +3,13 @@ from typing import Any
 import numpy as np
 from pyDecision.algorithm import promethee_vi
 
+from models.shared_alternative_matrix import expert_matrix_tensor
 from utils.get_plots_graphics_from_matrices import get_plots_graphics_from_matrices
+from utils.projections import DEFAULT_PROJECTION_METHOD
 
 
 def run_promethee_vi(
-    matrices: dict[str, list[list[float]]],
+    matrices: np.ndarray | dict[str, list[list[float]]],
     q_thresholds: list[float],
     s_thresholds: list[float],
     p_thresholds: list[float],
@@ -16,8 +18,9 @@ def run_promethee_vi(
     weights_upper: list[float],
     iterations: int,
     topn: int,
+    projection_method: str = DEFAULT_PROJECTION_METHOD,
 ) -> dict[str, Any]:
-    matrices_np = [np.array(matrix, dtype=float) for matrix in matrices.values()]
+    matrices_np = expert_matrix_tensor(matrices)
     collective_matrix = np.mean(matrices_np, axis=0)
 
     p6_minus, p6, p6_plus = promethee_vi(
@@ -43,6 +46,6 @@ def run_promethee_vi(
         "plots_graphic": get_plots_graphics_from_matrices(
             matrices_np,
             collective_matrix,
-            method="MDS",
+            method=projection_method,
         ),
     }
\ No newline at end of file
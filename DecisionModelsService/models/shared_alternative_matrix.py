@@ -1,5 +1,7 @@
 from typing import Any, Callable
 
+import numpy as np
+
 from schemas.model_requests import GenericModelExecutionRequest
 from models.shared_expression_domains import (
     SUPPORTED_EXPRESSION_DOMAIN_TYPE_KEYS,
@@ -9,24 +11,26 @@ from models.shared_expression_domains import (
 EXPERT_WEIGHT_SUM_EPSILON = 0.0015
 
 
-def extract_id_keyed_alternative_criteria_input(
-    *,
-    payload: GenericModelExecutionRequest,
-    expert_key_fn: Callable[[dict[str, Any], int], str],
-    evaluation_value_fn: Callable[[Any, dict[str, Any], str], Any],
-    require_expert_weights: bool = False,
-) -> dict[str, Any]:
-    context = payload.context or {}
+class DecisionMatrixValidationError(ValueError):
+    """Errores de celdas y pesos de expertos recogidos en una sola pasada.
+
+    ``errors`` conserva cada fallo como ``{"field", "message"}``; el mensaje de
+    la excepción los concatena para mantener el contrato de ``ValueError``.
+    """
+
+    def __init__(self, errors: list[dict[str, str]]):
+        self.errors = errors
+        super().__init__("; ".join(error["message"] for error in errors))
+
+
+def _context_items(context: dict[str, Any]) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
     alternatives = context.get("alternatives") or []
     criteria = context.get("criteria") or []
-    evaluations = payload.evaluations or []
 
     if len(alternatives) == 0:
         raise ValueError("context.alternatives is required")
     if len(criteria) == 0:
         raise ValueError("context.criteria is required")
-    if len(evaluations) == 0:
-        raise ValueError("evaluations must include at least one expert payload")
 
     alternative_items = []
     for item in alternatives:
@@ -66,94 +70,115 @@ def extract_id_keyed_alternative_criteria_input(
             }
         )
 
+    return alternative_items, criterion_items
+
+
+def _expert_weight(evaluation: dict[str, Any], expert_index: int) -> float:
+    raw_weight = evaluation.get("weight")
+    try:
+        weight = float(raw_weight)
+    except (TypeError, ValueError):
+        raise ValueError(f"evaluations[{expert_index}].weight is required")
+
+    if weight != weight or weight in {float("inf"), float("-inf")}:
+        raise ValueError(f"evaluations[{expert_index}].weight must be finite")
+    if weight < 0 or weight > 1:
+        raise ValueError(f"evaluations[{expert_index}].weight must be between 0 and 1")
+
+    return weight
+
+
+def extract_decision_matrix_tensor(
+    *,
+    payload: GenericModelExecutionRequest,
+    expert_key_fn: Callable[[dict[str, Any], int], str],
+    evaluation_value_fn: Callable[[Any, dict[str, Any], str], Any],
+    cell_shape: tuple[int, ...] = (),
+    require_expert_weights: bool = False,
+) -> dict[str, Any]:
+    """Construye el tensor ``(n_expertos, n_alternativas, n_criterios, *cell_shape)``.
+
+    Los índices id→posición se calculan una vez y cada celda se escribe
+    directamente en un array float64 prerreservado. Los errores de celdas y
+    pesos se acumulan con su ruta y se lanzan juntos al final como
+    ``DecisionMatrixValidationError``.
+    """
+
+    context = payload.context or {}
+    evaluations = payload.evaluations or []
+
+    alternative_items, criterion_items = _context_items(context)
+    if len(evaluations) == 0:
+        raise ValueError("evaluations must include at least one expert payload")
+
     alternative_ids = [item["id"] for item in alternative_items]
     criterion_ids = [item["id"] for item in criterion_items]
-    alternative_names = [item["name"] for item in alternative_items]
-    criterion_names = [item["name"] for item in criterion_items]
-
-    matrices: dict[str, list[list[float]]] = {}
+    alternative_index = {alternative_id: index for index, alternative_id in enumerate(alternative_ids)}
+    criterion_index = {criterion_id: index for index, criterion_id in enumerate(criterion_ids)}
+
+    tensor = np.zeros(
+        (len(evaluations), len(alternative_ids), len(criterion_ids), *cell_shape),
+        dtype=np.float64,
+    )
+    expert_keys: list[str] = []
     expert_weights: list[float] = []
     seen_expert_keys: set[str] = set()
+    errors: list[dict[str, str]] = []
+
+    def add_error(field: str, message: str) -> None:
+        errors.append({"field": field, "message": message})
 
     for expert_index, evaluation in enumerate(evaluations):
         expert = evaluation.get("expert") or {}
         evaluation_payload = evaluation.get("payload") or {}
-
-        if not isinstance(evaluation_payload, dict):
-            raise ValueError(f"evaluations[{expert_index}].payload is required")
+        payload_field = f"evaluations[{expert_index}].payload"
 
         expert_key = expert_key_fn(expert, expert_index)
         if expert_key in seen_expert_keys:
             expert_key = f"{expert_key}_{expert_index + 1}"
         seen_expert_keys.add(expert_key)
+        expert_keys.append(expert_key)
 
-        matrix: list[list[float]] = []
-        unknown_alternative_ids = [
-            alternative_id
-            for alternative_id in evaluation_payload.keys()
-            if alternative_id not in alternative_ids
-        ]
+        if require_expert_weights:
+            try:
+                expert_weights.append(_expert_weight(evaluation, expert_index))
+            except ValueError as error:
+                add_error(f"evaluations[{expert_index}].weight", str(error))
 
-        if unknown_alternative_ids:
-            raise ValueError(
-                f"evaluations[{expert_index}].payload contains unknown alternative rows"
-            )
+        if not isinstance(evaluation_payload, dict):
+            add_error(payload_field, f"{payload_field} is required")
+            continue
 
-        for alternative_id in alternative_ids:
-            if alternative_id not in evaluation_payload:
-                raise ValueError(
-                    f"evaluations[{expert_index}].payload['{alternative_id}'] is required"
-                )
+        if any(key not in alternative_index for key in evaluation_payload):
+            add_error(payload_field, f"{payload_field} contains unknown alternative rows")
 
-            alternative_payload = evaluation_payload[alternative_id]
+        expert_slice = tensor[expert_index]
+        for alternative_id, row_index in alternative_index.items():
+            row_field = f"{payload_field}['{alternative_id}']"
+            alternative_payload = evaluation_payload.get(alternative_id)
             if not isinstance(alternative_payload, dict):
-                raise ValueError(
-                    f"evaluations[{expert_index}].payload['{alternative_id}'] is required"
-                )
-
-            unknown_criterion_ids = [
-                criterion_id
-                for criterion_id in alternative_payload.keys()
-                if criterion_id not in criterion_ids
-            ]
-
-            if unknown_criterion_ids:
-                raise ValueError(
-                    f"evaluations[{expert_index}].payload['{alternative_id}'] contains unknown criterion cells"
-                )
-
-            row: list[float] = []
-            for criterion in criterion_items:
-                criterion_id = criterion["id"]
-                field = (
-                    f"evaluations[{expert_index}].payload['{alternative_id}']['{criterion_id}']"
-                )
-                if criterion_id not in alternative_payload:
-                    raise ValueError(f"{field} is required")
-
-                value = alternative_payload[criterion_id]
-                if value is None:
-                    raise ValueError(f"{field} is required")
-
-                row.append(evaluation_value_fn(value, criterion, field))
-
-            matrix.append(row)
+                add_error(row_field, f"{row_field} is required")
+                continue
 
-        matrices[expert_key] = matrix
+            if any(key not in criterion_index for key in alternative_payload):
+                add_error(row_field, f"{row_field} contains unknown criterion cells")
 
-        if require_expert_weights:
-            raw_weight = evaluation.get("weight")
-            try:
-                weight = float(raw_weight)
-            except (TypeError, ValueError):
-                raise ValueError(f"evaluations[{expert_index}].weight is required")
+            row_slice = expert_slice[row_index]
+            for column_index, criterion in enumerate(criterion_items):
+                criterion_id = criterion["id"]
+                field = f"{row_field}['{criterion_id}']"
+                value = alternative_payload.get(criterion_id)
+                if value is None:
+                    add_error(field, f"{field} is required")
+                    continue
 
-            if weight != weight or weight in {float("inf"), float("-inf")}:
-                raise ValueError(f"evaluations[{expert_index}].weight must be finite")
-            if weight < 0 or weight > 1:
-                raise ValueError(f"evaluations[{expert_index}].weight must be between 0 and 1")
+                try:
+                    row_slice[column_index] = evaluation_value_fn(value, criterion, field)
+                except (TypeError, ValueError) as error:
+                    add_error(field, str(error))
 
-            expert_weights.append(weight)
+    if errors:
+        raise DecisionMatrixValidationError(errors)
 
     if require_expert_weights:
         total_weight = sum(expert_weights)
@@ -162,17 +187,63 @@ def extract_id_keyed_alternative_criteria_input(
         expert_weights = [weight / total_weight for weight in expert_weights]
 
     return {
-        "matrices": matrices,
+        "tensor": tensor,
+        "expert_keys": expert_keys,
         "alternative_items": alternative_items,
         "criterion_items": criterion_items,
         "alternative_ids": alternative_ids,
         "criterion_ids": criterion_ids,
-        "alternative_names": alternative_names,
-        "criterion_names": criterion_names,
+        "alternative_names": [item["name"] for item in alternative_items],
+        "criterion_names": [item["name"] for item in criterion_items],
         "expert_weights": expert_weights if require_expert_weights else None,
     }
 
 
+def extract_id_keyed_alternative_criteria_input(
+    *,
+    payload: GenericModelExecutionRequest,
+    expert_key_fn: Callable[[dict[str, Any], int], str],
+    evaluation_value_fn: Callable[[Any, dict[str, Any], str], Any],
+    cell_shape: tuple[int, ...] = (),
+    require_expert_weights: bool = False,
+) -> dict[str, Any]:
+    """Variante histórica: añade ``matrices`` (listas por experto) al tensor.
+
+    Ningún ejecutor del repositorio la usa ya; se conserva para paquetes de
+    modelo externos escritos contra el formato ``{experto: matriz}``. El
+    ``tolist()`` copia el tensor entero, así que los ejecutores nuevos deben
+    llamar a ``extract_decision_matrix_tensor``.
+    """
+
+    extracted = extract_decision_matrix_tensor(
+        payload=payload,
+        expert_key_fn=expert_key_fn,
+        evaluation_value_fn=evaluation_value_fn,
+        cell_shape=cell_shape,
+        require_expert_weights=require_expert_weights,
+    )
+
+    return {
+        **extracted,
+        "matrices": dict(zip(extracted["expert_keys"], extracted["tensor"].tolist())),
+    }
+
+
+def expert_matrix_tensor(matrices: Any) -> np.ndarray:
+    """Devuelve las matrices de expertos como un único array float64.
+
+    Acepta el tensor de ``extract_decision_matrix_tensor`` sin copiarlo o el
+    formato histórico ``{experto: matriz}``.
+    """
+
+    if isinstance(matrices, np.ndarray):
+        return np.asarray(matrices, dtype=np.float64)
+    if isinstance(matrices, dict):
+        return np.array(list(matrices.values()), dtype=np.float64)
+
+    return np.array(matrices, dtype=np.float64)
+
+
 def normalize_collective_evaluations_by_ids(
     *,
     collective_matrix: Any,
@@ -1,3 +1,9 @@
+import copy
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field as dataclass_field
 from typing import Any
 
 
@@ -48,29 +54,213 @@ def resolve_linguistic_label_key(value: Any, field: str) -> str:
     return label_key
 
 
-def resolve_linguistic_label_definition(
-    *,
-    value: Any,
-    expression_domain: dict[str, Any],
-    field: str,
-) -> dict[str, Any]:
-    label_key = resolve_linguistic_label_key(value, field)
-    labels = expression_domain_definition(expression_domain).get("labels")
+EXPRESSION_DOMAIN_CACHE_SIZE = 256
+
+
+@dataclass(frozen=True)
+class CompiledLinguisticLabel:
+    """Etiqueta de un dominio compilado con sus valores ya validados.
+
+    ``values`` y ``centroid`` son ``None`` cuando la definición no contiene una lista no vacía
+    de números finitos; en ese caso el llamador debe validar ``definition``
+    para producir su propio mensaje de error.
+    """
+
+    key: str
+    index: int
+    definition: dict[str, Any]
+    values: tuple[float, ...] | None
+    centroid: float | None
+
+    @property
+    def fuzzy_triplet(self) -> tuple[float, float, float] | None:
+        if self.values is None or len(self.values) != 3:
+            return None
+
+        return self.values
+
+
+@dataclass(frozen=True)
+class CompiledExpressionDomain:
+    """Tablas de búsqueda O(1) de un ``expressionDomain``.
+
+    Se compila una vez por contenido del dominio; las funciones
+    ``resolve_linguistic_*`` delegan aquí para no recorrer las etiquetas en
+    cada celda evaluada.
+    """
+
+    type_key: str
+    label_count: int | None
+    labels_by_key: dict[str, CompiledLinguisticLabel] = dataclass_field(default_factory=dict)
+    two_tuple_indexes: dict[str, int] = dataclass_field(default_factory=dict)
+
+    def _require_labels(self, field: str) -> None:
+        if self.label_count is None:
+            raise ValueError(
+                f"{field}.expressionDomain.definition.labels is required"
+            )
+
+    def resolve_label(self, *, value: Any, field: str) -> CompiledLinguisticLabel:
+        label_key = resolve_linguistic_label_key(value, field)
+        self._require_labels(field)
+
+        label = self.labels_by_key.get(label_key)
+        if label is None:
+            raise ValueError(f"Unknown linguistic label '{label_key}'")
+
+        return label
+
+    def resolve_2tuple_index(self, *, label_key: str, field: str) -> int:
+        self._require_labels(field)
+
+        label_index = self.two_tuple_indexes.get(label_key)
+        if label_index is None:
+            raise ValueError(f"Unknown linguistic label '{label_key}'")
+
+        return label_index
+
+
+def _validated_label_values(values: Any) -> tuple[float, ...] | None:
+    if not isinstance(values, list) or len(values) == 0:
+        return None
+
+    try:
+        parsed = tuple(float(item) for item in values)
+    except (TypeError, ValueError):
+        return None
+
+    if any(item != item or item in {float("inf"), float("-inf")} for item in parsed):
+        return None
+
+    return parsed
+
+
+def _build_compiled_expression_domain(expression_domain: Any) -> CompiledExpressionDomain:
+    labels = copy.deepcopy(expression_domain_definition(expression_domain).get("labels"))
+    type_key = expression_domain_type_key(expression_domain)
 
     if not isinstance(labels, list) or len(labels) == 0:
-        raise ValueError(
-            f"{field}.expressionDomain.definition.labels is required"
-        )
+        return CompiledExpressionDomain(type_key=type_key, label_count=None)
+
+    labels_by_key: dict[str, CompiledLinguisticLabel] = {}
+    exact_key_indexes: dict[Any, list[int]] = {}
 
-    for label_definition in labels:
+    for index, label_definition in enumerate(labels):
         if not isinstance(label_definition, dict):
             continue
 
-        current_label_key = str(label_definition.get("key") or "").strip()
-        if current_label_key == label_key:
-            return label_definition
+        raw_key = label_definition.get("key")
+        try:
+            exact_key_indexes.setdefault(raw_key, []).append(index)
+        except TypeError:
+            pass
+
+        label_key = str(raw_key or "").strip()
+        if label_key not in labels_by_key:
+            values = _validated_label_values(label_definition.get("values"))
+            labels_by_key[label_key] = CompiledLinguisticLabel(
+                key=label_key,
+                index=index,
+                definition=label_definition,
+                values=values,
+                centroid=None if values is None else float(sum(values) / len(values)),
+            )
+
+    return CompiledExpressionDomain(
+        type_key=type_key,
+        label_count=len(labels),
+        labels_by_key=labels_by_key,
+        two_tuple_indexes={
+            key: indexes[0]
+            for key, indexes in exact_key_indexes.items()
+            if isinstance(key, str) and len(indexes) == 1
+        },
+    )
+
+
+def expression_domain_content_hash(expression_domain: Any) -> str:
+    encoded = json.dumps(
+        expression_domain,
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class _ExpressionDomainCache:
+    """LRU de dominios compilados por hash de contenido.
+
+    Se re-serializa el dominio en cada consulta: un dict editado en sitio
+    obtiene su propia compilación y la caché no retiene los payloads.
+    """
+
+    def __init__(self, maxsize: int = EXPRESSION_DOMAIN_CACHE_SIZE):
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._by_content: OrderedDict[str, CompiledExpressionDomain] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, expression_domain: Any) -> CompiledExpressionDomain:
+        content_hash = expression_domain_content_hash(expression_domain)
+        with self._lock:
+            compiled = self._by_content.get(content_hash)
+            if compiled is not None:
+                self._by_content.move_to_end(content_hash)
+                self._hits += 1
+                return compiled
+
+        compiled = _build_compiled_expression_domain(expression_domain)
+        with self._lock:
+            self._misses += 1
+            self._by_content[content_hash] = compiled
+            while len(self._by_content) > self._maxsize:
+                self._by_content.popitem(last=False)
+
+        return compiled
+
+    def clear(self) -> None:
+        with self._lock:
+            self._by_content.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._by_content),
+                "maxSize": self._maxsize,
+                "hits": self._hits,
+                "misses": self._misses,
+            }
+
 
-    raise ValueError(f"Unknown linguistic label '{label_key}'")
+_EXPRESSION_DOMAIN_CACHE = _ExpressionDomainCache()
+
+
+def compile_expression_domain(expression_domain: Any) -> CompiledExpressionDomain:
+    return _EXPRESSION_DOMAIN_CACHE.get(expression_domain)
+
+
+def clear_expression_domain_cache() -> None:
+    _EXPRESSION_DOMAIN_CACHE.clear()
+
+
+def get_expression_domain_cache_stats() -> dict[str, int]:
+    return _EXPRESSION_DOMAIN_CACHE.stats()
+
+
+def resolve_linguistic_label_definition(
+    *,
+    value: Any,
+    expression_domain: dict[str, Any],
+    field: str,
+) -> dict[str, Any]:
+    return compile_expression_domain(expression_domain).resolve_label(
+        value=value,
+        field=field,
+    ).definition
 
 
 def resolve_linguistic_2tuple_value(
@@ -132,29 +322,10 @@ def resolve_linguistic_2tuple_value(
             "-0.5 and less than 0.5"
         )
 
-    labels = expression_domain_definition(expression_domain).get("labels")
-
-    if not isinstance(labels, list) or len(labels) == 0:
-        raise ValueError(
-            f"{field}.expressionDomain.definition.labels is required"
-        )
-
-    matching_indexes = []
-
-    for index, label_definition in enumerate(labels):
-        if not isinstance(label_definition, dict):
-            continue
-
-        current_label_key = label_definition.get("key")
-        if current_label_key == label_key:
-            matching_indexes.append(index)
-
-    if len(matching_indexes) != 1:
-        raise ValueError(f"Unknown linguistic label '{label_key}'")
-
-    label_index = matching_indexes[0]
+    compiled = compile_expression_domain(expression_domain)
+    label_index = compiled.resolve_2tuple_index(label_key=label_key, field=field)
     beta = float(label_index + alpha)
-    maximum_index = len(labels) - 1
+    maximum_index = compiled.label_count - 1
 
     if beta < 0 or beta > maximum_index:
         raise ValueError(
@@ -1,6 +1,7 @@
+from registry.lazy_handler import lazy_handler
 from registry.model_definition import ModelDefinition
 from schemas.model_requests import GenericModelExecutionRequest
-from .executor import execute_topsis
+from utils.projections import PROJECTION_METHOD_PARAMETER
 from .examples import TOPSIS_REQUEST_EXAMPLES, TOPSIS_RESPONSE_EXAMPLES
 
 
@@ -8,7 +9,7 @@ MODEL_DEFINITION = ModelDefinition(
         api_model_key="topsis",
         api_endpoint_path="/topsis",
         request_model=GenericModelExecutionRequest,
-        handler=execute_topsis,
+        handler=lazy_handler(".executor:execute_topsis", __package__),
         small_description=(
             "Distance-based MCDM method that selects the best compromise alternative by "
             "measuring closeness to ideal and anti-ideal solutions."
@@ -35,4 +36,5 @@ MODEL_DEFINITION = ModelDefinition(
             {"typeKey": "numericContinuous"},
             {"typeKey": "numericDiscrete"},
         ],
+        parameters=[PROJECTION_METHOD_PARAMETER],
     )
@@ -1,31 +1,60 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Iterator
+
+from services.results_analysis.streaming import assemble_analysis
 
 from .core import build_core_facts_from_evidence
-from .evidence import extract_topsis_evidence
 from .experts import build_evaluator_facts
 from .interpretation import build_interpretation
 from .linguistic import build_linguistic_facts
 from .robustness import build_robustness_facts
-from .sensitivity import build_sensitivity_facts
+from .sensitivity import build_sensitivity_facts, sensitivity_step
+from .session import AnalysisSession
 from .visualizations import build_visualization_sections, build_visualizations
 
 
+def stream_issue(context: dict[str, Any]) -> Iterator[tuple[tuple[str, ...], Any]]:
+    """Yield the issue analysis as ``(path, value)`` parts, each as soon as it is built.
+
+    Core facts come first so the ranking summary can be shown while the
+    evaluator, robustness and sensitivity facts are still being computed.
+    """
+    session = AnalysisSession.from_context(context)
+    with session.stage("core"):
+        facts = build_core_facts_from_evidence(session.evidence)
+    yield ("facts",), dict(facts)
+
+    for key, build in (
+        ("linguistic2Tuple", lambda: build_linguistic_facts(session.evidence)),
+        ("evaluators", lambda: build_evaluator_facts(session)),
+        ("robustness", lambda: build_robustness_facts(session)),
+        ("sensitivity", lambda: build_sensitivity_facts(session)),
+    ):
+        with session.stage(key):
+            facts[key] = build()
+        yield ("facts", key), facts[key]
+
+    with session.stage("interpretation"):
+        interpretation = build_interpretation(facts)
+    yield ("interpretation",), interpretation
+
+    with session.stage("visualizations"):
+        visualizations = build_visualizations(facts)
+        sections = build_visualization_sections(facts)
+    yield ("visualizations",), visualizations
+    yield ("sections",), sections
+    yield ("metadata",), {"timings": session.timing_metadata()}
+
+
+def analysis_settings() -> dict[str, Any]:
+    """Environment-driven settings that change the analysis output."""
+    return {"sensitivityStep": sensitivity_step()}
+
+
 def analyze_issue(context: dict[str, Any]) -> dict[str, Any]:
     """Build deterministic issue-level Results Analysis for 2-Tuple TOPSIS."""
-    evidence = extract_topsis_evidence(context)
-    facts = build_core_facts_from_evidence(evidence)
-    facts["linguistic2Tuple"] = build_linguistic_facts(evidence)
-    facts["evaluators"] = build_evaluator_facts(evidence, context)
-    facts["robustness"] = build_robustness_facts(evidence, context)
-    facts["sensitivity"] = build_sensitivity_facts(evidence, context)
-    return {
-        "facts": facts,
-        "interpretation": build_interpretation(facts),
-        "visualizations": build_visualizations(facts),
-        "sections": build_visualization_sections(facts),
-    }
-
-
-__all__ = ["analyze_issue"]
+    return assemble_analysis(stream_issue(context))
+
+
+__all__ = ["analysis_settings", "analyze_issue", "stream_issue"]
@@ -1,15 +1,10 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from models.shared_expression_domains import resolve_linguistic_2tuple_value
 
-from ..run import (
-    calculate_closeness_coefficients,
-    calculate_ideal_solutions,
-    calculate_weighted_distances,
-    rank_closeness_coefficients,
-)
+from ..run import evaluate_collective_beta_matrix
 from .common import (
     ANALYTICAL_TIE_TOLERANCE,
     EVIDENCE_TOLERANCE,
@@ -24,6 +19,11 @@ from .common import (
 )
 from .evidence import TopsisEvidence
 
+if TYPE_CHECKING:
+    import numpy as np
+
+    from .session import AnalysisSession
+
 
 def _final_execution(context: dict[str, Any]) -> dict[str, Any]:
     rounds = as_list(context.get("rounds"), "context.rounds", non_empty=True)
@@ -394,33 +394,17 @@ def _orientation_adjusted_score(
 def _personal_result(
     *,
     evidence: TopsisEvidence,
-    matrix: list[list[float]],
+    matrix: list[list[float]] | np.ndarray,
+    scales: list[dict[str, Any]],
 ) -> dict[str, Any]:
-    scales = [
-        {
-            "criterionId": evidence.criterion_ids[index],
-            "labelCount": len(evidence.scale_labels[index]),
-            "maximumIndex": len(evidence.scale_labels[index]) - 1,
-            "labels": evidence.scale_labels[index],
-        }
-        for index in range(len(evidence.criterion_ids))
-    ]
-    ideals = calculate_ideal_solutions(
+    evaluation = evaluate_collective_beta_matrix(
         collective_beta_matrix=matrix,
+        weights=evidence.criterion_weights,
         criterion_directions=evidence.criterion_directions,
         criterion_scales=scales,
     )
-    distances = calculate_weighted_distances(
-        collective_beta_matrix=matrix,
-        positive_ideal_beta=ideals["positive_ideal_beta"],
-        negative_ideal_beta=ideals["negative_ideal_beta"],
-        weights=evidence.criterion_weights,
-    )
-    closeness = calculate_closeness_coefficients(
-        positive_distances=distances["positive_distances"],
-        negative_distances=distances["negative_distances"],
-    )
-    ranking = rank_closeness_coefficients(closeness)
+    closeness = evaluation["closeness_coefficients"]
+    ranking = evaluation["collective_ranking"]
     rank_by_index = {
         alternative_index: rank
         for rank, alternative_index in enumerate(ranking, start=1)
@@ -437,8 +421,8 @@ def _personal_result(
             "originalIndex": index,
             "technicalRank": rank,
             "closeness": closeness[index],
-            "positiveDistance": distances["positive_distances"][index],
-            "negativeDistance": distances["negative_distances"][index],
+            "positiveDistance": evaluation["positive_distances"][index],
+            "negativeDistance": evaluation["negative_distances"][index],
             "collectiveTechnicalRank": collective_rank_by_index[index],
             "personalRankMinusCollectiveRank": (
                 rank - collective_rank_by_index[index]
@@ -467,8 +451,8 @@ def _personal_result(
     weighted_discrimination = sum(
         evidence.criterion_weights[index]
         * abs(
-            ideals["positive_ideal_beta"][index]
-            - ideals["negative_ideal_beta"][index]
+            evaluation["positive_ideal_beta"][index]
+            - evaluation["negative_ideal_beta"][index]
         )
         for index in range(len(evidence.criterion_ids))
     )
@@ -493,8 +477,8 @@ def _personal_result(
             )
             / len(evidence.alternative_ids)
         ),
-        "positiveIdealBeta": list(ideals["positive_ideal_beta"]),
-        "negativeIdealBeta": list(ideals["negative_ideal_beta"]),
+        "positiveIdealBeta": list(evaluation["positive_ideal_beta"]),
+        "negativeIdealBeta": list(evaluation["negative_ideal_beta"]),
     }
 
 
@@ -764,21 +748,21 @@ def extract_expert_profiles(
     """Return validated expert matrices reconstructed from executed input."""
     return _expert_matrices(context=context, evidence=evidence)
 
-def build_evaluator_facts(
-    evidence: TopsisEvidence,
-    context: dict[str, Any],
-) -> dict[str, Any]:
-    experts = extract_expert_profiles(evidence=evidence, context=context)
+
+def build_evaluator_facts(session: AnalysisSession) -> dict[str, Any]:
+    evidence = session.evidence
+    experts = session.experts
     evaluator_items: list[dict[str, Any]] = []
 
-    for expert in experts:
+    for index, expert in enumerate(experts):
         distance, normalized_distance, cells = _alignment(
             evidence=evidence,
             expert=expert,
         )
         personal_result = _personal_result(
             evidence=evidence,
-            matrix=expert["betaMatrix"],
+            matrix=session.expert_beta_tensor[index],
+            scales=session.criterion_scales,
         )
         evaluator_items.append(
             {
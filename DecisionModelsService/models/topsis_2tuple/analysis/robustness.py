@@ -1,13 +1,10 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from ..run import (
-    calculate_closeness_coefficients,
-    calculate_ideal_solutions,
-    calculate_weighted_distances,
-    rank_closeness_coefficients,
-)
+import numpy as np
+
+from ..run import evaluate_weight_samples
 from .common import (
     ANALYTICAL_TIE_TOLERANCE,
     EVIDENCE_TOLERANCE,
@@ -15,45 +12,80 @@ from .common import (
     effective_tie,
 )
 from .evidence import TopsisEvidence
-from .experts import extract_expert_profiles
 
-
-def _criterion_scales(evidence: TopsisEvidence) -> list[dict[str, Any]]:
-    return [
-        {
-            "criterionId": evidence.criterion_ids[index],
-            "labelCount": len(evidence.scale_labels[index]),
-            "maximumIndex": len(evidence.scale_labels[index]) - 1,
-            "labels": [dict(label) for label in evidence.scale_labels[index]],
-        }
-        for index in range(len(evidence.criterion_ids))
-    ]
+if TYPE_CHECKING:
+    from .session import AnalysisSession
 
 
-def _semantic_result(
+def _sample_results(
     *,
     evidence: TopsisEvidence,
-    matrix: list[list[float]],
-    weights: list[float],
-    directions: list[str],
+    matrix: list[list[float]] | np.ndarray,
+    weight_matrix: np.ndarray,
     scales: list[dict[str, Any]],
-) -> dict[str, Any]:
-    ideals = calculate_ideal_solutions(
+    kept_criteria: list[list[int]] | None = None,
+) -> list[dict[str, Any]]:
+    """Semantic facts for every row of ``weight_matrix`` in one kernel pass.
+
+    ``kept_criteria`` restricts the reported ideals and weights of each
+    sample to the listed criteria; the others carry a zero weight and add
+    an exact ``0.0`` to every distance, as if they had been removed.
+    """
+    evaluation = evaluate_weight_samples(
         collective_beta_matrix=matrix,
-        criterion_directions=directions,
+        weight_matrix=weight_matrix,
+        criterion_directions=evidence.criterion_directions,
         criterion_scales=scales,
     )
-    distances = calculate_weighted_distances(
-        collective_beta_matrix=matrix,
-        positive_ideal_beta=ideals["positive_ideal_beta"],
-        negative_ideal_beta=ideals["negative_ideal_beta"],
-        weights=weights,
-    )
-    closeness = calculate_closeness_coefficients(
-        positive_distances=distances["positive_distances"],
-        negative_distances=distances["negative_distances"],
+    rows = {key: values.tolist() for key, values in evaluation.items()}
+    weight_rows = weight_matrix.tolist()
+    results: list[dict[str, Any]] = []
+
+    for index, weights in enumerate(weight_rows):
+        sample = {key: values[index] for key, values in rows.items()}
+        if kept_criteria is not None:
+            kept = kept_criteria[index]
+            weights = [weights[criterion] for criterion in kept]
+            for key in ("positive_ideal_beta", "negative_ideal_beta"):
+                sample[key] = [sample[key][criterion] for criterion in kept]
+        results.append(
+            _semantic_facts(
+                evidence=evidence,
+                weights=weights,
+                evaluation=sample,
+            )
+        )
+
+    return results
+
+
+def _leave_one_out_weights(
+    weights: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Row ``k`` holds ``weights`` with entry ``k`` zeroed, plus its total.
+
+    Totals are accumulated in the original order; adding the zeroed entry
+    is exact, so they equal the sum over the remaining entries.
+    """
+    masked = np.where(
+        np.eye(weights.shape[0], dtype=bool),
+        0.0,
+        weights[None, :],
     )
-    ranking = rank_closeness_coefficients(closeness)
+    totals = np.zeros(weights.shape[0], dtype=np.float64)
+    for index in range(weights.shape[0]):
+        totals += masked[:, index]
+    return masked, totals
+
+
+def _semantic_facts(
+    *,
+    evidence: TopsisEvidence,
+    weights: list[float],
+    evaluation: dict[str, Any],
+) -> dict[str, Any]:
+    closeness = evaluation["closeness_coefficients"]
+    ranking = evaluation["collective_ranking"]
     rank_by_index = {
         alternative_index: rank
         for rank, alternative_index in enumerate(ranking, start=1)
@@ -66,8 +98,8 @@ def _semantic_result(
             "originalIndex": index,
             "technicalRank": rank,
             "closeness": closeness[index],
-            "positiveDistance": distances["positive_distances"][index],
-            "negativeDistance": distances["negative_distances"][index],
+            "positiveDistance": evaluation["positive_distances"][index],
+            "negativeDistance": evaluation["negative_distances"][index],
         }
         for rank, index in enumerate(ranking, start=1)
     ]
@@ -89,8 +121,8 @@ def _semantic_result(
     weighted_discrimination = sum(
         weights[index]
         * abs(
-            ideals["positive_ideal_beta"][index]
-            - ideals["negative_ideal_beta"][index]
+            evaluation["positive_ideal_beta"][index]
+            - evaluation["negative_ideal_beta"][index]
         )
         for index in range(len(weights))
     )
@@ -109,10 +141,10 @@ def _semantic_result(
         "technicalRanking": technical_ranking,
         "leadingGroup": leading_group,
         "winner": winner,
-        "positiveIdealBeta": list(ideals["positive_ideal_beta"]),
-        "negativeIdealBeta": list(ideals["negative_ideal_beta"]),
-        "positiveDistances": list(distances["positive_distances"]),
-        "negativeDistances": list(distances["negative_distances"]),
+        "positiveIdealBeta": list(evaluation["positive_ideal_beta"]),
+        "negativeIdealBeta": list(evaluation["negative_ideal_beta"]),
+        "positiveDistances": list(evaluation["positive_distances"]),
+        "negativeDistances": list(evaluation["negative_distances"]),
         "closeness": list(closeness),
         "totalWeightedDiscrimination": weighted_discrimination,
     }
@@ -308,9 +340,10 @@ def _extreme_counterfactual(
 
 def _loco(
     *,
-    evidence: TopsisEvidence,
+    session: AnalysisSession,
     baseline: dict[str, Any],
 ) -> dict[str, Any]:
+    evidence = session.evidence
     criterion_count = len(evidence.criterion_ids)
     if criterion_count == 1:
         return {
@@ -331,16 +364,48 @@ def _loco(
             "winnerStateChangingCriteria": [],
         }
 
-    all_scales = _criterion_scales(evidence)
+    # Every counterfactual keeps the baseline matrix and ideals; removing
+    # criterion r only zeroes its weight, so all of them are evaluated in
+    # one batched pass over (criteria, alternatives).
+    masked_weights, remaining_totals = _leave_one_out_weights(
+        np.array(evidence.criterion_weights, dtype=np.float64)
+    )
+    available_indexes = [
+        index
+        for index, total in enumerate(remaining_totals.tolist())
+        if total > EVIDENCE_TOLERANCE
+    ]
+    kept_criteria = [
+        [index for index in range(criterion_count) if index != removed_index]
+        for removed_index in available_indexes
+    ]
+    weight_matrix = (
+        masked_weights[available_indexes]
+        / remaining_totals[available_indexes, None]
+    )
+    counterfactuals = (
+        dict(
+            zip(
+                available_indexes,
+                _sample_results(
+                    evidence=evidence,
+                    matrix=session.collective_beta_matrix,
+                    weight_matrix=weight_matrix,
+                    scales=session.criterion_scales,
+                    kept_criteria=kept_criteria,
+                ),
+                strict=True,
+            )
+        )
+        if available_indexes
+        else {}
+    )
+    positions = {index: position for position, index in enumerate(available_indexes)}
+    weight_rows = weight_matrix.tolist()
     items: list[dict[str, Any]] = []
 
     for removed_index, criterion_id in enumerate(evidence.criterion_ids):
-        remaining_indexes = [
-            index for index in range(criterion_count) if index != removed_index
-        ]
-        remaining_weight_total = sum(
-            evidence.criterion_weights[index] for index in remaining_indexes
-        )
+        remaining_weight_total = float(remaining_totals[removed_index])
 
         identity = {
             "criterionId": criterion_id,
@@ -350,7 +415,7 @@ def _loco(
             "remainingConfiguredWeight": remaining_weight_total,
         }
 
-        if remaining_weight_total <= EVIDENCE_TOLERANCE:
+        if removed_index not in counterfactuals:
             items.append(
                 {
                     **identity,
@@ -363,27 +428,8 @@ def _loco(
             )
             continue
 
-        weights = [
-            evidence.criterion_weights[index] / remaining_weight_total
-            for index in remaining_indexes
-        ]
-        matrix = [
-            [row[index] for index in remaining_indexes]
-            for row in evidence.collective_beta_matrix
-        ]
-        directions = [
-            evidence.criterion_directions[index]
-            for index in remaining_indexes
-        ]
-        scales = [all_scales[index] for index in remaining_indexes]
-
-        counterfactual = _semantic_result(
-            evidence=evidence,
-            matrix=matrix,
-            weights=weights,
-            directions=directions,
-            scales=scales,
-        )
+        position = positions[removed_index]
+        counterfactual = counterfactuals[removed_index]
         impact = _impact(
             evidence=evidence,
             baseline=baseline,
@@ -400,13 +446,10 @@ def _loco(
                         "criterionId": evidence.criterion_ids[index],
                         "name": evidence.criterion_names[index],
                         "criterionIndex": index,
-                        "weight": weight,
+                        "weight": weight_rows[position][index],
                     }
-                    for index, weight in zip(
-                        remaining_indexes,
-                        weights,
-                        strict=True,
-                    )
+                    for index in range(criterion_count)
+                    if index != removed_index
                 ],
                 "counterfactualResult": counterfactual,
                 "impact": impact,
@@ -440,11 +483,11 @@ def _loco(
 
 def _loeo(
     *,
-    evidence: TopsisEvidence,
-    context: dict[str, Any],
+    session: AnalysisSession,
     baseline: dict[str, Any],
 ) -> dict[str, Any]:
-    experts = extract_expert_profiles(evidence=evidence, context=context)
+    evidence = session.evidence
+    experts = session.experts
     if len(experts) == 1:
         return {
             "availability": availability(False, "single_evaluator"),
@@ -464,18 +507,56 @@ def _loeo(
             "winnerStateChangingEvaluators": [],
         }
 
-    scales = _criterion_scales(evidence)
+    # Removing evaluator e zeroes its weight; each counterfactual
+    # collective matrix is accumulated expert by expert over the shared
+    # beta tensor, for all removed evaluators at once.
+    beta_tensor = session.expert_beta_tensor
+    masked_weights, remaining_totals = _leave_one_out_weights(
+        session.expert_weights
+    )
+    available_indexes = [
+        index
+        for index, total in enumerate(remaining_totals.tolist())
+        if total > EVIDENCE_TOLERANCE
+    ]
+    expert_weight_matrix = (
+        masked_weights[available_indexes]
+        / remaining_totals[available_indexes, None]
+    )
+    matrices = np.zeros(
+        (len(available_indexes), *beta_tensor.shape[1:]),
+        dtype=np.float64,
+    )
+    for expert_index in range(len(experts)):
+        matrices += (
+            expert_weight_matrix[:, expert_index, None, None]
+            * beta_tensor[expert_index]
+        )
+    counterfactuals = (
+        dict(
+            zip(
+                available_indexes,
+                _sample_results(
+                    evidence=evidence,
+                    matrix=matrices,
+                    weight_matrix=np.tile(
+                        session.criterion_weights,
+                        (len(available_indexes), 1),
+                    ),
+                    scales=session.criterion_scales,
+                ),
+                strict=True,
+            )
+        )
+        if available_indexes
+        else {}
+    )
+    positions = {index: position for position, index in enumerate(available_indexes)}
+    weight_rows = expert_weight_matrix.tolist()
     items: list[dict[str, Any]] = []
 
     for removed_index, removed in enumerate(experts):
-        remaining = [
-            expert
-            for index, expert in enumerate(experts)
-            if index != removed_index
-        ]
-        remaining_weight_total = sum(
-            expert["configuredWeight"] for expert in remaining
-        )
+        remaining_weight_total = float(remaining_totals[removed_index])
         identity = {
             "expertIndex": removed["expertIndex"],
             "expertKey": removed["expertKey"],
@@ -486,7 +567,7 @@ def _loeo(
             "remainingConfiguredWeight": remaining_weight_total,
         }
 
-        if remaining_weight_total <= EVIDENCE_TOLERANCE:
+        if removed_index not in counterfactuals:
             items.append(
                 {
                     **identity,
@@ -500,32 +581,8 @@ def _loeo(
             )
             continue
 
-        normalized_weights = [
-            expert["configuredWeight"] / remaining_weight_total
-            for expert in remaining
-        ]
-        counterfactual_matrix = [
-            [
-                sum(
-                    weight
-                    * expert["betaMatrix"][alternative_index][criterion_index]
-                    for expert, weight in zip(
-                        remaining,
-                        normalized_weights,
-                        strict=True,
-                    )
-                )
-                for criterion_index in range(len(evidence.criterion_ids))
-            ]
-            for alternative_index in range(len(evidence.alternative_ids))
-        ]
-        counterfactual = _semantic_result(
-            evidence=evidence,
-            matrix=counterfactual_matrix,
-            weights=evidence.criterion_weights,
-            directions=evidence.criterion_directions,
-            scales=scales,
-        )
+        position = positions[removed_index]
+        counterfactual = counterfactuals[removed_index]
         impact = _impact(
             evidence=evidence,
             baseline=baseline,
@@ -543,17 +600,12 @@ def _loeo(
                         "expertKey": expert["expertKey"],
                         "expertId": expert["expertId"],
                         "name": expert["name"],
-                        "weight": weight,
+                        "weight": weight_rows[position][index],
                     }
-                    for expert, weight in zip(
-                        remaining,
-                        normalized_weights,
-                        strict=True,
-                    )
-                ],
-                "counterfactualCollectiveBetaMatrix": [
-                    list(row) for row in counterfactual_matrix
+                    for index, expert in enumerate(experts)
+                    if index != removed_index
                 ],
+                "counterfactualCollectiveBetaMatrix": matrices[position].tolist(),
                 "counterfactualResult": counterfactual,
                 "impact": impact,
             }
@@ -585,13 +637,10 @@ def _loeo(
     }
 
 
-def build_robustness_facts(
-    evidence: TopsisEvidence,
-    context: dict[str, Any],
-) -> dict[str, Any]:
-    baseline = _baseline_result(evidence)
-    loco = _loco(evidence=evidence, baseline=baseline)
-    loeo = _loeo(evidence=evidence, context=context, baseline=baseline)
+def build_robustness_facts(session: AnalysisSession) -> dict[str, Any]:
+    baseline = _baseline_result(session.evidence)
+    loco = _loco(session=session, baseline=baseline)
+    loeo = _loeo(session=session, baseline=baseline)
 
     return {
         "method": {
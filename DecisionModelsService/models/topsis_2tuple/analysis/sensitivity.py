@@ -1,6 +1,10 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from core.environment import get_float_setting
 
 from .common import (
     ANALYTICAL_TIE_TOLERANCE,
@@ -10,33 +14,52 @@ from .common import (
     effective_tie,
 )
 from .evidence import TopsisEvidence
-from .experts import extract_expert_profiles
-from .robustness import _baseline_result, _impact, _semantic_result
+from .robustness import _baseline_result, _impact, _sample_results
+
+if TYPE_CHECKING:
+    from .session import AnalysisSession
 
 
 SENSITIVITY_STEP = 0.05
+MINIMUM_SENSITIVITY_STEP = 0.001
+SENSITIVITY_STEP_SETTING = "DECISION_MODELS_SENSITIVITY_STEP"
 
 
-def _criterion_scales(evidence: TopsisEvidence) -> list[dict[str, Any]]:
-    return [
-        {
-            "criterionId": evidence.criterion_ids[index],
-            "labelCount": len(evidence.scale_labels[index]),
-            "maximumIndex": len(evidence.scale_labels[index]) - 1,
-            "labels": [dict(label) for label in evidence.scale_labels[index]],
-        }
-        for index in range(len(evidence.criterion_ids))
-    ]
+def sensitivity_step() -> float:
+    """Sampling step, configurable when it splits [0, 1] into whole intervals."""
+    step = get_float_setting(SENSITIVITY_STEP_SETTING, SENSITIVITY_STEP)
+    if step is None or not MINIMUM_SENSITIVITY_STEP <= step <= 0.5:
+        return SENSITIVITY_STEP
+    if abs(round(1.0 / step) * step - 1.0) > EVIDENCE_TOLERANCE:
+        return SENSITIVITY_STEP
+    return step
 
 
-def _sample_weights(configured_weight: float) -> list[float]:
-    steps = round(1.0 / SENSITIVITY_STEP)
-    values = [round(index * SENSITIVITY_STEP, 12) for index in range(steps + 1)]
+def _sample_weights(configured_weight: float, step: float) -> list[float]:
+    steps = round(1.0 / step)
+    values = [round(index * step, 12) for index in range(steps + 1)]
     if not any(abs(value - configured_weight) <= EVIDENCE_TOLERANCE for value in values):
         values.append(float(configured_weight))
     return sorted(set(values))
 
 
+def _redistributed_weights(
+    *,
+    configured_weights: list[float],
+    target_index: int,
+    varied_weights: list[float],
+    complement_total: float,
+) -> np.ndarray:
+    varied = np.array(varied_weights, dtype=np.float64)
+    weights = (
+        (1.0 - varied)[:, None]
+        * np.array(configured_weights, dtype=np.float64)
+        / complement_total
+    )
+    weights[:, target_index] = varied
+    return weights
+
+
 def _leading_ids(result: dict[str, Any]) -> tuple[str, ...]:
     return tuple(item["alternativeId"] for item in result["leadingGroup"])
 
@@ -346,9 +369,11 @@ def _extreme_items(
 
 def _criterion_weight_sensitivity(
     *,
-    evidence: TopsisEvidence,
+    session: AnalysisSession,
     baseline: dict[str, Any],
+    step: float,
 ) -> dict[str, Any]:
+    evidence = session.evidence
     alternative_count = len(evidence.alternative_ids)
     criterion_count = len(evidence.criterion_ids)
 
@@ -363,7 +388,6 @@ def _criterion_weight_sensitivity(
             "items": [],
         }
 
-    scales = _criterion_scales(evidence)
     items: list[dict[str, Any]] = []
 
     for target_index, criterion_id in enumerate(evidence.criterion_ids):
@@ -392,27 +416,21 @@ def _criterion_weight_sensitivity(
             )
             continue
 
-        points: list[dict[str, Any]] = []
-        for varied_weight in _sample_weights(configured_weight):
-            weights = [0.0 for _ in evidence.criterion_weights]
-            weights[target_index] = varied_weight
-            for index, baseline_weight in enumerate(evidence.criterion_weights):
-                if index == target_index:
-                    continue
-                weights[index] = (
-                    (1.0 - varied_weight)
-                    * baseline_weight
-                    / complement_total
-                )
-
-            result = _semantic_result(
-                evidence=evidence,
-                matrix=evidence.collective_beta_matrix,
-                weights=weights,
-                directions=evidence.criterion_directions,
-                scales=scales,
-            )
-            point = _point(
+        varied_weights = _sample_weights(configured_weight, step)
+        weight_matrix = _redistributed_weights(
+            configured_weights=evidence.criterion_weights,
+            target_index=target_index,
+            varied_weights=varied_weights,
+            complement_total=complement_total,
+        )
+        results = _sample_results(
+            evidence=evidence,
+            matrix=session.collective_beta_matrix,
+            weight_matrix=weight_matrix,
+            scales=session.criterion_scales,
+        )
+        points = [
+            _point(
                 evidence=evidence,
                 baseline=baseline,
                 varied_weight=varied_weight,
@@ -421,13 +439,19 @@ def _criterion_weight_sensitivity(
                         "criterionId": evidence.criterion_ids[index],
                         "name": evidence.criterion_names[index],
                         "criterionIndex": index,
-                        "weight": weights[index],
+                        "weight": weight,
                     }
-                    for index in range(criterion_count)
+                    for index, weight in enumerate(weights)
                 ],
                 result=result,
             )
-            points.append(point)
+            for varied_weight, weights, result in zip(
+                varied_weights,
+                weight_matrix.tolist(),
+                results,
+                strict=True,
+            )
+        ]
 
         baseline_points = [
             point
@@ -486,12 +510,13 @@ def _criterion_weight_sensitivity(
 
 def _evaluator_weight_sensitivity(
     *,
-    evidence: TopsisEvidence,
-    context: dict[str, Any],
+    session: AnalysisSession,
     baseline: dict[str, Any],
+    step: float,
 ) -> dict[str, Any]:
+    evidence = session.evidence
     alternative_count = len(evidence.alternative_ids)
-    experts = extract_expert_profiles(evidence=evidence, context=context)
+    experts = session.experts
 
     if alternative_count == 1:
         return {
@@ -504,7 +529,7 @@ def _evaluator_weight_sensitivity(
             "items": [],
         }
 
-    scales = _criterion_scales(evidence)
+    beta_tensor = session.expert_beta_tensor
     items: list[dict[str, Any]] = []
 
     for target_index, target in enumerate(experts):
@@ -535,38 +560,35 @@ def _evaluator_weight_sensitivity(
             )
             continue
 
-        points: list[dict[str, Any]] = []
-        for varied_weight in _sample_weights(configured_weight):
-            weights = [0.0 for _ in experts]
-            weights[target_index] = varied_weight
-            for index, expert in enumerate(experts):
-                if index == target_index:
-                    continue
-                weights[index] = (
-                    (1.0 - varied_weight)
-                    * expert["configuredWeight"]
-                    / complement_total
-                )
-
-            matrix = [
-                [
-                    sum(
-                        weights[expert_index]
-                        * expert["betaMatrix"][alternative_index][criterion_index]
-                        for expert_index, expert in enumerate(experts)
-                    )
-                    for criterion_index in range(len(evidence.criterion_ids))
-                ]
-                for alternative_index in range(len(evidence.alternative_ids))
-            ]
-            result = _semantic_result(
-                evidence=evidence,
-                matrix=matrix,
-                weights=evidence.criterion_weights,
-                directions=evidence.criterion_directions,
-                scales=scales,
+        varied_weights = _sample_weights(configured_weight, step)
+        expert_weight_matrix = _redistributed_weights(
+            configured_weights=[expert["configuredWeight"] for expert in experts],
+            target_index=target_index,
+            varied_weights=varied_weights,
+            complement_total=complement_total,
+        )
+        # One collective matrix per sample, accumulated expert by expert
+        # to keep the summation order of the executed model.
+        matrices = np.zeros(
+            (len(varied_weights), *beta_tensor.shape[1:]),
+            dtype=np.float64,
+        )
+        for expert_index in range(len(experts)):
+            matrices += (
+                expert_weight_matrix[:, expert_index, None, None]
+                * beta_tensor[expert_index]
             )
-            point = _point(
+        results = _sample_results(
+            evidence=evidence,
+            matrix=matrices,
+            weight_matrix=np.tile(
+                session.criterion_weights,
+                (len(varied_weights), 1),
+            ),
+            scales=session.criterion_scales,
+        )
+        points = [
+            _point(
                 evidence=evidence,
                 baseline=baseline,
                 varied_weight=varied_weight,
@@ -582,7 +604,13 @@ def _evaluator_weight_sensitivity(
                 ],
                 result=result,
             )
-            points.append(point)
+            for varied_weight, weights, result in zip(
+                varied_weights,
+                expert_weight_matrix.tolist(),
+                results,
+                strict=True,
+            )
+        ]
 
         baseline_points = [
             point
@@ -650,16 +678,15 @@ def _evaluator_weight_sensitivity(
     }
 
 
-def build_sensitivity_facts(
-    evidence: TopsisEvidence,
-    context: dict[str, Any],
-) -> dict[str, Any]:
+def build_sensitivity_facts(session: AnalysisSession) -> dict[str, Any]:
+    evidence = session.evidence
     baseline = _baseline_result(evidence)
+    step = sensitivity_step()
     return {
         "method": {
             "kind": "sampled_counterfactual_diagnostic",
             "range": {"minimum": 0.0, "maximum": 1.0},
-            "step": SENSITIVITY_STEP,
+            "step": step,
             "sampling": "fixed_grid_plus_exact_configured_weight",
             "redistribution": (
                 "When one weight is varied, the remaining weight mass is "
@@ -692,12 +719,13 @@ def build_sensitivity_facts(
             ),
         },
         "criterionWeights": _criterion_weight_sensitivity(
-            evidence=evidence,
+            session=session,
             baseline=baseline,
+            step=step,
         ),
         "evaluatorWeights": _evaluator_weight_sensitivity(
-            evidence=evidence,
-            context=context,
+            session=session,
             baseline=baseline,
+            step=step,
         ),
     }
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any, Iterator
+
+import numpy as np
+
+from .evidence import TopsisEvidence, extract_topsis_evidence
+from .experts import extract_expert_profiles
+
+
+def _criterion_scales(evidence: TopsisEvidence) -> list[dict[str, Any]]:
+    return [
+        {
+            "criterionId": evidence.criterion_ids[index],
+            "labelCount": len(evidence.scale_labels[index]),
+            "maximumIndex": len(evidence.scale_labels[index]) - 1,
+            "labels": [dict(label) for label in evidence.scale_labels[index]],
+        }
+        for index in range(len(evidence.criterion_ids))
+    ]
+
+
+def _read_only_array(values: Any) -> np.ndarray:
+    array = np.array(values, dtype=np.float64)
+    array.setflags(write=False)
+    return array
+
+
+@contextmanager
+def _timed(timings: dict[str, float], stage: str) -> Iterator[None]:
+    started = perf_counter()
+    try:
+        yield
+    finally:
+        timings[stage] = timings.get(stage, 0.0) + (perf_counter() - started) * 1000
+
+
+@dataclass(frozen=True)
+class AnalysisSession:
+    """Evidence and evaluator profiles extracted once per issue analysis."""
+
+    context: dict[str, Any]
+    evidence: TopsisEvidence
+    experts: list[dict[str, Any]]
+    criterion_scales: list[dict[str, Any]]
+    collective_beta_matrix: np.ndarray
+    criterion_weights: np.ndarray
+    expert_beta_tensor: np.ndarray
+    expert_weights: np.ndarray
+    timings: dict[str, float] = field(default_factory=dict)
+
+    @classmethod
+    def from_context(cls, context: dict[str, Any]) -> AnalysisSession:
+        timings: dict[str, float] = {}
+        with _timed(timings, "evidence"):
+            evidence = extract_topsis_evidence(context)
+        with _timed(timings, "expertProfiles"):
+            experts = extract_expert_profiles(evidence=evidence, context=context)
+            expert_beta_tensor = _read_only_array(
+                [expert["betaMatrix"] for expert in experts]
+            )
+            expert_weights = _read_only_array(
+                [expert["configuredWeight"] for expert in experts]
+            )
+
+        return cls(
+            context=context,
+            evidence=evidence,
+            experts=experts,
+            criterion_scales=_criterion_scales(evidence),
+            collective_beta_matrix=_read_only_array(evidence.collective_beta_matrix),
+            criterion_weights=_read_only_array(evidence.criterion_weights),
+            expert_beta_tensor=expert_beta_tensor,
+            expert_weights=expert_weights,
+            timings=timings,
+        )
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        with _timed(self.timings, name):
+            yield
+
+    def timing_metadata(self) -> dict[str, Any]:
+        return {
+            "unit": "ms",
+            "stages": {
+                stage: round(elapsed, 3)
+                for stage, elapsed in self.timings.items()
+            },
+            "total": round(sum(self.timings.values()), 3),
+        }
+
+
+__all__ = ["AnalysisSession"]
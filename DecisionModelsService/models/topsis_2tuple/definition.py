@@ -2,9 +2,10 @@
 # Declares this model's DecisionModelsService contract.
 # See IMPLEMENTATION_GUIDE.md.
 
+from registry.lazy_handler import lazy_handler
 from registry.model_definition import ModelDefinition
 from schemas.model_requests import GenericModelExecutionRequest
-from .executor import execute_topsis_2tuple
+from utils.projections import PROJECTION_METHOD_PARAMETER
 from .examples import (
     TOPSIS_2TUPLE_REQUEST_EXAMPLES,
     TOPSIS_2TUPLE_RESPONSE_EXAMPLES,
@@ -15,7 +16,7 @@ MODEL_DEFINITION = ModelDefinition(
     api_model_key="topsis_2tuple",
     api_endpoint_path="/topsis_2tuple",
     request_model=GenericModelExecutionRequest,
-    handler=execute_topsis_2tuple,
+    handler=lazy_handler(".executor:execute_topsis_2tuple", __package__),
     display_name="2-TUPLE TOPSIS",
     small_description="TOPSIS method for multi-expert decision making using the 2-tuple linguistic representation model.",
     extended_description="Ranks alternatives using linguistic 2-tuples, criteria weights, expert weights, and benefit/cost criterion types.",
@@ -35,5 +36,6 @@ MODEL_DEFINITION = ModelDefinition(
     uses_fuzzy_criteria_weights=False,
     uses_criterion_types=True,
     supported_expression_domains=[{'typeKey': 'linguistic2Tuple', 'constraints': {}}],
-    parameters=[],
+    parameters=[PROJECTION_METHOD_PARAMETER],
+    execution_backend="process",
 )
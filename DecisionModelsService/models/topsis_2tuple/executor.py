@@ -3,7 +3,8 @@ from typing import Any
 from fastapi.responses import JSONResponse
 
 from models.shared_alternative_matrix import (
-    extract_id_keyed_alternative_criteria_input,
+    DecisionMatrixValidationError,
+    extract_decision_matrix_tensor,
     normalize_collective_evaluations_by_ids,
 )
 from models.shared_expression_domains import (
@@ -17,6 +18,7 @@ from services.model_executors.responses import (
     error_response,
     success_response,
 )
+from utils.projections import projection_method_error, resolve_projection_method
 from .run import run_topsis_2tuple
 
 
@@ -221,7 +223,7 @@ def _weights(
 def _input(
     payload: GenericModelExecutionRequest,
 ) -> dict[str, Any]:
-    extracted = extract_id_keyed_alternative_criteria_input(
+    extracted = extract_decision_matrix_tensor(
         payload=payload,
         expert_key_fn=_expert_key,
         evaluation_value_fn=_evaluation_value,
@@ -229,11 +231,9 @@ def _input(
     )
 
     criterion_items = extracted["criterion_items"]
-    matrices = extracted["matrices"]
 
     return {
         **extracted,
-        "expert_keys": list(matrices.keys()),
         "expert_labels": [
             _expert_label(evaluation.get("expert") or {}, index)
             for index, evaluation in enumerate(payload.evaluations or [])
@@ -387,10 +387,14 @@ def execute_topsis_2tuple(
     request: GenericModelExecutionRequest,
 ) -> dict[str, Any] | JSONResponse:
     try:
+        projection_error = projection_method_error(request)
+        if projection_error is not None:
+            return error_response(projection_error)
+
         execution_input = _input(request)
 
         results = run_topsis_2tuple(
-            matrices=execution_input["matrices"],
+            matrices=execution_input["tensor"],
             expert_weights=execution_input[
                 "expert_weights"
             ],
@@ -401,6 +405,7 @@ def execute_topsis_2tuple(
             criterion_scales=execution_input[
                 "criterion_scales"
             ],
+            projection_method=resolve_projection_method(request),
         )
 
         return success_response(
@@ -411,6 +416,13 @@ def execute_topsis_2tuple(
             ),
         )
 
+    except DecisionMatrixValidationError as error:
+        return error_response(
+            str(error),
+            code="VALIDATION_ERROR",
+            details={"errors": error.errors},
+        )
+
     except ValueError as error:
         return error_response(
             str(error),
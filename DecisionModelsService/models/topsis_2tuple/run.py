@@ -141,9 +141,13 @@ Implementation conventions
 import math
 from typing import Any
 
+import numpy as np
+
+from models.shared_alternative_matrix import expert_matrix_tensor
 from utils.get_plots_graphics_from_matrices import (
     get_plots_graphics_from_matrices,
 )
+from utils.projections import DEFAULT_PROJECTION_METHOD
 
 
 FLOAT_TOLERANCE = 1e-12
@@ -379,95 +383,251 @@ def _criterion_scale_labels(
     return labels
 
 
-def aggregate_expert_matrices(
+def _scale_maximum_indexes(
+    scale_labels: list[list[dict[str, Any]]],
+) -> np.ndarray:
+    return np.array(
+        [len(labels) - 1 for labels in scale_labels],
+        dtype=np.float64,
+    )
+
+
+def _cell_path(position: tuple[int, ...]) -> str:
+    return "".join(f"[{int(index)}]" for index in position)
+
+
+def _finite_array(
+    values: Any,
     *,
-    matrices: dict[str, list[list[float]]],
-    expert_weights: list[float],
-    criterion_scales: list[dict[str, Any]],
-) -> dict[str, Any]:
+    field: str,
+    shape: tuple[int, ...],
+    path_fn: Any = None,
+) -> np.ndarray:
     """
-    Aggregate expert 2-tuple evaluations through their numeric beta
-    representations.
+    Convert a rectangular nested list (or array) of betas into float64.
 
-    For each alternative i and criterion j:
+    Cell types are checked in a single flat pass and finiteness with one
+    vectorised test. The caller is responsible for the structural checks
+    (row counts and lengths) that give the historical error messages.
+    """
 
-        beta_ij = sum_k lambda_k * beta_ij^k
+    path_fn = path_fn or (lambda position: f"{field}{_cell_path(position)}")
 
-    where:
+    if isinstance(values, np.ndarray):
+        array = np.asarray(values, dtype=np.float64).reshape(shape)
+    else:
+        flat = values
+        for _ in range(len(shape) - 1):
+            flat = [item for row in flat for item in row]
 
-        lambda_k >= 0
-        sum_k lambda_k = 1
+        invalid_types = [
+            isinstance(item, bool) or not isinstance(item, (int, float))
+            for item in flat
+        ]
+        if any(invalid_types):
+            position = np.unravel_index(invalid_types.index(True), shape)
+            raise ValueError(f"{path_fn(position)} must be a finite number")
 
-    The resulting collective beta is converted back to a linguistic
-    2-tuple with Delta.
-    """
+        array = np.fromiter(flat, dtype=np.float64, count=len(flat)).reshape(shape)
 
-    if not isinstance(matrices, dict) or len(matrices) == 0:
+    non_finite = ~np.isfinite(array)
+    if non_finite.any():
+        position = np.unravel_index(int(np.argmax(non_finite)), shape)
+        raise ValueError(f"{path_fn(position)} must be a finite number")
+
+    return array
+
+
+def _clip_to_scale(
+    betas: np.ndarray,
+    maximum_indexes: np.ndarray,
+    path_fn: Any,
+) -> np.ndarray:
+    """Reject betas outside [0, g] beyond FLOAT_TOLERANCE and clamp drift."""
+
+    outside = (betas < -FLOAT_TOLERANCE) | (
+        betas > maximum_indexes + FLOAT_TOLERANCE
+    )
+    if outside.any():
+        position = np.unravel_index(int(np.argmax(outside)), betas.shape)
         raise ValueError(
-            "matrices must contain at least one expert matrix"
+            f"{path_fn(position)} is outside the linguistic scale"
         )
 
-    expert_items = list(matrices.items())
+    return np.minimum(np.maximum(betas, 0.0), maximum_indexes)
 
-    weights = _normalized_expert_weights(
-        expert_weights,
-        len(expert_items),
+
+def delta_arrays(
+    betas: Any,
+    maximum_indexes: Any,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorised Delta over an array of betas.
+
+    ``maximum_indexes`` broadcasts against ``betas`` (typically one value
+    per criterion). Returns the label indexes and the symbolic translations
+    with the same rounding and tolerance rules as ``delta``.
+    """
+
+    betas_np = np.asarray(betas, dtype=np.float64)
+    maximum_np = np.broadcast_to(
+        np.asarray(maximum_indexes, dtype=np.float64),
+        betas_np.shape,
     )
 
-    first_expert_key, first_matrix = expert_items[0]
+    if not np.isfinite(betas_np).all():
+        raise ValueError("beta must be a finite number")
 
-    if not isinstance(first_matrix, list) or len(first_matrix) == 0:
+    if (
+        (betas_np < -FLOAT_TOLERANCE)
+        | (betas_np > maximum_np + FLOAT_TOLERANCE)
+    ).any():
         raise ValueError(
-            f"matrices['{first_expert_key}'] must be a non-empty matrix"
+            "beta must be inside the linguistic scale"
         )
 
-    if not isinstance(first_matrix[0], list) or len(first_matrix[0]) == 0:
+    normalized = np.minimum(np.maximum(betas_np, 0.0), maximum_np)
+
+    # Same rule as ``delta``: half positions belong to the upper label.
+    label_indexes = np.minimum(
+        np.maximum(np.floor(normalized + 0.5), 0.0),
+        maximum_np,
+    )
+    alphas = normalized - label_indexes
+    alphas = np.where(np.abs(alphas) <= FLOAT_TOLERANCE, 0.0, alphas)
+    alphas = np.where(np.abs(alphas + 0.5) <= FLOAT_TOLERANCE, -0.5, alphas)
+
+    if ((alphas < -0.5) | (alphas >= 0.5)).any():
         raise ValueError(
-            f"matrices['{first_expert_key}'][0] must be a non-empty row"
+            "Delta produced an invalid symbolic translation"
         )
 
-    alternative_count = len(first_matrix)
-    criterion_count = len(first_matrix[0])
+    return label_indexes.astype(np.int64), alphas
 
-    if not isinstance(criterion_scales, list):
-        raise ValueError("criterion_scales must be a list")
 
-    if len(criterion_scales) != criterion_count:
+def _label_key(
+    labels: list[dict[str, Any]],
+    label_index: int,
+) -> str:
+    label_definition = labels[label_index]
+
+    if not isinstance(label_definition, dict):
         raise ValueError(
-            "criterion_scales length must match "
-            "the number of criteria"
+            f"labels[{label_index}] must be an object"
         )
 
-    scale_labels = [
-        _criterion_scale_labels(scale, index)
-        for index, scale in enumerate(criterion_scales)
+    label_key = str(
+        label_definition.get("key") or ""
+    ).strip()
+
+    if not label_key:
+        raise ValueError(
+            f"labels[{label_index}].key is required"
+        )
+
+    return label_key
+
+
+def delta_matrix(
+    *,
+    betas: Any,
+    scale_labels: list[list[dict[str, Any]]],
+) -> list[Any]:
+    """
+    Translate a vector or matrix of betas (criteria on the last axis) back
+    to linguistic 2-tuples with one vectorised Delta.
+    """
+
+    betas_np = np.asarray(betas, dtype=np.float64)
+    label_indexes, alphas = delta_arrays(
+        betas_np,
+        _scale_maximum_indexes(scale_labels),
+    )
+
+    key_tables: list[dict[int, str]] = [{} for _ in scale_labels]
+
+    def translate(
+        label_row: list[int],
+        alpha_row: list[float],
+    ) -> list[dict[str, Any]]:
+        tuples: list[dict[str, Any]] = []
+
+        for criterion_index, (label_index, alpha) in enumerate(
+            zip(label_row, alpha_row)
+        ):
+            table = key_tables[criterion_index]
+            label_key = table.get(label_index)
+            if label_key is None:
+                label_key = _label_key(
+                    scale_labels[criterion_index],
+                    label_index,
+                )
+                table[label_index] = label_key
+
+            tuples.append(
+                {
+                    "labelKey": label_key,
+                    "alpha": float(alpha),
+                }
+            )
+
+        return tuples
+
+    if betas_np.ndim == 1:
+        return translate(label_indexes.tolist(), alphas.tolist())
+
+    return [
+        translate(label_row, alpha_row)
+        for label_row, alpha_row in zip(
+            label_indexes.tolist(),
+            alphas.tolist(),
+        )
     ]
 
-    granularities = {
-        len(labels)
-        for labels in scale_labels
-    }
 
-    if len(granularities) != 1:
+def _expert_beta_tensor(
+    matrices: Any,
+) -> tuple[np.ndarray, list[str]]:
+    if isinstance(matrices, np.ndarray):
+        if matrices.ndim != 3 or 0 in matrices.shape:
+            raise ValueError(
+                "matrices must contain at least one non-empty expert matrix"
+            )
+
+        expert_keys = [str(index) for index in range(matrices.shape[0])]
+        tensor = _finite_array(
+            matrices,
+            field="matrices",
+            shape=matrices.shape,
+            path_fn=lambda position: (
+                f"matrices['{expert_keys[position[0]]}']"
+                f"{_cell_path(position[1:])}"
+            ),
+        )
+        return tensor, expert_keys
+
+    if not isinstance(matrices, dict) or len(matrices) == 0:
         raise ValueError(
-            "All linguistic2Tuple criteria must use "
-            "the same number of linguistic labels"
+            "matrices must contain at least one expert matrix"
         )
 
-    # Step 1 — Expert aggregation.
-    #
-    # For every alternative i and criterion j:
-    #
-    #     beta_ij = sum_k lambda_k * beta_ij^k
-    #
-    # The accumulation below constructs the collective beta matrix directly
-    # from the expert beta matrices and their normalized weights.
-    collective_beta_matrix = [
-        [0.0 for _ in range(criterion_count)]
-        for _ in range(alternative_count)
-    ]
+    expert_items = list(matrices.items())
+    first_expert_key, first_matrix = expert_items[0]
+
+    if not isinstance(first_matrix, list) or len(first_matrix) == 0:
+        raise ValueError(
+            f"matrices['{first_expert_key}'] must be a non-empty matrix"
+        )
 
-    for expert_index, (expert_key, matrix) in enumerate(expert_items):
+    if not isinstance(first_matrix[0], list) or len(first_matrix[0]) == 0:
+        raise ValueError(
+            f"matrices['{first_expert_key}'][0] must be a non-empty row"
+        )
+
+    alternative_count = len(first_matrix)
+    criterion_count = len(first_matrix[0])
+
+    for expert_key, matrix in expert_items:
         if not isinstance(matrix, list):
             raise ValueError(
                 f"matrices['{expert_key}'] must be a matrix"
@@ -492,90 +652,143 @@ def aggregate_expert_matrices(
                     "the same number of criteria"
                 )
 
-            for criterion_index, raw_beta in enumerate(row):
-                beta = _finite_number(
-                    raw_beta,
-                    (
-                        f"matrices['{expert_key}']"
-                        f"[{alternative_index}]"
-                        f"[{criterion_index}]"
-                    ),
-                )
-
-                maximum_index = (
-                    len(scale_labels[criterion_index]) - 1
-                )
+    expert_keys = [str(key) for key, _ in expert_items]
+    tensor = _finite_array(
+        [matrix for _, matrix in expert_items],
+        field="matrices",
+        shape=(len(expert_items), alternative_count, criterion_count),
+        path_fn=lambda position: (
+            f"matrices['{expert_keys[position[0]]}']"
+            f"{_cell_path(position[1:])}"
+        ),
+    )
+    return tensor, expert_keys
 
-                if (
-                    beta < -FLOAT_TOLERANCE
-                    or beta > maximum_index + FLOAT_TOLERANCE
-                ):
-                    raise ValueError(
-                        f"matrices['{expert_key}']"
-                        f"[{alternative_index}]"
-                        f"[{criterion_index}] is outside "
-                        "the linguistic scale"
-                    )
-
-                if beta < 0:
-                    beta = 0.0
-                elif beta > maximum_index:
-                    beta = float(maximum_index)
-
-                collective_beta_matrix[
-                    alternative_index
-                ][criterion_index] += (
-                    weights[expert_index] * beta
-                )
 
-    # Convert the aggregated beta values back to 2-tuples so the result
-    # keeps the linguistic representation in addition to the numeric matrix.
-    collective_matrix: list[list[dict[str, Any]]] = []
-
-    for alternative_index in range(alternative_count):
-        collective_row: list[dict[str, Any]] = []
-
-        for criterion_index in range(criterion_count):
-            collective_row.append(
-                delta(
-                    beta=collective_beta_matrix[
-                        alternative_index
-                    ][criterion_index],
-                    labels=scale_labels[criterion_index],
-                )
-            )
+def _scale_labels(
+    criterion_scales: Any,
+    criterion_count: int,
+) -> list[list[dict[str, Any]]]:
+    if not isinstance(criterion_scales, list):
+        raise ValueError("criterion_scales must be a list")
 
-        collective_matrix.append(collective_row)
+    if len(criterion_scales) != criterion_count:
+        raise ValueError(
+            "criterion_scales length must match "
+            "the number of criteria"
+        )
 
-    return {
-        "collective_beta_matrix": collective_beta_matrix,
-        "collective_matrix": collective_matrix,
-    }
+    return [
+        _criterion_scale_labels(scale, index)
+        for index, scale in enumerate(criterion_scales)
+    ]
 
 
-def calculate_ideal_solutions(
+def aggregate_expert_matrices(
     *,
-    collective_beta_matrix: list[list[float]],
-    criterion_directions: list[str],
+    matrices: np.ndarray | dict[str, list[list[float]]],
+    expert_weights: list[float],
     criterion_scales: list[dict[str, Any]],
 ) -> dict[str, Any]:
     """
-    Calculate the positive and negative ideal linguistic solutions.
+    Aggregate expert 2-tuple evaluations through their numeric beta
+    representations.
 
-    For benefit/max criteria:
+    For each alternative i and criterion j:
 
-        positive ideal = max beta
-        negative ideal = min beta
+        beta_ij = sum_k lambda_k * beta_ij^k
 
-    For cost/min criteria:
+    where:
 
-        positive ideal = min beta
-        negative ideal = max beta
+        lambda_k >= 0
+        sum_k lambda_k = 1
 
-    The numeric beta ideals are also converted back to linguistic
-    2-tuples through Delta.
+    ``matrices`` is either the ``(experts, alternatives, criteria)`` beta
+    tensor or the historical ``{expert: matrix}`` mapping. The resulting
+    collective beta is converted back to a linguistic 2-tuple with Delta.
     """
 
+    if isinstance(matrices, np.ndarray):
+        expert_count = matrices.shape[0] if matrices.ndim > 0 else 0
+    elif isinstance(matrices, dict):
+        expert_count = len(matrices)
+    else:
+        expert_count = 0
+
+    if expert_count == 0:
+        raise ValueError(
+            "matrices must contain at least one expert matrix"
+        )
+
+    weights = _normalized_expert_weights(
+        expert_weights,
+        expert_count,
+    )
+
+    tensor, expert_keys = _expert_beta_tensor(matrices)
+    criterion_count = tensor.shape[2]
+
+    scale_labels = _scale_labels(criterion_scales, criterion_count)
+
+    granularities = {
+        len(labels)
+        for labels in scale_labels
+    }
+
+    if len(granularities) != 1:
+        raise ValueError(
+            "All linguistic2Tuple criteria must use "
+            "the same number of linguistic labels"
+        )
+
+    tensor = _clip_to_scale(
+        tensor,
+        _scale_maximum_indexes(scale_labels),
+        lambda position: (
+            f"matrices['{expert_keys[position[0]]}']"
+            f"{_cell_path(position[1:])}"
+        ),
+    )
+
+    # Step 1 — Expert aggregation.
+    #
+    # For every alternative i and criterion j:
+    #
+    #     beta_ij = sum_k lambda_k * beta_ij^k
+    #
+    # Experts are accumulated in order so the collective matrix is
+    # bit-identical to the historical cell-by-cell accumulation.
+    collective_beta = np.zeros(tensor.shape[1:], dtype=np.float64)
+
+    for expert_index, weight in enumerate(weights):
+        collective_beta += weight * tensor[expert_index]
+
+    # Convert the aggregated beta values back to 2-tuples so the result
+    # keeps the linguistic representation in addition to the numeric matrix.
+    return {
+        "collective_beta_matrix": collective_beta.tolist(),
+        "collective_matrix": delta_matrix(
+            betas=collective_beta,
+            scale_labels=scale_labels,
+        ),
+    }
+
+
+def _collective_beta_array(
+    collective_beta_matrix: Any,
+) -> np.ndarray:
+    if isinstance(collective_beta_matrix, np.ndarray):
+        if collective_beta_matrix.ndim != 2 or 0 in collective_beta_matrix.shape:
+            raise ValueError(
+                "collective_beta_matrix must be a non-empty matrix"
+            )
+
+        return _finite_array(
+            collective_beta_matrix,
+            field="collective_beta_matrix",
+            shape=collective_beta_matrix.shape,
+        )
+
     if (
         not isinstance(collective_beta_matrix, list)
         or len(collective_beta_matrix) == 0
@@ -593,6 +806,32 @@ def calculate_ideal_solutions(
 
     criterion_count = len(first_row)
 
+    for alternative_index, row in enumerate(collective_beta_matrix):
+        if not isinstance(row, list):
+            raise ValueError(
+                f"collective_beta_matrix[{alternative_index}] "
+                "must be a row"
+            )
+
+        if len(row) != criterion_count:
+            raise ValueError(
+                "All collective matrix rows must contain "
+                "the same number of criteria"
+            )
+
+    return _finite_array(
+        collective_beta_matrix,
+        field="collective_beta_matrix",
+        shape=(len(collective_beta_matrix), criterion_count),
+    )
+
+
+def _direction_mask(
+    criterion_directions: Any,
+    criterion_count: int,
+) -> np.ndarray:
+    """True for benefit/max criteria, False for cost/min criteria."""
+
     if not isinstance(criterion_directions, list):
         raise ValueError(
             "criterion_directions must be a list"
@@ -604,135 +843,165 @@ def calculate_ideal_solutions(
             "the number of criteria"
         )
 
-    if not isinstance(criterion_scales, list):
-        raise ValueError(
-            "criterion_scales must be a list"
-        )
+    is_benefit: list[bool] = []
 
-    if len(criterion_scales) != criterion_count:
-        raise ValueError(
-            "criterion_scales length must match "
-            "the number of criteria"
-        )
-
-    columns: list[list[float]] = [
-        []
-        for _ in range(criterion_count)
-    ]
+    for direction in criterion_directions:
+        normalized_direction = str(
+            direction or ""
+        ).strip().lower()
 
-    for alternative_index, row in enumerate(
-        collective_beta_matrix
-    ):
-        if not isinstance(row, list):
+        if normalized_direction not in {"max", "min"}:
             raise ValueError(
-                f"collective_beta_matrix[{alternative_index}] "
-                "must be a row"
+                f"Unsupported criterion direction: {direction}"
             )
 
-        if len(row) != criterion_count:
-            raise ValueError(
-                "All collective matrix rows must contain "
-                "the same number of criteria"
-            )
+        is_benefit.append(normalized_direction == "max")
 
-        for criterion_index, raw_beta in enumerate(row):
-            beta = _finite_number(
-                raw_beta,
-                (
-                    f"collective_beta_matrix"
-                    f"[{alternative_index}]"
-                    f"[{criterion_index}]"
-                ),
-            )
+    return np.array(is_benefit, dtype=bool)
 
-            labels = _criterion_scale_labels(
-                criterion_scales[criterion_index],
-                criterion_index,
-            )
 
-            maximum_index = len(labels) - 1
+def _ideal_arrays(
+    collective_beta: np.ndarray,
+    is_benefit: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    # Step 2 — Ideal solutions.
+    #
+    # Benefit/max criterion:  beta+ = max, beta- = min
+    # Cost/min criterion:     beta+ = min, beta- = max
+    #
+    # The alternatives axis is always the second to last one, so a stack
+    # of collective matrices (samples, alternatives, criteria) yields one
+    # ideal vector per sample.
+    column_max = collective_beta.max(axis=-2)
+    column_min = collective_beta.min(axis=-2)
+
+    return (
+        np.where(is_benefit, column_max, column_min),
+        np.where(is_benefit, column_min, column_max),
+    )
 
-            if (
-                beta < -FLOAT_TOLERANCE
-                or beta > maximum_index + FLOAT_TOLERANCE
-            ):
-                raise ValueError(
-                    f"collective_beta_matrix"
-                    f"[{alternative_index}]"
-                    f"[{criterion_index}] is outside "
-                    "the linguistic scale"
-                )
 
-            if beta < 0:
-                beta = 0.0
-            elif beta > maximum_index:
-                beta = float(maximum_index)
+def _distance_arrays(
+    collective_beta: np.ndarray,
+    positive_ideal_beta: np.ndarray,
+    negative_ideal_beta: np.ndarray,
+    weights: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    # Step 3 — Weighted L1 distances for every alternative i:
+    #
+    #     D_i+ = sum_j w_j * |beta_ij - beta_j+|
+    #     D_i- = sum_j w_j * |beta_ij - beta_j-|
+    #
+    # Criteria are accumulated in order (vectorised over alternatives and,
+    # for weight samples, over samples) to keep the historical
+    # floating-point summation order. ``weights`` and the ideals may carry
+    # a leading samples axis; the result then has shape
+    # (samples, alternatives).
+    shape = np.broadcast_shapes(
+        collective_beta.shape[:-1],
+        weights.shape[:-1] + (1,),
+        positive_ideal_beta.shape[:-1] + (1,),
+    )
+    positive_distances = np.zeros(shape, dtype=np.float64)
+    negative_distances = np.zeros(shape, dtype=np.float64)
+
+    for criterion_index in range(collective_beta.shape[-1]):
+        column = collective_beta[..., criterion_index]
+        weight = weights[..., criterion_index, None]
+        positive_distances += weight * np.abs(
+            column - positive_ideal_beta[..., criterion_index, None]
+        )
+        negative_distances += weight * np.abs(
+            column - negative_ideal_beta[..., criterion_index, None]
+        )
 
-            columns[criterion_index].append(beta)
+    return positive_distances, negative_distances
 
-    positive_ideal_beta: list[float] = []
-    negative_ideal_beta: list[float] = []
 
-    # Step 2 — Ideal solutions.
+def _closeness_array(
+    positive_distances: np.ndarray,
+    negative_distances: np.ndarray,
+) -> np.ndarray:
+    # Step 4 — TOPSIS relative closeness:
     #
-    # Benefit/max criterion:  beta+ = max, beta- = min
-    # Cost/min criterion:     beta+ = min, beta- = max
-    for criterion_index, direction in enumerate(
-        criterion_directions
-    ):
-        normalized_direction = str(
-            direction or ""
-        ).strip().lower()
+    #     C_i = D_i- / (D_i+ + D_i-)
+    #
+    # with the neutral value 0.5 when both distances vanish.
+    denominators = positive_distances + negative_distances
+    degenerate = denominators <= FLOAT_TOLERANCE
+    coefficients = np.divide(
+        negative_distances,
+        denominators,
+        out=np.full_like(denominators, 0.5),
+        where=~degenerate,
+    )
 
-        criterion_values = columns[criterion_index]
+    return np.minimum(np.maximum(coefficients, 0.0), 1.0)
 
-        if normalized_direction == "max":
-            positive_beta = max(criterion_values)
-            negative_beta = min(criterion_values)
 
-        elif normalized_direction == "min":
-            positive_beta = min(criterion_values)
-            negative_beta = max(criterion_values)
+def _ranking_array(
+    closeness: np.ndarray,
+) -> np.ndarray:
+    # Step 5 — Final TOPSIS order: decreasing closeness coefficient.
+    # A stable sort keeps the original alternative order on exact ties.
+    return np.argsort(-closeness, axis=-1, kind="stable")
 
-        else:
-            raise ValueError(
-                f"Unsupported criterion direction: {direction}"
-            )
 
-        positive_ideal_beta.append(
-            float(positive_beta)
-        )
-        negative_ideal_beta.append(
-            float(negative_beta)
-        )
+def _ranking_from_closeness(
+    closeness: np.ndarray,
+) -> list[int]:
+    return _ranking_array(closeness).tolist()
 
-    positive_ideal = [
-        delta(
-            beta=positive_ideal_beta[index],
-            labels=_criterion_scale_labels(
-                criterion_scales[index],
-                index,
-            ),
-        )
-        for index in range(criterion_count)
-    ]
 
-    negative_ideal = [
-        delta(
-            beta=negative_ideal_beta[index],
-            labels=_criterion_scale_labels(
-                criterion_scales[index],
-                index,
-            ),
-        )
-        for index in range(criterion_count)
-    ]
+def calculate_ideal_solutions(
+    *,
+    collective_beta_matrix: np.ndarray | list[list[float]],
+    criterion_directions: list[str],
+    criterion_scales: list[dict[str, Any]],
+) -> dict[str, Any]:
+    """
+    Calculate the positive and negative ideal linguistic solutions.
+
+    For benefit/max criteria:
+
+        positive ideal = max beta
+        negative ideal = min beta
+
+    For cost/min criteria:
+
+        positive ideal = min beta
+        negative ideal = max beta
+
+    The numeric beta ideals are also converted back to linguistic
+    2-tuples through Delta.
+    """
+
+    collective_beta = _collective_beta_array(collective_beta_matrix)
+    criterion_count = collective_beta.shape[1]
+    is_benefit = _direction_mask(criterion_directions, criterion_count)
+    scale_labels = _scale_labels(criterion_scales, criterion_count)
+
+    collective_beta = _clip_to_scale(
+        collective_beta,
+        _scale_maximum_indexes(scale_labels),
+        lambda position: f"collective_beta_matrix{_cell_path(position)}",
+    )
+    positive_ideal_beta, negative_ideal_beta = _ideal_arrays(
+        collective_beta,
+        is_benefit,
+    )
 
     return {
-        "positive_ideal_beta": positive_ideal_beta,
-        "negative_ideal_beta": negative_ideal_beta,
-        "positive_ideal": positive_ideal,
-        "negative_ideal": negative_ideal,
+        "positive_ideal_beta": positive_ideal_beta.tolist(),
+        "negative_ideal_beta": negative_ideal_beta.tolist(),
+        "positive_ideal": delta_matrix(
+            betas=positive_ideal_beta,
+            scale_labels=scale_labels,
+        ),
+        "negative_ideal": delta_matrix(
+            betas=negative_ideal_beta,
+            scale_labels=scale_labels,
+        ),
     }
 
 
@@ -782,9 +1051,36 @@ def _normalized_criterion_weights(
     ]
 
 
+def _ideal_vector(
+    values: Any,
+    *,
+    field: str,
+    criterion_count: int,
+) -> np.ndarray:
+    if isinstance(values, np.ndarray):
+        values = values.tolist()
+
+    if not isinstance(values, list):
+        raise ValueError(
+            f"{field} must be a list"
+        )
+
+    if len(values) != criterion_count:
+        raise ValueError(
+            f"{field} length must match "
+            "the number of criteria"
+        )
+
+    return _finite_array(
+        values,
+        field=field,
+        shape=(criterion_count,),
+    )
+
+
 def calculate_weighted_distances(
     *,
-    collective_beta_matrix: list[list[float]],
+    collective_beta_matrix: np.ndarray | list[list[float]],
     positive_ideal_beta: list[float],
     negative_ideal_beta: list[float],
     weights: list[float],
@@ -803,130 +1099,35 @@ def calculate_weighted_distances(
     method, not Euclidean distance.
     """
 
-    if (
-        not isinstance(collective_beta_matrix, list)
-        or len(collective_beta_matrix) == 0
-    ):
-        raise ValueError(
-            "collective_beta_matrix must be a non-empty matrix"
-        )
-
-    first_row = collective_beta_matrix[0]
-
-    if not isinstance(first_row, list) or len(first_row) == 0:
-        raise ValueError(
-            "collective_beta_matrix[0] must be a non-empty row"
-        )
+    collective_beta = _collective_beta_array(collective_beta_matrix)
+    criterion_count = collective_beta.shape[1]
 
-    criterion_count = len(first_row)
-
-    if not isinstance(positive_ideal_beta, list):
-        raise ValueError(
-            "positive_ideal_beta must be a list"
-        )
-
-    if len(positive_ideal_beta) != criterion_count:
-        raise ValueError(
-            "positive_ideal_beta length must match "
-            "the number of criteria"
-        )
-
-    if not isinstance(negative_ideal_beta, list):
-        raise ValueError(
-            "negative_ideal_beta must be a list"
-        )
-
-    if len(negative_ideal_beta) != criterion_count:
-        raise ValueError(
-            "negative_ideal_beta length must match "
-            "the number of criteria"
-        )
+    positive_ideal = _ideal_vector(
+        positive_ideal_beta,
+        field="positive_ideal_beta",
+        criterion_count=criterion_count,
+    )
+    negative_ideal = _ideal_vector(
+        negative_ideal_beta,
+        field="negative_ideal_beta",
+        criterion_count=criterion_count,
+    )
 
     normalized_weights = _normalized_criterion_weights(
         weights,
         criterion_count,
     )
 
-    positive_ideal = [
-        _finite_number(
-            value,
-            f"positive_ideal_beta[{index}]",
-        )
-        for index, value in enumerate(positive_ideal_beta)
-    ]
-
-    negative_ideal = [
-        _finite_number(
-            value,
-            f"negative_ideal_beta[{index}]",
-        )
-        for index, value in enumerate(negative_ideal_beta)
-    ]
-
-    positive_distances: list[float] = []
-    negative_distances: list[float] = []
-
-    for alternative_index, row in enumerate(
-        collective_beta_matrix
-    ):
-        if not isinstance(row, list):
-            raise ValueError(
-                f"collective_beta_matrix[{alternative_index}] "
-                "must be a row"
-            )
-
-        if len(row) != criterion_count:
-            raise ValueError(
-                "All collective matrix rows must contain "
-                "the same number of criteria"
-            )
-
-        positive_distance = 0.0
-        negative_distance = 0.0
-
-        # Step 3 — Weighted L1 distances for alternative i:
-        #
-        #     D_i+ = sum_j w_j * |beta_ij - beta_j+|
-        #     D_i- = sum_j w_j * |beta_ij - beta_j-|
-        for criterion_index, raw_beta in enumerate(row):
-            beta = _finite_number(
-                raw_beta,
-                (
-                    f"collective_beta_matrix"
-                    f"[{alternative_index}]"
-                    f"[{criterion_index}]"
-                ),
-            )
-
-            weight = normalized_weights[criterion_index]
-
-            positive_distance += (
-                weight
-                * abs(
-                    beta
-                    - positive_ideal[criterion_index]
-                )
-            )
-
-            negative_distance += (
-                weight
-                * abs(
-                    beta
-                    - negative_ideal[criterion_index]
-                )
-            )
-
-        positive_distances.append(
-            float(positive_distance)
-        )
-
-        negative_distances.append(
-            float(negative_distance)
-        )
+    positive_distances, negative_distances = _distance_arrays(
+        collective_beta,
+        positive_ideal,
+        negative_ideal,
+        np.array(normalized_weights, dtype=np.float64),
+    )
 
     return {
-        "positive_distances": positive_distances,
-        "negative_distances": negative_distances,
+        "positive_distances": positive_distances.tolist(),
+        "negative_distances": negative_distances.tolist(),
     }
 
 
@@ -970,68 +1171,30 @@ def calculate_closeness_coefficients(
             "must contain the same number of alternatives"
         )
 
-    coefficients: list[float] = []
+    alternative_count = len(positive_distances)
+    positive = _finite_array(
+        positive_distances,
+        field="positive_distances",
+        shape=(alternative_count,),
+    )
+    negative = _finite_array(
+        negative_distances,
+        field="negative_distances",
+        shape=(alternative_count,),
+    )
 
-    for index, (
-        raw_positive_distance,
-        raw_negative_distance,
-    ) in enumerate(
-        zip(
-            positive_distances,
-            negative_distances,
-            strict=True,
-        )
+    for field, values in (
+        ("positive_distances", positive),
+        ("negative_distances", negative),
     ):
-        positive_distance = _finite_number(
-            raw_positive_distance,
-            f"positive_distances[{index}]",
-        )
-
-        negative_distance = _finite_number(
-            raw_negative_distance,
-            f"negative_distances[{index}]",
-        )
-
-        if positive_distance < 0:
+        negative_entries = values < 0
+        if negative_entries.any():
             raise ValueError(
-                f"positive_distances[{index}] "
+                f"{field}[{int(np.argmax(negative_entries))}] "
                 "must be greater than or equal to 0"
             )
 
-        if negative_distance < 0:
-            raise ValueError(
-                f"negative_distances[{index}] "
-                "must be greater than or equal to 0"
-            )
-
-        # Step 4 — TOPSIS relative closeness:
-        #
-        #     C_i = D_i- / (D_i+ + D_i-)
-        #
-        # Higher values are preferred.
-        denominator = (
-            positive_distance
-            + negative_distance
-        )
-
-        if denominator <= FLOAT_TOLERANCE:
-            coefficient = 0.5
-        else:
-            coefficient = (
-                negative_distance
-                / denominator
-            )
-
-        if coefficient < 0:
-            coefficient = 0.0
-        elif coefficient > 1:
-            coefficient = 1.0
-
-        coefficients.append(
-            float(coefficient)
-        )
-
-    return coefficients
+    return _closeness_array(positive, negative).tolist()
 
 
 def rank_closeness_coefficients(
@@ -1051,51 +1214,237 @@ def rank_closeness_coefficients(
             "closeness_coefficients must be a non-empty list"
         )
 
-    normalized: list[float] = []
+    scores = _finite_array(
+        closeness_coefficients,
+        field="closeness_coefficients",
+        shape=(len(closeness_coefficients),),
+    )
+
+    outside = (scores < -FLOAT_TOLERANCE) | (
+        scores > 1.0 + FLOAT_TOLERANCE
+    )
+    if outside.any():
+        raise ValueError(
+            f"closeness_coefficients[{int(np.argmax(outside))}] "
+            "must be between 0 and 1"
+        )
+
+    return _ranking_from_closeness(
+        np.minimum(np.maximum(scores, 0.0), 1.0)
+    )
+
+
+def evaluate_collective_beta_matrix(
+    *,
+    collective_beta_matrix: np.ndarray | list[list[float]],
+    weights: list[float],
+    criterion_directions: list[str],
+    criterion_scales: list[dict[str, Any]],
+) -> dict[str, Any]:
+    """
+    Run steps 2-5 of 2-tuple TOPSIS on a collective beta matrix.
+
+    This is the single kernel shared by ``run_topsis_2tuple`` and the
+    analysis package (robustness scenarios, personal expert rankings). The
+    matrix, ideals and distances stay as arrays between steps and inputs
+    are validated once instead of at every stage.
+    """
+
+    collective_beta = _collective_beta_array(collective_beta_matrix)
+    criterion_count = collective_beta.shape[1]
+    is_benefit = _direction_mask(criterion_directions, criterion_count)
+    scale_labels = _scale_labels(criterion_scales, criterion_count)
+    normalized_weights = np.array(
+        _normalized_criterion_weights(weights, criterion_count),
+        dtype=np.float64,
+    )
+
+    collective_beta = _clip_to_scale(
+        collective_beta,
+        _scale_maximum_indexes(scale_labels),
+        lambda position: f"collective_beta_matrix{_cell_path(position)}",
+    )
+    positive_ideal_beta, negative_ideal_beta = _ideal_arrays(
+        collective_beta,
+        is_benefit,
+    )
+    positive_distances, negative_distances = _distance_arrays(
+        collective_beta,
+        positive_ideal_beta,
+        negative_ideal_beta,
+        normalized_weights,
+    )
+    closeness = _closeness_array(
+        positive_distances,
+        negative_distances,
+    )
+
+    return {
+        "positive_ideal_beta": positive_ideal_beta.tolist(),
+        "negative_ideal_beta": negative_ideal_beta.tolist(),
+        "positive_ideal": delta_matrix(
+            betas=positive_ideal_beta,
+            scale_labels=scale_labels,
+        ),
+        "negative_ideal": delta_matrix(
+            betas=negative_ideal_beta,
+            scale_labels=scale_labels,
+        ),
+        "positive_distances": positive_distances.tolist(),
+        "negative_distances": negative_distances.tolist(),
+        "closeness_coefficients": closeness.tolist(),
+        "collective_ranking": _ranking_from_closeness(closeness),
+    }
+
+
+def _weight_matrix_array(
+    weight_matrix: Any,
+    criterion_count: int,
+) -> np.ndarray:
+    """
+    Validate a (samples, criteria) weight matrix and normalise every row.
+
+    Each row follows the rules of ``_normalized_criterion_weights``; the
+    row totals are accumulated criterion by criterion so the normalised
+    weights match the per-sample path bit for bit.
+    """
 
-    for index, raw_score in enumerate(
-        closeness_coefficients
+    if isinstance(weight_matrix, np.ndarray):
+        shape = weight_matrix.shape
+    elif isinstance(weight_matrix, list) and all(
+        isinstance(row, list) and len(row) == criterion_count
+        for row in weight_matrix
     ):
-        score = _finite_number(
-            raw_score,
-            f"closeness_coefficients[{index}]",
+        shape = (len(weight_matrix), criterion_count)
+    else:
+        shape = ()
+
+    if len(shape) != 2 or shape[0] == 0 or shape[1] != criterion_count:
+        raise ValueError(
+            "weight_matrix must be a non-empty (samples, criteria) matrix"
         )
 
-        if (
-            score < -FLOAT_TOLERANCE
-            or score > 1.0 + FLOAT_TOLERANCE
-        ):
+    weights = _finite_array(
+        weight_matrix,
+        field="weight_matrix",
+        shape=shape,
+    )
+
+    negative_entries = weights < 0
+    if negative_entries.any():
+        position = np.unravel_index(
+            int(np.argmax(negative_entries)),
+            weights.shape,
+        )
+        raise ValueError(
+            f"weight_matrix{_cell_path(position)} must be greater "
+            "than or equal to 0"
+        )
+
+    totals = np.zeros(weights.shape[0], dtype=np.float64)
+    for criterion_index in range(criterion_count):
+        totals += weights[:, criterion_index]
+
+    invalid_rows = (totals <= 0) | (
+        np.abs(totals - 1.0) > WEIGHT_SUM_TOLERANCE
+    )
+    if invalid_rows.any():
+        raise ValueError(
+            f"weight_matrix[{int(np.argmax(invalid_rows))}] "
+            "must sum to 1"
+        )
+
+    return weights / totals[:, None]
+
+
+def evaluate_weight_samples(
+    *,
+    collective_beta_matrix: np.ndarray | list[list[float]],
+    weight_matrix: np.ndarray | list[list[float]],
+    criterion_directions: list[str],
+    criterion_scales: list[dict[str, Any]],
+) -> dict[str, np.ndarray]:
+    """
+    Run steps 2-5 of 2-tuple TOPSIS for many weight vectors in one pass.
+
+    ``weight_matrix`` has one row of criterion weights per sample.
+    ``collective_beta_matrix`` is either the fixed (alternatives, criteria)
+    matrix shared by every sample, in which case the ideals are computed
+    once, or a (samples, alternatives, criteria) stack when the collective
+    matrix itself changes per sample (e.g. expert-weight what-ifs).
+
+    Results are returned as arrays with a leading samples axis; row ``s``
+    is bit-identical to ``evaluate_collective_beta_matrix`` called with
+    the matrix and weights of sample ``s``.
+    """
+
+    if (
+        isinstance(collective_beta_matrix, np.ndarray)
+        and collective_beta_matrix.ndim == 3
+    ):
+        if 0 in collective_beta_matrix.shape:
             raise ValueError(
-                f"closeness_coefficients[{index}] "
-                "must be between 0 and 1"
+                "collective_beta_matrix must be a non-empty matrix"
             )
+        collective_beta = _finite_array(
+            collective_beta_matrix,
+            field="collective_beta_matrix",
+            shape=collective_beta_matrix.shape,
+        )
+    else:
+        collective_beta = _collective_beta_array(collective_beta_matrix)
 
-        if score < 0:
-            score = 0.0
-        elif score > 1:
-            score = 1.0
+    criterion_count = collective_beta.shape[-1]
+    is_benefit = _direction_mask(criterion_directions, criterion_count)
+    scale_labels = _scale_labels(criterion_scales, criterion_count)
+    weights = _weight_matrix_array(weight_matrix, criterion_count)
+    sample_count = weights.shape[0]
 
-        normalized.append(score)
+    if collective_beta.ndim == 3 and collective_beta.shape[0] != sample_count:
+        raise ValueError(
+            "collective_beta_matrix and weight_matrix must contain "
+            "the same number of samples"
+        )
 
-    # Step 5 — Final TOPSIS order: decreasing closeness coefficient.
-    # Python's stable ordering keeps the original alternative order on exact
-    # technical ties.
-    return sorted(
-        range(len(normalized)),
-        key=lambda index: (
-            -normalized[index],
-            index,
-        ),
+    collective_beta = _clip_to_scale(
+        collective_beta,
+        _scale_maximum_indexes(scale_labels),
+        lambda position: f"collective_beta_matrix{_cell_path(position)}",
+    )
+    positive_ideal_beta, negative_ideal_beta = _ideal_arrays(
+        collective_beta,
+        is_benefit,
     )
+    positive_distances, negative_distances = _distance_arrays(
+        collective_beta,
+        positive_ideal_beta,
+        negative_ideal_beta,
+        weights,
+    )
+    closeness = _closeness_array(
+        positive_distances,
+        negative_distances,
+    )
+    ideal_shape = (sample_count, criterion_count)
+
+    return {
+        "positive_ideal_beta": np.broadcast_to(positive_ideal_beta, ideal_shape),
+        "negative_ideal_beta": np.broadcast_to(negative_ideal_beta, ideal_shape),
+        "positive_distances": positive_distances,
+        "negative_distances": negative_distances,
+        "closeness_coefficients": closeness,
+        "collective_ranking": _ranking_array(closeness),
+    }
 
 
 def run_topsis_2tuple(
     *,
-    matrices: dict[str, list[list[float]]],
+    matrices: np.ndarray | dict[str, list[list[float]]],
     expert_weights: list[float],
     weights: list[float],
     criterion_directions: list[str],
     criterion_scales: list[dict[str, Any]],
+    projection_method: str = DEFAULT_PROJECTION_METHOD,
 ) -> dict[str, Any]:
     """
     Execute the complete 2-tuple linguistic TOPSIS pipeline.
@@ -1108,7 +1457,7 @@ def run_topsis_2tuple(
     4. Calculate relative closeness coefficients.
     5. Rank alternatives from highest to lowest closeness.
 
-    The algorithm operates internally on beta values while preserving
+    The algorithm operates internally on beta arrays while preserving
     collective and ideal linguistic 2-tuples for the public result and
     later model-specific analysis.
     """
@@ -1124,86 +1473,40 @@ def run_topsis_2tuple(
     collective_beta_matrix = aggregation[
         "collective_beta_matrix"
     ]
-    collective_matrix = aggregation[
-        "collective_matrix"
-    ]
 
-    # 2) Build the positive and negative ideal solution for every
-    #    criterion according to its max/min direction.
-    ideals = calculate_ideal_solutions(
-        collective_beta_matrix=collective_beta_matrix,
+    # 2-5) Ideals, weighted L1 distances, closeness and ranking on the
+    #      shared array kernel.
+    evaluation = evaluate_collective_beta_matrix(
+        collective_beta_matrix=np.array(collective_beta_matrix, dtype=np.float64),
+        weights=weights,
         criterion_directions=criterion_directions,
         criterion_scales=criterion_scales,
     )
 
-    # 3) Measure each alternative against both ideals with the configured
-    #    criterion weights using weighted L1 distance.
-    distances = calculate_weighted_distances(
-        collective_beta_matrix=collective_beta_matrix,
-        positive_ideal_beta=ideals[
-            "positive_ideal_beta"
-        ],
-        negative_ideal_beta=ideals[
-            "negative_ideal_beta"
-        ],
-        weights=weights,
-    )
-
-    # 4) Convert the pair of ideal distances into the TOPSIS closeness
-    #    coefficient C_i.
-    closeness_coefficients = (
-        calculate_closeness_coefficients(
-            positive_distances=distances[
-                "positive_distances"
-            ],
-            negative_distances=distances[
-                "negative_distances"
-            ],
-        )
-    )
-
-    # 5) Rank alternatives from the largest C_i to the smallest.
-    collective_ranking = (
-        rank_closeness_coefficients(
-            closeness_coefficients
-        )
-    )
     # The plot is presentation evidence only; it does not participate in
     # the TOPSIS score or ranking.
     plots_graphic = get_plots_graphics_from_matrices(
-        list(matrices.values()),
+        expert_matrix_tensor(matrices),
         collective_beta_matrix,
-        method="MDS",
+        method=projection_method,
     )
 
     return {
-        "collective_matrix": collective_matrix,
+        "collective_matrix": aggregation["collective_matrix"],
         "collective_beta_matrix": collective_beta_matrix,
-        "positive_ideal": ideals[
-            "positive_ideal"
-        ],
-        "negative_ideal": ideals[
-            "negative_ideal"
-        ],
-        "positive_ideal_beta": ideals[
-            "positive_ideal_beta"
-        ],
-        "negative_ideal_beta": ideals[
-            "negative_ideal_beta"
-        ],
-        "positive_distances": distances[
-            "positive_distances"
-        ],
-        "negative_distances": distances[
-            "negative_distances"
-        ],
-        "closeness_coefficients": closeness_coefficients,
-        "collective_scores": closeness_coefficients,
-        "collective_ranking": collective_ranking,
+        "positive_ideal": evaluation["positive_ideal"],
+        "negative_ideal": evaluation["negative_ideal"],
+        "positive_ideal_beta": evaluation["positive_ideal_beta"],
+        "negative_ideal_beta": evaluation["negative_ideal_beta"],
+        "positive_distances": evaluation["positive_distances"],
+        "negative_distances": evaluation["negative_distances"],
+        "closeness_coefficients": evaluation["closeness_coefficients"],
+        "collective_scores": evaluation["closeness_coefficients"],
+        "collective_ranking": evaluation["collective_ranking"],
         "expert_weights": list(expert_weights),
         "criterion_weights": list(weights),
         "criterion_directions": list(
             criterion_directions
         ),
         "plots_graphic": plots_graphic,
-    }
\ No newline at end of file
+    }
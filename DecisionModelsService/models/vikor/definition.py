@@ -1,13 +1,14 @@
+from registry.lazy_handler import lazy_handler
 from registry.model_definition import ModelDefinition
 from schemas.model_requests import GenericModelExecutionRequest
-from .executor import execute_vikor
+from utils.projections import PROJECTION_METHOD_PARAMETER
 from .examples import VIKOR_REQUEST_EXAMPLES, VIKOR_RESPONSE_EXAMPLES
 
 MODEL_DEFINITION = ModelDefinition(
     api_model_key="vikor",
     api_endpoint_path="/vikor",
     request_model=GenericModelExecutionRequest,
-    handler=execute_vikor,
+    handler=lazy_handler(".executor:execute_vikor", __package__),
     small_description=(
         "Compromise-ranking MCDM method that identifies alternatives closest "
         "to an acceptable group solution."
@@ -44,5 +45,6 @@ MODEL_DEFINITION = ModelDefinition(
             "default": 0.5,
             "restrictions": {"min": 0, "max": 1, "allowed": None},
         },
+        PROJECTION_METHOD_PARAMETER,
     ],
 )
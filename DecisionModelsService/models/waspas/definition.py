@@ -1,13 +1,14 @@
+from registry.lazy_handler import lazy_handler
 from registry.model_definition import ModelDefinition
 from schemas.model_requests import GenericModelExecutionRequest
-from .executor import execute_waspas
+from utils.projections import PROJECTION_METHOD_PARAMETER
 from .examples import WASPAS_REQUEST_EXAMPLES, WASPAS_RESPONSE_EXAMPLES
 
 MODEL_DEFINITION = ModelDefinition(
     api_model_key="waspas",
     api_endpoint_path="/waspas",
     request_model=GenericModelExecutionRequest,
-    handler=execute_waspas,
+    handler=lazy_handler(".executor:execute_waspas", __package__),
     small_description=(
         "Hybrid MCDM method that combines weighted sum and weighted product "
         "aggregation into a single ranking score."
@@ -44,5 +45,6 @@ MODEL_DEFINITION = ModelDefinition(
             "default": 0.5,
             "restrictions": {"min": 0, "max": 1, "allowed": None},
         },
+        PROJECTION_METHOD_PARAMETER,
     ],
 )
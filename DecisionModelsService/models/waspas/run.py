@@ -5,8 +5,10 @@ from typing import Any
 import numpy as np
 from pyDecision.algorithm import waspas_method
 
+from models.shared_alternative_matrix import expert_matrix_tensor
 from utils.clean_matrix import clean_matrix
 from utils.get_plots_graphics_from_matrices import get_plots_graphics_from_matrices
+from utils.projections import DEFAULT_PROJECTION_METHOD
 
 
 def _ensure_valid_scores(
@@ -29,18 +31,19 @@ def _ensure_valid_scores(
 
 
 def run_waspas(
-    matrices: dict[str, list[list[float]]],
+    matrices: np.ndarray | dict[str, list[list[float]]],
     weights: list[float],
     criterion_type: list[str],
     lambda_value: float = 0.5,
     expert_weights: list[float] | None = None,
+    projection_method: str = DEFAULT_PROJECTION_METHOD,
 ) -> dict[str, Any]:
-    matrices_np = [np.array(matrix, dtype=float) for matrix in matrices.values()]
+    matrices_np = expert_matrix_tensor(matrices)
     if not expert_weights or len(expert_weights) != len(matrices_np):
         raise ValueError("expert_weights must match the number of expert matrices")
 
     collective_matrix = np.average(
-        np.stack(matrices_np),
+        matrices_np,
         axis=0,
         weights=np.array(expert_weights, dtype=float),
     )
@@ -93,6 +96,6 @@ def run_waspas(
         "plots_graphic": get_plots_graphics_from_matrices(
             matrices_np,
             collective_matrix,
-            method="MDS",
+            method=projection_method,
         ),
     }
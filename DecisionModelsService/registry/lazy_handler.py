@@ -0,0 +1,98 @@
+"""Handlers de modelos que importan su executor en la primera ejecución.
+
+Los ``definition.py`` solo describen el modelo, pero importar el executor
+arrastra ``run.py`` y con él pyDecision, scikit-learn, SciPy, PuLP o
+matplotlib. Con ``lazy_handler`` el registro, el manifest y OpenAPI se
+construyen sin esas dependencias y el coste de importarlas se paga en la
+primera ejecución del modelo (o en el warm-up, ver
+``services.model_executors.warmup``).
+
+Solo admite handlers síncronos: el backend de ejecución decide si un handler
+corre ``inline`` con ``iscoroutinefunction`` antes de importarlo, y un
+``LazyHandler`` nunca lo es. Los executors ``async`` deben declararse
+directamente en ``ModelDefinition.handler``.
+"""
+
+from importlib import import_module
+from inspect import iscoroutinefunction
+from importlib.util import resolve_name
+from threading import Lock
+from time import perf_counter
+from typing import Any, Callable
+
+
+class LazyHandler:
+    """Callable que resuelve ``module:attribute`` al llamarse por primera vez.
+
+    Es serializable con ``pickle`` (solo viaja la referencia), así que sirve
+    igual para el backend ``process``: cada proceso hijo importa el executor
+    en su primera ejecución.
+    """
+
+    def __init__(self, module_path: str, attribute: str) -> None:
+        self.module_path = module_path
+        self.attribute = attribute
+        self._handler: Callable[[Any], Any] | None = None
+        self._import_seconds: float | None = None
+        self._lock = Lock()
+
+    @property
+    def is_resolved(self) -> bool:
+        return self._handler is not None
+
+    @property
+    def import_seconds(self) -> float | None:
+        """Tiempo que tardó la importación del executor en este proceso."""
+
+        return self._import_seconds
+
+    def resolve(self) -> Callable[[Any], Any]:
+        handler = self._handler
+        if handler is not None:
+            return handler
+
+        with self._lock:
+            if self._handler is None:
+                started = perf_counter()
+                handler = getattr(import_module(self.module_path), self.attribute)
+                if not callable(handler):
+                    raise TypeError(f"{self.module_path}:{self.attribute} is not callable")
+                if iscoroutinefunction(handler):
+                    raise TypeError(
+                        f"{self.module_path}:{self.attribute} is async; lazy handlers must be "
+                        "synchronous, declare async executors directly as the handler"
+                    )
+                self._import_seconds = perf_counter() - started
+                self._handler = handler
+
+            return self._handler
+
+    def __call__(self, payload: Any) -> Any:
+        return self.resolve()(payload)
+
+    def __getstate__(self) -> dict[str, str]:
+        return {"module_path": self.module_path, "attribute": self.attribute}
+
+    def __setstate__(self, state: dict[str, str]) -> None:
+        self.__init__(state["module_path"], state["attribute"])
+
+    def __repr__(self) -> str:
+        return f"LazyHandler({self.module_path}:{self.attribute})"
+
+
+def lazy_handler(reference: str, package: str | None = None) -> LazyHandler:
+    """Crea un :class:`LazyHandler` a partir de ``"module:attribute"``.
+
+    ``reference`` puede ser relativa al paquete del modelo, p. ej.
+    ``lazy_handler(".executor:execute_topsis", __package__)``. El atributo
+    debe ser un handler síncrono.
+    """
+
+    module_path, separator, attribute = reference.partition(":")
+    if not separator or not module_path or not attribute:
+        raise ValueError(f"Lazy handler reference must be 'module:attribute', got '{reference}'")
+
+    return LazyHandler(resolve_name(module_path, package), attribute)
+
+
+__all__ = ["LazyHandler", "lazy_handler"]
@@ -4,6 +4,7 @@ from typing import Any, Callable
 from pydantic import BaseModel
 
 MODEL_KINDS = {"issue", "criteriaWeighting"}
+EXECUTION_BACKENDS = {"inline", "thread", "process"}
 
 
 @dataclass(frozen=True)
@@ -38,6 +39,10 @@ class ModelDefinition:
     supported_expression_domains: list[dict[str, Any]] = field(default_factory=list)
     parameters: list[dict[str, Any]] = field(default_factory=list)
 
+    execution_backend: str | None = None
+    max_concurrency: int | None = None
+    execution_timeout_seconds: float | None = None
+
     def __post_init__(self) -> None:
         """Valida el contrato interno mínimo de metadata."""
 
@@ -53,6 +58,34 @@ class ModelDefinition:
                 f"model_kind in {sorted(MODEL_KINDS)}."
             )
 
+        if (
+            self.execution_backend is not None
+            and self.execution_backend not in EXECUTION_BACKENDS
+        ):
+            raise ValueError(
+                f"ModelDefinition '{self.api_model_key}' requires "
+                f"execution_backend in {sorted(EXECUTION_BACKENDS)}."
+            )
+
+        if self.max_concurrency is not None and (
+            isinstance(self.max_concurrency, bool)
+            or not isinstance(self.max_concurrency, int)
+            or self.max_concurrency < 1
+        ):
+            raise ValueError(
+                f"ModelDefinition '{self.api_model_key}' requires "
+                "max_concurrency to be a positive integer."
+            )
+
+        if self.execution_timeout_seconds is not None and not (
+            isinstance(self.execution_timeout_seconds, (int, float))
+            and self.execution_timeout_seconds > 0
+        ):
+            raise ValueError(
+                f"ModelDefinition '{self.api_model_key}' requires "
+                "execution_timeout_seconds to be a positive number."
+            )
+
         if not isinstance(self.evaluation_structure_key, str) or (
             not self.evaluation_structure_key.strip()
         ):
@@ -1,5 +1,9 @@
+from dataclasses import dataclass
+from hashlib import sha256
 from importlib import import_module, invalidate_caches, reload
 from pathlib import Path
+from threading import RLock
+from time import perf_counter
 import sys
 
 from registry.model_definition import ModelDefinition
@@ -76,40 +80,305 @@ def _append_definition_or_raise(
     definitions.append(definition)
 
 
-def get_model_definitions(*, strict: bool = True) -> tuple[ModelDefinition, ...]:
-    invalidate_caches()
+def _iter_package_sources(model_dir: Path) -> list[Path]:
+    return sorted(
+        path
+        for path in model_dir.rglob("*.py")
+        if "__pycache__" not in path.relative_to(model_dir).parts
+    )
+
+
+def _stat_fingerprint(model_dir: Path) -> tuple[tuple[str, int, int], ...] | None:
+    if not (model_dir / "definition.py").is_file():
+        return None
+
+    fingerprint = []
+    try:
+        for path in _iter_package_sources(model_dir):
+            stat = path.stat()
+            fingerprint.append(
+                (path.relative_to(model_dir).as_posix(), stat.st_mtime_ns, stat.st_size)
+            )
+    except OSError:
+        return None
+
+    return tuple(fingerprint)
+
+
+def _content_digest(model_dir: Path) -> str | None:
+    digest = sha256()
+    try:
+        for path in _iter_package_sources(model_dir):
+            digest.update(path.relative_to(model_dir).as_posix().encode("utf-8"))
+            digest.update(b"\0")
+            digest.update(path.read_bytes())
+            digest.update(b"\0")
+    except OSError:
+        return None
+
+    return digest.hexdigest()
+
+
+def _purge_package_modules(model_dir: Path) -> None:
+    package_name = f"models.{model_dir.name}"
+
+    for module_name in list(sys.modules):
+        if module_name.startswith(f"{package_name}."):
+            sys.modules.pop(module_name, None)
+
+
+@dataclass(frozen=True)
+class _CachedModelPackage:
+    fingerprint: tuple[tuple[str, int, int], ...]
+    digest: str | None
+    definition: ModelDefinition | None
+    error: Exception | None
+    load_seconds: float | None = None
+
+
+class ModelRegistry:
+    """Caché de definiciones de modelos que solo recarga paquetes modificados.
+
+    Cada paquete se identifica por la ruta de su carpeta y se recarga cuando
+    cambia la huella (ruta, mtime y tamaño) de cualquiera de sus ``*.py`` y
+    además su contenido; al recargar se descartan los submódulos del paquete
+    para no reutilizar ejecutores antiguos. Las carpetas nuevas de ModelForge
+    se detectan en la siguiente consulta sin reiniciar el servicio, aunque
+    ``definition.py`` aparezca antes que el resto de ficheros.
+    """
+
+    def __init__(self) -> None:
+        self._lock = RLock()
+        self._packages: dict[Path, _CachedModelPackage] = {}
+        self._snapshot_key: tuple | None = None
+        self._snapshots: dict[bool, tuple[ModelDefinition, ...]] = {}
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._reloads = 0
+        self._invalidations = 0
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._packages.clear()
+            self._snapshot_key = None
+            self._snapshots.clear()
+            self._generation += 1
+            self._invalidations += 1
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "generation": self._generation,
+                "cachedPackages": len(self._packages),
+                "hits": self._hits,
+                "misses": self._misses,
+                "reloads": self._reloads,
+                "invalidations": self._invalidations,
+            }
+
+    def package_load_report(self) -> list[dict[str, object]]:
+        """Última carga de cada paquete: tiempo de ``definition.py`` y error, si lo hubo."""
+
+        with self._lock:
+            packages = sorted(self._packages.items(), key=lambda item: item[0].name)
+
+        return [
+            {
+                "package": model_dir.name,
+                "apiModelKey": package.definition.api_model_key if package.definition else None,
+                "definitionLoadMs": (
+                    round(package.load_seconds * 1000, 3)
+                    if package.load_seconds is not None
+                    else None
+                ),
+                "error": str(package.error) if package.error is not None else None,
+            }
+            for model_dir, package in packages
+        ]
+
+    def get_definitions(self, *, strict: bool = True) -> tuple[ModelDefinition, ...]:
+        with self._lock:
+            model_dirs = _iter_candidate_model_dirs()
+            packages = [self._resolve_package(model_dir) for model_dir in model_dirs]
+            snapshot_key = tuple(zip(model_dirs, packages))
+
+            if not self._is_current_snapshot(snapshot_key):
+                self._snapshot_key = snapshot_key
+                self._snapshots.clear()
+                self._generation += 1
+
+            cached = self._snapshots.get(strict)
+            if cached is not None:
+                return cached
+
+            definitions = self._build_snapshot(packages, strict=strict)
+            self._snapshots[strict] = definitions
+            return definitions
+
+    def _is_current_snapshot(self, snapshot_key: tuple) -> bool:
+        if self._snapshot_key is None or len(snapshot_key) != len(self._snapshot_key):
+            return False
+
+        return all(
+            model_dir == current_dir and package is current_package
+            for (model_dir, package), (current_dir, current_package) in zip(
+                snapshot_key, self._snapshot_key
+            )
+        )
+
+    def _resolve_package(self, model_dir: Path) -> _CachedModelPackage:
+        fingerprint = _stat_fingerprint(model_dir)
+        cached = self._packages.get(model_dir)
+        digest: str | None = None
+
+        if fingerprint is not None and cached is not None:
+            if cached.fingerprint == fingerprint:
+                self._hits += 1
+                return cached
 
-    definitions: list[ModelDefinition] = []
-    seen_model_keys: set[str] = set()
-    seen_endpoint_paths: set[str] = set()
+            digest = _content_digest(model_dir)
+            if digest is not None and digest == cached.digest:
+                self._hits += 1
+                cached = _CachedModelPackage(
+                    fingerprint=fingerprint,
+                    digest=digest,
+                    definition=cached.definition,
+                    error=cached.error,
+                    load_seconds=cached.load_seconds,
+                )
+                self._packages[model_dir] = cached
+                return cached
 
-    for model_dir in _iter_candidate_model_dirs():
+            _purge_package_modules(model_dir)
+        elif fingerprint is not None:
+            digest = _content_digest(model_dir)
+
+        self._misses += 1
+        self._reloads += 1
+        invalidate_caches()
+
+        definition: ModelDefinition | None = None
+        error: Exception | None = None
+        started = perf_counter()
         try:
             definition = _load_model_definition(model_dir)
-        except Exception:
-            if strict:
-                raise
-            continue
+        except Exception as exc:
+            error = exc
 
-        _append_definition_or_raise(
-            definitions=definitions,
+        package = _CachedModelPackage(
+            fingerprint=fingerprint,
+            digest=digest,
             definition=definition,
-            seen_model_keys=seen_model_keys,
-            seen_endpoint_paths=seen_endpoint_paths,
-            strict=strict,
+            error=error,
+            load_seconds=perf_counter() - started,
+        )
+
+        if fingerprint is not None:
+            self._packages[model_dir] = package
+        else:
+            self._packages.pop(model_dir, None)
+
+        return package
+
+    @staticmethod
+    def _build_snapshot(
+        packages: list[_CachedModelPackage],
+        *,
+        strict: bool,
+    ) -> tuple[ModelDefinition, ...]:
+        definitions: list[ModelDefinition] = []
+        seen_model_keys: set[str] = set()
+        seen_endpoint_paths: set[str] = set()
+
+        for package in packages:
+            if package.error is not None:
+                if strict:
+                    raise package.error
+                continue
+
+            _append_definition_or_raise(
+                definitions=definitions,
+                definition=package.definition,
+                seen_model_keys=seen_model_keys,
+                seen_endpoint_paths=seen_endpoint_paths,
+                strict=strict,
+            )
+
+        return tuple(definitions)
+
+
+MODEL_REGISTRY = ModelRegistry()
+
+_SnapshotIndexes = tuple[
+    tuple[ModelDefinition, ...] | None,
+    dict[str, ModelDefinition],
+    dict[str, ModelDefinition],
+]
+
+# (snapshot, definiciones por endpoint, definiciones por clave), sustituidos
+# de una vez para que un lector nunca mezcle índices de dos snapshots.
+_snapshot_indexes: _SnapshotIndexes = (None, {}, {})
+
+
+def get_model_definitions(*, strict: bool = True) -> tuple[ModelDefinition, ...]:
+    return MODEL_REGISTRY.get_definitions(strict=strict)
+
+
+def _get_snapshot_indexes(
+    definitions: tuple[ModelDefinition, ...],
+) -> _SnapshotIndexes:
+    global _snapshot_indexes
+
+    indexes = _snapshot_indexes
+    if definitions is not indexes[0]:
+        indexes = (
+            definitions,
+            {definition.api_endpoint_path: definition for definition in definitions},
+            {definition.api_model_key: definition for definition in definitions},
         )
+        _snapshot_indexes = indexes
 
-    return tuple(definitions)
+    return indexes
 
 
 def get_model_definition_by_endpoint_path(endpoint_path: str) -> ModelDefinition | None:
     normalized_endpoint_path = f"/{str(endpoint_path or '').strip('/')}"
+    definitions = get_model_definitions(strict=False)
+
+    return _get_snapshot_indexes(definitions)[1].get(normalized_endpoint_path)
+
+
+def get_model_definition_by_key(api_model_key: str) -> ModelDefinition | None:
+    normalized_key = str(api_model_key or "").strip()
+    definitions = get_model_definitions(strict=False)
+
+    return _get_snapshot_indexes(definitions)[2].get(normalized_key)
+
+
+def invalidate_model_registry() -> None:
+    MODEL_REGISTRY.invalidate()
+
+
+def get_model_registry_stats() -> dict[str, int]:
+    return MODEL_REGISTRY.stats()
 
-    for definition in get_model_definitions(strict=False):
-        if definition.api_endpoint_path == normalized_endpoint_path:
-            return definition
 
-    return None
+def get_model_package_load_report() -> list[dict[str, object]]:
+    return MODEL_REGISTRY.package_load_report()
 
 
-__all__ = ["get_model_definition_by_endpoint_path", "get_model_definitions"]
+__all__ = [
+    "MODEL_REGISTRY",
+    "ModelRegistry",
+    "get_model_definition_by_endpoint_path",
+    "get_model_definition_by_key",
+    "get_model_definitions",
+    "get_model_package_load_report",
+    "get_model_registry_stats",
+    "invalidate_model_registry",
+]
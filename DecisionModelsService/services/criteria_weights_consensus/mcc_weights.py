@@ -3,11 +3,27 @@ from __future__ import annotations
 import math
 from typing import Any
 
+import numpy as np
 import pulp as pl
+from scipy import sparse
+from scipy.optimize import linprog
+
+from core.environment import get_str_setting
 
 DEFAULT_MCC_EPS = 0.05
 WEIGHT_SUM_TOLERANCE = 1e-6
 
+MCC_SOLVER_SETTING = "DECISION_MODELS_MCC_SOLVER"
+MCC_SOLVER_BACKENDS = ("pulp", "highs")
+DEFAULT_MCC_SOLVER_BACKEND = "pulp"
+
+# scipy.optimize.linprog status codes, mapped to PuLP's LpStatus names.
+HIGHS_STATUS = {
+    0: "Optimal",
+    2: "Infeasible",
+    3: "Unbounded",
+}
+
 
 def _is_plain_object(value: Any) -> bool:
     return isinstance(value, dict)
@@ -121,15 +137,13 @@ def _validate_expert_weights(
     return expert_keys, matrix, original_by_expert
 
 
-def _solve_mcc_lp(
+def _validate_lp_inputs(
     *,
     o: list[list[float]],
     c: list[float],
     w: list[float],
     eps: float,
-    solver: Any = None,
-    msg: bool = False,
-) -> dict[str, Any]:
+) -> tuple[int, int, float]:
     if not isinstance(o, list) or len(o) == 0:
         raise ValueError("o must be a non-empty matrix")
 
@@ -171,6 +185,27 @@ def _solve_mcc_lp(
     if abs(sum(w) - 1.0) > WEIGHT_SUM_TOLERANCE:
         raise ValueError(f"Aggregation weights w must sum to 1 (got {sum(w)})")
 
+    return m, n, eps_value
+
+
+def mcc_solver_backend() -> str:
+    """LP backend configured for this deployment (``pulp`` or ``highs``)."""
+
+    backend = get_str_setting(MCC_SOLVER_SETTING, DEFAULT_MCC_SOLVER_BACKEND)
+    return backend if backend in MCC_SOLVER_BACKENDS else DEFAULT_MCC_SOLVER_BACKEND
+
+
+def _solve_mcc_lp_pulp(
+    *,
+    o: list[list[float]],
+    c: list[float],
+    w: list[float],
+    eps: float,
+    m: int,
+    n: int,
+    solver: Any,
+    msg: bool,
+) -> dict[str, Any]:
     problem = pl.LpProblem("MCC_weights", pl.LpMinimize)
 
     o_bar = [
@@ -198,8 +233,8 @@ def _solve_mcc_lp(
 
     for k in range(m):
         for j in range(n):
-            problem += o_bar[k][j] - g_bar[j] <= eps_value, f"consensus_pos_{k}_{j}"
-            problem += g_bar[j] - o_bar[k][j] <= eps_value, f"consensus_neg_{k}_{j}"
+            problem += o_bar[k][j] - g_bar[j] <= eps, f"consensus_pos_{k}_{j}"
+            problem += g_bar[j] - o_bar[k][j] <= eps, f"consensus_neg_{k}_{j}"
 
     for k in range(m):
         problem += pl.lpSum(o_bar[k][j] for j in range(n)) == 1, f"expert_simplex_{k}"
@@ -224,6 +259,177 @@ def _solve_mcc_lp(
     }
 
 
+def build_mcc_lp_matrices(
+    *,
+    o: list[list[float]],
+    c: list[float],
+    w: list[float],
+    eps: float,
+) -> dict[str, Any]:
+    """Sparse standard form of the MCC model for ``scipy.optimize.linprog``.
+
+    Variables are laid out as ``[o_bar (m*n), g_bar (n), u (m*n)]`` in
+    row-major expert order. Rows follow the PuLP formulation: the two
+    absolute-value bounds on ``u`` and the two consensus bounds, then the
+    weighted-average, per-expert simplex and collective simplex equalities.
+    """
+
+    o_values = np.asarray(o, dtype=np.float64)
+    m, n = o_values.shape
+    cells = m * n
+    variable_count = 2 * cells + n
+
+    cell = np.arange(cells)
+    o_bar = cell
+    g_bar = cells + np.tile(np.arange(n), m)
+    u = cells + n + cell
+    ones = np.ones(cells)
+
+    objective = np.zeros(variable_count)
+    objective[u] = np.repeat(np.asarray(c, dtype=np.float64), n)
+
+    # o_bar - u <= o          (abs_pos)
+    # -o_bar - u <= -o        (abs_neg)
+    # o_bar - g_bar <= eps    (consensus_pos)
+    # g_bar - o_bar <= eps    (consensus_neg)
+    A_ub = sparse.csr_matrix(
+        (
+            np.concatenate([ones, -ones, -ones, -ones, ones, -ones, -ones, ones]),
+            (
+                np.concatenate([
+                    cell, cell,
+                    cells + cell, cells + cell,
+                    2 * cells + cell, 2 * cells + cell,
+                    3 * cells + cell, 3 * cells + cell,
+                ]),
+                np.concatenate([o_bar, u, o_bar, u, o_bar, g_bar, o_bar, g_bar]),
+            ),
+        ),
+        shape=(4 * cells, variable_count),
+    )
+    b_ub = np.concatenate([
+        o_values.ravel(),
+        -o_values.ravel(),
+        np.full(2 * cells, eps),
+    ])
+
+    # g_bar_j - sum_k w_k * o_bar_kj = 0   (weighted_avg)
+    # sum_j o_bar_kj = 1                   (expert_simplex)
+    # sum_j g_bar_j = 1                    (simplex)
+    criterion = np.arange(n)
+    A_eq = sparse.csr_matrix(
+        (
+            np.concatenate([
+                np.ones(n),
+                -np.repeat(np.asarray(w, dtype=np.float64), n),
+                ones,
+                np.ones(n),
+            ]),
+            (
+                np.concatenate([
+                    criterion,
+                    np.tile(criterion, m),
+                    n + np.repeat(np.arange(m), n),
+                    np.full(n, n + m),
+                ]),
+                np.concatenate([
+                    cells + criterion,
+                    o_bar,
+                    o_bar,
+                    cells + criterion,
+                ]),
+            ),
+        ),
+        shape=(n + m + 1, variable_count),
+    )
+    b_eq = np.concatenate([np.zeros(n), np.ones(m + 1)])
+
+    return {
+        "c": objective,
+        "A_ub": A_ub,
+        "b_ub": b_ub,
+        "A_eq": A_eq,
+        "b_eq": b_eq,
+    }
+
+
+def _solve_mcc_lp_highs(
+    *,
+    o: list[list[float]],
+    c: list[float],
+    w: list[float],
+    eps: float,
+    m: int,
+    n: int,
+    msg: bool,
+) -> dict[str, Any]:
+    result = linprog(
+        **build_mcc_lp_matrices(o=o, c=c, w=w, eps=eps),
+        bounds=(0.0, None),
+        method="highs",
+        options={"disp": msg},
+    )
+    status = HIGHS_STATUS.get(result.status, "Not Solved")
+
+    if result.x is None:
+        return {
+            "status": status,
+            "o_bar": [[0.0] * n for _ in range(m)],
+            "g_bar": [0.0] * n,
+            "objective": None,
+        }
+
+    values = result.x.tolist()
+    cells = m * n
+
+    return {
+        "status": status,
+        "o_bar": [values[k * n:(k + 1) * n] for k in range(m)],
+        "g_bar": values[cells:cells + n],
+        "objective": float(result.fun),
+    }
+
+
+def _solve_mcc_lp(
+    *,
+    o: list[list[float]],
+    c: list[float],
+    w: list[float],
+    eps: float,
+    solver: Any = None,
+    msg: bool = False,
+    backend: str | None = None,
+) -> dict[str, Any]:
+    """Solve the MCC model with the selected backend.
+
+    An explicit PuLP ``solver`` implies the ``pulp`` backend; otherwise the
+    deployment setting (``DECISION_MODELS_MCC_SOLVER``) decides.
+    """
+
+    m, n, eps_value = _validate_lp_inputs(o=o, c=c, w=w, eps=eps)
+
+    if backend is None:
+        backend = "pulp" if solver is not None else mcc_solver_backend()
+
+    if backend == "highs":
+        lp_result = _solve_mcc_lp_highs(o=o, c=c, w=w, eps=eps_value, m=m, n=n, msg=msg)
+    elif backend == "pulp":
+        lp_result = _solve_mcc_lp_pulp(
+            o=o,
+            c=c,
+            w=w,
+            eps=eps_value,
+            m=m,
+            n=n,
+            solver=solver,
+            msg=msg,
+        )
+    else:
+        raise ValueError(f"Unsupported MCC solver backend: {backend}")
+
+    return {**lp_result, "solver": backend}
+
+
 def solve_mcc_weights(
     *,
     criteria: list[dict[str, str]],
@@ -231,12 +437,16 @@ def solve_mcc_weights(
     eps: float = DEFAULT_MCC_EPS,
     solver: Any = None,
     msg: bool = False,
+    backend: str | None = None,
 ) -> dict[str, Any]:
     """Apply MCC consensus to already-computed expert criteria weights.
 
     The input weights are not normalized here. They must already be valid
     criteria-weight vectors: finite values in [0, 1] and sum approximately 1
     for each expert.
+
+    ``backend`` overrides the deployment LP backend (``highs`` solves the
+    sparse model in-process; ``pulp`` runs CBC through PuLP).
     """
 
     criterion_items = _validate_criteria(criteria)
@@ -256,6 +466,7 @@ def solve_mcc_weights(
         eps=eps,
         solver=solver,
         msg=msg,
+        backend=backend,
     )
 
     if lp_result["status"] != "Optimal":
@@ -277,6 +488,7 @@ def solve_mcc_weights(
         "useMcc": True,
         "eps": float(eps),
         "status": lp_result["status"],
+        "solver": lp_result["solver"],
         "objective": lp_result["objective"],
         "weightsByCriterion": weights_by_criterion,
         "adjustedWeightsByExpert": adjusted_weights_by_expert,
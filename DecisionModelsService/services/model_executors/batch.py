@@ -0,0 +1,155 @@
+"""Ejecución por lotes de un modelo con resultados NDJSON en orden de finalización."""
+
+import asyncio
+import json
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import ValidationError
+
+from core.environment import get_int_setting
+from registry.model_definition import ModelDefinition
+from services.model_executors.execution import get_model_execution_backend
+from services.model_executors.serialization import (
+    RawOutputMode,
+    apply_raw_output_mode,
+    dumps,
+    model_execution_envelope,
+)
+
+DEFAULT_MAX_BATCH_SIZE = 500
+
+ExecutePayload = Callable[[ModelDefinition, Any], Awaitable[dict | JSONResponse]]
+
+
+def get_max_batch_size() -> int:
+    return get_int_setting(
+        "DECISION_MODELS_MAX_BATCH_SIZE",
+        DEFAULT_MAX_BATCH_SIZE,
+        minimum=1,
+    )
+
+
+def _validation_error_envelope(exc: ValidationError) -> dict[str, Any]:
+    return {
+        "success": False,
+        "message": "Validation error",
+        "data": None,
+        "error": {
+            "code": "VALIDATION_ERROR",
+            "field": None,
+            "details": jsonable_encoder(exc.errors()),
+        },
+    }
+
+
+def _execution_error_envelope(error: Exception) -> dict[str, Any]:
+    return {
+        "success": False,
+        "message": f"Error executing model: {error}",
+        "data": None,
+        "error": {
+            "code": "MODEL_EXECUTION_ERROR",
+            "field": None,
+            "details": None,
+        },
+    }
+
+
+def _as_envelope(
+    result: dict | JSONResponse,
+    raw_output: RawOutputMode = "include",
+) -> tuple[int, dict[str, Any]]:
+    """Convierte la salida de un handler al contrato ``success/message/data/error``."""
+
+    if isinstance(result, JSONResponse):
+        return result.status_code, json.loads(result.body)
+
+    # Mismo contrato y serialización que las rutas individuales.
+    return 200, apply_raw_output_mode(model_execution_envelope(result), raw_output)
+
+
+def _line(record: dict[str, Any]) -> bytes:
+    return dumps(record) + b"\n"
+
+
+def _result_line(index: int, status_code: int, envelope: dict[str, Any]) -> bytes:
+    return _line(
+        {
+            "type": "result",
+            "index": index,
+            "statusCode": status_code,
+            "response": envelope,
+        }
+    )
+
+
+async def stream_batch_execution(
+    model: ModelDefinition,
+    raw_payloads: list[Any],
+    execute: ExecutePayload,
+    *,
+    raw_output: RawOutputMode = "include",
+) -> AsyncIterator[bytes]:
+    """Valida todos los payloads y emite una línea NDJSON por ítem según terminan.
+
+    Los payloads inválidos se notifican primero sin ejecutarse. Los válidos se
+    despachan al backend de ejecución con, como mucho, tantos ítems en vuelo
+    como workers tenga el modelo, para no saturar su cola con un solo lote.
+    La última línea es un resumen del lote. ``raw_output`` se aplica a cada
+    resultado igual que en las rutas individuales.
+    """
+
+    validated: list[tuple[int, Any]] = []
+    succeeded = 0
+    failed = 0
+
+    for index, raw_payload in enumerate(raw_payloads):
+        try:
+            validated.append((index, model.request_model.model_validate(raw_payload)))
+        except ValidationError as exc:
+            failed += 1
+            yield _result_line(index, 422, _validation_error_envelope(exc))
+
+    backend = get_model_execution_backend()
+    limit = asyncio.Semaphore(model.max_concurrency or backend.settings.max_concurrency)
+
+    async def run_item(index: int, payload: Any) -> tuple[int, int, dict[str, Any]]:
+        async with limit:
+            try:
+                status_code, envelope = _as_envelope(
+                    await execute(model, payload),
+                    raw_output,
+                )
+            except Exception as error:
+                status_code, envelope = 500, _execution_error_envelope(error)
+
+        return index, status_code, envelope
+
+    tasks = [asyncio.ensure_future(run_item(index, payload)) for index, payload in validated]
+
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            index, status_code, envelope = await next_done
+            if status_code == 200 and envelope.get("success") is True:
+                succeeded += 1
+            else:
+                failed += 1
+            yield _result_line(index, status_code, envelope)
+    finally:
+        for task in tasks:
+            task.cancel()
+
+    yield _line(
+        {
+            "type": "summary",
+            "apiModelKey": model.api_model_key,
+            "total": len(raw_payloads),
+            "succeeded": succeeded,
+            "failed": failed,
+        }
+    )
+
+
+__all__ = ["get_max_batch_size", "stream_batch_execution"]
@@ -0,0 +1,424 @@
+"""Ejecución de handlers de modelos fuera del event loop con límites por modelo."""
+
+import asyncio
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from inspect import isawaitable, iscoroutinefunction
+from threading import Lock
+from typing import Any
+
+from core.environment import get_float_setting, get_int_setting, get_str_setting
+from registry.model_definition import EXECUTION_BACKENDS, ModelDefinition
+from services.model_executors.solver_pool import get_process_context
+
+DEFAULT_EXECUTION_BACKEND = "thread"
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_MAX_QUEUE_DEPTH = 32
+DEFAULT_EXECUTION_TIMEOUT_SECONDS = 120.0
+
+
+class ModelExecutionSaturatedError(Exception):
+    """La cola de un modelo ha alcanzado su profundidad máxima."""
+
+    def __init__(self, model: ModelDefinition, max_queue_depth: int) -> None:
+        super().__init__(
+            f"Model '{model.api_model_key}' execution queue is full "
+            f"({max_queue_depth} pending requests)."
+        )
+        self.api_model_key = model.api_model_key
+        self.max_queue_depth = max_queue_depth
+
+
+class ModelExecutionInterruptedError(Exception):
+    """Un worker del pool de procesos de un modelo murió durante la ejecución."""
+
+    def __init__(self, model: ModelDefinition) -> None:
+        super().__init__(
+            f"Model '{model.api_model_key}' execution was interrupted because its worker process stopped."
+        )
+        self.api_model_key = model.api_model_key
+
+
+class ModelExecutionTimeoutError(Exception):
+    """La ejecución de un modelo ha superado su tiempo máximo."""
+
+    def __init__(self, model: ModelDefinition, timeout_seconds: float) -> None:
+        super().__init__(
+            f"Model '{model.api_model_key}' execution exceeded {timeout_seconds} seconds."
+        )
+        self.api_model_key = model.api_model_key
+        self.timeout_seconds = timeout_seconds
+
+
+@dataclass(frozen=True)
+class ExecutionSettings:
+    """Configuración del backend de ejecución, leída del entorno."""
+
+    default_backend: str = DEFAULT_EXECUTION_BACKEND
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    max_queue_depth: int = DEFAULT_MAX_QUEUE_DEPTH
+    timeout_seconds: float | None = DEFAULT_EXECUTION_TIMEOUT_SECONDS
+
+    @classmethod
+    def from_environment(cls) -> "ExecutionSettings":
+        default_backend = get_str_setting(
+            "DECISION_MODELS_EXECUTION_BACKEND",
+            DEFAULT_EXECUTION_BACKEND,
+        )
+        if default_backend not in EXECUTION_BACKENDS:
+            default_backend = DEFAULT_EXECUTION_BACKEND
+
+        return cls(
+            default_backend=default_backend,
+            max_concurrency=get_int_setting(
+                "DECISION_MODELS_MAX_CONCURRENCY",
+                DEFAULT_MAX_CONCURRENCY,
+                minimum=1,
+            ),
+            max_queue_depth=get_int_setting(
+                "DECISION_MODELS_MAX_QUEUE_DEPTH",
+                DEFAULT_MAX_QUEUE_DEPTH,
+                minimum=1,
+            ),
+            timeout_seconds=get_float_setting(
+                "DECISION_MODELS_EXECUTION_TIMEOUT_SECONDS",
+                DEFAULT_EXECUTION_TIMEOUT_SECONDS,
+            ),
+        )
+
+
+class _LaneClosedError(Exception):
+    """El carril se retiró entre obtenerlo y enviarle trabajo."""
+
+
+class _ProcessPool:
+    """Un ``ProcessPoolExecutor`` de un carril y el trabajo que corre en él."""
+
+    def __init__(self, max_workers: int) -> None:
+        self.executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=get_process_context(),
+        )
+        self.in_flight: set[Future] = set()
+        self.abandoned: set[Future] = set()
+        self.retired = False
+
+    def drained(self) -> bool:
+        """Retirado y sin más trabajo vivo que el abandonado por timeout o cancelación."""
+
+        return self.retired and self.in_flight <= self.abandoned
+
+    def terminate(self) -> None:
+        for process in list((getattr(self.executor, "_processes", None) or {}).values()):
+            process.terminate()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+class _ModelLane:
+    """Pool dedicado de un modelo: limita concurrencia y profundidad de cola.
+
+    En procesos, cancelar un trabajo en curso retira el pool: las peticiones
+    nuevas van a un pool nuevo y los procesos del retirado se terminan cuando
+    acaban las demás peticiones que ya corrían en él, sin romperlas. Mientras
+    tanto el trabajo abandonado sigue ocupando procesos del pool retirado, así
+    que tras un timeout el carril puede superar temporalmente ``max_workers``.
+    ``shutdown`` termina también los pools retirados que aún no se vaciaron.
+
+    ``close`` retira el carril entero cuando cambia la configuración del
+    modelo: deja de aceptar trabajo y sus pools se cierran en cuanto acaban
+    las peticiones que ya tenían.
+    """
+
+    def __init__(self, backend: str, max_workers: int, max_queue_depth: int) -> None:
+        self.backend = backend
+        self.max_workers = max_workers
+        self.max_queue_depth = max_queue_depth
+        self._lock = Lock()
+        self._pending = 0
+        self._executor: Executor | None = None
+        self._process_pool: _ProcessPool | None = None
+        self._pools_by_future: dict[Future, _ProcessPool] = {}
+        self._retired_pools: set[_ProcessPool] = set()
+        self._closed = False
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="decision-model",
+            )
+
+        return self._executor
+
+    def _get_process_pool(self) -> _ProcessPool:
+        if self._process_pool is None:
+            self._process_pool = _ProcessPool(self.max_workers)
+
+        return self._process_pool
+
+    def _retire(self, pool: _ProcessPool) -> None:
+        if pool is self._process_pool:
+            self._process_pool = None
+            pool.retired = True
+            self._retired_pools.add(pool)
+
+    def _take_drained(self, pool: _ProcessPool | None) -> bool:
+        if pool is None or not pool.drained():
+            return False
+
+        self._retired_pools.discard(pool)
+        return True
+
+    def try_submit(self, handler, payload) -> Future | None:
+        with self._lock:
+            if self._closed:
+                raise _LaneClosedError()
+            if self._pending >= self.max_queue_depth:
+                return None
+
+            if self.backend == "process":
+                pool = self._get_process_pool()
+                future = pool.executor.submit(handler, payload)
+                pool.in_flight.add(future)
+                self._pools_by_future[future] = pool
+            else:
+                future = self._get_executor().submit(handler, payload)
+            self._pending += 1
+
+        future.add_done_callback(self._release)
+        return future
+
+    def _release(self, future: Future) -> None:
+        with self._lock:
+            self._pending -= 1
+            pool = self._pools_by_future.pop(future, None)
+            if pool is not None:
+                pool.in_flight.discard(future)
+                pool.abandoned.discard(future)
+            drained = self._take_drained(pool)
+
+        if drained:
+            pool.terminate()
+
+    def cancel(self, future: Future) -> None:
+        """Cancela trabajo en cola; en procesos también detiene el trabajo en curso.
+
+        Solo se terminan los procesos del pool en el que corre ``future`` y
+        cuando ya no queda en él trabajo de otras peticiones.
+        """
+
+        if future.cancel() or self.backend != "process":
+            return
+
+        with self._lock:
+            pool = self._pools_by_future.get(future)
+            if pool is None:
+                return
+            pool.abandoned.add(future)
+            self._retire(pool)
+            drained = self._take_drained(pool)
+
+        if drained:
+            pool.terminate()
+
+    def discard_broken(self, future: Future) -> None:
+        """Retira el pool de ``future`` si un worker murió para no reutilizarlo."""
+
+        with self._lock:
+            pool = self._pools_by_future.get(future)
+            if pool is not None:
+                self._retire(pool)
+
+    def close(self) -> None:
+        """Deja de aceptar trabajo y cierra los pools cuando acaba el que ya corre."""
+
+        with self._lock:
+            self._closed = True
+            executor, self._executor = self._executor, None
+            pool = self._process_pool
+            if pool is not None:
+                self._retire(pool)
+            drained = self._take_drained(pool)
+
+        if executor is not None:
+            executor.shutdown(wait=False)
+        if drained:
+            pool.terminate()
+
+    def shutdown(self) -> None:
+        """Cierra los pools; los retirados se terminan aunque aún corran trabajo abandonado."""
+
+        with self._lock:
+            executor, self._executor = self._executor, None
+            pool, self._process_pool = self._process_pool, None
+            retired_pools, self._retired_pools = list(self._retired_pools), set()
+
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        if pool is not None:
+            pool.executor.shutdown(wait=False, cancel_futures=True)
+        for retired_pool in retired_pools:
+            retired_pool.terminate()
+
+
+class ModelExecutionBackend:
+    """Despacha handlers síncronos a pools por modelo sin bloquear el event loop.
+
+    Los handlers ``thread`` comparten el GIL pero liberan el loop mientras NumPy,
+    SciPy o CBC trabajan; los ``process`` esquivan el GIL a cambio de serializar
+    el payload. Un timeout cancela el trabajo en cola y, en procesos, retira el
+    pool del modelo y lo termina cuando acaba el resto de su trabajo; un hilo
+    ya en marcha no puede interrumpirse y sigue ocupando su plaza hasta
+    terminar.
+
+    Hay un carril por modelo; si una recarga del registro cambia su backend o
+    su concurrencia, el carril anterior se retira y se cierra al vaciarse.
+    """
+
+    def __init__(self, settings: ExecutionSettings | None = None) -> None:
+        self.settings = settings or ExecutionSettings.from_environment()
+        self._lock = Lock()
+        self._lanes: dict[str, _ModelLane] = {}
+        self._retired_lanes: set[_ModelLane] = set()
+
+    def resolve_backend(self, model: ModelDefinition) -> str:
+        if iscoroutinefunction(model.handler):
+            return "inline"
+
+        return model.execution_backend or self.settings.default_backend
+
+    def resolve_timeout(self, model: ModelDefinition) -> float | None:
+        return model.execution_timeout_seconds or self.settings.timeout_seconds
+
+    def _get_lane(self, model: ModelDefinition, backend: str) -> _ModelLane:
+        max_workers = model.max_concurrency or self.settings.max_concurrency
+        retired_lane = None
+
+        with self._lock:
+            lane = self._lanes.get(model.api_model_key)
+            if lane is not None and (lane.backend, lane.max_workers) != (backend, max_workers):
+                retired_lane, lane = lane, None
+                self._retired_lanes = {
+                    candidate for candidate in self._retired_lanes if candidate.pending
+                }
+                self._retired_lanes.add(retired_lane)
+            if lane is None:
+                lane = _ModelLane(backend, max_workers, self.settings.max_queue_depth)
+                self._lanes[model.api_model_key] = lane
+
+        if retired_lane is not None:
+            retired_lane.close()
+
+        return lane
+
+    def _submit(
+        self,
+        model: ModelDefinition,
+        backend: str,
+        payload: Any,
+    ) -> tuple[_ModelLane, Future | None]:
+        while True:
+            lane = self._get_lane(model, backend)
+            try:
+                return lane, lane.try_submit(model.handler, payload)
+            except _LaneClosedError:
+                continue
+
+    async def execute(self, model: ModelDefinition, payload: Any) -> Any:
+        backend = self.resolve_backend(model)
+
+        if backend == "inline":
+            result = model.handler(payload)
+            if isawaitable(result):
+                result = await result
+            return result
+
+        lane, future = self._submit(model, backend, payload)
+
+        if future is None:
+            raise ModelExecutionSaturatedError(model, lane.max_queue_depth)
+
+        timeout_seconds = self.resolve_timeout(model)
+
+        try:
+            result = await asyncio.wait_for(
+                asyncio.shield(asyncio.wrap_future(future)),
+                timeout=timeout_seconds,
+            )
+        except asyncio.TimeoutError as exc:
+            lane.cancel(future)
+            raise ModelExecutionTimeoutError(model, timeout_seconds) from exc
+        except asyncio.CancelledError:
+            lane.cancel(future)
+            raise
+        except BrokenProcessPool as exc:
+            lane.discard_broken(future)
+            raise ModelExecutionInterruptedError(model) from exc
+
+        if isawaitable(result):
+            result = await result
+
+        return result
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            lanes = dict(self._lanes)
+
+        return {
+            api_model_key: {
+                "backend": lane.backend,
+                "maxConcurrency": lane.max_workers,
+                "maxQueueDepth": lane.max_queue_depth,
+                "pending": lane.pending,
+            }
+            for api_model_key, lane in lanes.items()
+        }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            lanes, self._lanes = list(self._lanes.values()), {}
+            lanes.extend(self._retired_lanes)
+            self._retired_lanes = set()
+
+        for lane in lanes:
+            lane.shutdown()
+
+
+_execution_backend: ModelExecutionBackend | None = None
+_execution_backend_lock = Lock()
+
+
+def get_model_execution_backend() -> ModelExecutionBackend:
+    global _execution_backend
+
+    with _execution_backend_lock:
+        if _execution_backend is None:
+            _execution_backend = ModelExecutionBackend()
+
+        return _execution_backend
+
+
+def shutdown_model_execution_backend() -> None:
+    global _execution_backend
+
+    with _execution_backend_lock:
+        backend, _execution_backend = _execution_backend, None
+
+    if backend is not None:
+        backend.shutdown()
+
+
+__all__ = [
+    "ExecutionSettings",
+    "ModelExecutionBackend",
+    "ModelExecutionInterruptedError",
+    "ModelExecutionSaturatedError",
+    "ModelExecutionTimeoutError",
+    "get_model_execution_backend",
+    "shutdown_model_execution_backend",
+]
@@ -0,0 +1,152 @@
+"""Serialización rápida de las respuestas de ejecución de modelos.
+
+La salida de los executors es de confianza: ya cumple el contrato
+``success/message/data/error``, así que las rutas de modelos la devuelven con
+``ModelExecutionJSONResponse`` en lugar de revalidarla contra
+``ModelExecutionResponse`` y pasarla por ``jsonable_encoder`` + ``json``.
+El resultado es el mismo JSON (``None`` excluidos del sobre, ``NaN``/``inf``
+como ``null``, claves no textuales convertidas a texto), pero los arrays y
+escalares de NumPy se serializan directamente, sin ``tolist()`` previo.
+
+Se usa ``orjson`` si está instalado y, si no, ``pydantic_core.to_json``.
+"""
+
+import base64
+import gzip
+from typing import Any, Literal
+
+import numpy as np
+import pydantic_core
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depende del entorno
+    orjson = None
+
+RawOutputMode = Literal["include", "omit", "gzip"]
+
+RAW_OUTPUT_MODES: tuple[str, ...] = ("include", "omit", "gzip")
+RAW_OUTPUT_ENCODING = "gzip+base64"
+# Nivel 1: casi la misma reducción que el 9 en una décima parte del tiempo.
+RAW_OUTPUT_GZIP_LEVEL = 1
+
+_ENVELOPE_FIELDS = ("success", "message", "data", "error")
+_ORJSON_OPTIONS = (
+    orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+)
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    return jsonable_encoder(value)
+
+
+def dumps(content: Any) -> bytes:
+    """JSON compacto en UTF-8 con soporte nativo de NumPy."""
+
+    if orjson is not None:
+        try:
+            return orjson.dumps(content, default=_default, option=_ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            # Enteros de más de 64 bits u otros tipos que orjson no admite.
+            pass
+
+    return pydantic_core.to_json(content, inf_nan_mode="null", fallback=_default)
+
+
+def model_execution_envelope(result: dict[str, Any]) -> dict[str, Any]:
+    """Sobre de ``result`` tal como lo dejaba ``response_model_exclude_none``."""
+
+    envelope = {
+        field: result[field]
+        for field in _ENVELOPE_FIELDS
+        if result.get(field) is not None
+    }
+
+    error = envelope.get("error")
+    if isinstance(error, dict):
+        envelope["error"] = {
+            field: error[field]
+            for field in ("code", "field", "details")
+            if error.get(field) is not None
+        }
+
+    return envelope
+
+
+def apply_raw_output_mode(
+    envelope: dict[str, Any],
+    raw_output: RawOutputMode = "include",
+) -> dict[str, Any]:
+    """Omite o comprime ``data.rawOutput`` según lo pida el cliente.
+
+    ``gzip`` sustituye ``rawOutput`` por su JSON comprimido en base64 y añade
+    ``rawOutputEncoding``; el resto de ``data`` no cambia.
+    """
+
+    data = envelope.get("data")
+    if raw_output == "include" or not isinstance(data, dict) or "rawOutput" not in data:
+        return envelope
+
+    data = dict(data)
+    raw = data.pop("rawOutput")
+
+    if raw_output == "gzip":
+        compressed = gzip.compress(dumps(raw), compresslevel=RAW_OUTPUT_GZIP_LEVEL)
+        data["rawOutput"] = base64.b64encode(compressed).decode("ascii")
+        data["rawOutputEncoding"] = RAW_OUTPUT_ENCODING
+
+    return {**envelope, "data": data}
+
+
+def decode_raw_output(data: dict[str, Any]) -> Any:
+    """Recupera ``rawOutput`` de un ``data`` servido con ``rawOutput=gzip``."""
+
+    raw = data.get("rawOutput")
+    if data.get("rawOutputEncoding") != RAW_OUTPUT_ENCODING:
+        return raw
+
+    return pydantic_core.from_json(gzip.decompress(base64.b64decode(raw)))
+
+
+class ModelExecutionJSONResponse(JSONResponse):
+    """``JSONResponse`` que serializa con :func:`dumps`."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def model_execution_response(
+    result: dict[str, Any] | JSONResponse,
+    raw_output: RawOutputMode = "include",
+) -> JSONResponse:
+    """Respuesta HTTP para la salida de un handler, sin revalidarla.
+
+    Los ``JSONResponse`` que ya construyen los handlers (errores) se devuelven
+    tal cual.
+    """
+
+    if isinstance(result, JSONResponse):
+        return result
+
+    return ModelExecutionJSONResponse(
+        apply_raw_output_mode(model_execution_envelope(result), raw_output)
+    )
+
+
+__all__ = [
+    "RAW_OUTPUT_ENCODING",
+    "RAW_OUTPUT_MODES",
+    "ModelExecutionJSONResponse",
+    "RawOutputMode",
+    "apply_raw_output_mode",
+    "decode_raw_output",
+    "dumps",
+    "model_execution_envelope",
+    "model_execution_response",
+]
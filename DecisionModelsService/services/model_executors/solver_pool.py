@@ -0,0 +1,114 @@
+"""Pool de procesos compartido para subproblemas independientes dentro de un modelo.
+
+Algunos modelos resuelven un problema por experto (p. ej. la optimización de
+BWM) y esos problemas no comparten estado. ``map_solver_tasks`` los reparte en
+un ``ProcessPoolExecutor`` común a todos los modelos, dimensionado con
+``DECISION_MODELS_SOLVER_WORKERS`` (``0`` o ``1`` resuelven en serie).
+
+Dentro de un proceso hijo (backend ``process`` o el propio pool) las tareas se
+resuelven siempre en serie para no anidar pools.
+
+Los workers arrancan con ``forkserver`` (``spawn`` donde no existe) y no con
+``fork``: el servidor es multihilo (threadpool de uvicorn, warm-up, locks de
+cachés) y un ``fork`` puede clonar un lock tomado por otro hilo y bloquear al
+hijo.
+"""
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import parent_process
+from multiprocessing.context import BaseContext
+from threading import Lock
+from typing import Any, Callable, TypeVar
+
+from core.environment import get_int_setting
+
+DEFAULT_SOLVER_WORKERS = min(4, os.cpu_count() or 1)
+
+Task = TypeVar("Task")
+
+
+def get_solver_workers() -> int:
+    """Procesos del pool; ``1`` si se resuelve en serie en este proceso."""
+
+    if parent_process() is not None:
+        return 1
+
+    return max(
+        get_int_setting("DECISION_MODELS_SOLVER_WORKERS", DEFAULT_SOLVER_WORKERS, minimum=0),
+        1,
+    )
+
+
+def get_process_context() -> BaseContext:
+    """Contexto de arranque de los pools de procesos del servicio."""
+
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+
+    return multiprocessing.get_context("spawn")
+
+
+_solver_pool: ProcessPoolExecutor | None = None
+_solver_pool_workers = 0
+_solver_pool_lock = Lock()
+
+
+def _get_solver_pool(workers: int) -> ProcessPoolExecutor:
+    global _solver_pool, _solver_pool_workers
+
+    with _solver_pool_lock:
+        if _solver_pool is None or _solver_pool_workers != workers:
+            if _solver_pool is not None:
+                _solver_pool.shutdown(wait=False, cancel_futures=True)
+            _solver_pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=get_process_context(),
+            )
+            _solver_pool_workers = workers
+
+        return _solver_pool
+
+
+def map_solver_tasks(
+    function: Callable[[Task], Any],
+    tasks: list[Task],
+) -> tuple[list[Any], int]:
+    """Aplica ``function`` a cada tarea conservando el orden.
+
+    ``function`` y las tareas deben poder serializarse con ``pickle``. Devuelve
+    los resultados y el tamaño del pool que las resolvió (``1`` en serie); si
+    el pool se rompe (un worker muere) se descarta y las tareas se resuelven
+    en serie.
+    """
+
+    workers = get_solver_workers()
+    if workers <= 1 or len(tasks) <= 1:
+        return [function(task) for task in tasks], 1
+
+    try:
+        return list(_get_solver_pool(workers).map(function, tasks)), workers
+    except BrokenProcessPool:
+        shutdown_solver_pool()
+        return [function(task) for task in tasks], 1
+
+
+def shutdown_solver_pool() -> None:
+    global _solver_pool, _solver_pool_workers
+
+    with _solver_pool_lock:
+        pool, _solver_pool, _solver_pool_workers = _solver_pool, None, 0
+
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+__all__ = [
+    "DEFAULT_SOLVER_WORKERS",
+    "get_process_context",
+    "get_solver_workers",
+    "map_solver_tasks",
+    "shutdown_solver_pool",
+]
@@ -0,0 +1,186 @@
+"""Warm-up opcional de executors y el informe de arranque por paquete de modelo.
+
+Los modelos declaran sus handlers con ``lazy_handler``, así que el arranque
+solo carga los ``definition.py``. ``DECISION_MODELS_WARMUP`` (``all`` o una
+lista de ``apiModelKey`` separada por comas) importa en segundo plano, tras el
+arranque, los executors indicados para que su primera petición no pague la
+importación de pyDecision, scikit-learn, SciPy o matplotlib.
+"""
+
+from threading import Event, Lock, Thread
+from time import perf_counter
+from typing import Any
+
+from core.environment import get_str_setting
+from registry.lazy_handler import LazyHandler
+from registry.model_registry import get_model_definitions, get_model_package_load_report
+
+WARMUP_ALL = "all"
+
+
+def get_warmup_selection() -> tuple[str, ...]:
+    """``("all",)``, las claves pedidas o ``()`` si el warm-up está desactivado."""
+
+    value = get_str_setting("DECISION_MODELS_WARMUP", "")
+    keys = tuple(key.strip() for key in value.split(",") if key.strip())
+
+    if WARMUP_ALL in keys or "*" in keys:
+        return (WARMUP_ALL,)
+    return keys
+
+
+def _milliseconds(seconds: float | None) -> float | None:
+    return round(seconds * 1000, 3) if seconds is not None else None
+
+
+class ModelWarmup:
+    """Importa los executors seleccionados en un hilo de fondo, uno detrás de otro."""
+
+    def __init__(self, selection: tuple[str, ...]) -> None:
+        self.selection = selection
+        self._lock = Lock()
+        self._stop = Event()
+        self._thread: Thread | None = None
+        self._results: dict[str, dict[str, Any]] = {}
+        self._started_at: float | None = None
+        self._finished_seconds: float | None = None
+
+    @property
+    def status(self) -> str:
+        if not self.selection:
+            return "disabled"
+        if self._thread is None:
+            return "pending"
+        if self._finished_seconds is None:
+            return "running"
+        return "completed"
+
+    def start(self) -> None:
+        if not self.selection or self._thread is not None:
+            return
+
+        self._started_at = perf_counter()
+        self._thread = Thread(target=self._run, name="decision-model-warmup", daemon=True)
+        self._thread.start()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        if self._thread is not None:
+            self._thread.join(timeout)
+        return self.status in {"completed", "disabled"}
+
+    def stop(self) -> None:
+        # Una importación en curso no puede interrumpirse; solo se evita la siguiente.
+        self._stop.set()
+
+    def _run(self) -> None:
+        selected = set(self.selection)
+        for model in get_model_definitions(strict=False):
+            if self._stop.is_set():
+                break
+            if WARMUP_ALL not in selected and model.api_model_key not in selected:
+                continue
+
+            started = perf_counter()
+            try:
+                if isinstance(model.handler, LazyHandler):
+                    model.handler.resolve()
+                result = {"status": "ready", "error": None}
+            except Exception as error:
+                result = {"status": "failed", "error": str(error)}
+
+            result["warmupMs"] = _milliseconds(perf_counter() - started)
+            with self._lock:
+                self._results[model.api_model_key] = result
+
+        self._finished_seconds = perf_counter() - self._started_at
+
+    def results(self) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            return dict(self._results)
+
+    def report(self) -> dict[str, Any]:
+        return {
+            "selection": list(self.selection),
+            "status": self.status,
+            "durationMs": _milliseconds(self._finished_seconds),
+        }
+
+
+def _handler_report(handler: Any) -> dict[str, Any]:
+    if isinstance(handler, LazyHandler):
+        return {
+            "handlerLazy": True,
+            "handlerImported": handler.is_resolved,
+            "handlerImportMs": _milliseconds(handler.import_seconds),
+        }
+
+    return {"handlerLazy": False, "handlerImported": True, "handlerImportMs": None}
+
+
+def build_startup_report(warmup: "ModelWarmup | None" = None) -> dict[str, Any]:
+    """Tiempos de carga por paquete de modelo, estado de sus executors y del warm-up."""
+
+    warmup = warmup or get_model_warmup()
+    definitions = {
+        model.api_model_key: model for model in get_model_definitions(strict=False)
+    }
+    warmup_results = warmup.results()
+    packages = []
+
+    for entry in get_model_package_load_report():
+        model = definitions.get(entry["apiModelKey"])
+        handler = _handler_report(model.handler) if model is not None else {}
+        packages.append(
+            {
+                **entry,
+                **handler,
+                "warmup": warmup_results.get(entry["apiModelKey"]),
+            }
+        )
+
+    return {
+        "definitionsLoadMs": round(
+            sum(entry["definitionLoadMs"] or 0.0 for entry in packages),
+            3,
+        ),
+        "warmup": warmup.report(),
+        "packages": packages,
+    }
+
+
+_model_warmup: ModelWarmup | None = None
+_model_warmup_lock = Lock()
+
+
+def get_model_warmup() -> ModelWarmup:
+    global _model_warmup
+
+    with _model_warmup_lock:
+        if _model_warmup is None:
+            _model_warmup = ModelWarmup(get_warmup_selection())
+
+        return _model_warmup
+
+
+def start_model_warmup() -> None:
+    get_model_warmup().start()
+
+
+def shutdown_model_warmup() -> None:
+    global _model_warmup
+
+    with _model_warmup_lock:
+        warmup, _model_warmup = _model_warmup, None
+
+    if warmup is not None:
+        warmup.stop()
+
+
+__all__ = [
+    "ModelWarmup",
+    "build_startup_report",
+    "get_model_warmup",
+    "get_warmup_selection",
+    "shutdown_model_warmup",
+    "start_model_warmup",
+]
@@ -1,10 +1,22 @@
-"""Construcción del manifest público de modelos."""
-
+"""Construcción del manifest público de modelos.
+
+El backend consulta el manifest de forma periódica, así que
+``get_serialized_model_manifest`` lo construye una sola vez por snapshot del
+registro (cada vez que cambia una definición el registro devuelve una tupla
+nueva) y guarda la respuesta ya serializada junto con su ETag fuerte.
+"""
+
+import json
+from dataclasses import dataclass
+from hashlib import sha256
+from threading import Lock
 from typing import Any
 
 from registry.model_definition import ModelDefinition
 from registry.model_registry import get_model_definitions
 
+MANIFEST_MESSAGE = "Model manifest fetched successfully"
+
 
 def _build_supported_expression_domains(model: ModelDefinition) -> list[dict[str, Any]]:
     """Normaliza el contrato público de dominios de expresión soportados."""
@@ -55,10 +67,18 @@ def _get_response_example(model: ModelDefinition) -> dict[str, Any] | None:
     return success_value if isinstance(success_value, dict) else None
 
 
-def _build_manifest_entry(model: ModelDefinition) -> dict[str, Any]:
-    """Convierte una definición de modelo al formato público canónico del manifest."""
+def _build_manifest_entry(
+    model: ModelDefinition,
+    *,
+    include_examples: bool = True,
+) -> dict[str, Any]:
+    """Convierte una definición de modelo al formato público canónico del manifest.
 
-    return {
+    Sin ``include_examples`` se omiten los ejemplos de request y response, que
+    son la mayor parte del tamaño de cada entrada.
+    """
+
+    entry = {
         "apiModelKey": model.api_model_key,
         "displayName": model.display_name,
         "modelKind": model.model_kind,
@@ -92,13 +112,80 @@ def _build_manifest_entry(model: ModelDefinition) -> dict[str, Any]:
         },
     }
 
+    if not include_examples:
+        del entry["request"]["example"]
+        del entry["response"]["example"]
 
-def build_model_manifest() -> dict[str, Any]:
+    return entry
+
+
+def build_model_manifest(
+    definitions: tuple[ModelDefinition, ...] | None = None,
+    *,
+    include_examples: bool = True,
+) -> dict[str, Any]:
     """Construye el manifest read-only desde las definiciones de DecisionModelsService."""
 
+    if definitions is None:
+        definitions = get_model_definitions(strict=False)
+
     return {
         "models": [
-            _build_manifest_entry(model)
-            for model in get_model_definitions(strict=False)
+            _build_manifest_entry(model, include_examples=include_examples)
+            for model in definitions
         ],
     }
+
+
+@dataclass(frozen=True)
+class SerializedModelManifest:
+    """Respuesta completa del manifest ya serializada y su ETag fuerte."""
+
+    body: bytes
+    etag: str
+
+
+def _serialize_manifest(manifest: dict[str, Any]) -> SerializedModelManifest:
+    body = json.dumps(
+        {"success": True, "message": MANIFEST_MESSAGE, "data": manifest},
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+    return SerializedModelManifest(body=body, etag=f'"{sha256(body).hexdigest()[:32]}"')
+
+
+_manifest_lock = Lock()
+_manifest_source: tuple[ModelDefinition, ...] | None = None
+_manifest_cache: dict[bool, SerializedModelManifest] = {}
+
+
+def get_serialized_model_manifest(*, include_examples: bool = True) -> SerializedModelManifest:
+    """Manifest serializado del snapshot actual del registro, construido una vez por variante."""
+
+    global _manifest_source
+
+    definitions = get_model_definitions(strict=False)
+
+    with _manifest_lock:
+        if definitions is not _manifest_source:
+            _manifest_cache.clear()
+            _manifest_source = definitions
+
+        cached = _manifest_cache.get(include_examples)
+        if cached is None:
+            cached = _serialize_manifest(
+                build_model_manifest(definitions, include_examples=include_examples)
+            )
+            _manifest_cache[include_examples] = cached
+
+        return cached
+
+
+def invalidate_model_manifest_cache() -> None:
+    global _manifest_source
+
+    with _manifest_lock:
+        _manifest_source = None
+        _manifest_cache.clear()
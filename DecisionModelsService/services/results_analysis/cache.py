@@ -0,0 +1,344 @@
+"""Caché direccionada por contenido de los resultados de Results Analysis.
+
+El contexto de análisis de un issue terminado es evidencia congelada: la misma
+proyección normalizada produce siempre el mismo resultado mientras no cambie
+el código que lo calcula. La clave combina el hash canónico del contexto
+proyectado con una huella de los ficheros fuente del paquete que analiza (y
+de los módulos del servicio que importa) y de los ajustes de entorno que
+cambian el resultado.
+"""
+
+import ast
+import hashlib
+import json
+import sys
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from importlib import import_module
+from pathlib import Path
+from threading import Lock
+from typing import Any, Callable
+
+from core.environment import get_int_setting, get_path_setting
+from services.results_analysis.views import shared_source
+
+DEFAULT_ANALYSIS_CACHE_SIZE = 128
+DEFAULT_ANALYSIS_CACHE_DISK_LIMIT_BYTES = 256 * 1024 * 1024
+
+SERVICE_ROOT = Path(__file__).resolve().parents[2]
+GENERIC_ANALYSIS_SCOPE = "generic"
+
+
+@dataclass(frozen=True)
+class AnalysisCacheSettings:
+    """Configuración de la caché, leída del entorno."""
+
+    memory_size: int = DEFAULT_ANALYSIS_CACHE_SIZE
+    disk_directory: str | None = None
+    disk_size_limit: int = DEFAULT_ANALYSIS_CACHE_DISK_LIMIT_BYTES
+
+    @classmethod
+    def from_environment(cls) -> "AnalysisCacheSettings":
+        return cls(
+            memory_size=get_int_setting(
+                "DECISION_MODELS_ANALYSIS_CACHE_SIZE",
+                DEFAULT_ANALYSIS_CACHE_SIZE,
+            ),
+            disk_directory=get_path_setting("DECISION_MODELS_ANALYSIS_CACHE_DIR"),
+            disk_size_limit=get_int_setting(
+                "DECISION_MODELS_ANALYSIS_CACHE_DISK_LIMIT_BYTES",
+                DEFAULT_ANALYSIS_CACHE_DISK_LIMIT_BYTES,
+                minimum=1024 * 1024,
+            ),
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.memory_size > 0 or self.disk_directory is not None
+
+
+def _source_files(root: Path) -> list[Path]:
+    if root.is_file():
+        return [root]
+    if root.is_dir():
+        return sorted(root.rglob("*.py"))
+    return []
+
+
+def _module_file(module_name: str) -> Path | None:
+    base = SERVICE_ROOT.joinpath(*module_name.split("."))
+    for candidate in (base.with_suffix(".py"), base / "__init__.py"):
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+@lru_cache(maxsize=1024)
+def _imported_module_names(path: Path, mtime_ns: int, size: int) -> tuple[str, ...]:
+    """Módulos que importa ``path``, resueltos a nombres absolutos."""
+
+    tree = ast.parse(path.read_bytes(), filename=str(path))
+    # Tanto ``pkg/mod.py`` como ``pkg/__init__.py`` resuelven ``.`` a ``pkg``.
+    package_parts = list(path.relative_to(SERVICE_ROOT).parts[:-1])
+
+    names: list[str] = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.level > len(package_parts) + 1:
+                continue
+            base_parts = package_parts[: len(package_parts) - node.level + 1] if node.level else []
+            module = ".".join([*base_parts, *([node.module] if node.module else [])])
+            if not module:
+                continue
+            names.append(module)
+            names.extend(f"{module}.{alias.name}" for alias in node.names)
+
+    return tuple(names)
+
+
+def _with_imported_sources(paths: list[Path]) -> list[Path]:
+    """Cierre transitivo de ``paths`` sobre los módulos del propio servicio."""
+
+    pending = list(paths)
+    seen: set[Path] = set()
+    while pending:
+        path = pending.pop()
+        if path in seen:
+            continue
+        seen.add(path)
+
+        stat = path.stat()
+        for module_name in _imported_module_names(path, stat.st_mtime_ns, stat.st_size):
+            module_path = _module_file(module_name)
+            if module_path is not None and module_path not in seen:
+                pending.append(module_path)
+
+    return sorted(seen)
+
+
+def _analysis_settings(api_model_key: str) -> dict[str, Any]:
+    """Ajustes de entorno efectivos que declara ``models.<key>.analysis``.
+
+    Un paquete de análisis puede exponer ``analysis_settings()``; el módulo se
+    importa una vez por proceso (sin recargar), también en los aciertos.
+    """
+
+    module_path = f"models.{api_model_key}.analysis"
+    module = sys.modules.get(module_path)
+    if module is None:
+        try:
+            module = import_module(module_path)
+        except ModuleNotFoundError as error:
+            if error.name in {module_path, f"models.{api_model_key}"}:
+                return {}
+            raise
+
+    settings = getattr(module, "analysis_settings", None)
+    return settings() if callable(settings) else {}
+
+
+def analysis_package_version(api_model_key: str | None = None) -> str:
+    """Huella (ruta, tamaño, mtime) del código que produce un análisis.
+
+    Para el análisis genérico cubre ``services/results_analysis``; para un
+    modelo, su paquete ``models/<api_model_key>``, los módulos ``shared_*``
+    que reutiliza, el contrato de normalización y el ensamblado por partes.
+    En ambos casos se añaden los módulos del servicio (``utils``,
+    ``services``, ``core``...) que esos ficheros importan, y para un modelo
+    también los ajustes de ``analysis_settings()``.
+    """
+
+    settings: dict[str, Any] = {}
+    if api_model_key is None:
+        roots = [SERVICE_ROOT / "services" / "results_analysis"]
+    else:
+        is_package_key = api_model_key.isidentifier()
+        roots = [
+            *([SERVICE_ROOT / "models" / api_model_key] if is_package_key else []),
+            *sorted((SERVICE_ROOT / "models").glob("shared_*.py")),
+            SERVICE_ROOT / "services" / "results_analysis" / "contracts.py",
+            SERVICE_ROOT / "services" / "results_analysis" / "streaming.py",
+        ]
+        if is_package_key:
+            settings = _analysis_settings(api_model_key)
+
+    sources = _with_imported_sources([path for root in roots for path in _source_files(root)])
+
+    digest = hashlib.sha256(str(api_model_key or GENERIC_ANALYSIS_SCOPE).encode("utf-8"))
+    for path in sources:
+        stat = path.stat()
+        relative_path = path.relative_to(SERVICE_ROOT).as_posix()
+        digest.update(f"{relative_path}:{stat.st_size}:{stat.st_mtime_ns}\n".encode("utf-8"))
+    digest.update(json.dumps(settings, sort_keys=True, default=str).encode("utf-8"))
+
+    return digest.hexdigest()[:16]
+
+
+def analysis_cache_key(*, scope: str, version: str, context: dict) -> str:
+    """SHA-256 del contexto normalizado serializado de forma canónica."""
+
+    canonical = json.dumps(
+        {"scope": scope, "version": version, "context": shared_source(context)},
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class AnalysisResultCache:
+    """LRU acotado en memoria con un nivel opcional en disco (``diskcache``)."""
+
+    def __init__(self, settings: AnalysisCacheSettings) -> None:
+        self.settings = settings
+        self._lock = Lock()
+        self._memory: OrderedDict[str, Any] = OrderedDict()
+        self._disk = None
+        self._hits = {"memory": 0, "disk": 0}
+        self._misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.settings.enabled
+
+    def _get_disk(self):
+        if self.settings.disk_directory is None:
+            return None
+
+        if self._disk is None:
+            from diskcache import Cache
+
+            self._disk = Cache(
+                self.settings.disk_directory,
+                size_limit=self.settings.disk_size_limit,
+                eviction_policy="least-recently-used",
+            )
+
+        return self._disk
+
+    def _remember(self, key: str, value: Any) -> None:
+        if self.settings.memory_size <= 0:
+            return
+
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.settings.memory_size:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str) -> tuple[Any, str] | None:
+        """Devuelve ``(valor, nivel)`` o ``None``; un acierto en disco sube a memoria."""
+
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self._hits["memory"] += 1
+                return self._memory[key], "memory"
+
+            disk = self._get_disk()
+            value = None if disk is None else disk.get(key)
+            if value is None:
+                self._misses += 1
+                return None
+
+            self._hits["disk"] += 1
+            self._remember(key, value)
+            return value, "disk"
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._remember(key, value)
+            disk = self._get_disk()
+            if disk is not None:
+                disk.set(key, value)
+
+    def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Any],
+        *,
+        refresh: bool = False,
+    ) -> tuple[Any, str, str | None]:
+        """Devuelve ``(resultado, estado, nivel)`` con estado ``hit``, ``miss`` o ``bypass``.
+
+        ``refresh`` recalcula y sobrescribe la entrada; los resultados ``None``
+        (modelo sin análisis de issue) no se guardan.
+        """
+
+        if not self.enabled:
+            return compute(), "bypass", None
+
+        if not refresh:
+            cached = self.get(key)
+            if cached is not None:
+                return cached[0], "hit", cached[1]
+
+        result = compute()
+        if result is not None:
+            self.set(key, result)
+
+        return result, "bypass" if refresh else "miss", None
+
+    def purge(self) -> dict[str, int]:
+        with self._lock:
+            memory_entries = len(self._memory)
+            self._memory.clear()
+            disk = self._get_disk()
+            disk_entries = 0 if disk is None else disk.clear()
+
+        return {"memoryEntries": memory_entries, "diskEntries": disk_entries}
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "memoryEntries": len(self._memory),
+                "memoryMaxEntries": self.settings.memory_size,
+                "diskEnabled": self.settings.disk_directory is not None,
+                "memoryHits": self._hits["memory"],
+                "diskHits": self._hits["disk"],
+                "misses": self._misses,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            disk, self._disk = self._disk, None
+
+        if disk is not None:
+            disk.close()
+
+
+_analysis_result_cache: AnalysisResultCache | None = None
+_analysis_result_cache_lock = Lock()
+
+
+def get_analysis_result_cache() -> AnalysisResultCache:
+    global _analysis_result_cache
+
+    with _analysis_result_cache_lock:
+        if _analysis_result_cache is None:
+            _analysis_result_cache = AnalysisResultCache(AnalysisCacheSettings.from_environment())
+
+        return _analysis_result_cache
+
+
+def shutdown_analysis_result_cache() -> None:
+    global _analysis_result_cache
+
+    with _analysis_result_cache_lock:
+        cache, _analysis_result_cache = _analysis_result_cache, None
+
+    if cache is not None:
+        cache.close()
+
+
+__all__ = [
+    "AnalysisCacheSettings",
+    "AnalysisResultCache",
+    "analysis_cache_key",
+    "analysis_package_version",
+    "get_analysis_result_cache",
+    "shutdown_analysis_result_cache",
+]
@@ -1,4 +1,4 @@
-from copy import deepcopy
+from services.results_analysis.views import read_only
 
 
 def _selected_execution(round_entry: dict) -> dict:
@@ -22,7 +22,7 @@ def build_generic_round_context(analysis_context: dict, round_entry: dict) -> di
     ]
     start = round_entry.get("start")
 
-    return deepcopy(
+    return read_only(
         {
             "phase": round_entry["phase"],
             "participants": start.get("participants") if start else None,
@@ -53,7 +53,7 @@ def _executed_rounds(analysis_context: dict) -> list[dict]:
 def build_generic_issue_context(analysis_context: dict) -> dict:
     """Project the issue to information generic analysis may safely interpret."""
     issue = analysis_context["issue"]
-    return deepcopy(
+    return read_only(
         {
             "issue": {
                 "id": issue["id"],
@@ -75,7 +75,7 @@ def build_generic_issue_context(analysis_context: dict) -> dict:
 def build_model_round_context(analysis_context: dict, round_entry: dict) -> dict:
     """Provide an executed round's exact mathematical input to its own model."""
     execution = _selected_execution(round_entry)
-    return deepcopy(
+    return read_only(
         {
             "phase": round_entry["phase"],
             "issue": analysis_context["issue"],
@@ -89,7 +89,7 @@ def build_model_round_context(analysis_context: dict, round_entry: dict) -> dict
 
 def build_model_issue_context(analysis_context: dict) -> dict:
     """Provide issue-level frozen data and exact executed-round evidence to a model."""
-    return deepcopy(
+    return read_only(
         {
             "issue": analysis_context["issue"],
             "decisionSpace": analysis_context["decisionSpace"],
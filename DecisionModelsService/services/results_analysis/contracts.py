@@ -9,7 +9,7 @@ def normalize_analysis_result(value):
     if not isinstance(value, dict):
         raise TypeError("Analysis result must be a dict or None")
 
-    allowed_fields = {"facts", "interpretation", "visualizations", "sections"}
+    allowed_fields = {"facts", "interpretation", "visualizations", "sections", "metadata"}
     unexpected_fields = set(value) - allowed_fields
     if unexpected_fields:
         raise ValueError(
@@ -25,5 +25,7 @@ def normalize_analysis_result(value):
         raise TypeError("Analysis result visualizations must be a list")
     if "sections" in value and not isinstance(value["sections"], list):
         raise TypeError("Analysis result sections must be a list")
+    if "metadata" in value and not isinstance(value["metadata"], dict):
+        raise TypeError("Analysis result metadata must be a dict")
 
     return deepcopy(value)
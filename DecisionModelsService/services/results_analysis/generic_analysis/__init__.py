@@ -1,3 +1,3 @@
-from .analysis import analyze_issue, analyze_round
+from .analysis import analyze_issue, analyze_round, stream_issue
 
-__all__ = ["analyze_issue", "analyze_round"]
+__all__ = ["analyze_issue", "analyze_round", "stream_issue"]
@@ -1,4 +1,5 @@
 from services.results_analysis.contracts import normalize_analysis_result
+from services.results_analysis.streaming import assemble_analysis
 
 from .alternative_relationships import alternative_relationships
 from .common import attempt_summary, fmt, ranking
@@ -190,8 +191,8 @@ def _visualizations(facts):
     return result
 
 
-def analyze_issue(context):
-    """Analyze a completed issue without interpreting model-specific semantics."""
+def stream_issue(context):
+    """Yield the issue analysis as ``(path, value)`` parts: facts, interpretation, visualizations."""
     issue = context.get("issue") or {}
     rounds = _executed_rounds(context)
     rankings = rankings_by_phase(context, rounds)
@@ -241,10 +242,11 @@ def analyze_issue(context):
         participants,
     )
 
-    return normalize_analysis_result(
-        {
-            "facts": facts,
-            "interpretation": build_issue_interpretation(facts),
-            "visualizations": _visualizations(facts),
-        }
-    )
+    yield ("facts",), facts
+    yield ("interpretation",), build_issue_interpretation(facts)
+    yield ("visualizations",), _visualizations(facts)
+
+
+def analyze_issue(context):
+    """Analyze a completed issue without interpreting model-specific semantics."""
+    return normalize_analysis_result(assemble_analysis(stream_issue(context)))
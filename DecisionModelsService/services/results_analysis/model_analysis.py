@@ -3,7 +3,11 @@ import sys
 
 
 def load_model_analysis_handlers(api_model_key: str):
-    """Load optional ``models.<api_model_key>.analysis`` handlers when present."""
+    """Load optional ``models.<api_model_key>.analysis`` handlers when present.
+
+    ``stream_issue`` is an optional generator of ``(path, value)`` parts that
+    assemble into the ``analyze_issue`` document, used by streaming requests.
+    """
     invalidate_caches()
     module_path = f"models.{api_model_key}.analysis"
     model_package_path = f"models.{api_model_key}"
@@ -20,7 +24,7 @@ def load_model_analysis_handlers(api_model_key: str):
         raise
 
     handlers = {}
-    for name in ("analyze_round", "analyze_issue"):
+    for name in ("analyze_round", "analyze_issue", "stream_issue"):
         if not hasattr(module, name):
             continue
         handler = getattr(module, name)
@@ -0,0 +1,152 @@
+"""Emisión progresiva de Results Analysis como NDJSON o Server-Sent Events.
+
+Un análisis en streaming es una secuencia de partes ``(path, value)``: cada
+parte fija ``value`` en la ruta ``path`` del documento final, en orden. Al
+aplicar todas las partes se obtiene exactamente el documento que devuelve la
+respuesta JSON no streaming. Cada parte se emite en cuanto se calcula y la
+última línea es ``complete`` (o ``error`` si el análisis falla a mitad).
+"""
+
+import json
+from typing import Any, Callable, Iterable, Iterator
+
+from services.results_analysis.contracts import normalize_analysis_result
+
+AnalysisPart = tuple[tuple[str, ...], Any]
+
+STREAM_MEDIA_TYPES = {
+    "application/x-ndjson": "ndjson",
+    "text/event-stream": "sse",
+}
+
+
+def requested_stream_format(accept: str | None) -> str | None:
+    """``ndjson`` o ``sse`` si la cabecera ``Accept`` pide streaming; si no, ``None``."""
+
+    for media_range in str(accept or "").split(","):
+        media_type = media_range.split(";", 1)[0].strip().lower()
+        if media_type in STREAM_MEDIA_TYPES:
+            return STREAM_MEDIA_TYPES[media_type]
+    return None
+
+
+def stream_media_type(stream_format: str) -> str:
+    return next(
+        media_type
+        for media_type, candidate in STREAM_MEDIA_TYPES.items()
+        if candidate == stream_format
+    )
+
+
+def apply_analysis_part(document: dict[str, Any], path: tuple[str, ...], value: Any) -> None:
+    *parents, key = path
+    target = document
+    for parent in parents:
+        target = target[parent]
+    target[key] = value
+
+
+def assemble_analysis(parts: Iterable[AnalysisPart]) -> dict[str, Any]:
+    document: dict[str, Any] = {}
+    for path, value in parts:
+        apply_analysis_part(document, path, value)
+    return document
+
+
+def document_parts(document: dict[str, Any] | None) -> Iterator[AnalysisPart]:
+    """Partes de un documento ya calculado (p. ej. un acierto de caché)."""
+
+    for key, value in (document or {}).items():
+        yield (key,), value
+
+
+def _encode(stream_format: str, record: dict[str, Any]) -> bytes:
+    payload = json.dumps(record, separators=(",", ":"), allow_nan=False)
+    if stream_format == "sse":
+        return f"event: {record['type']}\ndata: {payload}\n\n".encode("utf-8")
+    return (payload + "\n").encode("utf-8")
+
+
+def _error_record(
+    status_code: int,
+    message: str,
+    code: str,
+    field: str | None,
+    details: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    return {
+        "type": "error",
+        "statusCode": status_code,
+        "response": {
+            "success": False,
+            "message": message,
+            "data": None,
+            "error": {"code": code, "field": field, "details": details},
+        },
+    }
+
+
+def stream_analysis(
+    parts: Iterator[AnalysisPart],
+    *,
+    stream_format: str,
+    message: str,
+    on_complete: Callable[[dict[str, Any] | None], None] | None = None,
+) -> Iterator[bytes]:
+    """Codifica las partes según se producen y cierra con ``complete``.
+
+    El documento ensamblado se valida con ``normalize_analysis_result`` antes
+    de ``complete`` y se entrega a ``on_complete`` (la caché). Cualquier fallo
+    a mitad de análisis se notifica con una línea ``error``: ``422``
+    ``ANALYSIS_CONTEXT_INVALID`` para contextos inválidos y ``500``
+    ``ANALYSIS_FAILED`` para el resto.
+    """
+
+    document: dict[str, Any] = {}
+    has_result = False
+
+    try:
+        for path, value in parts:
+            apply_analysis_part(document, path, value)
+            has_result = True
+            yield _encode(stream_format, {"type": "part", "path": list(path), "value": value})
+
+        result = normalize_analysis_result(document) if has_result else None
+    except (KeyError, TypeError, ValueError) as error:
+        yield _encode(
+            stream_format,
+            _error_record(422, str(error), "ANALYSIS_CONTEXT_INVALID", "analysisContext"),
+        )
+        return
+    except Exception as error:
+        # La respuesta 200 ya empezó: sin este registro el cliente no distingue
+        # un stream roto de uno lento.
+        yield _encode(
+            stream_format,
+            _error_record(
+                500,
+                "Results analysis failed.",
+                "ANALYSIS_FAILED",
+                None,
+                {"exceptionType": type(error).__name__},
+            ),
+        )
+        return
+
+    if on_complete is not None:
+        on_complete(result)
+
+    yield _encode(
+        stream_format,
+        {"type": "complete", "success": True, "message": message, "hasResult": has_result},
+    )
+
+
+__all__ = [
+    "apply_analysis_part",
+    "assemble_analysis",
+    "document_parts",
+    "requested_stream_format",
+    "stream_analysis",
+    "stream_media_type",
+]
@@ -0,0 +1,149 @@
+"""Vistas de solo lectura sobre el contexto de análisis ya parseado.
+
+Las proyecciones de ``contexts`` comparten los subárboles del payload en
+lugar de copiarlos. ``ReadOnlyDict`` y ``ReadOnlyList`` siguen siendo
+``dict`` y ``list`` (las validaciones ``isinstance`` y ``json`` no cambian),
+pero rechazan cualquier mutación y envuelven los contenedores anidados la
+primera vez que se accede a ellos, así que ningún análisis puede alterar el
+payload original.
+"""
+
+from copy import deepcopy
+from typing import Any
+
+READ_ONLY_MESSAGE = "Results Analysis context is read-only"
+
+
+def read_only(value: Any) -> Any:
+    """Envuelve ``dict``/``list`` en vistas de solo lectura; el resto se devuelve tal cual."""
+
+    if isinstance(value, (ReadOnlyDict, ReadOnlyList)):
+        return value
+    if isinstance(value, dict):
+        return ReadOnlyDict(value)
+    if isinstance(value, list):
+        return ReadOnlyList(value)
+    return value
+
+
+def shared_source(value: Any) -> Any:
+    """Estructura subyacente de una vista, sin copiar los subárboles no visitados.
+
+    Pensada para serializar (claves de caché) a la velocidad de ``json`` sobre
+    ``dict``/``list`` nativos; quien la reciba no debe mutarla.
+    """
+
+    if isinstance(value, ReadOnlyDict):
+        return {key: shared_source(item) for key, item in dict.items(value)}
+    if isinstance(value, ReadOnlyList):
+        return [shared_source(item) for item in list.__iter__(value)]
+    return value
+
+
+def _read_only_error(*args, **kwargs):
+    raise TypeError(READ_ONLY_MESSAGE)
+
+
+class ReadOnlyDict(dict):
+    """``dict`` inmutable cuyos valores anidados se exponen como vistas.
+
+    Solo se copia el nivel superior (referencias); el acceso por clave
+    memoriza la vista del hijo, mientras que ``items``/``values`` (y por
+    tanto ``json.dumps``) envuelven de forma transitoria.
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        value = dict.__getitem__(self, key)
+        view = read_only(value)
+        if view is not value:
+            dict.__setitem__(self, key, view)
+        return view
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def __iter__(self):
+        # Sobrescribirlo obliga a dict(view) y {**view} a pasar por __getitem__.
+        return dict.__iter__(self)
+
+    def items(self):
+        return [(key, read_only(value)) for key, value in dict.items(self)]
+
+    def values(self):
+        return [read_only(value) for value in dict.values(self)]
+
+    def copy(self):
+        return dict(self)
+
+    def __or__(self, other):
+        return dict(self) | other
+
+    def __ror__(self, other):
+        return other | dict(self)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return {key: deepcopy(value, memo) for key, value in dict.items(self)}
+
+    def __reduce__(self):
+        return (type(self), (dict(dict.items(self)),))
+
+    __setitem__ = __delitem__ = __ior__ = _read_only_error
+    clear = pop = popitem = setdefault = update = _read_only_error
+
+
+class ReadOnlyList(list):
+    """``list`` inmutable cuyos elementos anidados se exponen como vistas."""
+
+    __slots__ = ()
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ReadOnlyList(list.__getitem__(self, index))
+
+        value = list.__getitem__(self, index)
+        view = read_only(value)
+        if view is not value:
+            list.__setitem__(self, index, view)
+        return view
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def __reversed__(self):
+        for index in range(len(self) - 1, -1, -1):
+            yield self[index]
+
+    def copy(self):
+        return list(self)
+
+    def __add__(self, other):
+        return list(self) + list(other)
+
+    def __radd__(self, other):
+        return list(other) + list(self)
+
+    def __mul__(self, count):
+        return list(self) * count
+
+    __rmul__ = __mul__
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return [deepcopy(value, memo) for value in list.__iter__(self)]
+
+    def __reduce__(self):
+        return (type(self), (list(list.__iter__(self)),))
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only_error
+    append = clear = extend = insert = pop = remove = reverse = sort = _read_only_error
+
+
+__all__ = ["ReadOnlyDict", "ReadOnlyList", "read_only", "shared_source"]
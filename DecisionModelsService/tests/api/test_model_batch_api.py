@@ -0,0 +1,123 @@
+import json
+from copy import deepcopy
+
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from api.routers import models as models_router
+from core.application import create_application
+from models.topsis.examples import TOPSIS_REQUEST_EXAMPLES
+from registry.model_definition import ModelDefinition
+from services.model_executors.responses import error_response, success_response
+
+
+class FakeRequest(BaseModel):
+    answer: int
+
+
+def _handler(payload):
+    if payload.answer < 0:
+        return error_response("Negative answers are not supported", code="INTERNAL_ERROR")
+    if payload.answer == 13:
+        raise RuntimeError("unlucky")
+    return success_response("Fake model executed", {"answer": payload.answer})
+
+
+def _fake_definition() -> ModelDefinition:
+    return ModelDefinition(
+        api_model_key="fake_model",
+        api_endpoint_path="/fake/model/path",
+        request_model=FakeRequest,
+        handler=_handler,
+        display_name="Fake Model",
+        small_description="Small",
+        extended_description="Extended",
+        evaluation_structure_key="alternativeCriteriaMatrix",
+    )
+
+
+def _lines(response) -> list[dict]:
+    return [json.loads(line) for line in response.text.splitlines() if line.strip()]
+
+
+def _client(monkeypatch) -> TestClient:
+    definition = _fake_definition()
+    monkeypatch.setattr(
+        models_router,
+        "get_model_definition_by_key",
+        lambda key: definition if key == "fake_model" else None,
+    )
+    return TestClient(create_application())
+
+
+def test_batch_streams_one_envelope_per_item_and_a_summary(monkeypatch):
+    client = _client(monkeypatch)
+
+    response = client.post(
+        "/models/fake_model/batch",
+        json={"payloads": [{"answer": 1}, {"wrong": True}, {"answer": -1}, {"answer": 13}]},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = _lines(response)
+    results = {line["index"]: line for line in lines if line["type"] == "result"}
+
+    assert sorted(results) == [0, 1, 2, 3]
+    assert results[0]["statusCode"] == 200
+    assert results[0]["response"] == {
+        "success": True,
+        "message": "Fake model executed",
+        "data": {"answer": 1},
+    }
+    assert results[1]["statusCode"] == 422
+    assert results[1]["response"]["error"]["code"] == "VALIDATION_ERROR"
+    assert results[2]["response"]["success"] is False
+    assert results[2]["response"]["error"]["code"] == "INTERNAL_ERROR"
+    assert results[3]["statusCode"] == 500
+    assert results[3]["response"]["error"]["code"] == "MODEL_EXECUTION_ERROR"
+    assert lines[-1] == {
+        "type": "summary",
+        "apiModelKey": "fake_model",
+        "total": 4,
+        "succeeded": 1,
+        "failed": 3,
+    }
+
+
+def test_batch_rejects_unknown_models_and_invalid_bodies(monkeypatch):
+    client = _client(monkeypatch)
+
+    missing = client.post("/models/missing/batch", json={"payloads": [{}]})
+    assert missing.status_code == 404
+    assert missing.json()["error"]["code"] == "MODEL_NOT_FOUND"
+
+    empty = client.post("/models/fake_model/batch", json={"payloads": []})
+    assert empty.status_code == 422
+    assert empty.json()["error"]["field"] == "payloads"
+
+
+def test_batch_enforces_maximum_size(monkeypatch):
+    monkeypatch.setenv("DECISION_MODELS_MAX_BATCH_SIZE", "2")
+    client = _client(monkeypatch)
+
+    response = client.post(
+        "/models/fake_model/batch",
+        json={"payloads": [{"answer": 1}, {"answer": 2}, {"answer": 3}]},
+    )
+
+    assert response.status_code == 422
+    assert response.json()["error"]["code"] == "BATCH_TOO_LARGE"
+
+
+def test_batch_runs_registered_models_like_single_requests():
+    client = TestClient(create_application())
+    payload = deepcopy(TOPSIS_REQUEST_EXAMPLES["basic_numeric_matrix"]["value"])
+
+    single = client.post("/topsis", json=payload).json()
+    response = client.post("/models/topsis/batch", json={"payloads": [payload, payload]})
+
+    results = [line for line in _lines(response) if line["type"] == "result"]
+    assert len(results) == 2
+    for line in results:
+        assert line["response"] == single
@@ -0,0 +1,275 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from api.routers import models as models_router
+from core.application import create_application
+from registry.model_definition import ModelDefinition
+from services.model_executors import execution
+from services.model_executors.execution import (
+    ExecutionSettings,
+    ModelExecutionBackend,
+    ModelExecutionInterruptedError,
+    ModelExecutionTimeoutError,
+)
+
+
+class FakeRequest(BaseModel):
+    answer: int
+
+
+def _build_fake_definition(handler, **overrides) -> ModelDefinition:
+    data = {
+        "api_model_key": "fake_model",
+        "api_endpoint_path": "/fake/model/path",
+        "request_model": FakeRequest,
+        "handler": handler,
+        "display_name": "Fake Model",
+        "small_description": "Small",
+        "extended_description": "Extended",
+        "evaluation_structure_key": "alternativeCriteriaMatrix",
+    }
+    data.update(overrides)
+    return ModelDefinition(**data)
+
+
+def _install(monkeypatch, definition, settings: ExecutionSettings) -> TestClient:
+    backend = ModelExecutionBackend(settings)
+    monkeypatch.setattr(execution, "_execution_backend", backend)
+    monkeypatch.setattr(
+        models_router,
+        "get_model_definition_by_endpoint_path",
+        lambda endpoint_path: definition if endpoint_path == "/fake/model/path" else None,
+    )
+    return TestClient(create_application())
+
+
+def test_sync_handler_runs_off_the_event_loop_thread(monkeypatch):
+    def handler(payload):
+        return {
+            "success": True,
+            "message": "ok",
+            "data": {"thread": threading.current_thread().name},
+            "error": None,
+        }
+
+    client = _install(monkeypatch, _build_fake_definition(handler), ExecutionSettings())
+
+    response = client.post("/fake/model/path", json={"answer": 1})
+
+    assert response.status_code == 200
+    assert response.json()["data"]["thread"].startswith("decision-model")
+
+
+def test_inline_backend_keeps_handler_on_request_thread(monkeypatch):
+    def handler(payload):
+        return {
+            "success": True,
+            "message": "ok",
+            "data": {"thread": threading.current_thread().name},
+            "error": None,
+        }
+
+    client = _install(
+        monkeypatch,
+        _build_fake_definition(handler, execution_backend="inline"),
+        ExecutionSettings(),
+    )
+
+    response = client.post("/fake/model/path", json={"answer": 1})
+
+    assert response.status_code == 200
+    assert not response.json()["data"]["thread"].startswith("decision-model")
+
+
+def test_saturated_model_queue_returns_503_envelope(monkeypatch):
+    release = threading.Event()
+
+    def handler(payload):
+        release.wait(5)
+        return {"success": True, "message": "ok", "data": None, "error": None}
+
+    definition = _build_fake_definition(handler, max_concurrency=1)
+    client = _install(
+        monkeypatch,
+        definition,
+        ExecutionSettings(max_queue_depth=1, timeout_seconds=10),
+    )
+    backend = execution.get_model_execution_backend()
+    blocked = backend._get_lane(definition, "thread").try_submit(handler, None)
+
+    try:
+        response = client.post("/fake/model/path", json={"answer": 1})
+    finally:
+        release.set()
+        blocked.result(timeout=5)
+
+    assert response.status_code == 503
+    payload = response.json()
+    assert payload["success"] is False
+    assert payload["data"] is None
+    assert payload["error"]["code"] == "MODEL_EXECUTION_SATURATED"
+    assert payload["error"]["details"] == {
+        "apiModelKey": "fake_model",
+        "maxQueueDepth": 1,
+    }
+
+
+def test_slow_model_returns_504_envelope(monkeypatch):
+    def handler(payload):
+        time.sleep(0.5)
+        return {"success": True, "message": "ok", "data": None, "error": None}
+
+    client = _install(
+        monkeypatch,
+        _build_fake_definition(handler, execution_timeout_seconds=0.05),
+        ExecutionSettings(),
+    )
+
+    response = client.post("/fake/model/path", json={"answer": 1})
+
+    assert response.status_code == 504
+    payload = response.json()
+    assert payload["success"] is False
+    assert payload["error"]["code"] == "MODEL_EXECUTION_TIMEOUT"
+    assert payload["error"]["details"]["apiModelKey"] == "fake_model"
+
+
+def test_queued_work_is_cancelled_on_timeout():
+    release = threading.Event()
+    calls = []
+
+    def handler(payload):
+        calls.append(payload)
+        release.wait(5)
+
+    definition = _build_fake_definition(handler, max_concurrency=1)
+    backend = ModelExecutionBackend(ExecutionSettings())
+    lane = backend._get_lane(definition, "thread")
+    running = lane.try_submit(handler, "running")
+    queued = lane.try_submit(handler, "queued")
+
+    lane.cancel(queued)
+    release.set()
+    running.result(timeout=5)
+    backend.shutdown()
+
+    assert queued.cancelled()
+    assert calls == ["running"]
+
+
+def _sleeping_handler(seconds):
+    time.sleep(seconds)
+    return {"success": True, "message": "ok", "data": {"slept": seconds}, "error": None}
+
+
+def test_process_timeout_does_not_break_other_requests_on_the_same_lane():
+    definition = _build_fake_definition(
+        _sleeping_handler,
+        execution_backend="process",
+        execution_timeout_seconds=0.3,
+        max_concurrency=2,
+    )
+    backend = ModelExecutionBackend(ExecutionSettings())
+    # Arranca los dos workers antes de medir: el timeout no debe cubrir su arranque.
+    lane = backend._get_lane(definition, "process")
+    warm_up = [lane.try_submit(_sleeping_handler, 0.2) for _ in range(2)]
+    for future in warm_up:
+        future.result(timeout=30)
+
+    async def started_later():
+        await asyncio.sleep(0.15)
+        return await backend.execute(definition, 0.25)
+
+    async def scenario():
+        # El segundo sigue en marcha cuando el primero agota su timeout (0.3 s).
+        return await asyncio.gather(
+            backend.execute(definition, 5),
+            started_later(),
+            return_exceptions=True,
+        )
+
+    try:
+        timed_out, finished = asyncio.run(scenario())
+        # El pool nuevo arranca sus workers; se espera sin el timeout del modelo.
+        after = backend._get_lane(definition, "process").try_submit(_sleeping_handler, 0)
+        after = after.result(timeout=30)
+    finally:
+        backend.shutdown()
+
+    assert isinstance(timed_out, ModelExecutionTimeoutError)
+    assert finished["data"] == {"slept": 0.25}
+    assert after["success"] is True
+
+
+def test_interrupted_process_worker_returns_503_envelope(monkeypatch):
+    def interrupted(self, model, payload):
+        raise ModelExecutionInterruptedError(model)
+
+    monkeypatch.setattr(ModelExecutionBackend, "execute", interrupted)
+    client = _install(monkeypatch, _build_fake_definition(_sleeping_handler), ExecutionSettings())
+
+    response = client.post("/fake/model/path", json={"answer": 1})
+
+    assert response.status_code == 503
+    payload = response.json()
+    assert payload["success"] is False
+    assert payload["error"]["code"] == "MODEL_EXECUTION_INTERRUPTED"
+    assert payload["error"]["details"] == {"apiModelKey": "fake_model"}
+
+
+def test_shutdown_terminates_retired_process_pools():
+    definition = _build_fake_definition(
+        _sleeping_handler,
+        execution_backend="process",
+        execution_timeout_seconds=0.2,
+        max_concurrency=2,
+    )
+    backend = ModelExecutionBackend(ExecutionSettings())
+    lane = backend._get_lane(definition, "process")
+    # Trabajo de otra petición que mantiene vivo el pool tras el timeout.
+    lane.try_submit(_sleeping_handler, 30)
+
+    try:
+        with pytest.raises(ModelExecutionTimeoutError):
+            asyncio.run(backend.execute(definition, 30))
+        retired_processes = [
+            process
+            for pool in lane._retired_pools
+            for process in (pool.executor._processes or {}).values()
+        ]
+    finally:
+        backend.shutdown()
+
+    assert retired_processes
+    for process in retired_processes:
+        process.join(timeout=5)
+        assert not process.is_alive()
+
+
+def test_reconfigured_model_retires_its_previous_lane():
+    definition = _build_fake_definition(_sleeping_handler, max_concurrency=2)
+    resized = _build_fake_definition(_sleeping_handler, max_concurrency=3)
+    backend = ModelExecutionBackend(ExecutionSettings())
+    old_lane = backend._get_lane(definition, "process")
+    running = old_lane.try_submit(_sleeping_handler, 0.5)
+    old_processes = list((old_lane._process_pool.executor._processes or {}).values())
+
+    try:
+        new_lane = backend._get_lane(resized, "process")
+
+        assert new_lane is not old_lane
+        assert backend._get_lane(resized, "process") is new_lane
+        assert list(backend.stats()) == ["fake_model"]
+        assert backend.stats()["fake_model"]["maxConcurrency"] == 3
+        assert running.result(timeout=10)["data"] == {"slept": 0.5}
+        assert old_processes
+        for process in old_processes:
+            process.join(timeout=5)
+            assert not process.is_alive()
+    finally:
+        backend.shutdown()
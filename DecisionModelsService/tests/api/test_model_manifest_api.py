@@ -1,14 +1,18 @@
+import json
+
 from fastapi.testclient import TestClient
 
-from api.routers import model_manifest as model_manifest_router
 from core.application import create_application
+from registry.model_registry import get_model_definitions
+from services import model_manifest_service
+from services.model_manifest_service import build_model_manifest
 
 
 def test_get_models_manifest_returns_success_and_models_list(monkeypatch):
     monkeypatch.setattr(
-        model_manifest_router,
+        model_manifest_service,
         "build_model_manifest",
-        lambda: {"models": [{"apiModelKey": "alpha"}]},
+        lambda definitions=None, include_examples=True: {"models": [{"apiModelKey": "alpha"}]},
     )
     client = TestClient(create_application())
 
@@ -19,3 +23,77 @@ def test_get_models_manifest_returns_success_and_models_list(monkeypatch):
     assert payload["success"] is True
     assert isinstance(payload["data"]["models"], list)
     assert payload["data"]["models"] == [{"apiModelKey": "alpha"}]
+
+
+def test_manifest_is_built_once_per_registry_snapshot(monkeypatch):
+    calls = []
+    original = model_manifest_service.build_model_manifest
+
+    def counting_build(definitions=None, *, include_examples=True):
+        calls.append(include_examples)
+        return original(definitions, include_examples=include_examples)
+
+    monkeypatch.setattr(model_manifest_service, "build_model_manifest", counting_build)
+    client = TestClient(create_application())
+
+    first = client.get("/models/manifest")
+    second = client.get("/models/manifest")
+
+    assert calls == [True]
+    assert first.content == second.content
+    assert first.headers["etag"] == second.headers["etag"]
+    assert first.headers["content-type"] == "application/json"
+    assert json.loads(first.content)["data"] == build_model_manifest()
+
+
+def test_manifest_answers_not_modified_for_a_matching_etag():
+    client = TestClient(create_application())
+    etag = client.get("/models/manifest").headers["etag"]
+
+    not_modified = client.get("/models/manifest", headers={"If-None-Match": etag})
+    weak = client.get("/models/manifest", headers={"If-None-Match": f'"stale", W/{etag}'})
+    stale = client.get("/models/manifest", headers={"If-None-Match": '"stale"'})
+
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified.headers["etag"] == etag
+    assert weak.status_code == 304
+    assert stale.status_code == 200
+
+
+def test_manifest_etag_changes_with_the_registry_snapshot(monkeypatch, model_definition_factory):
+    client = TestClient(create_application())
+    etag = client.get("/models/manifest").headers["etag"]
+    definitions = (
+        *get_model_definitions(strict=False),
+        model_definition_factory(api_model_key="extra_model", api_endpoint_path="/extra_model"),
+    )
+    monkeypatch.setattr(
+        model_manifest_service,
+        "get_model_definitions",
+        lambda strict=False: definitions,
+    )
+
+    response = client.get("/models/manifest", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert response.json()["data"]["models"][-1]["apiModelKey"] == "extra_model"
+
+
+def test_slim_manifest_omits_examples_but_keeps_capabilities():
+    client = TestClient(create_application())
+
+    full_response = client.get("/models/manifest")
+    slim_response = client.get("/models/manifest?includeExamples=false")
+    full = full_response.json()["data"]["models"]
+    slim = slim_response.json()["data"]["models"]
+
+    assert len(slim_response.content) < len(full_response.content)
+    assert slim_response.headers["etag"] != full_response.headers["etag"]
+    for full_entry, slim_entry in zip(full, slim, strict=True):
+        assert slim_entry["request"] == {"contentType": "application/json"}
+        assert slim_entry["response"] == {}
+        for key in ("request", "response"):
+            del full_entry[key], slim_entry[key]
+        assert slim_entry == full_entry
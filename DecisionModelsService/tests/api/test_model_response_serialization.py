@@ -0,0 +1,150 @@
+import json
+
+import numpy as np
+from fastapi.encoders import jsonable_encoder
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from api.routers import models as models_router
+from benchmarks.response_serialization import run as run_benchmark
+from core.application import create_application
+from models.topsis.examples import TOPSIS_REQUEST_EXAMPLES
+from registry.model_definition import ModelDefinition
+from registry.model_registry import get_model_definition_by_key
+from schemas.common import ModelExecutionResponse
+from services.model_executors.serialization import (
+    RAW_OUTPUT_ENCODING,
+    decode_raw_output,
+    model_execution_response,
+)
+
+
+class FakeRequest(BaseModel):
+    answer: int
+
+
+def _handler(payload):
+    return {
+        "success": True,
+        "message": "Fake model executed",
+        "data": {
+            "answer": np.int64(payload.answer),
+            "scores": np.array([0.25, np.nan, 1.0]),
+            "columns": np.arange(6).reshape(2, 3)[:, 1],
+            "consensusMeasure": None,
+            "rawOutput": {"matrix": np.eye(2), 1: np.float32(0.5)},
+        },
+        "error": None,
+    }
+
+
+def _client(monkeypatch) -> TestClient:
+    definition = ModelDefinition(
+        api_model_key="fake_model",
+        api_endpoint_path="/fake/model/path",
+        request_model=FakeRequest,
+        handler=_handler,
+        display_name="Fake Model",
+        small_description="Small",
+        extended_description="Extended",
+        evaluation_structure_key="alternativeCriteriaMatrix",
+    )
+    monkeypatch.setattr(
+        models_router,
+        "get_model_definition_by_endpoint_path",
+        lambda path: definition if path == "/fake/model/path" else None,
+    )
+    monkeypatch.setattr(
+        models_router,
+        "get_model_definition_by_key",
+        lambda key: definition if key == "fake_model" else None,
+    )
+    return TestClient(create_application())
+
+
+def test_numpy_outputs_are_serialized_without_tolist(monkeypatch):
+    response = _client(monkeypatch).post("/fake/model/path", json={"answer": 7})
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "success": True,
+        "message": "Fake model executed",
+        "data": {
+            "answer": 7,
+            "scores": [0.25, None, 1.0],
+            "columns": [1, 4],
+            "consensusMeasure": None,
+            "rawOutput": {"matrix": [[1.0, 0.0], [0.0, 1.0]], "1": 0.5},
+        },
+    }
+
+
+def test_raw_output_can_be_omitted_or_compressed(monkeypatch):
+    client = _client(monkeypatch)
+
+    omitted = client.post("/fake/model/path?rawOutput=omit", json={"answer": 7}).json()
+    compressed = client.post("/fake/model/path?rawOutput=gzip", json={"answer": 7}).json()
+    invalid = client.post("/fake/model/path?rawOutput=zip", json={"answer": 7})
+
+    assert "rawOutput" not in omitted["data"]
+    assert omitted["data"]["columns"] == [1, 4]
+    assert compressed["data"]["rawOutputEncoding"] == RAW_OUTPUT_ENCODING
+    assert decode_raw_output(compressed["data"]) == {
+        "matrix": [[1.0, 0.0], [0.0, 1.0]],
+        "1": 0.5,
+    }
+    assert invalid.status_code == 422
+
+
+def test_batch_applies_the_raw_output_mode_to_every_item(monkeypatch):
+    response = _client(monkeypatch).post(
+        "/models/fake_model/batch?rawOutput=omit",
+        json={"payloads": [{"answer": 1}, {"answer": 2}]},
+    )
+
+    lines = [json.loads(line) for line in response.text.splitlines() if line.strip()]
+    results = [line for line in lines if line["type"] == "result"]
+
+    results.sort(key=lambda line: line["index"])
+
+    assert [line["response"]["data"]["answer"] for line in results] == [1, 2]
+    assert all("rawOutput" not in line["response"]["data"] for line in results)
+
+
+def test_fast_response_matches_the_validated_response_model():
+    model = get_model_definition_by_key("topsis")
+
+    for example in TOPSIS_REQUEST_EXAMPLES.values():
+        result = model.handler(model.request_model.model_validate(example["value"]))
+        legacy = jsonable_encoder(
+            ModelExecutionResponse.model_validate(result).model_dump(
+                mode="json",
+                exclude_none=True,
+            )
+        )
+
+        assert json.loads(model_execution_response(result).body) == legacy
+
+
+def test_error_envelopes_drop_empty_fields_like_the_response_model():
+    response = model_execution_response(
+        {
+            "success": False,
+            "message": "Failed",
+            "data": None,
+            "error": {"code": "MODEL_EXECUTION_ERROR", "field": None, "details": None},
+        }
+    )
+
+    assert json.loads(response.body) == {
+        "success": False,
+        "message": "Failed",
+        "error": {"code": "MODEL_EXECUTION_ERROR"},
+    }
+
+
+def test_response_serialization_benchmark_small_run():
+    result = run_benchmark(n_exp=3, n_alt=6, n_crit=4, repeats=1)
+
+    assert result["equal"] is True
+    assert result["omitBytes"] < result["legacyBytes"]
@@ -0,0 +1,61 @@
+from fastapi.testclient import TestClient
+
+from core.application import create_application
+from registry.model_registry import get_model_definitions
+from services.model_executors.warmup import (
+    ModelWarmup,
+    build_startup_report,
+    get_warmup_selection,
+    shutdown_model_warmup,
+)
+
+
+def test_warmup_selection_is_read_from_the_environment(monkeypatch):
+    monkeypatch.delenv("DECISION_MODELS_WARMUP", raising=False)
+    assert get_warmup_selection() == ()
+
+    monkeypatch.setenv("DECISION_MODELS_WARMUP", " topsis, BWM ,")
+    assert get_warmup_selection() == ("topsis", "bwm")
+
+    monkeypatch.setenv("DECISION_MODELS_WARMUP", "topsis,all")
+    assert get_warmup_selection() == ("all",)
+
+
+def test_warmup_imports_selected_executors_in_the_background():
+    warmup = ModelWarmup(("topsis", "unknown_model"))
+
+    assert warmup.status == "pending"
+    warmup.start()
+
+    assert warmup.wait(timeout=60)
+    assert warmup.status == "completed"
+    assert set(warmup.results()) == {"topsis"}
+    assert warmup.results()["topsis"]["status"] == "ready"
+
+    report = build_startup_report(warmup)
+    topsis = next(entry for entry in report["packages"] if entry["apiModelKey"] == "topsis")
+
+    assert report["warmup"]["status"] == "completed"
+    assert topsis["handlerImported"] is True
+    assert topsis["warmup"]["status"] == "ready"
+
+
+def test_startup_report_lists_every_model_package(monkeypatch):
+    monkeypatch.setenv("DECISION_MODELS_WARMUP", "bwm")
+    shutdown_model_warmup()
+
+    try:
+        with TestClient(create_application()) as client:
+            response = client.get("/system/startup")
+    finally:
+        shutdown_model_warmup()
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    packages = {entry["apiModelKey"]: entry for entry in data["packages"]}
+
+    assert set(packages) == {model.api_model_key for model in get_model_definitions(strict=False)}
+    assert data["warmup"]["selection"] == ["bwm"]
+    assert data["warmup"]["status"] in {"running", "completed"}
+    assert all(entry["definitionLoadMs"] is not None for entry in packages.values())
+    assert all(entry["handlerLazy"] for entry in packages.values())
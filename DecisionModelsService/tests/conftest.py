@@ -11,6 +11,22 @@ if str(SERVICE_ROOT) not in sys.path:
 
 from registry.model_definition import ModelDefinition
 from schemas.model_requests import GenericModelExecutionRequest
+from services.model_manifest_service import invalidate_model_manifest_cache
+from services.results_analysis.cache import shutdown_analysis_result_cache
+
+
+@pytest.fixture(autouse=True)
+def isolated_analysis_result_cache():
+    shutdown_analysis_result_cache()
+    yield
+    shutdown_analysis_result_cache()
+
+
+@pytest.fixture(autouse=True)
+def isolated_model_manifest_cache():
+    invalidate_model_manifest_cache()
+    yield
+    invalidate_model_manifest_cache()
 
 
 @pytest.fixture
@@ -31,9 +31,10 @@ def test_bwm_reads_selected_ids_and_preserves_criterion_order(
 ) -> None:
     captured: dict = {}
 
-    def fake_run_bwm(experts_data: dict, eps_penalty: float) -> dict:
+    def fake_run_bwm(experts_data: dict, eps_penalty: float, formulation: str) -> dict:
         captured["experts_data"] = experts_data
         captured["eps_penalty"] = eps_penalty
+        captured["formulation"] = formulation
         expert_key = next(iter(experts_data))
         return {
             "success": True,
@@ -46,6 +47,7 @@ def test_bwm_reads_selected_ids_and_preserves_criterion_order(
     result = _execute(_request_payload())
 
     assert result["success"] is True
+    assert captured["formulation"] == "nonlinear"
     assert captured["experts_data"]["ana.torres@example.com"] == {
         "mic": [1.0, 5.0, 3.0],
         "lic": [5.0, 1.0, 3.0],
@@ -0,0 +1,113 @@
+import json
+
+import numpy as np
+import pytest
+
+import models.bwm.run as bwm_run
+from models.bwm import executor
+from models.bwm.examples import BWM_REQUEST_EXAMPLES
+from schemas.model_requests import GenericModelExecutionRequest
+
+
+@pytest.fixture(autouse=True)
+def isolated_bwm_solution_cache():
+    bwm_run.clear_bwm_solution_cache()
+    yield
+    bwm_run.clear_bwm_solution_cache()
+
+
+def _experts(count: int, n_crit: int = 5, seed: int = 3) -> dict[str, dict[str, list[float]]]:
+    rng = np.random.default_rng(seed)
+    experts = {}
+    for index in range(count):
+        mic = rng.integers(2, 10, n_crit).astype(float)
+        lic = rng.integers(2, 10, n_crit).astype(float)
+        best, worst = index % n_crit, (index + 1) % n_crit
+        mic[best], lic[worst] = 1.0, 1.0
+        lic[best] = mic[worst] = 9.0
+        experts[f"expert-{index}"] = {"mic": mic.tolist(), "lic": lic.tolist()}
+    return experts
+
+
+def test_linear_bwm_recovers_consistent_weights_with_zero_xi():
+    result = bwm_run.run_bwm(
+        {"expert": {"mic": [1.0, 2.0, 4.0], "lic": [4.0, 2.0, 1.0]}},
+        formulation="linear",
+    )
+
+    assert result["success"] is True
+    assert result["expertWeights"]["expert"] == pytest.approx([4 / 7, 2 / 7, 1 / 7])
+    assert result["expertSolves"]["expert"]["xi"] == pytest.approx(0.0, abs=1e-12)
+    assert result["expertSolves"]["expert"]["consistencyRatio"] == 0.0
+
+
+def test_consistency_ratio_uses_the_closed_form_input_based_ratio():
+    ratio = bwm_run.consistency_ratio(np.array([1.0, 3.0, 5.0]), np.array([5.0, 3.0, 1.0]))
+
+    assert ratio == pytest.approx(abs(3 * 3 - 5) / (5 * 5 - 5))
+    assert bwm_run.consistency_ratio(np.array([1.0, 1.0]), np.array([1.0, 1.0])) == 0.0
+
+
+def test_repeated_inputs_are_served_from_the_solution_cache(monkeypatch):
+    calls = []
+    solve = bwm_run.solve_bwm_expert
+
+    def counting_map(function, tasks):
+        calls.append(len(tasks))
+        return [solve(task) for task in tasks], 1
+
+    monkeypatch.setattr(bwm_run, "map_solver_tasks", counting_map)
+    experts = _experts(3)
+    experts["expert-copy"] = dict(experts["expert-0"])
+
+    first = bwm_run.run_bwm(experts, formulation="linear")
+    second = bwm_run.run_bwm(experts, formulation="linear")
+
+    assert calls == [3]
+    assert first["expertSolves"]["expert-0"]["cached"] is False
+    assert first["expertSolves"]["expert-copy"]["cached"] is True
+    assert first["expertWeights"]["expert-copy"] == first["expertWeights"]["expert-0"]
+    assert all(solve["cached"] for solve in second["expertSolves"].values())
+    assert second["expertWeights"] == first["expertWeights"]
+
+
+def test_per_expert_solves_on_the_process_pool_match_serial_solves(monkeypatch):
+    experts = _experts(4)
+
+    monkeypatch.setenv("DECISION_MODELS_SOLVER_WORKERS", "1")
+    serial = bwm_run.run_bwm(experts, formulation="linear")
+    bwm_run.clear_bwm_solution_cache()
+
+    monkeypatch.setenv("DECISION_MODELS_SOLVER_WORKERS", "2")
+    pooled = bwm_run.run_bwm(experts, formulation="linear")
+
+    assert serial["solverWorkers"] == 1
+    assert pooled["solverWorkers"] == 2
+    assert pooled["expertWeights"] == serial["expertWeights"]
+    assert all(solve["solveMs"] > 0 for solve in pooled["expertSolves"].values())
+
+
+def test_linear_and_nonlinear_formulations_agree_on_consistent_judgements():
+    experts = {"expert": {"mic": [1.0, 2.0, 4.0, 8.0], "lic": [8.0, 4.0, 2.0, 1.0]}}
+
+    linear = bwm_run.run_bwm(experts, formulation="linear")
+    nonlinear = bwm_run.run_bwm(experts, formulation="nonlinear")
+
+    assert nonlinear["expertSolves"]["expert"]["xi"] is None
+    assert np.allclose(
+        linear["expertWeights"]["expert"],
+        nonlinear["expertWeights"]["expert"],
+        atol=1e-3,
+    )
+
+
+def test_executor_rejects_unknown_formulations():
+    payload = BWM_REQUEST_EXAMPLES["basic_criteria_weighting"]["value"]
+    request = GenericModelExecutionRequest.model_validate(
+        {**payload, "modelParameters": {"formulation": "quadratic"}}
+    )
+
+    body = json.loads(executor.execute_bwm(request).body)
+
+    assert body["success"] is False
+    assert body["message"].startswith("modelParameters.formulation must be one of")
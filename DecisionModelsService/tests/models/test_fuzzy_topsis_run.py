@@ -2,8 +2,10 @@ import copy
 
 import numpy as np
 import pytest
+from pyDecision.algorithm import fuzzy_topsis_method
 
 import models.fuzzy_topsis.run as fuzzy_topsis_run
+from utils.triangular_fuzzy import TriangularFuzzyArray
 
 
 def _patch_projection(monkeypatch) -> None:
@@ -14,8 +16,7 @@ def _patch_projection(monkeypatch) -> None:
     )
 
 
-def test_run_fuzzy_topsis_passes_aggregated_inputs_directly_to_pydecision(monkeypatch) -> None:
-    captured: dict[str, object] = {}
+def test_run_fuzzy_topsis_aggregates_experts_and_matches_pydecision(monkeypatch) -> None:
     matrices = {
         "expert-a": [
             [[0, 0, 0.25], [0.1, 0.3, 0.5]],
@@ -29,25 +30,12 @@ def test_run_fuzzy_topsis_passes_aggregated_inputs_directly_to_pydecision(monkey
     original_matrices = copy.deepcopy(matrices)
     directions = ["max", "min"]
     original_directions = list(directions)
-
-    def fake_fuzzy_topsis_method(*, dataset, weights, criterion_type, graph, verbose):
-        captured["dataset"] = dataset
-        captured["weights"] = weights
-        captured["criterion_type"] = criterion_type
-        captured["graph"] = graph
-        captured["verbose"] = verbose
-        return np.array([0.2, 0.8])
-
-    monkeypatch.setattr(
-        fuzzy_topsis_run,
-        "fuzzy_topsis_method",
-        fake_fuzzy_topsis_method,
-    )
+    weights = [[0.4, 0.5, 0.6], [0.2, 0.3, 0.4]]
     _patch_projection(monkeypatch)
 
     result = fuzzy_topsis_run.run_fuzzy_topsis(
         matrices=matrices,
-        weights=[[0.4, 0.5, 0.6], [0.2, 0.3, 0.4]],
+        weights=weights,
         criterion_type=directions,
     )
 
@@ -55,17 +43,62 @@ def test_run_fuzzy_topsis_passes_aggregated_inputs_directly_to_pydecision(monkey
         [(0.0, 0.0, 0.25), (0.1, 0.3, 0.5)],
         [(0.25, 0.5, 0.75), (0.3, 0.5, 0.7)],
     ]
-    assert captured == {
-        "dataset": expected_matrix,
-        "weights": [[(0.4, 0.5, 0.6), (0.2, 0.3, 0.4)]],
-        "criterion_type": directions,
-        "graph": False,
-        "verbose": False,
-    }
-    assert captured["criterion_type"] is directions
+    expected_scores = fuzzy_topsis_method(
+        dataset=expected_matrix,
+        weights=[[tuple(weight) for weight in weights]],
+        criterion_type=directions,
+        graph=False,
+        verbose=False,
+    )
+    assert result["collective_matrix"] == expected_matrix
+    assert result["collective_scores"] == pytest.approx(expected_scores.tolist(), abs=1e-12)
     assert matrices == original_matrices
     assert directions == original_directions
-    assert result["collective_matrix"] == expected_matrix
+
+
+@pytest.mark.parametrize("n_alt,n_crit", [(2, 1), (4, 3), (25, 9)])
+def test_fuzzy_topsis_kernel_matches_pydecision(n_alt, n_crit) -> None:
+    rng = np.random.default_rng(n_alt * n_crit)
+    collective = np.sort(rng.uniform(0.05, 1.0, (n_alt, n_crit, 3)), axis=-1)
+    weights = np.sort(rng.uniform(0.0, 1.0, (n_crit, 3)), axis=-1)
+    directions = ["min" if index % 3 == 1 else "max" for index in range(n_crit)]
+
+    expected = fuzzy_topsis_method(
+        dataset=[[tuple(cell) for cell in row] for row in collective.tolist()],
+        weights=[[tuple(weight) for weight in weights.tolist()]],
+        criterion_type=directions,
+        graph=False,
+        verbose=False,
+    )
+    scores = fuzzy_topsis_run.fuzzy_topsis_scores(
+        TriangularFuzzyArray(collective),
+        TriangularFuzzyArray(weights),
+        directions,
+    )
+
+    np.testing.assert_allclose(scores, expected, rtol=1e-12, atol=1e-12)
+
+
+def test_run_fuzzy_topsis_reports_the_first_invalid_expert_cell() -> None:
+    matrices = {
+        "expert-a": [[[0.1, 0.2, 0.3]]],
+        "expert-b": [[[0.3, 0.2, 0.1]]],
+    }
+
+    with pytest.raises(ValueError, match=r"matrices\['expert-b'\]\[0\]\[0\] must be an ordered"):
+        fuzzy_topsis_run.run_fuzzy_topsis(
+            matrices=matrices,
+            weights=[[0.4, 0.5, 0.6]],
+            criterion_type=["max"],
+        )
+
+    matrices["expert-b"] = [[0.3]]
+    with pytest.raises(ValueError, match=r"matrices\['expert-b'\]\[0\]\[0\] received float"):
+        fuzzy_topsis_run.run_fuzzy_topsis(
+            matrices=matrices,
+            weights=[[0.4, 0.5, 0.6]],
+            criterion_type=["max"],
+        )
 
 
 @pytest.mark.parametrize(
@@ -85,15 +118,15 @@ def test_run_fuzzy_topsis_validates_zero_lower_bounds_only_for_costs(
 ) -> None:
     called = False
 
-    def fake_fuzzy_topsis_method(**_):
+    def fake_fuzzy_topsis_scores(*_):
         nonlocal called
         called = True
         return np.array([0.5])
 
     monkeypatch.setattr(
         fuzzy_topsis_run,
-        "fuzzy_topsis_method",
-        fake_fuzzy_topsis_method,
+        "fuzzy_topsis_scores",
+        fake_fuzzy_topsis_scores,
     )
     _patch_projection(monkeypatch)
     matrices = {"expert": [[triplet]]}
@@ -118,3 +151,37 @@ def test_run_fuzzy_topsis_validates_zero_lower_bounds_only_for_costs(
         )
         assert called is True
         assert result["collective_scores"] == [0.5]
+
+
+def test_run_fuzzy_topsis_accepts_expert_tensor(monkeypatch) -> None:
+    monkeypatch.setattr(
+        fuzzy_topsis_run,
+        "fuzzy_topsis_scores",
+        lambda *_: np.array([0.4, 0.6]),
+    )
+    _patch_projection(monkeypatch)
+    tensor = np.array(
+        [
+            [[[0.1, 0.2, 0.3]], [[0.4, 0.5, 0.6]]],
+            [[[0.3, 0.4, 0.5]], [[0.6, 0.7, 0.8]]],
+        ]
+    )
+
+    result = fuzzy_topsis_run.run_fuzzy_topsis(
+        matrices=tensor,
+        weights=[[0.4, 0.5, 0.6]],
+        criterion_type=["max"],
+    )
+
+    assert result["collective_matrix"] == [
+        [pytest.approx((0.2, 0.3, 0.4))],
+        [pytest.approx((0.5, 0.6, 0.7))],
+    ]
+
+    tensor[1, 0, 0] = [0.5, 0.4, 0.3]
+    with pytest.raises(ValueError, match=r"matrices\[1\]\[0\]\[0\] must be an ordered"):
+        fuzzy_topsis_run.run_fuzzy_topsis(
+            matrices=tensor,
+            weights=[[0.4, 0.5, 0.6]],
+            criterion_type=["max"],
+        )
@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+from benchmarks.herrera_viedma_kernels import (
+    legacy_colectiva_OWA,
+    legacy_consenso_alt,
+    legacy_consenso_exp_alt,
+    legacy_diferencia_rankings,
+    legacy_QGDD,
+    run,
+)
+from models.herrera_viedma_crp.utils import (
+    calcular_colectiva_OWA,
+    calcular_consenso_alt,
+    calcular_consenso_exp_alt,
+    calcular_diferencia_rankings,
+    calcular_pesos_OWA,
+    calcular_QGDD,
+    owa,
+    owa_tensor,
+)
+
+
+@pytest.mark.parametrize("n_exp,n_alt,n_crit", [(1, 2, 1), (3, 4, 1), (7, 6, 3), (12, 9, 2)])
+def test_collective_owa_matches_cell_by_cell_aggregation(n_exp, n_alt, n_crit):
+    rng = np.random.default_rng(n_exp * 100 + n_alt)
+    pref = rng.random((n_exp * n_crit + 1, n_alt, n_alt))
+    w_crit = calcular_pesos_OWA(n_crit, [0.2, 0.9])
+    w_exp = calcular_pesos_OWA(n_exp, [0.3, 0.8])
+
+    assert np.array_equal(
+        calcular_colectiva_OWA(pref, n_exp, n_alt, n_crit, w_crit, w_exp),
+        legacy_colectiva_OWA(pref, n_exp, n_alt, n_crit, w_crit, w_exp),
+    )
+
+
+def test_owa_tensor_truncates_weights_like_zip():
+    values = np.array([[0.1, 0.9, 0.5]])
+
+    assert owa_tensor(values, [0.5, 0.5])[0] == owa(values[0], [0.5, 0.5])
+    assert owa_tensor(values, [1.0, 0.0, 0.0, 0.0])[0] == owa(values[0], [1.0, 0.0, 0.0, 0.0])
+
+
+def test_qgdd_batches_all_rows_with_identical_results():
+    rng = np.random.default_rng(3)
+    pref = np.round(rng.random((6, 8, 8)), 2)
+    w_alt = calcular_pesos_OWA(8, [0.5, 1.0])
+
+    batched = calcular_QGDD(8, pref, w_alt)
+
+    assert batched.shape == (6, 8)
+    for index in range(6):
+        assert np.array_equal(batched[index], legacy_QGDD(8, pref[index], w_alt))
+        assert np.array_equal(calcular_QGDD(8, pref[index], w_alt), batched[index])
+
+
+@pytest.mark.parametrize("b", [1, 0.5, 1.5, 2])
+def test_ranking_differences_and_consensus_degrees_match_legacy(b):
+    rng = np.random.default_rng(11)
+    rankings = [rng.permutation(7) for _ in range(10)]
+
+    differences = calcular_diferencia_rankings(rankings)
+    assert np.array_equal(differences, legacy_diferencia_rankings(rankings))
+
+    exp_alt = calcular_consenso_exp_alt(differences, b)
+    assert np.array_equal(exp_alt, legacy_consenso_exp_alt(differences, b))
+    assert np.array_equal(
+        calcular_consenso_alt(exp_alt, 7, 9),
+        legacy_consenso_alt(exp_alt, 7, 9),
+    )
+
+
+def test_full_pipeline_is_bit_identical_at_benchmark_scale():
+    assert run(n_exp=50, n_alt=40, repeats=1)["bitIdentical"] is True
@@ -1,14 +1,21 @@
 from copy import deepcopy
+import json
 
 import numpy as np
 import pytest
 
+from benchmarks.herrera_viedma_ingestion import (
+    build_request,
+    legacy_preferences,
+    tensor_preferences,
+)
 from models.herrera_viedma_crp.examples import (
     HERRERA_VIEDMA_CRP_REQUEST_EXAMPLES,
 )
 from models.herrera_viedma_crp.executor import (
     _input,
     _normalize_pairwise_collective_evaluations,
+    execute_herrera_viedma,
 )
 from models.herrera_viedma_crp.run import _build_suggested_pairwise_payload
 from schemas.model_requests import GenericModelExecutionRequest
@@ -25,7 +32,8 @@ def test_herrera_viedma_reads_direct_pairwise_values() -> None:
 
     execution_input = _input(request)
 
-    assert execution_input["matrices"]["expert-ana"]["crit-overall"] == [
+    assert execution_input["expert_keys"][0] == "expert-ana"
+    assert execution_input["preferences"][0].tolist() == [
         [0.5, 0.35, 0.70],
         [0.65, 0.5, 0.80],
         [0.30, 0.20, 0.5],
@@ -43,6 +51,77 @@ def test_herrera_viedma_rejects_the_former_value_wrapper() -> None:
         _input(request)
 
 
+@pytest.mark.parametrize("n_crit", [1, 4])
+def test_herrera_viedma_tensor_ingestion_matches_nested_list_aggregation(n_crit) -> None:
+    request = build_request(6, 5, n_crit, seed=n_crit)
+    execution_input = _input(request)
+
+    assert execution_input["criterion_preferences"].shape == (6, n_crit, 5, 5)
+    assert np.array_equal(
+        tensor_preferences(request),
+        legacy_preferences(request, execution_input["weights"]),
+    )
+
+
+@pytest.mark.parametrize(
+    "value,message",
+    [
+        (None, "is required"),
+        ("high", "must be a finite number"),
+        (float("nan"), "must be a finite number"),
+        (1.2, "must be between 0 and 1"),
+    ],
+)
+def test_herrera_viedma_reports_the_exact_invalid_pairwise_field(value, message) -> None:
+    payload = _request_payload()
+    payload["evaluations"][1]["payload"]["crit-overall"]["alt-supplier-b"][
+        "alt-supplier-c"
+    ] = value
+    request = GenericModelExecutionRequest.model_validate(payload)
+
+    with pytest.raises(ValueError) as error:
+        _input(request)
+
+    assert str(error.value).startswith(
+        "evaluations[1].payload['crit-overall']['alt-supplier-b']['alt-supplier-c'] "
+    )
+    assert message in str(error.value)
+
+
+def test_herrera_viedma_returns_invalid_pairwise_input_as_validation_error() -> None:
+    payload = _request_payload()
+    payload["evaluations"][1]["payload"]["crit-overall"]["alt-supplier-b"][
+        "alt-supplier-c"
+    ] = 1.2
+    request = GenericModelExecutionRequest.model_validate(payload)
+
+    body = json.loads(execute_herrera_viedma(request).body)
+
+    assert body["success"] is False
+    assert body["error"]["code"] == "VALIDATION_ERROR"
+    assert body["message"].startswith(
+        "evaluations[1].payload['crit-overall']['alt-supplier-b']['alt-supplier-c'] "
+    )
+
+
+def test_herrera_viedma_accepts_its_own_suggestions_as_next_round_input() -> None:
+    payload = _request_payload()
+    payload["context"]["issue"]["consensusThreshold"] = 0.99
+
+    for _ in range(3):
+        result = execute_herrera_viedma(GenericModelExecutionRequest.model_validate(payload))
+        assert result["success"] is True
+
+        suggestions = result["data"]["rawOutput"]["suggested_next_evaluations"]
+        if not suggestions:
+            break
+
+        for evaluation in payload["evaluations"]:
+            suggestion = suggestions.get(evaluation["expert"]["id"])
+            if suggestion is not None:
+                evaluation["payload"] = suggestion["payload"]
+
+
 def test_herrera_viedma_suggestions_use_direct_values() -> None:
     payload = _build_suggested_pairwise_payload(
         matrix=np.array(
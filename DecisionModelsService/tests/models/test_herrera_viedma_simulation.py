@@ -0,0 +1,182 @@
+from copy import deepcopy
+import json
+
+import numpy as np
+import pytest
+
+from models.herrera_viedma_crp.examples import (
+    HERRERA_VIEDMA_CRP_REQUEST_EXAMPLES,
+)
+from models.herrera_viedma_crp.executor import execute_herrera_viedma
+from models.herrera_viedma_crp.run import run_herrera_viedma, run_herrera_viedma_simulation
+from models.herrera_viedma_crp.utils import simular_comportamiento
+from schemas.model_requests import GenericModelExecutionRequest
+
+
+def _request_payload(**simulation) -> dict:
+    payload = deepcopy(
+        HERRERA_VIEDMA_CRP_REQUEST_EXAMPLES["basic_pairwise_consensus"]["value"]
+    )
+    payload["modelParameters"].update(simulation)
+    return payload
+
+
+def _divergent_matrices(n_exp: int = 6, n_alt: int = 4, seed: int = 5) -> dict:
+    rng = np.random.default_rng(seed)
+    matrices = {}
+    for index in range(n_exp):
+        matrix = np.round(rng.random((n_alt, n_alt)), 2)
+        np.fill_diagonal(matrix, 0.5)
+        matrices[f"expert-{index}"] = {"crit": matrix.tolist()}
+    return matrices
+
+
+def _arguments(n_alt: int = 4, cl: float = 0.95) -> dict:
+    return {
+        "cl": cl,
+        "ag_lq": [0.3, 0.8],
+        "ex_lq": [0.5, 1.0],
+        "b": 1,
+        "beta": 0.8,
+        "w_crit": [1.0],
+        "criterion_id": "crit",
+        "alternative_ids": [f"alt-{index}" for index in range(n_alt)],
+        "alternative_names": [f"Alternative {index}" for index in range(n_alt)],
+    }
+
+
+def test_seeded_behaviour_simulation_is_reproducible():
+    first = simular_comportamiento(5, 0.5, 0.2, rng=np.random.default_rng(3))
+    second = simular_comportamiento(5, 0.5, 0.2, rng=np.random.default_rng(3))
+
+    assert first == second
+    assert all(0.0 <= value <= 0.2 for value in first)
+
+
+def test_single_round_simulation_matches_one_herrera_viedma_round():
+    matrices = _divergent_matrices()
+
+    single = run_herrera_viedma(matrices, **_arguments(), seed=9)
+    simulated = run_herrera_viedma_simulation(
+        matrices,
+        **_arguments(),
+        max_rounds=1,
+        seed=9,
+    )
+
+    trajectory = simulated.pop("simulation")["trajectory"]
+    assert simulated["cm"] == single["cm"]
+    assert simulated["suggested_next_evaluations"] == single["suggested_next_evaluations"]
+    assert simulated["plots_graphic"] == single["plots_graphic"]
+    assert trajectory[0]["cm"] == single["cm"]
+
+
+def test_simulation_follows_the_suggested_payloads_between_rounds():
+    matrices = _divergent_matrices()
+
+    first_round = run_herrera_viedma(matrices, **_arguments(), seed=4)
+    next_matrices = {
+        expert_key: {
+            "crit": [
+                [
+                    0.5 if row == col else suggestion["payload"]["crit"][f"alt-{row}"][f"alt-{col}"]
+                    for col in range(4)
+                ]
+                for row in range(4)
+            ]
+        }
+        for expert_key, suggestion in first_round["suggested_next_evaluations"].items()
+    }
+    second_round = run_herrera_viedma(next_matrices, **_arguments(), seed=0)
+
+    simulated = run_herrera_viedma_simulation(
+        matrices,
+        **_arguments(),
+        max_rounds=2,
+        seed=4,
+    )
+
+    trajectory = simulated["simulation"]["trajectory"]
+    assert [entry["cm"] for entry in trajectory] == [first_round["cm"], second_round["cm"]]
+
+
+def test_simulation_stops_when_consensus_is_reached():
+    matrices = {
+        "expert-a": {"crit": [[0.5, 0.8], [0.2, 0.5]]},
+        "expert-b": {"crit": [[0.5, 0.7], [0.3, 0.5]]},
+    }
+
+    result = run_herrera_viedma_simulation(
+        matrices,
+        **_arguments(n_alt=2, cl=0.5),
+        max_rounds=5,
+        seed=1,
+    )
+
+    assert result["simulation"]["rounds_executed"] == 1
+    assert result["simulation"]["consensus_reached"] is True
+    assert result["suggested_next_evaluations"] == {}
+    assert "expert_points" in result["plots_graphic"]
+
+
+def test_executor_returns_consensus_trajectory_in_one_response():
+    request = GenericModelExecutionRequest.model_validate(
+        _request_payload(maxRounds=4, seed=123)
+    )
+
+    first = execute_herrera_viedma(request)
+    second = execute_herrera_viedma(request)
+
+    assert first["success"] is True
+    simulation = first["data"]["consensusSimulation"]
+    assert simulation["maxRounds"] == 4
+    assert 1 <= simulation["roundsExecuted"] <= 4
+    assert simulation["seed"] == 123
+    assert [entry["round"] for entry in simulation["trajectory"]] == list(
+        range(1, simulation["roundsExecuted"] + 1)
+    )
+    assert simulation["trajectory"][-1]["consensusMeasure"] == first["data"]["consensusMeasure"]
+    assert first["data"] == second["data"]
+
+
+def test_executor_defaults_max_rounds_to_issue_max_phases():
+    request = GenericModelExecutionRequest.model_validate(_request_payload(seed=1))
+
+    result = execute_herrera_viedma(request)
+
+    assert result["data"]["consensusSimulation"]["maxRounds"] == 3
+
+
+def test_executor_without_simulation_keeps_single_round_contract():
+    request = GenericModelExecutionRequest.model_validate(_request_payload())
+
+    result = execute_herrera_viedma(request)
+
+    assert "consensusSimulation" not in result["data"]
+    assert "simulation" not in result["data"]["rawOutput"]
+
+
+@pytest.mark.parametrize(
+    ("simulation", "message"),
+    [
+        ({"maxRounds": 0}, "modelParameters.maxRounds must be between 1 and 100"),
+        ({"maxRounds": 1.5}, "modelParameters.maxRounds must be an integer"),
+        ({"seed": "x"}, "modelParameters.seed must be an integer"),
+        ({"seed": -1}, "modelParameters.seed must be a non-negative integer"),
+        (
+            {"acceptanceProbability": 1.5},
+            "modelParameters.acceptanceProbability must be between 0 and 1",
+        ),
+        ({"changeScale": "x"}, "modelParameters.changeScale must be a finite number"),
+    ],
+)
+def test_executor_rejects_invalid_simulation_settings(simulation, message):
+    request = GenericModelExecutionRequest.model_validate(_request_payload(**simulation))
+
+    result = execute_herrera_viedma(request)
+
+    body = json.loads(result.body)
+    assert result.status_code == 200
+    assert body["success"] is False
+    assert body["message"] == message
+    assert body["error"]["code"] == "MODEL_EXECUTION_ERROR"
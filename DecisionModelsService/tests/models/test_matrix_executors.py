@@ -116,7 +116,7 @@ def _fuzzy_request(value: Any) -> GenericModelExecutionRequest:
 def test_aras_executor_uses_context_criterion_expression_domain(monkeypatch) -> None:
     captured: dict[str, Any] = {}
 
-    def fake_run_aras(matrices, weights, criterion_type):
+    def fake_run_aras(matrices, weights, criterion_type, projection_method):
         captured["matrices"] = matrices
         captured["weights"] = weights
         captured["criterion_type"] = criterion_type
@@ -132,7 +132,8 @@ def test_aras_executor_uses_context_criterion_expression_domain(monkeypatch) ->
     result = _payload_result(execute_aras(_aras_request()))
 
     assert result["success"] is True
-    assert captured["matrices"] == {"expert-1": [[7.5], [6.5]]}
+    assert captured["matrices"].shape == (1, 2, 1)
+    assert captured["matrices"].tolist() == [[[7.5], [6.5]]]
     assert captured["weights"] == [1.0]
     assert captured["criterion_type"] == ["max"]
 
@@ -140,7 +141,7 @@ def test_aras_executor_uses_context_criterion_expression_domain(monkeypatch) ->
 def test_fuzzy_topsis_executor_resolves_canonical_label_key_values(monkeypatch) -> None:
     captured: dict[str, Any] = {}
 
-    def fake_run_fuzzy_topsis(matrices, weights, criterion_directions):
+    def fake_run_fuzzy_topsis(matrices, weights, criterion_directions, projection_method):
         captured["matrices"] = matrices
         captured["weights"] = weights
         captured["criterion_directions"] = criterion_directions
@@ -159,9 +160,8 @@ def test_fuzzy_topsis_executor_resolves_canonical_label_key_values(monkeypatch)
     result = _payload_result(execute_fuzzy_topsis(_fuzzy_request({"labelKey": "high"})))
 
     assert result["success"] is True
-    assert captured["matrices"] == {
-        "expert-1": [[[0.5, 0.7, 0.9]], [[0.1, 0.3, 0.5]]]
-    }
+    assert captured["matrices"].shape == (1, 2, 1, 3)
+    assert captured["matrices"].tolist() == [[[[0.5, 0.7, 0.9]], [[0.1, 0.3, 0.5]]]]
     assert captured["weights"] == [[0.4, 0.5, 0.6]]
     assert captured["criterion_directions"] == ["max"]
 
@@ -198,7 +198,9 @@ def test_waspas_executor_passes_ordered_expert_weights(monkeypatch) -> None:
     )
     payload["evaluations"][0]["weight"] = 0.2
 
-    def fake_run_waspas(matrices, weights, criterion_type, lambda_value, expert_weights):
+    def fake_run_waspas(
+        matrices, weights, criterion_type, lambda_value, expert_weights, projection_method
+    ):
         captured["matrices"] = matrices
         captured["expert_weights"] = expert_weights
         return {
@@ -215,3 +217,20 @@ def test_waspas_executor_passes_ordered_expert_weights(monkeypatch) -> None:
 
     assert result["success"] is True
     assert captured["expert_weights"] == [0.2, 0.8]
+
+
+def test_aras_executor_reports_every_invalid_cell_with_its_field_path() -> None:
+    payload = _aras_request().model_dump()
+    payload["evaluations"][0]["payload"]["alt-a"]["criterion-1"] = "abc"
+    payload["evaluations"][0]["payload"]["alt-b"]["criterion-1"] = None
+
+    result = _payload_result(
+        execute_aras(GenericModelExecutionRequest.model_validate(payload))
+    )
+
+    assert result["success"] is False
+    assert result["error"]["code"] == "VALIDATION_ERROR"
+    assert [error["field"] for error in result["error"]["details"]["errors"]] == [
+        "evaluations[0].payload['alt-a']['criterion-1']",
+        "evaluations[0].payload['alt-b']['criterion-1']",
+    ]
@@ -0,0 +1,74 @@
+import numpy as np
+import pulp as pl
+import pytest
+
+from benchmarks.mcc_solvers import build_problem, run
+from services.criteria_weights_consensus.mcc_weights import (
+    _solve_mcc_lp,
+    mcc_solver_backend,
+    solve_mcc_weights,
+)
+
+
+@pytest.mark.parametrize("n_exp,n_crit", [(2, 2), (5, 3), (9, 7), (20, 12)])
+def test_highs_backend_reaches_the_pulp_optimum_with_a_feasible_consensus(n_exp, n_crit):
+    problem = build_problem(n_exp, n_crit, seed=n_exp * n_crit)
+
+    expected = _solve_mcc_lp(**problem, backend="pulp")
+    result = _solve_mcc_lp(**problem, backend="highs")
+
+    assert result["status"] == expected["status"] == "Optimal"
+    assert result["solver"] == "highs"
+    assert result["objective"] == pytest.approx(expected["objective"], abs=1e-6)
+
+    o_bar = np.array(result["o_bar"])
+    g_bar = np.array(result["g_bar"])
+    assert o_bar.min() >= -1e-9
+    assert o_bar.sum(axis=1) == pytest.approx(np.ones(n_exp))
+    assert g_bar == pytest.approx(np.array(problem["w"]) @ o_bar)
+    assert np.abs(o_bar - g_bar).max() <= problem["eps"] + 1e-9
+    assert np.abs(o_bar - np.array(problem["o"])).sum() == pytest.approx(result["objective"])
+
+
+def test_backends_agree_when_the_consensus_is_unique():
+    o = [[0.5, 0.3, 0.2], [0.52, 0.28, 0.2], [0.48, 0.32, 0.2]]
+    arguments = {"o": o, "c": [1.0] * 3, "w": [1.0 / 3] * 3, "eps": 0.05}
+
+    expected = _solve_mcc_lp(**arguments, backend="pulp")
+    result = _solve_mcc_lp(**arguments, backend="highs")
+
+    assert result["objective"] == pytest.approx(expected["objective"]) == pytest.approx(0.0)
+    assert np.array(result["o_bar"]) == pytest.approx(np.array(expected["o_bar"]))
+    assert result["g_bar"] == pytest.approx(expected["g_bar"])
+    assert result["g_bar"] == pytest.approx([0.5, 0.3, 0.2])
+
+
+def test_solver_backend_is_selected_per_deployment(monkeypatch):
+    arguments = {
+        "criteria": [{"id": "c1", "name": "C1"}, {"id": "c2", "name": "C2"}],
+        "expert_weights_by_expert": {
+            "e1": {"c1": 0.7, "c2": 0.3},
+            "e2": {"c1": 0.4, "c2": 0.6},
+        },
+    }
+    assert mcc_solver_backend() == "pulp"
+    assert solve_mcc_weights(**arguments)["solver"] == "pulp"
+
+    monkeypatch.setenv("DECISION_MODELS_MCC_SOLVER", "HiGHS")
+    assert solve_mcc_weights(**arguments)["solver"] == "highs"
+    assert solve_mcc_weights(**arguments, solver=pl.PULP_CBC_CMD(msg=False))["solver"] == "pulp"
+    assert solve_mcc_weights(**arguments, backend="pulp")["solver"] == "pulp"
+
+    monkeypatch.setenv("DECISION_MODELS_MCC_SOLVER", "glpk")
+    assert mcc_solver_backend() == "pulp"
+
+    with pytest.raises(ValueError, match="Unsupported MCC solver backend: glpk"):
+        solve_mcc_weights(**arguments, backend="glpk")
+
+
+def test_mcc_solver_benchmark_reports_matching_objectives():
+    result = run(n_exp=8, n_crit=5, repeats=1)
+
+    assert result["sameObjective"] is True
+    assert result["pulpMs"] > 0
+    assert result["highsMs"] > 0
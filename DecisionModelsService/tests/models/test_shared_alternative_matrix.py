@@ -1,8 +1,11 @@
 from typing import Any
 
+import numpy as np
 import pytest
 
 from models.shared_alternative_matrix import (
+    DecisionMatrixValidationError,
+    extract_decision_matrix_tensor,
     extract_id_keyed_alternative_criteria_input,
     normalize_collective_evaluations_by_ids,
 )
@@ -175,6 +178,64 @@ def test_shared_alternative_matrix_validates_and_normalizes_expert_weights() ->
         )
 
 
+def test_decision_matrix_tensor_fills_expert_alternative_criterion_axes() -> None:
+    payload = _base_payload()
+    payload["evaluations"].append(
+        {
+            "expert": {"id": "expert-1"},
+            "payload": {
+                "alt-b": {"criterion-1": 2.0},
+                "alt-a": {"criterion-1": 3.0},
+            },
+        }
+    )
+
+    result = extract_decision_matrix_tensor(
+        payload=_request(payload),
+        expert_key_fn=lambda expert, _: str(expert["id"]),
+        evaluation_value_fn=lambda value, criterion, field: float(value),
+    )
+
+    assert result["tensor"].dtype == np.float64
+    assert result["tensor"].shape == (2, 2, 1)
+    assert result["tensor"].tolist() == [[[7.5], [6.5]], [[3.0], [2.0]]]
+    assert result["expert_keys"] == ["expert-1", "expert-1_2"]
+
+
+def test_decision_matrix_tensor_supports_fuzzy_cells() -> None:
+    result = extract_decision_matrix_tensor(
+        payload=_request(_base_payload()),
+        expert_key_fn=lambda expert, _: str(expert["id"]),
+        evaluation_value_fn=lambda value, criterion, field: [value - 1, value, value + 1],
+        cell_shape=(3,),
+    )
+
+    assert result["tensor"].shape == (1, 2, 1, 3)
+    assert result["tensor"][0, 1, 0].tolist() == [5.5, 6.5, 7.5]
+
+
+def test_decision_matrix_tensor_collects_every_error_with_its_field() -> None:
+    payload = _base_payload()
+    payload["evaluations"][0]["payload"]["alt-a"]["criterion-1"] = None
+    payload["evaluations"][0]["payload"]["alt-b"]["criterion-1"] = "bad"
+    payload["evaluations"][0]["payload"]["alt-c"] = {"criterion-1": 1}
+
+    with pytest.raises(DecisionMatrixValidationError) as exc_info:
+        extract_decision_matrix_tensor(
+            payload=_request(payload),
+            expert_key_fn=lambda expert, _: str(expert["id"]),
+            evaluation_value_fn=lambda value, criterion, field: float(value),
+        )
+
+    assert [error["field"] for error in exc_info.value.errors] == [
+        "evaluations[0].payload",
+        "evaluations[0].payload['alt-a']['criterion-1']",
+        "evaluations[0].payload['alt-b']['criterion-1']",
+    ]
+    assert "unknown alternative rows" in str(exc_info.value)
+    assert "['criterion-1'] is required" in str(exc_info.value)
+
+
 def test_normalize_collective_evaluations_by_ids_builds_a_complete_direct_matrix() -> None:
     assert normalize_collective_evaluations_by_ids(
         collective_matrix=[[7.5, 6.5], [5.5, 4.5]],
@@ -1,10 +1,15 @@
+import copy
 from typing import Any
 
 import pytest
 
 from models.shared_expression_domains import (
     SUPPORTED_EXPRESSION_DOMAIN_TYPE_KEYS,
+    clear_expression_domain_cache,
+    compile_expression_domain,
+    get_expression_domain_cache_stats,
     resolve_linguistic_2tuple_value,
+    resolve_linguistic_label_definition,
 )
 
 
@@ -186,4 +191,86 @@ def test_resolve_linguistic_2tuple_rejects_out_of_scale_beta(
     value: dict[str, Any],
 ) -> None:
     with pytest.raises(ValueError, match="out-of-range"):
-        _resolve(value)
\ No newline at end of file
+        _resolve(value)
+
+
+FUZZY_DOMAIN: dict[str, Any] = {
+    "typeKey": "linguisticFuzzy",
+    "definition": {
+        "labels": [
+            {"key": "low", "label": "Low", "index": 0, "values": [0.1, 0.3, 0.5]},
+            {"key": "high", "label": "High", "index": 1, "values": [0.5, 0.7, 0.9]},
+            {"key": "broken", "label": "Broken", "index": 2, "values": [0.5, "x"]},
+        ],
+    },
+}
+
+
+def test_compiled_expression_domain_exposes_prevalidated_label_lookups() -> None:
+    compiled = compile_expression_domain(FUZZY_DOMAIN)
+
+    high = compiled.resolve_label(value={"labelKey": "high"}, field="cell")
+    assert high.index == 1
+    assert high.values == (0.5, 0.7, 0.9)
+    assert high.fuzzy_triplet == (0.5, 0.7, 0.9)
+    assert high.centroid == pytest.approx(0.7)
+
+    broken = compiled.resolve_label(value={"labelKey": "broken"}, field="cell")
+    assert broken.values is None
+    assert broken.definition["values"] == [0.5, "x"]
+
+    with pytest.raises(ValueError, match="Unknown linguistic label 'missing'"):
+        compiled.resolve_label(value={"labelKey": "missing"}, field="cell")
+
+
+def test_compiled_expression_domains_are_memoised_by_content() -> None:
+    clear_expression_domain_cache()
+
+    first = compile_expression_domain(FUZZY_DOMAIN)
+    assert compile_expression_domain(FUZZY_DOMAIN) is first
+    assert compile_expression_domain(copy.deepcopy(FUZZY_DOMAIN)) is first
+
+    changed = copy.deepcopy(FUZZY_DOMAIN)
+    changed["definition"]["labels"][0]["values"] = [0.0, 0.2, 0.4]
+    assert compile_expression_domain(changed) is not first
+
+    assert get_expression_domain_cache_stats() == {
+        "size": 2,
+        "maxSize": 256,
+        "hits": 2,
+        "misses": 2,
+    }
+
+
+def test_compiled_expression_domains_follow_in_place_edits() -> None:
+    clear_expression_domain_cache()
+    domain = copy.deepcopy(FUZZY_DOMAIN)
+
+    before = compile_expression_domain(domain).resolve_label(
+        value={"labelKey": "low"},
+        field="cell",
+    )
+    assert before.values == (0.1, 0.3, 0.5)
+
+    domain["definition"]["labels"][0]["values"] = [0.0, 0.2, 0.4]
+
+    after = compile_expression_domain(domain).resolve_label(
+        value={"labelKey": "low"},
+        field="cell",
+    )
+    assert after.values == (0.0, 0.2, 0.4)
+
+
+def test_resolve_linguistic_label_definition_uses_compiled_lookup() -> None:
+    assert resolve_linguistic_label_definition(
+        value={"labelKey": "low"},
+        expression_domain=FUZZY_DOMAIN,
+        field="cell",
+    ) == FUZZY_DOMAIN["definition"]["labels"][0]
+
+    with pytest.raises(ValueError, match=r"cell.expressionDomain.definition.labels is required"):
+        resolve_linguistic_label_definition(
+            value={"labelKey": "low"},
+            expression_domain={"typeKey": "linguisticFuzzy", "definition": {}},
+            field="cell",
+        )
@@ -0,0 +1,55 @@
+import json
+
+import pytest
+
+from benchmarks.model_suite import compare, parse_size, run
+from benchmarks.synthetic_issues import build_payload
+from registry.model_registry import get_model_definitions
+
+
+MODELS = get_model_definitions(strict=False)
+
+
+@pytest.mark.parametrize("model", MODELS, ids=lambda model: model.api_model_key)
+def test_synthetic_payload_validates_and_executes_for_every_registered_model(model):
+    payload = build_payload(model, experts=3, alternatives=4, criteria=3, seed=7)
+
+    result = model.handler(model.request_model.model_validate(payload))
+
+    assert result["success"] is True, result.get("message")
+
+
+def test_synthetic_payload_is_deterministic_for_a_seed_and_scales_with_the_size():
+    model = next(model for model in MODELS if model.api_model_key == "topsis")
+
+    first = build_payload(model, experts=4, alternatives=6, criteria=5, seed=3)
+    second = build_payload(model, experts=4, alternatives=6, criteria=5, seed=3)
+
+    assert first == second
+    assert len(first["evaluations"]) == 4
+    assert len(first["context"]["alternatives"]) == 6
+    assert len(first["context"]["criteria"]) == 5
+
+
+def test_model_suite_writes_a_stable_baseline_that_can_be_compared(tmp_path):
+    result = run(sizes=((2, 3, 2),), models=("topsis", "topsis_2tuple"), repeats=1)
+    baseline_path = tmp_path / "baseline.json"
+    baseline_path.write_text(json.dumps(result, indent=2, sort_keys=True), encoding="utf-8")
+
+    modes = {(entry["apiModelKey"], entry["mode"]) for entry in result["entries"]}
+    assert ("topsis", "execute.inProcess") in modes
+    assert ("topsis", "execute.asgi") in modes
+    assert ("topsis_2tuple", "analysis.asgi") in modes
+    assert all(entry["p95Ms"] >= entry["p50Ms"] > 0 for entry in result["entries"])
+    assert all(entry["peakKiB"] > 0 for entry in result["entries"])
+
+    rows = compare(json.loads(baseline_path.read_text(encoding="utf-8")), result)
+    assert len(rows) == len(result["entries"])
+    assert all(row["p50Ratio"] == 1.0 for row in rows)
+
+
+def test_parse_size_rejects_malformed_sizes():
+    assert parse_size("5x10x4") == (5, 10, 4)
+
+    with pytest.raises(Exception, match="EXPERTSxALTERNATIVESxCRITERIA"):
+        parse_size("5x10")
@@ -147,16 +147,16 @@ def test_topsis_2tuple_input_prepares_beta_matrices() -> None:
         _request(_base_payload())
     )
 
-    assert result["matrices"] == {
-        "expert-1": [
+    assert result["tensor"].tolist() == [
+        [
             [1.75, 3.0],
             [3.5, 1.25],
         ],
-        "expert-2": [
+        [
             [2.0, 2.25],
             [3.25, 1.0],
         ],
-    }
+    ]
 
     assert result["expert_keys"] == [
         "expert-1",
@@ -350,7 +350,7 @@ def test_topsis_2tuple_input_uses_full_nonzero_alpha() -> None:
         _request(payload)
     )
 
-    assert result["matrices"]["expert-1"][0][0] == pytest.approx(
+    assert result["tensor"][0, 0, 0] == pytest.approx(
         3.4
     )
 
@@ -0,0 +1,157 @@
+import numpy as np
+import pytest
+
+from benchmarks.topsis_2tuple_kernel import (
+    build_problem,
+    build_scales,
+    legacy_topsis_2tuple,
+    run,
+)
+from models.topsis_2tuple.run import (
+    aggregate_expert_matrices,
+    delta,
+    delta_arrays,
+    evaluate_collective_beta_matrix,
+    evaluate_weight_samples,
+    run_topsis_2tuple,
+)
+from models.topsis_2tuple.analysis.sensitivity import (
+    SENSITIVITY_STEP,
+    _sample_weights,
+    sensitivity_step,
+)
+
+
+@pytest.mark.parametrize("n_exp,n_alt,n_crit", [(1, 1, 1), (3, 5, 4), (6, 40, 11), (12, 9, 2)])
+def test_vectorised_engine_matches_cell_by_cell_pipeline(n_exp, n_alt, n_crit):
+    problem = build_problem(n_exp, n_alt, n_crit, seed=n_exp + n_alt)
+
+    result = run_topsis_2tuple(
+        matrices=problem["tensor"],
+        expert_weights=problem["expert_weights"],
+        weights=problem["weights"],
+        criterion_directions=problem["directions"],
+        criterion_scales=problem["scales"],
+    )
+    expected = legacy_topsis_2tuple(
+        problem["matrices"],
+        problem["expert_weights"],
+        problem["weights"],
+        problem["directions"],
+        problem["scales"],
+    )
+
+    for key, value in expected.items():
+        assert result[key] == value, key
+
+
+def test_aggregation_accepts_tensor_or_expert_mapping():
+    problem = build_problem(4, 6, 3)
+    arguments = {
+        "expert_weights": problem["expert_weights"],
+        "criterion_scales": problem["scales"],
+    }
+
+    assert aggregate_expert_matrices(
+        matrices=problem["tensor"], **arguments
+    ) == aggregate_expert_matrices(matrices=problem["matrices"], **arguments)
+
+
+def test_tensor_aggregation_reports_out_of_scale_cells():
+    tensor = np.full((2, 2, 2), 1.0)
+    tensor[1, 0, 1] = 9.0
+
+    with pytest.raises(ValueError, match=r"matrices\['1'\]\[0\]\[1\] is outside the linguistic scale"):
+        aggregate_expert_matrices(
+            matrices=tensor,
+            expert_weights=[0.5, 0.5],
+            criterion_scales=build_scales(2),
+        )
+
+
+def test_delta_arrays_match_scalar_delta_on_boundaries():
+    labels = build_scales(1)[0]["labels"]
+    betas = [0.0, 1e-13, 0.5, 1.49999999999999, 2.5, 5.5, 6.0, 6.0 + 1e-13]
+
+    label_indexes, alphas = delta_arrays(betas, len(labels) - 1)
+
+    assert [
+        {"labelKey": f"s{index}", "alpha": alpha}
+        for index, alpha in zip(label_indexes.tolist(), alphas.tolist())
+    ] == [delta(beta=beta, labels=labels) for beta in betas]
+
+
+def test_kernel_validates_directions_once():
+    with pytest.raises(ValueError, match="Unsupported criterion direction"):
+        evaluate_collective_beta_matrix(
+            collective_beta_matrix=np.ones((2, 2)),
+            weights=[0.5, 0.5],
+            criterion_directions=["max", "sideways"],
+            criterion_scales=build_scales(2),
+        )
+
+
+def _weight_samples(n_samples, n_crit, seed=7):
+    raw = np.random.default_rng(seed).random((n_samples, n_crit))
+    return raw / raw.sum(axis=1, keepdims=True)
+
+
+@pytest.mark.parametrize("stacked", [False, True])
+def test_weight_samples_match_per_sample_kernel(stacked):
+    problem = build_problem(3, 15, 6, seed=5)
+    weight_matrix = _weight_samples(21, 6)
+    matrices = (
+        problem["tensor"][0] * np.linspace(0.8, 1.0, 21)[:, None, None]
+        if stacked
+        else problem["tensor"][0]
+    )
+
+    batch = evaluate_weight_samples(
+        collective_beta_matrix=matrices,
+        weight_matrix=weight_matrix,
+        criterion_directions=problem["directions"],
+        criterion_scales=problem["scales"],
+    )
+
+    for sample, weights in enumerate(weight_matrix.tolist()):
+        expected = evaluate_collective_beta_matrix(
+            collective_beta_matrix=matrices[sample] if stacked else matrices,
+            weights=weights,
+            criterion_directions=problem["directions"],
+            criterion_scales=problem["scales"],
+        )
+        for key, values in batch.items():
+            assert values[sample].tolist() == expected[key], key
+
+
+def test_weight_samples_validate_each_row():
+    arguments = {
+        "collective_beta_matrix": np.ones((2, 2)),
+        "criterion_directions": ["max", "min"],
+        "criterion_scales": build_scales(2),
+    }
+
+    with pytest.raises(ValueError, match=r"weight_matrix\[1\] must sum to 1"):
+        evaluate_weight_samples(weight_matrix=[[0.5, 0.5], [0.5, 0.4]], **arguments)
+    with pytest.raises(ValueError, match=r"weight_matrix\[0\]\[1\] must be greater"):
+        evaluate_weight_samples(weight_matrix=[[1.5, -0.5]], **arguments)
+    with pytest.raises(ValueError, match="non-empty"):
+        evaluate_weight_samples(weight_matrix=[[1.0]], **arguments)
+
+
+def test_sensitivity_step_is_configurable(monkeypatch):
+    monkeypatch.setenv("DECISION_MODELS_SENSITIVITY_STEP", "0.01")
+    assert sensitivity_step() == 0.01
+    assert len(_sample_weights(0.3, sensitivity_step())) == 101
+
+    for invalid in ("0.03", "0.0001", "0.75", "nan-ish"):
+        monkeypatch.setenv("DECISION_MODELS_SENSITIVITY_STEP", invalid)
+        assert sensitivity_step() == SENSITIVITY_STEP
+
+
+def test_benchmark_reports_bit_identical_results():
+    result = run(n_exp=4, n_alt=12, n_crit=5, repeats=1)
+
+    assert result["bitIdentical"] is True
+    assert result["legacyMs"] > 0
+    assert result["vectorizedMs"] > 0
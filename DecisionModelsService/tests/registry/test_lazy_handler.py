@@ -0,0 +1,67 @@
+import pickle
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from registry.lazy_handler import LazyHandler, lazy_handler
+from registry.model_registry import get_model_definitions
+
+SERVICE_ROOT = Path(__file__).resolve().parents[2]
+
+
+def test_registered_models_resolve_their_executor_lazily():
+    for definition in get_model_definitions(strict=False):
+        assert isinstance(definition.handler, LazyHandler)
+        assert definition.handler.module_path == f"models.{definition.api_model_key}.executor"
+
+
+def test_importing_the_application_does_not_import_model_executors():
+    script = (
+        "import sys, app\n"
+        "heavy = [name for name in sys.modules if name.endswith('.executor') "
+        "or name.split('.')[0] in {'pyDecision', 'sklearn', 'pulp', 'matplotlib'}]\n"
+        "print(len(app.app.routes), heavy)\n"
+    )
+
+    completed = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=SERVICE_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    routes, heavy = completed.stdout.strip().split(" ", 1)
+    assert int(routes) > 0
+    assert heavy == "[]"
+
+
+def test_lazy_handler_imports_on_first_call_and_survives_pickling():
+    handler = lazy_handler(".serialization:model_execution_envelope", "services.model_executors")
+    restored = pickle.loads(pickle.dumps(handler))
+
+    assert handler.module_path == "services.model_executors.serialization"
+    assert not restored.is_resolved
+    assert restored({"success": True, "message": "ok", "data": None}) == {
+        "success": True,
+        "message": "ok",
+    }
+    assert restored.is_resolved
+    assert restored.import_seconds is not None
+
+
+@pytest.mark.parametrize("reference", ["models.topsis.executor", ":execute", "module:"])
+def test_lazy_handler_rejects_references_without_module_and_attribute(reference):
+    with pytest.raises(ValueError, match="module:attribute"):
+        lazy_handler(reference)
+
+
+def test_lazy_handler_refuses_async_executors():
+    handler = lazy_handler("asyncio:sleep")
+
+    with pytest.raises(TypeError, match="lazy handlers must be synchronous"):
+        handler(0)
+
+    assert not handler.is_resolved
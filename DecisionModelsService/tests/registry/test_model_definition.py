@@ -98,3 +98,29 @@ def test_valid_criteria_weighting_definition_with_expert_side_support():
 def test_model_definition_validation_errors(overrides, message_fragment):
     with pytest.raises(ValueError, match=message_fragment):
         _build_definition(**overrides)
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {"execution_backend": "gpu"},
+        {"max_concurrency": 0},
+        {"max_concurrency": True},
+        {"execution_timeout_seconds": 0},
+    ],
+)
+def test_invalid_execution_settings_raise(overrides):
+    with pytest.raises(ValueError):
+        _build_definition(**overrides)
+
+
+def test_valid_execution_settings_are_kept():
+    definition = _build_definition(
+        execution_backend="process",
+        max_concurrency=2,
+        execution_timeout_seconds=30,
+    )
+
+    assert definition.execution_backend == "process"
+    assert definition.max_concurrency == 2
+    assert definition.execution_timeout_seconds == 30
@@ -9,6 +9,7 @@ from registry import model_registry
 from registry.model_registry import (
     _iter_candidate_model_dirs,
     get_model_definition_by_endpoint_path,
+    get_model_definition_by_key,
     get_model_definitions,
 )
 
@@ -337,3 +338,200 @@ def test_real_registry_metadata_smoke():
         assert definition.display_name.strip()
         assert issubclass(definition.request_model, BaseModel)
         assert callable(definition.handler)
+
+
+_CACHED_MODEL_DEFINITION = """
+from registry.model_definition import ModelDefinition
+from schemas.model_requests import GenericModelExecutionRequest
+
+
+def handler(payload):
+    return {"success": True, "message": "ok", "data": None, "error": None}
+
+
+MODEL_DEFINITION = ModelDefinition(
+    api_model_key="alpha",
+    api_endpoint_path="/alpha",
+    request_model=GenericModelExecutionRequest,
+    handler=handler,
+    display_name="DISPLAY_NAME",
+    small_description="Small",
+    extended_description="Extended",
+    evaluation_structure_key="alternativeCriteriaMatrix",
+)
+""".strip() + "\n"
+
+
+def test_registry_reuses_unchanged_packages_without_reloading(temp_models_root):
+    _write_temp_model(
+        temp_models_root.parent,
+        "alpha",
+        _CACHED_MODEL_DEFINITION.replace("DISPLAY_NAME", "Alpha"),
+    )
+    registry = model_registry.ModelRegistry()
+
+    first = registry.get_definitions()
+    second = registry.get_definitions()
+
+    assert first is second
+    assert registry.stats()["reloads"] == 1
+    assert registry.stats()["hits"] == 1
+
+
+def test_registry_reloads_package_when_definition_content_changes(temp_models_root):
+    package_dir = _write_temp_model(
+        temp_models_root.parent,
+        "alpha",
+        _CACHED_MODEL_DEFINITION.replace("DISPLAY_NAME", "Alpha"),
+    )
+    registry = model_registry.ModelRegistry()
+
+    assert registry.get_definitions()[0].display_name == "Alpha"
+    generation = registry.generation
+
+    (package_dir / "definition.py").write_text(
+        _CACHED_MODEL_DEFINITION.replace("DISPLAY_NAME", "Alpha Reloaded"),
+        encoding="utf-8",
+    )
+
+    assert registry.get_definitions()[0].display_name == "Alpha Reloaded"
+    assert registry.generation > generation
+    assert registry.stats()["reloads"] == 2
+
+
+def test_registry_detects_new_packages_and_invalidation(temp_models_root):
+    registry = model_registry.ModelRegistry()
+
+    assert registry.get_definitions() == ()
+
+    _write_temp_model(
+        temp_models_root.parent,
+        "alpha",
+        _CACHED_MODEL_DEFINITION.replace("DISPLAY_NAME", "Alpha"),
+    )
+
+    assert [definition.api_model_key for definition in registry.get_definitions()] == [
+        "alpha"
+    ]
+
+    registry.invalidate()
+
+    assert registry.stats()["cachedPackages"] == 0
+    assert len(registry.get_definitions()) == 1
+    assert registry.stats()["reloads"] == 2
+    assert registry.stats()["invalidations"] == 1
+
+
+def test_registry_keeps_broken_packages_cached_until_they_change(temp_models_root):
+    _write_temp_model(temp_models_root.parent, "alpha", "SOMETHING_ELSE = 1\n")
+    registry = model_registry.ModelRegistry()
+
+    assert registry.get_definitions(strict=False) == ()
+    assert registry.get_definitions(strict=False) == ()
+    assert registry.stats()["reloads"] == 1
+
+    with pytest.raises(ValueError, match="must export MODEL_DEFINITION"):
+        registry.get_definitions(strict=True)
+
+
+def test_lookups_reuse_indexes_for_same_registry_snapshot(
+    monkeypatch,
+    model_definition_factory,
+):
+    definitions = (
+        model_definition_factory(api_model_key="alpha", api_endpoint_path="/alpha"),
+        model_definition_factory(api_model_key="beta", api_endpoint_path="/beta"),
+    )
+    monkeypatch.setattr(
+        model_registry,
+        "get_model_definitions",
+        lambda strict=False: definitions,
+    )
+
+    assert get_model_definition_by_endpoint_path("beta") is definitions[1]
+    indexes = model_registry._get_snapshot_indexes(definitions)
+    assert get_model_definition_by_endpoint_path("/alpha") is definitions[0]
+    assert get_model_definition_by_key(" beta ") is definitions[1]
+    assert get_model_definition_by_key("missing") is None
+    assert model_registry._get_snapshot_indexes(definitions) is indexes
+
+    reloaded = definitions[:1]
+    monkeypatch.setattr(
+        model_registry,
+        "get_model_definitions",
+        lambda strict=False: reloaded,
+    )
+
+    assert get_model_definition_by_key("beta") is None
+    assert get_model_definition_by_endpoint_path("/beta") is None
+
+
+_SCAFFOLD_MODEL_DEFINITION = """
+from registry.model_definition import ModelDefinition
+from schemas.model_requests import GenericModelExecutionRequest
+
+from .executor import DISPLAY_NAME, handler
+
+
+MODEL_DEFINITION = ModelDefinition(
+    api_model_key="alpha",
+    api_endpoint_path="/alpha",
+    request_model=GenericModelExecutionRequest,
+    handler=handler,
+    display_name=DISPLAY_NAME,
+    small_description="Small",
+    extended_description="Extended",
+    evaluation_structure_key="alternativeCriteriaMatrix",
+)
+""".strip() + "\n"
+
+_SCAFFOLD_EXECUTOR = """
+DISPLAY_NAME = "LABEL"
+
+
+def handler(payload):
+    return {"success": True, "message": "ok", "data": None, "error": None}
+""".strip() + "\n"
+
+
+def test_registry_picks_up_scaffold_once_sibling_files_appear(temp_models_root):
+    package_dir = _write_temp_model(
+        temp_models_root.parent,
+        "alpha",
+        _SCAFFOLD_MODEL_DEFINITION,
+    )
+    registry = model_registry.ModelRegistry()
+
+    assert registry.get_definitions(strict=False) == ()
+
+    (package_dir / "executor.py").write_text(
+        _SCAFFOLD_EXECUTOR.replace("LABEL", "Alpha"),
+        encoding="utf-8",
+    )
+
+    assert [definition.display_name for definition in registry.get_definitions()] == [
+        "Alpha"
+    ]
+
+
+def test_registry_reloads_package_when_a_sibling_module_changes(temp_models_root):
+    package_dir = _write_temp_model(
+        temp_models_root.parent,
+        "alpha",
+        _SCAFFOLD_MODEL_DEFINITION,
+    )
+    (package_dir / "executor.py").write_text(
+        _SCAFFOLD_EXECUTOR.replace("LABEL", "Alpha"),
+        encoding="utf-8",
+    )
+    registry = model_registry.ModelRegistry()
+
+    assert registry.get_definitions()[0].display_name == "Alpha"
+
+    (package_dir / "executor.py").write_text(
+        _SCAFFOLD_EXECUTOR.replace("LABEL", "Alpha Reloaded"),
+        encoding="utf-8",
+    )
+
+    assert registry.get_definitions()[0].display_name == "Alpha Reloaded"
+    assert registry.stats()["reloads"] == 2
@@ -29,7 +29,7 @@ def test_all_current_number_global_parameters_declare_canonical_metadata():
         for parameter in _number_global_parameters(definition)
     ]
 
-    assert len(parameters) == 4
+    assert len(parameters) == 8
     for parameter in parameters:
         assert "scope" not in parameter
         assert parameter["valueType"] in {"number", "integer"}
@@ -43,12 +43,16 @@ def test_current_number_global_semantics_and_defaults_are_unchanged():
         ("waspas", "lambda"): ("number", 0.5),
         ("promethee_vi", "iterations"): ("integer", 1000),
         ("herrera_viedma_crp", "beta"): ("number", 0.8),
+        ("herrera_viedma_crp", "maxRounds"): ("integer", None),
+        ("herrera_viedma_crp", "seed"): ("integer", None),
+        ("herrera_viedma_crp", "acceptanceProbability"): ("number", None),
+        ("herrera_viedma_crp", "changeScale"): ("number", None),
     }
 
     actual = {
         (definition.api_model_key, parameter["key"]): (
             parameter["valueType"],
-            parameter["default"],
+            parameter.get("default"),
         )
         for definition in DEFINITIONS
         for parameter in _number_global_parameters(definition)
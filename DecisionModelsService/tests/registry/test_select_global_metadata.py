@@ -10,9 +10,9 @@ def test_current_select_global_parameters_declare_typed_closed_options():
         if parameter.get("parameterStructureKey") == "selectGlobal"
     ]
 
-    assert len(parameters) == 1
+    assert [parameter["key"] for parameter in parameters] == ["b", "projectionMethod"]
+    assert all(parameter["default"] in parameter["restrictions"]["allowed"] for parameter in parameters)
     parameter = parameters[0]
-    assert parameter["key"] == "b"
     assert "scope" not in parameter
     assert parameter["valueType"] == "number"
     assert parameter["restrictions"]["allowed"] == [0.5, 0.7, 0.9, 1]
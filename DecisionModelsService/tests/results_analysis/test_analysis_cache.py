@@ -0,0 +1,191 @@
+import asyncio
+
+import httpx
+
+from api.routers import results_analysis
+from core.application import create_application
+from services.results_analysis import cache as analysis_cache
+from services.results_analysis.cache import (
+    AnalysisCacheSettings,
+    AnalysisResultCache,
+    analysis_cache_key,
+    analysis_package_version,
+)
+
+from test_generic_issue_api import analysis_context
+
+
+async def _post_all(requests):
+    transport = httpx.ASGITransport(app=create_application())
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return [await client.request(method, path, **kwargs) for method, path, kwargs in requests]
+
+
+def _count_generic_analyses(monkeypatch):
+    calls = []
+    original = results_analysis.analyze_issue
+    monkeypatch.setattr(
+        results_analysis,
+        "analyze_issue",
+        lambda context: calls.append(context) or original(context),
+    )
+    return calls
+
+
+def test_generic_issue_analysis_is_memoised_by_normalised_context(monkeypatch):
+    calls = _count_generic_analyses(monkeypatch)
+    context = analysis_context()
+    changed = analysis_context()
+    changed["rounds"][0]["selectedExecution"]["result"]["standardResult"]["consensusMeasure"] = 0.5
+    private_only_change = analysis_context()
+    private_only_change["decisionSpace"]["expressionDomains"][0]["definition"]["private"] = False
+
+    first, second, third, fourth = asyncio.run(
+        _post_all(
+            [
+                ("POST", "/results-analysis/generic-issue", {"json": context}),
+                ("POST", "/results-analysis/generic-issue", {"json": private_only_change}),
+                ("POST", "/results-analysis/generic-issue", {"json": changed}),
+                ("POST", "/results-analysis/generic-issue", {"json": context, "headers": {"Cache-Control": "no-cache"}}),
+            ]
+        )
+    )
+
+    assert first.headers["X-Analysis-Cache"] == "miss"
+    assert second.headers["X-Analysis-Cache"] == "hit"
+    assert second.headers["X-Analysis-Cache-Tier"] == "memory"
+    assert second.headers["X-Analysis-Cache-Key"] == first.headers["X-Analysis-Cache-Key"]
+    assert second.json() == first.json()
+    assert third.headers["X-Analysis-Cache"] == "miss"
+    assert fourth.headers["X-Analysis-Cache"] == "bypass"
+    assert len(calls) == 3
+
+
+def test_model_issue_analysis_skips_handler_loading_on_hits(monkeypatch):
+    loads = []
+    monkeypatch.setattr(
+        results_analysis,
+        "load_model_analysis_handlers",
+        lambda key: loads.append(key) or {"analyze_issue": lambda _: {"facts": {}, "interpretation": "Model", "visualizations": []}},
+    )
+    body = {"apiModelKey": "cached_model", "analysisContext": analysis_context()}
+
+    responses = asyncio.run(
+        _post_all(
+            [
+                ("POST", "/results-analysis/model-issue", {"json": body}),
+                ("POST", "/results-analysis/model-issue", {"json": body}),
+                ("DELETE", "/results-analysis/cache", {}),
+                ("POST", "/results-analysis/model-issue", {"json": body}),
+            ]
+        )
+    )
+
+    assert [response.headers.get("X-Analysis-Cache") for response in responses] == ["miss", "hit", None, "miss"]
+    assert responses[1].json()["data"]["interpretation"] == "Model"
+    assert responses[2].json() == {
+        "success": True,
+        "message": "Results analysis cache purged successfully",
+        "data": {"memoryEntries": 1, "diskEntries": 0},
+        "error": None,
+    }
+    assert loads == ["cached_model", "cached_model"]
+
+
+def test_analysis_cache_is_bypassed_when_disabled(monkeypatch):
+    monkeypatch.setenv("DECISION_MODELS_ANALYSIS_CACHE_SIZE", "0")
+    calls = _count_generic_analyses(monkeypatch)
+
+    responses = asyncio.run(
+        _post_all([("POST", "/results-analysis/generic-issue", {"json": analysis_context()})] * 2)
+    )
+
+    assert [response.headers["X-Analysis-Cache"] for response in responses] == ["bypass", "bypass"]
+    assert len(calls) == 2
+
+
+def test_disk_tier_survives_a_new_cache_instance(tmp_path):
+    settings = AnalysisCacheSettings(memory_size=1, disk_directory=str(tmp_path))
+    writer = AnalysisResultCache(settings)
+    writer.set("a", {"facts": {"a": 1}})
+    writer.set("b", {"facts": {"b": 2}})
+    writer.close()
+
+    reader = AnalysisResultCache(settings)
+    assert reader.get("a") == ({"facts": {"a": 1}}, "disk")
+    assert reader.get("a") == ({"facts": {"a": 1}}, "memory")
+    assert reader.get("missing") is None
+    assert reader.stats()["diskHits"] == 1
+    assert reader.purge() == {"memoryEntries": 1, "diskEntries": 2}
+    reader.close()
+
+
+def test_cache_key_changes_with_context_or_analysis_sources(monkeypatch, tmp_path):
+    package = tmp_path / "models" / "demo_model"
+    package.mkdir(parents=True)
+    source = package / "analysis.py"
+    source.write_text("VALUE = 1\n", encoding="utf-8")
+    monkeypatch.setattr(analysis_cache, "SERVICE_ROOT", tmp_path)
+
+    version = analysis_package_version("demo_model")
+    assert analysis_package_version("demo_model") == version
+    assert analysis_package_version("other_model") != version
+
+    source.write_text("VALUE = 22\n", encoding="utf-8")
+    assert analysis_package_version("demo_model") != version
+
+    key = analysis_cache_key(scope="model:demo_model", version=version, context={"b": 1, "a": [1, 2]})
+    assert key == analysis_cache_key(scope="model:demo_model", version=version, context={"a": [1, 2], "b": 1})
+    assert key != analysis_cache_key(scope="model:demo_model", version=version, context={"a": [2, 1], "b": 1})
+
+
+def test_model_version_tracks_effective_analysis_settings(monkeypatch):
+    monkeypatch.setenv("DECISION_MODELS_SENSITIVITY_STEP", "0.05")
+    default_step = analysis_package_version("topsis_2tuple")
+
+    monkeypatch.setenv("DECISION_MODELS_SENSITIVITY_STEP", "0.1")
+    coarse_step = analysis_package_version("topsis_2tuple")
+
+    monkeypatch.setenv("DECISION_MODELS_SENSITIVITY_STEP", "0.3")
+    assert analysis_package_version("topsis_2tuple") == default_step
+    assert coarse_step != default_step
+
+
+def test_model_version_covers_imported_service_modules(monkeypatch, tmp_path):
+    package = tmp_path / "models" / "demo_model"
+    package.mkdir(parents=True)
+    (package / "analysis.py").write_text("from utils.helpers import VALUE\n", encoding="utf-8")
+    helpers = tmp_path / "utils" / "helpers.py"
+    helpers.parent.mkdir()
+    helpers.write_text("VALUE = 1\n", encoding="utf-8")
+    monkeypatch.setattr(analysis_cache, "SERVICE_ROOT", tmp_path)
+
+    version = analysis_package_version("demo_model")
+
+    helpers.write_text("VALUE = 22\n", encoding="utf-8")
+    assert analysis_package_version("demo_model") != version
+
+
+def test_cache_purge_is_refused_in_production(monkeypatch):
+    monkeypatch.setattr(results_analysis, "is_production_environment", lambda: True)
+    purges = []
+    monkeypatch.setattr(
+        AnalysisResultCache,
+        "purge",
+        lambda self: purges.append(self) or {"memoryEntries": 0, "diskEntries": 0},
+    )
+
+    (response,) = asyncio.run(_post_all([("DELETE", "/results-analysis/cache", {})]))
+
+    assert response.status_code == 403
+    assert response.json() == {
+        "success": False,
+        "message": "Results analysis cache purge is disabled in production.",
+        "data": None,
+        "error": {
+            "code": "ANALYSIS_CACHE_PURGE_DISABLED",
+            "field": None,
+            "details": None,
+        },
+    }
+    assert purges == []
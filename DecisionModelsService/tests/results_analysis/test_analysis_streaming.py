@@ -0,0 +1,201 @@
+import asyncio
+import json
+
+import httpx
+
+from core.application import create_application
+from services.results_analysis.model_analysis import load_model_analysis_handlers
+from services.results_analysis.streaming import requested_stream_format
+
+from test_generic_issue_api import analysis_context
+from test_topsis_2tuple_analysis_session import _context
+
+NDJSON = {"Accept": "application/x-ndjson"}
+
+
+async def _send_all(requests):
+    transport = httpx.ASGITransport(app=create_application())
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return [await client.post(path, **kwargs) for path, kwargs in requests]
+
+
+def _topsis_payload():
+    execution = _context()["rounds"][0]["execution"]
+    return {
+        "apiModelKey": "topsis_2tuple",
+        "analysisContext": {
+            "issue": {"id": "issue-1"},
+            "decisionSpace": {},
+            "participants": {},
+            "semanticDirectory": {},
+            "rounds": [{"phase": 1, "selectedExecution": execution}],
+        },
+    }
+
+
+def _ndjson_records(response):
+    return [json.loads(line) for line in response.text.splitlines() if line]
+
+
+def _sse_records(response):
+    records = []
+    for block in response.text.strip().split("\n\n"):
+        event, data = block.split("\n")
+        record = json.loads(data.removeprefix("data: "))
+        assert event == f"event: {record['type']}"
+        records.append(record)
+    return records
+
+
+def _assemble(records):
+    document = {}
+    for record in records[:-1]:
+        assert record["type"] == "part"
+        *parents, key = record["path"]
+        target = document
+        for parent in parents:
+            target = target[parent]
+        target[key] = record["value"]
+    return document
+
+
+def test_stream_format_is_negotiated_through_accept():
+    assert requested_stream_format("application/x-ndjson") == "ndjson"
+    assert requested_stream_format("text/html, text/event-stream;q=0.9") == "sse"
+    assert requested_stream_format("application/json") is None
+    assert requested_stream_format(None) is None
+
+
+def test_model_issue_streams_core_facts_first_and_assembles_the_json_document():
+    payload = _topsis_payload()
+    streamed, replayed, plain = asyncio.run(
+        _send_all(
+            [
+                ("/results-analysis/model-issue", {"json": payload, "headers": NDJSON}),
+                ("/results-analysis/model-issue", {"json": payload, "headers": NDJSON}),
+                ("/results-analysis/model-issue", {"json": payload}),
+            ]
+        )
+    )
+    records = _ndjson_records(streamed)
+
+    assert streamed.status_code == 200
+    assert streamed.headers["content-type"].startswith("application/x-ndjson")
+    assert streamed.headers["X-Analysis-Cache"] == "miss"
+    assert [record.get("path") for record in records] == [
+        ["facts"],
+        ["facts", "linguistic2Tuple"],
+        ["facts", "evaluators"],
+        ["facts", "robustness"],
+        ["facts", "sensitivity"],
+        ["interpretation"],
+        ["visualizations"],
+        ["sections"],
+        ["metadata"],
+        None,
+    ]
+    assert "result" in records[0]["value"]
+    assert records[-1] == {
+        "type": "complete",
+        "success": True,
+        "message": "Model issue analysis completed successfully",
+        "hasResult": True,
+    }
+    assert plain.headers["X-Analysis-Cache"] == "hit"
+    assert _assemble(records) == plain.json()["data"]
+    assert replayed.headers["X-Analysis-Cache"] == "hit"
+    assert _assemble(_ndjson_records(replayed)) == plain.json()["data"]
+
+
+def test_generic_issue_streams_server_sent_events():
+    streamed, plain = asyncio.run(
+        _send_all(
+            [
+                ("/results-analysis/generic-issue", {"json": analysis_context(), "headers": {"Accept": "text/event-stream"}}),
+                ("/results-analysis/generic-issue", {"json": analysis_context(), "headers": {"Cache-Control": "no-cache"}}),
+            ]
+        )
+    )
+    records = _sse_records(streamed)
+
+    assert streamed.headers["content-type"].startswith("text/event-stream")
+    assert [record.get("path") for record in records] == [["facts"], ["interpretation"], ["visualizations"], None]
+    assert _assemble(records) == plain.json()["data"]
+
+
+def test_streaming_keeps_json_errors_for_invalid_contexts_and_empty_results(monkeypatch):
+    invalid = _topsis_payload()
+    invalid["analysisContext"]["rounds"] = []
+    monkeypatch.setattr(
+        "api.routers.results_analysis.load_model_analysis_handlers",
+        lambda api_model_key: None if api_model_key == "model_without_analysis" else load_model_analysis_handlers(api_model_key),
+    )
+    no_analysis = {**_topsis_payload(), "apiModelKey": "model_without_analysis"}
+
+    rejected, empty = asyncio.run(
+        _send_all(
+            [
+                ("/results-analysis/model-issue", {"json": invalid, "headers": NDJSON}),
+                ("/results-analysis/model-issue", {"json": no_analysis, "headers": NDJSON}),
+            ]
+        )
+    )
+
+    assert rejected.status_code == 422
+    assert rejected.json()["error"]["code"] == "ANALYSIS_CONTEXT_INVALID"
+    assert _ndjson_records(empty) == [
+        {
+            "type": "complete",
+            "success": True,
+            "message": "Model issue analysis completed successfully",
+            "hasResult": False,
+        }
+    ]
+
+
+def test_mid_stream_analysis_errors_end_with_an_error_event(monkeypatch):
+    def failing_stream(context):
+        yield ("facts",), {"partial": True}
+        raise ValueError("sensitivity evidence is inconsistent")
+
+    monkeypatch.setattr(
+        "api.routers.results_analysis.load_model_analysis_handlers",
+        lambda api_model_key: {"stream_issue": failing_stream},
+    )
+
+    (response,) = asyncio.run(
+        _send_all([("/results-analysis/model-issue", {"json": _topsis_payload(), "headers": NDJSON})])
+    )
+    records = _ndjson_records(response)
+
+    assert records[0] == {"type": "part", "path": ["facts"], "value": {"partial": True}}
+    assert records[1]["type"] == "error"
+    assert records[1]["response"]["message"] == "sensitivity evidence is inconsistent"
+    assert records[1]["response"]["error"]["code"] == "ANALYSIS_CONTEXT_INVALID"
+
+
+def test_unexpected_mid_stream_failures_end_with_an_analysis_failed_event(monkeypatch):
+    def failing_stream(context):
+        yield ("facts",), {"partial": True}
+        raise ZeroDivisionError("division by zero")
+
+    monkeypatch.setattr(
+        "api.routers.results_analysis.load_model_analysis_handlers",
+        lambda api_model_key: {"stream_issue": failing_stream},
+    )
+
+    (response,) = asyncio.run(
+        _send_all([("/results-analysis/model-issue", {"json": _topsis_payload(), "headers": NDJSON})])
+    )
+    records = _ndjson_records(response)
+
+    assert response.status_code == 200
+    assert records[0]["type"] == "part"
+    assert records[1]["type"] == "error"
+    assert records[1]["statusCode"] == 500
+    assert records[1]["response"]["error"] == {
+        "code": "ANALYSIS_FAILED",
+        "field": None,
+        "details": {"exceptionType": "ZeroDivisionError"},
+    }
+    assert len(records) == 2
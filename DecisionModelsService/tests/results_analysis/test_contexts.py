@@ -1,13 +1,17 @@
+import json
+import pickle
 from copy import deepcopy
 
 import pytest
 
+from benchmarks.analysis_contexts import run
 from services.results_analysis.contexts import (
     build_generic_issue_context,
     build_generic_round_context,
     build_model_issue_context,
     build_model_round_context,
 )
+from services.results_analysis.views import ReadOnlyDict, ReadOnlyList
 
 
 def analysis_context():
@@ -66,7 +70,7 @@ def nested_keys(value):
     return set()
 
 
-def test_generic_contexts_exclude_model_semantics_and_are_detached():
+def test_generic_contexts_exclude_model_semantics_and_are_read_only():
     source = analysis_context()
     round_context = build_generic_round_context(source, source["rounds"][1])
     issue_context = build_generic_issue_context(source)
@@ -89,11 +93,14 @@ def test_generic_contexts_exclude_model_semantics_and_are_detached():
     assert [entry["phase"] for entry in issue_context["rounds"]] == [1, 2]
     assert {"modelParameters", "evaluations", "collectiveEvaluations", "plotsGraphic", "modelExecution", "decisionSpace", "criteriaWeighting", "evaluationStructureKey", "rawOutput"}.isdisjoint(nested_keys(issue_context))
 
-    issue_context["rounds"][0]["execution"]["ranking"][0]["rank"] = 99
+    with pytest.raises(TypeError, match="read-only"):
+        issue_context["rounds"][0]["execution"]["ranking"][0]["rank"] = 99
+    with pytest.raises(TypeError, match="read-only"):
+        issue_context["semanticDirectory"]["expertsById"].pop("expert-1")
     assert source["rounds"][1]["selectedExecution"]["result"]["standardResult"]["rankedAlternatives"][0]["rank"] == 1
 
 
-def test_model_contexts_preserve_exact_executed_evidence_and_are_detached():
+def test_model_contexts_preserve_exact_executed_evidence_and_are_read_only():
     source = analysis_context()
     round_context = build_model_round_context(source, source["rounds"][1])
     issue_context = build_model_issue_context(source)
@@ -106,10 +113,56 @@ def test_model_contexts_preserve_exact_executed_evidence_and_are_detached():
     assert [entry["phase"] for entry in issue_context["rounds"]] == [1, 2]
     assert issue_context["rounds"][0]["execution"] == source["rounds"][1]["selectedExecution"]
 
-    round_context["execution"]["input"]["evaluations"][0]["payload"]["structureSpecific"][0][0] = 0
+    cells = round_context["execution"]["input"]["evaluations"][0]["payload"]["structureSpecific"][0]
+    for mutate in (
+        lambda: cells.__setitem__(0, 0),
+        lambda: cells.append(0),
+        lambda: cells.sort(),
+        lambda: round_context["execution"]["input"].update({"evaluations": []}),
+        lambda: issue_context["rounds"].append({}),
+    ):
+        with pytest.raises(TypeError, match="read-only"):
+            mutate()
     assert source["rounds"][1]["selectedExecution"]["input"]["evaluations"][0]["payload"]["structureSpecific"][0][0] == 1
 
 
+def test_contexts_share_the_source_payload_through_read_only_views():
+    source = analysis_context()
+    context = build_model_issue_context(source)
+    execution_input = context["rounds"][0]["execution"]["input"]
+
+    assert isinstance(context, dict) and isinstance(context["rounds"], list)
+    assert isinstance(execution_input, ReadOnlyDict)
+    assert context["rounds"][0]["execution"]["input"] is execution_input
+    assert execution_input["evaluations"][0]["payload"]["structureSpecific"] == [[1, 9]]
+
+    for escaped in (
+        dict(execution_input)["evaluations"],
+        {**execution_input}["evaluations"],
+        execution_input.copy()["evaluations"],
+        list(execution_input.values())[1],
+        execution_input["evaluations"][:1],
+        list(reversed(execution_input["evaluations"]))[0],
+        (execution_input["evaluations"] + [])[0],
+    ):
+        assert isinstance(escaped, (ReadOnlyDict, ReadOnlyList))
+
+    detached = deepcopy(context)
+    assert type(detached) is dict and type(detached["rounds"][0]["execution"]["input"]["evaluations"]) is list
+    detached["rounds"][0]["execution"]["input"]["evaluations"].clear()
+    assert source["rounds"][1]["selectedExecution"]["input"]["evaluations"]
+
+    assert pickle.loads(pickle.dumps(context)) == context
+    assert json.loads(json.dumps(context)) == context
+
+
+def test_analysis_context_benchmark_matches_deepcopy_projection():
+    result = run(rounds=2, experts=3, alternatives=4, criteria=3, repeats=1)
+
+    assert result["equal"] is True
+    assert result["viewPeakKiB"] < result["legacyPeakKiB"]
+
+
 @pytest.mark.parametrize("builder", [build_generic_round_context, build_model_round_context])
 def test_round_contexts_require_selected_execution(builder):
     source = analysis_context()
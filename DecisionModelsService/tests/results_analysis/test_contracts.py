@@ -44,6 +44,7 @@ def test_normalize_analysis_result_accepts_optional_sections_and_detaches():
         ({"facts": []}, "facts"),
         ({"interpretation": {}}, "interpretation"),
         ({"visualizations": {}}, "visualizations"),
+        ({"metadata": []}, "metadata"),
         (["not", "a", "dict"], "dict or None"),
     ],
 )
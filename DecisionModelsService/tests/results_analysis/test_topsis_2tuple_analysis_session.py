@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from models.topsis_2tuple.analysis import analyze_issue, experts
+from models.topsis_2tuple.analysis.session import AnalysisSession
+from models.topsis_2tuple.executor import execute_topsis_2tuple
+from schemas.model_requests import GenericModelExecutionRequest
+from services.results_analysis.contracts import normalize_analysis_result
+
+
+def _domain():
+    return {
+        "typeKey": "linguistic2Tuple",
+        "definition": {
+            "labelCount": 5,
+            "labels": [
+                {"key": f"s{index}", "label": f"S{index}", "index": index}
+                for index in range(5)
+            ],
+        },
+    }
+
+
+def _payload():
+    cells = [
+        [("s2", -0.25), ("s3", 0.0), ("s1", 0.25)],
+        [("s3", 0.25), ("s1", 0.0), ("s2", 0.0)],
+        [("s2", 0.0), ("s2", 0.25), ("s3", -0.5)],
+    ]
+    return {
+        "context": {
+            "alternatives": [
+                {"id": f"alt-{index}", "name": f"Alternative {index}"}
+                for index in range(3)
+            ],
+            "criteria": [
+                {
+                    "id": f"c{index}",
+                    "name": f"Criterion {index}",
+                    "type": "cost" if index == 1 else "benefit",
+                    "expressionDomain": _domain(),
+                }
+                for index in range(3)
+            ],
+        },
+        "modelParameters": {"weights": {"c0": 0.5, "c1": 0.3, "c2": 0.2}},
+        "evaluations": [
+            {
+                "expert": {"id": f"expert-{expert_index}"},
+                "weight": weight,
+                "payload": {
+                    f"alt-{(alternative_index + expert_index) % 3}": {
+                        f"c{criterion_index}": {"labelKey": label, "alpha": alpha}
+                        for criterion_index, (label, alpha) in enumerate(row)
+                    }
+                    for alternative_index, row in enumerate(cells)
+                },
+            }
+            for expert_index, weight in enumerate([0.5, 0.3, 0.2])
+        ],
+    }
+
+
+def _context():
+    payload = _payload()
+    result = execute_topsis_2tuple(GenericModelExecutionRequest.model_validate(payload))
+    return {"rounds": [{"phase": 1, "execution": {"input": payload, "result": result["data"]}}]}
+
+
+def test_analysis_session_extracts_expert_profiles_once(monkeypatch):
+    calls = []
+    original = experts._expert_matrices
+    monkeypatch.setattr(
+        experts,
+        "_expert_matrices",
+        lambda **kwargs: calls.append(kwargs) or original(**kwargs),
+    )
+
+    result = analyze_issue(_context())
+
+    assert len(calls) == 1
+    assert result["facts"]["evaluators"]["capabilities"]["compareEvaluators"]["available"] is True
+    assert result["facts"]["robustness"]["leaveOneEvaluatorOut"]["availability"]["available"] is True
+    assert result["facts"]["sensitivity"]["evaluatorWeights"]["availability"]["available"] is True
+
+
+def test_analysis_session_holds_read_only_arrays():
+    session = AnalysisSession.from_context(_context())
+
+    assert session.expert_beta_tensor.shape == (3, 3, 3)
+    assert session.expert_beta_tensor.tolist() == [expert["betaMatrix"] for expert in session.experts]
+    assert session.expert_weights.tolist() == pytest.approx([0.5, 0.3, 0.2])
+    assert session.collective_beta_matrix.tolist() == session.evidence.collective_beta_matrix
+    for array in (session.expert_beta_tensor, session.collective_beta_matrix, session.criterion_weights):
+        with pytest.raises(ValueError, match="read-only"):
+            array[(0,) * array.ndim] = np.nan
+
+
+def test_analysis_result_reports_per_stage_timings():
+    result = normalize_analysis_result(analyze_issue(_context()))
+    timings = result["metadata"]["timings"]
+
+    assert timings["unit"] == "ms"
+    assert list(timings["stages"]) == [
+        "evidence",
+        "expertProfiles",
+        "core",
+        "linguistic2Tuple",
+        "evaluators",
+        "robustness",
+        "sensitivity",
+        "interpretation",
+        "visualizations",
+    ]
+    assert all(elapsed >= 0 for elapsed in timings["stages"].values())
+    assert timings["total"] == pytest.approx(sum(timings["stages"].values()), abs=0.01)
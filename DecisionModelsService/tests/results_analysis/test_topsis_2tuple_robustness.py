@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import pytest
+
+from models.topsis_2tuple.analysis import analyze_issue
+from models.topsis_2tuple.analysis.session import AnalysisSession
+from models.topsis_2tuple.executor import execute_topsis_2tuple
+from models.topsis_2tuple.run import evaluate_collective_beta_matrix
+from schemas.model_requests import GenericModelExecutionRequest
+from test_topsis_2tuple_analysis_session import _context, _payload
+
+
+def _reference(session, *, matrix, weights, kept):
+    evaluation = evaluate_collective_beta_matrix(
+        collective_beta_matrix=[[row[index] for index in kept] for row in matrix],
+        weights=weights,
+        criterion_directions=[session.evidence.criterion_directions[index] for index in kept],
+        criterion_scales=[session.criterion_scales[index] for index in kept],
+    )
+    return {
+        "closeness": evaluation["closeness_coefficients"],
+        "positiveDistances": evaluation["positive_distances"],
+        "negativeDistances": evaluation["negative_distances"],
+        "positiveIdealBeta": evaluation["positive_ideal_beta"],
+        "technicalRankingIndexes": evaluation["collective_ranking"],
+    }
+
+
+def test_leave_one_out_counterfactuals_match_independent_recomputation():
+    context = _context()
+    session = AnalysisSession.from_context(context)
+    robustness = analyze_issue(context)["facts"]["robustness"]
+    criterion_count = len(session.evidence.criterion_ids)
+
+    for item in robustness["leaveOneCriterionOut"]["items"]:
+        kept = [index for index in range(criterion_count) if index != item["criterionIndex"]]
+        weights = [entry["weight"] for entry in item["renormalizedCriterionWeights"]]
+        expected = _reference(
+            session,
+            matrix=session.evidence.collective_beta_matrix,
+            weights=weights,
+            kept=kept,
+        )
+        assert {key: item["counterfactualResult"][key] for key in expected} == expected
+
+    for item in robustness["leaveOneEvaluatorOut"]["items"]:
+        remaining = [expert for expert in session.experts if expert["expertIndex"] != item["expertIndex"]]
+        weights = [entry["weight"] for entry in item["renormalizedEvaluatorWeights"]]
+        matrix = [
+            [
+                sum(
+                    weight * expert["betaMatrix"][alternative][criterion]
+                    for expert, weight in zip(remaining, weights, strict=True)
+                )
+                for criterion in range(criterion_count)
+            ]
+            for alternative in range(len(session.evidence.alternative_ids))
+        ]
+        assert item["counterfactualCollectiveBetaMatrix"] == matrix
+        expected = _reference(
+            session,
+            matrix=matrix,
+            weights=session.evidence.criterion_weights,
+            kept=list(range(criterion_count)),
+        )
+        assert {key: item["counterfactualResult"][key] for key in expected} == expected
+
+
+def test_leave_one_evaluator_out_skips_counterfactuals_without_remaining_weight():
+    payload = _payload()
+    for evaluation, weight in zip(payload["evaluations"], [1.0, 0.0, 0.0], strict=True):
+        evaluation["weight"] = weight
+    result = execute_topsis_2tuple(GenericModelExecutionRequest.model_validate(payload))
+    context = {"rounds": [{"phase": 1, "execution": {"input": payload, "result": result["data"]}}]}
+
+    items = analyze_issue(context)["facts"]["robustness"]["leaveOneEvaluatorOut"]["items"]
+
+    assert [item["available"] for item in items] == [False, True, True]
+    assert items[0]["reason"] == "zero_effective_weight"
+    assert items[0]["remainingConfiguredWeight"] == pytest.approx(0.0)
+    assert [entry["weight"] for entry in items[1]["renormalizedEvaluatorWeights"]] == [1.0, 0.0]
@@ -0,0 +1,131 @@
+import json
+
+import numpy as np
+import pytest
+
+from benchmarks.synthetic_issues import build_payload
+from registry.model_registry import get_model_definitions
+from schemas.model_requests import GenericModelExecutionRequest
+from utils.get_plots_graphics_from_matrices import get_plots_graphics_from_matrices
+from utils.projections import (
+    PROJECTION_METHOD_PARAMETER,
+    classical_mds,
+    normalize_projection_method,
+    normalized_stress,
+    pairwise_distances,
+    pca_projection,
+    project_points,
+    resolve_projection_method,
+    smacof_projection,
+)
+
+
+def _points(seed: int = 7, n_points: int = 9, n_features: int = 12) -> np.ndarray:
+    return np.random.default_rng(seed).random((n_points, n_features))
+
+
+def test_classical_mds_recovers_planar_configurations_exactly():
+    planar = np.array([[0.0, 0.0], [3.0, 0.0], [0.0, 4.0], [3.0, 4.0], [1.0, 2.0]])
+    embedded = np.hstack([planar, np.zeros((5, 3))])
+
+    projection = classical_mds(embedded)
+
+    assert np.allclose(pairwise_distances(projection), pairwise_distances(planar))
+    assert normalized_stress(embedded, projection) == pytest.approx(0.0, abs=1e-12)
+
+
+def test_classical_mds_and_pca_agree_on_euclidean_data():
+    points = _points()
+
+    assert np.allclose(classical_mds(points), pca_projection(points), atol=1e-9)
+
+
+def test_projections_are_deterministic_and_sign_stable():
+    points = _points()
+
+    for method in ("classical", "pca", "smacof"):
+        first = project_points(points, method)
+        second = project_points(points.copy(), method)
+        assert first.shape == (9, 2)
+        assert np.array_equal(first, second)
+
+
+def test_smacof_warm_start_never_increases_classical_stress():
+    points = _points(n_points=12, n_features=20)
+
+    classical_stress = normalized_stress(points, classical_mds(points))
+    smacof_stress = normalized_stress(points, smacof_projection(points))
+
+    assert smacof_stress <= classical_stress + 1e-12
+
+
+def test_degenerate_inputs_project_to_origin():
+    points = np.ones((3, 4))
+
+    for method in ("classical", "pca", "smacof"):
+        assert np.array_equal(project_points(points, method), np.zeros((3, 2)))
+
+
+def test_projection_method_aliases_and_request_resolution():
+    assert normalize_projection_method("MDS") == "classical"
+    assert normalize_projection_method("PCA") == "pca"
+    assert normalize_projection_method(None) == "classical"
+    assert normalize_projection_method("metric-mds") == "smacof"
+
+    request = GenericModelExecutionRequest(modelParameters={"projectionMethod": "SMACOF"})
+    assert resolve_projection_method(request) == "smacof"
+    assert resolve_projection_method(GenericModelExecutionRequest()) == "classical"
+
+    with pytest.raises(ValueError, match="Unsupported projection method"):
+        normalize_projection_method("tsne")
+
+
+def test_plot_contract_keeps_relative_expert_points():
+    matrices = [np.array([[0.1, 0.4], [0.7, 0.2]]), np.array([[0.3, 0.5], [0.6, 0.9]])]
+    collective = np.mean(matrices, axis=0)
+
+    plots = get_plots_graphics_from_matrices(matrices, collective, method="MDS")
+
+    assert set(plots) == {"expert_points", "collective_point"}
+    assert len(plots["expert_points"]) == 2
+    assert len(plots["collective_point"]) == 2
+    assert all(len(point) == 2 for point in plots["expert_points"])
+    assert np.allclose(np.sum(plots["expert_points"], axis=0), [0.0, 0.0], atol=1e-3)
+
+
+PROJECTION_MODELS = [
+    model
+    for model in get_model_definitions(strict=False)
+    if any(parameter["key"] == "projectionMethod" for parameter in model.parameters)
+]
+
+
+def test_projection_method_is_declared_by_every_model_that_projects():
+    assert {model.api_model_key for model in PROJECTION_MODELS} == {
+        "aras",
+        "borda",
+        "edas",
+        "fuzzy_topsis",
+        "herrera_viedma_crp",
+        "marcos",
+        "promethee_vi",
+        "topsis",
+        "topsis_2tuple",
+        "vikor",
+        "waspas",
+    }
+    assert PROJECTION_METHOD_PARAMETER["parameterStructureKey"] == "selectGlobal"
+    assert PROJECTION_METHOD_PARAMETER["restrictions"]["allowed"] == ["classical", "pca", "smacof"]
+
+
+@pytest.mark.parametrize("model", PROJECTION_MODELS, ids=lambda model: model.api_model_key)
+def test_unsupported_projection_method_is_a_client_error(model):
+    payload = build_payload(model, experts=2, alternatives=3, criteria=2, seed=5)
+    payload["modelParameters"]["projectionMethod"] = "tsne"
+
+    result = model.handler(model.request_model.model_validate(payload))
+    body = json.loads(result.body.decode("utf-8"))
+
+    assert body["success"] is False
+    assert body["error"]["code"] == "MODEL_EXECUTION_ERROR"
+    assert body["message"] == "modelParameters.projectionMethod must be one of ['classical', 'pca', 'smacof']"
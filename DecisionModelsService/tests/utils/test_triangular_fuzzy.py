@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from utils.defuzzify_centroid import defuzzify_centroid
+from utils.triangular_fuzzy import TriangularFuzzyArray
+
+
+def _tensor() -> np.ndarray:
+    return np.array(
+        [
+            [[[0.1, 0.2, 0.3], [0.0, 0.5, 1.0]], [[0.2, 0.4, 0.6], [0.3, 0.3, 0.3]]],
+            [[[0.3, 0.4, 0.5], [0.2, 0.5, 0.8]], [[0.4, 0.6, 0.8], [0.1, 0.3, 0.5]]],
+        ]
+    )
+
+
+def test_component_operations_work_on_the_whole_array():
+    fuzzy = TriangularFuzzyArray(_tensor())
+
+    collective = fuzzy.mean(axis=0)
+
+    assert fuzzy.shape == (2, 2, 2)
+    assert collective.shape == (2, 2)
+    assert np.allclose(collective.values[0, 0], [0.2, 0.3, 0.4])
+    assert np.allclose(collective.max(axis=0).values, [[0.3, 0.5, 0.7], [0.2, 0.5, 0.9]])
+    assert np.allclose(collective.min(axis=0).lower, [0.2, 0.1])
+    assert np.allclose((collective * TriangularFuzzyArray([[1, 2, 3], [0, 1, 2]])).upper[1], [2.1, 0.8])
+    assert np.allclose((collective * np.array([2.0, 0.5])).values[0, 1], [0.05, 0.25, 0.45])
+    assert np.allclose(
+        collective.squared_distance(collective.max(axis=0))[1],
+        [0.0, 0.29],
+    )
+
+
+def test_centroid_and_triplets_keep_the_historic_formats():
+    fuzzy = TriangularFuzzyArray(_tensor())
+
+    assert np.allclose(fuzzy.centroid(), _tensor().mean(axis=-1))
+    assert np.array_equal(defuzzify_centroid(_tensor().tolist()), fuzzy.centroid())
+    assert fuzzy[0, 1].to_triplets() == [(0.2, 0.4, 0.6), (0.3, 0.3, 0.3)]
+
+
+@pytest.mark.parametrize(
+    "cell,message",
+    [
+        ([0.5, float("inf"), 0.7], "must contain finite numbers"),
+        ([0.5, 0.4, 0.7], "must be an ordered fuzzy triplet"),
+    ],
+)
+def test_validated_reports_the_first_invalid_cell(cell, message):
+    tensor = _tensor()
+    tensor[1, 0, 1] = cell
+
+    with pytest.raises(ValueError, match=rf"matrices\[1\]\[0\]\[1\] {message}"):
+        TriangularFuzzyArray.validated(tensor)
+
+    with pytest.raises(ValueError, match=rf"matrices\['expert-b'\]\[0\]\[1\] {message}"):
+        TriangularFuzzyArray.validated(tensor, labels=["expert-a", "expert-b"])
+
+
+def test_rejects_arrays_without_a_component_axis():
+    with pytest.raises(ValueError, match="trailing axis of size 3"):
+        TriangularFuzzyArray([[0.1, 0.2]])
@@ -4,9 +4,12 @@ from typing import Any
 
 import numpy as np
 
+from utils.triangular_fuzzy import TriangularFuzzyArray
+
 
 def defuzzify_centroid(matrix_fuzzy: Any) -> np.ndarray:
     """Defuzzifica una matriz fuzzy triangular aplicando promedio (l+m+u)/3."""
 
-    matrix = np.array(matrix_fuzzy, dtype=float)
-    return (matrix[..., 0] + matrix[..., 1] + matrix[..., 2]) / 3.0
+    if isinstance(matrix_fuzzy, TriangularFuzzyArray):
+        return matrix_fuzzy.centroid()
+    return TriangularFuzzyArray(matrix_fuzzy).centroid()
@@ -3,14 +3,14 @@
 from typing import Any, Sequence
 
 import numpy as np
-from sklearn.decomposition import PCA
-from sklearn.manifold import MDS
+
+from utils.projections import DEFAULT_PROJECTION_METHOD, project_points
 
 
 def get_plots_graphics_from_matrices(
-    matrices_np: Sequence[Any],
+    matrices_np: np.ndarray | Sequence[Any],
     collective_matrix: Any,
-    method: str = "MDS",
+    method: str = DEFAULT_PROJECTION_METHOD,
 ) -> dict[str, Any]:
     """Obtiene puntos 2D para expertos y punto colectivo.
 
@@ -18,17 +18,13 @@ def get_plots_graphics_from_matrices(
     se expresan relativos a ese centro para mantener el formato histórico.
     """
 
-    preferences = list(matrices_np) + [collective_matrix]
-    preferences_flat = np.array([np.array(pref, dtype=float).flatten() for pref in preferences], dtype=float)
+    expert_flat = np.asarray(matrices_np, dtype=float).reshape(len(matrices_np), -1)
+    collective_flat = np.asarray(collective_matrix, dtype=float).reshape(1, -1)
+    preferences_flat = np.concatenate([expert_flat, collective_flat])
     preferences_flat[preferences_flat == 0] = 1e-10
 
-    if method.upper() == "PCA":
-        reducer = PCA(n_components=2)
-    else:
-        reducer = MDS(n_components=2, dissimilarity="euclidean", random_state=42)
-
     try:
-        transformed = reducer.fit_transform(preferences_flat)
+        transformed = project_points(preferences_flat, method)
     except Exception:
         return {
             "reason": "projection_failed",
@@ -0,0 +1,213 @@
+"""Proyecciones 2D deterministas para visualizar expertos y opinión colectiva.
+
+Sustituye el MDS iterativo de scikit-learn por una única descomposición:
+
+- ``classical``: MDS clásico (Torgerson) sobre la matriz de distancias.
+- ``pca``: PCA vía SVD con la misma convención de signos que scikit-learn.
+- ``smacof``: SMACOF métrico arrancado desde la solución clásica.
+"""
+
+from typing import Any
+
+import numpy as np
+
+PROJECTION_METHODS = ("classical", "pca", "smacof")
+DEFAULT_PROJECTION_METHOD = "classical"
+
+_PROJECTION_METHOD_ALIASES = {
+    "classical": "classical",
+    "classical_mds": "classical",
+    "torgerson": "classical",
+    "mds": "classical",
+    "pca": "pca",
+    "smacof": "smacof",
+    "metric_mds": "smacof",
+}
+
+PROJECTION_METHOD_PARAMETER = {
+    "key": "projectionMethod",
+    "label": "Projection method",
+    "valueType": "string",
+    "parameterStructureKey": "selectGlobal",
+    "required": False,
+    "default": DEFAULT_PROJECTION_METHOD,
+    "restrictions": {"min": None, "max": None, "allowed": list(PROJECTION_METHODS)},
+}
+
+SMACOF_MAX_ITER = 300
+SMACOF_EPS = 1e-3
+
+
+def normalize_projection_method(method: Any) -> str:
+    """Normaliza el nombre del método; acepta los alias históricos ``MDS``/``PCA``."""
+
+    key = str(method or "").strip().lower().replace("-", "_")
+    if not key:
+        return DEFAULT_PROJECTION_METHOD
+
+    normalized = _PROJECTION_METHOD_ALIASES.get(key)
+    if normalized is None:
+        raise ValueError(
+            f"Unsupported projection method: {method}. "
+            f"Expected one of {list(PROJECTION_METHODS)}."
+        )
+
+    return normalized
+
+
+def resolve_projection_method(payload: Any) -> str:
+    """Lee ``modelParameters.projectionMethod`` de un request de ejecución."""
+
+    model_parameters = getattr(payload, "modelParameters", None)
+    if not isinstance(model_parameters, dict):
+        return DEFAULT_PROJECTION_METHOD
+
+    return normalize_projection_method(model_parameters.get("projectionMethod"))
+
+
+def projection_method_error(payload: Any) -> str | None:
+    """Mensaje de error del cliente si ``projectionMethod`` no es válido; si no, ``None``."""
+
+    try:
+        resolve_projection_method(payload)
+    except ValueError:
+        return f"modelParameters.projectionMethod must be one of {list(PROJECTION_METHODS)}"
+
+    return None
+
+
+def _fix_signs(components: np.ndarray) -> np.ndarray:
+    """Hace positivo el valor de mayor módulo de cada columna (convención svd_flip)."""
+
+    if components.size == 0:
+        return components
+
+    max_abs_rows = np.argmax(np.abs(components), axis=0)
+    signs = np.sign(components[max_abs_rows, range(components.shape[1])])
+    signs[signs == 0] = 1.0
+    return components * signs
+
+
+def _pad_components(components: np.ndarray, n_components: int) -> np.ndarray:
+    if components.shape[1] >= n_components:
+        return components[:, :n_components]
+
+    padding = np.zeros((components.shape[0], n_components - components.shape[1]))
+    return np.hstack([components, padding])
+
+
+def pairwise_distances(points: np.ndarray) -> np.ndarray:
+    """Distancias euclídeas entre filas sin materializar diferencias 3D."""
+
+    squared_norms = np.einsum("ij,ij->i", points, points)
+    squared = squared_norms[:, None] + squared_norms[None, :] - 2.0 * (points @ points.T)
+    np.maximum(squared, 0.0, out=squared)
+    np.fill_diagonal(squared, 0.0)
+    return np.sqrt(squared)
+
+
+def classical_mds(points: np.ndarray, n_components: int = 2) -> np.ndarray:
+    """MDS clásico: una descomposición espectral de la matriz doblemente centrada."""
+
+    distances = pairwise_distances(points)
+    n_points = distances.shape[0]
+    centering = np.eye(n_points) - np.full((n_points, n_points), 1.0 / n_points)
+    gram = -0.5 * centering @ (distances ** 2) @ centering
+
+    eigenvalues, eigenvectors = np.linalg.eigh(gram)
+    order = np.argsort(eigenvalues)[::-1][:n_components]
+    eigenvalues = np.clip(eigenvalues[order], 0.0, None)
+    components = eigenvectors[:, order] * np.sqrt(eigenvalues)
+
+    return _pad_components(_fix_signs(components), n_components)
+
+
+def pca_projection(points: np.ndarray, n_components: int = 2) -> np.ndarray:
+    """PCA vía SVD sobre los datos centrados."""
+
+    centered = points - points.mean(axis=0)
+    left, singular_values, _ = np.linalg.svd(centered, full_matrices=False)
+    components = _fix_signs(left[:, :n_components]) * singular_values[:n_components]
+
+    return _pad_components(components, n_components)
+
+
+def raw_stress(distances: np.ndarray, embedding: np.ndarray) -> float:
+    """Stress bruto de SMACOF: suma de errores cuadráticos en pares i<j."""
+
+    embedded = pairwise_distances(embedding)
+    return float(((embedded - distances) ** 2).sum() / 2.0)
+
+
+def normalized_stress(points: np.ndarray, embedding: np.ndarray) -> float:
+    """Stress-1 de Kruskal, comparable entre tamaños de problema."""
+
+    distances = pairwise_distances(points)
+    denominator = float((distances ** 2).sum() / 2.0)
+    if denominator == 0.0:
+        return 0.0
+
+    return float(np.sqrt(raw_stress(distances, embedding) / denominator))
+
+
+def smacof_projection(
+    points: np.ndarray,
+    n_components: int = 2,
+    *,
+    max_iter: int = SMACOF_MAX_ITER,
+    eps: float = SMACOF_EPS,
+) -> np.ndarray:
+    """SMACOF métrico con arranque en caliente desde MDS clásico."""
+
+    distances = pairwise_distances(points)
+    n_points = distances.shape[0]
+    embedding = classical_mds(points, n_components)
+
+    if n_points < 2:
+        return embedding
+
+    stress = raw_stress(distances, embedding)
+    for _ in range(max_iter):
+        embedded = pairwise_distances(embedding)
+        embedded[embedded == 0] = 1e-5
+        ratio = -distances / embedded
+        np.fill_diagonal(ratio, 0.0)
+        ratio[np.arange(n_points), np.arange(n_points)] = -ratio.sum(axis=1)
+        embedding = ratio @ embedding / n_points
+
+        previous_stress, stress = stress, raw_stress(distances, embedding)
+        denominator = float((distances ** 2).sum() / 2.0)
+        if denominator == 0.0 or (previous_stress - stress) / denominator < eps:
+            break
+
+    return _fix_signs(embedding)
+
+
+def project_points(points: Any, method: Any = DEFAULT_PROJECTION_METHOD) -> np.ndarray:
+    """Proyecta filas a 2D con el método indicado."""
+
+    points_np = np.asarray(points, dtype=float)
+    normalized_method = normalize_projection_method(method)
+
+    if normalized_method == "pca":
+        return pca_projection(points_np)
+    if normalized_method == "smacof":
+        return smacof_projection(points_np)
+
+    return classical_mds(points_np)
+
+
+__all__ = [
+    "DEFAULT_PROJECTION_METHOD",
+    "PROJECTION_METHODS",
+    "PROJECTION_METHOD_PARAMETER",
+    "classical_mds",
+    "normalize_projection_method",
+    "normalized_stress",
+    "pairwise_distances",
+    "pca_projection",
+    "project_points",
+    "projection_method_error",
+    "resolve_projection_method",
+    "smacof_projection",
+]
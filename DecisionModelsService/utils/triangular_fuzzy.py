@@ -0,0 +1,137 @@
+"""Arrays de números difusos triangulares ``(l, m, u)`` sobre NumPy."""
+
+from typing import Any
+
+import numpy as np
+
+
+def _cell_field(field: str, index: tuple[int, ...], labels: list[str] | None) -> str:
+    if labels is not None:
+        head, *rest = index
+        return f"{field}['{labels[head]}']" + "".join(f"[{item}]" for item in rest)
+
+    return field + "".join(f"[{item}]" for item in index)
+
+
+class TriangularFuzzyArray:
+    """Array ``float64`` de forma ``(..., 3)`` cuyo último eje es ``(l, m, u)``.
+
+    Las operaciones (agregación, producto, extremos por componente, distancia
+    de vértices y centroide) se hacen de una vez sobre todo el array, sin
+    iterar celdas ni materializar tuplas.
+    """
+
+    __slots__ = ("values",)
+
+    def __init__(self, values: Any) -> None:
+        array = np.asarray(values, dtype=np.float64)
+        if array.ndim == 0 or array.shape[-1] != 3:
+            raise ValueError("Triangular fuzzy values must have a trailing axis of size 3")
+
+        self.values = array
+
+    @classmethod
+    def validated(
+        cls,
+        values: Any,
+        *,
+        field: str = "matrices",
+        labels: list[str] | None = None,
+    ) -> "TriangularFuzzyArray":
+        """Construye el array comprobando con máscaras que cada triplete sea finito y ordenado.
+
+        El error señala la primera celda inválida como ``field[i][j]...`` o,
+        con ``labels``, ``field['<label del primer eje>'][j]...``.
+        """
+
+        fuzzy = cls(values)
+        array = fuzzy.values
+
+        invalid = ~np.isfinite(array).all(axis=-1)
+        if invalid.any():
+            index = tuple(int(item) for item in np.argwhere(invalid)[0])
+            raise ValueError(f"{_cell_field(field, index, labels)} must contain finite numbers")
+
+        unordered = (array[..., 0] > array[..., 1]) | (array[..., 1] > array[..., 2])
+        if unordered.any():
+            index = tuple(int(item) for item in np.argwhere(unordered)[0])
+            raise ValueError(
+                f"{_cell_field(field, index, labels)} must be an ordered fuzzy triplet [l, m, u]"
+            )
+
+        return fuzzy
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """Forma sin el eje de componentes."""
+
+        return self.values.shape[:-1]
+
+    @property
+    def lower(self) -> np.ndarray:
+        return self.values[..., 0]
+
+    @property
+    def middle(self) -> np.ndarray:
+        return self.values[..., 1]
+
+    @property
+    def upper(self) -> np.ndarray:
+        return self.values[..., 2]
+
+    def __getitem__(self, index: Any) -> "TriangularFuzzyArray":
+        if not isinstance(index, tuple):
+            index = (index,)
+        return TriangularFuzzyArray(self.values[(*index, slice(None))])
+
+    def __mul__(self, other: "TriangularFuzzyArray | float | np.ndarray") -> "TriangularFuzzyArray":
+        """Producto aproximado ``(l1·l2, m1·m2, u1·u2)``; un escalar o array crisp multiplica las tres componentes."""
+
+        if isinstance(other, TriangularFuzzyArray):
+            return TriangularFuzzyArray(self.values * other.values)
+        return TriangularFuzzyArray(self.values * np.asarray(other, dtype=np.float64)[..., None])
+
+    def mean(self, axis: int = 0) -> "TriangularFuzzyArray":
+        """Media aritmética por componente a lo largo de ``axis`` (sin contar el eje de componentes)."""
+
+        return TriangularFuzzyArray(self.values.mean(axis=self._axis(axis)))
+
+    def max(self, axis: int = 0) -> "TriangularFuzzyArray":
+        """Máximo por componente, p. ej. la solución ideal positiva."""
+
+        return TriangularFuzzyArray(self.values.max(axis=self._axis(axis)))
+
+    def min(self, axis: int = 0) -> "TriangularFuzzyArray":
+        """Mínimo por componente, p. ej. la solución ideal negativa."""
+
+        return TriangularFuzzyArray(self.values.min(axis=self._axis(axis)))
+
+    def squared_distance(self, other: "TriangularFuzzyArray") -> np.ndarray:
+        """Suma de cuadrados de las diferencias entre vértices, con broadcasting."""
+
+        difference = self.values - other.values
+        return np.einsum("...k,...k->...", difference, difference)
+
+    def centroid(self) -> np.ndarray:
+        """Defuzzificación por centroide ``(l + m + u) / 3``."""
+
+        return (self.values[..., 0] + self.values[..., 1] + self.values[..., 2]) / 3.0
+
+    def to_triplets(self) -> list[Any]:
+        """Listas anidadas con tuplas ``(l, m, u)`` en las hojas (formato de salida histórico)."""
+
+        def convert(value: Any) -> Any:
+            if len(value) == 3 and not isinstance(value[0], list):
+                return tuple(value)
+            return [convert(item) for item in value]
+
+        return convert(self.values.tolist())
+
+    def _axis(self, axis: int) -> int:
+        return axis if axis >= 0 else axis - 1
+
+    def __repr__(self) -> str:
+        return f"TriangularFuzzyArray(shape={self.shape})"
+
+
+__all__ = ["TriangularFuzzyArray"]